@@ -13,15 +13,39 @@ Features:
 
 Environment Variables:
     PORT (int): The port number on which to run the server (default: 8050)
+    DATASET_CACHE_MB (int): Memory budget of the database cache in MB
+        (default: 256)
+    UPLOAD_CACHE_MB (int): Memory budget of the Signal Data Explorer
+        upload cache in MB (default: 512)
+    UPLOAD_STORE_DIR (str): Directory where uploaded ZIP files are stored
+        (default: signal_data_explorer_uploads in the temporary directory)
+    UPLOAD_PARSE_WORKERS (int): Threads parsing uploaded CSV files
+        (default: number of CPUs, at most 8)
+    UPLOAD_REQUEST_WORKERS (int): CSV files parsed at once for a single
+        request (default: 4)
+    TRAFFIC_DATA_URL (str): Base URL of the repository traffic CSV files
+        (default: repo_traffic_data on GitHub)
+    TRAFFIC_CACHE_TTL (int): Seconds after which cached repository traffic
+        data is refreshed in the background (default: 900)
+    TRAFFIC_CACHE_DIR (str): Directory where downloaded traffic CSV files
+        are stored (default: repo_traffic_data_cache in the temporary
+        directory)
+    TRAFFIC_FETCH_WORKERS (int): Concurrent traffic downloads (default: 8)
+    GITHUB_CACHE_FILE (str): JSON file caching the GitHub Pages status of
+        the learning projects and the pictures list (default:
+        home_page_github_cache.json in the temporary directory)
+    GITHUB_CACHE_TTL (int): Seconds after which the cached GitHub resources
+        are probed again (default: 3600)
+    GITHUB_PROBE_WORKERS (int): Concurrent GitHub probes (default: 8)
 """
 
-import importlib
 import logging
 from typing import Optional
 
 import colorlog
 import dash
 import dash_bootstrap_components as dbc
+import pages.utils.dataset_utils as dsu
 from dash import Dash, Input, Output, callback, dcc, html
 from dash.exceptions import PreventUpdate
 from dash_bootstrap_templates import ThemeSwitchAIO
@@ -42,27 +66,30 @@ colorlog.basicConfig(
 )
 
 
-def get_page_count(module_path: str) -> Optional[int]:  # noqa: FA100
-    """Retrieve the number of items in a page's dataframe.
+def get_page_count(page: dict) -> Optional[int]:  # noqa: FA100
+    """Retrieve the number of items in a page's database.
 
-    Dynamically imports the specified module and attempts to access its
-    dataframe attribute to count the number of items.
+    Reads the row count of the database registered with the page from the
+    dataset metadata index, without importing the page or parsing the
+    database.
 
     Args:
-        module_path (str): The dot-notation path to the module to import
+        page (dict): The page registry entry of the page
 
     Returns:
         Optional[int]:
-            The number of items in the dataframe if found, None otherwise
+            The number of items in the database if the page registers one,
+            None otherwise
 
     """
+    dataset_file = page.get("dataset")
+    if not dataset_file:
+        return None
+
     try:
-        module = importlib.import_module(module_path)
-        if hasattr(module, "dataframe"):
-            return len(module.dataframe)
-    except (ImportError, AttributeError):
-        pass
-    return None
+        return dsu.get_row_count(dataset_file)
+    except (OSError, ValueError):
+        return None
 
 
 # Initialize Dash application with multi-page support
@@ -131,8 +158,8 @@ def update_links_store(
     """Generate and update the navigation links with item counts.
 
     This callback is triggered once on initial load and creates a list of
-    navigation links for all registered pages. If a page has a dataframe,
-    the number of items is appended to the page name.
+    navigation links for all registered pages. If a page registers a
+    database, the number of items is appended to the page name.
 
     Args:
         interval_component (Optional[int]):
@@ -155,12 +182,9 @@ def update_links_store(
             continue
 
         name = page["name"]
-        module_path = page.get("module", "")
-
-        if module_path:
-            count = get_page_count(module_path)
-            if count is not None:
-                name = f"{name} ({count:,} items)"
+        count = get_page_count(page)
+        if count is not None:
+            name = f"{name} ({count:,} items)"
 
         links.append({
             "name": name,
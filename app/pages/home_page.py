@@ -25,10 +25,11 @@ from typing import Any
 import dash
 import dash_bootstrap_components as dbc
 import pages.utils.dash_component_utils as dcu
+import pages.utils.github_cache_utils as gcu
 import pages.utils.style_utils as styles
+import pages.utils.traffic_data_utils as tdu
 import pandas as pd
 import plotly.graph_objects as go
-import requests
 from dash import Input, Output, State, callback, dcc, html
 
 link_name = __name__.rsplit(".", maxsplit=1)[-1].replace("_page", "").title()
@@ -646,30 +647,30 @@ def create_repo_link_column(project_name: str, name_suffix: str) -> dbc.Col:
     )
 
 
-def check_github_pages_simple(username: str, repo_name: str) -> bool:
-    """Check if GitHub Pages is available by testing the standard URL."""
-    import requests
+def refresh_github_resources() -> None:
+    """Start a background refresh of the cached GitHub resources if stale.
 
-    pages_url = f"https://{username}.github.io/{repo_name}/"
-
-    try:
-        response = requests.head(pages_url, timeout=15, allow_redirects=True)
-        return response.status_code == 200
-    except requests.RequestException:
-        return False
+    The GitHub Pages sites of the learning projects and the pictures list
+    are probed in the background, so callers never wait for GitHub.
+    """
+    if gcu.is_github_cache_stale():
+        gcu.refresh_github_cache(
+            GITHUB_USERNAME, [repo["name"] for repo in LEARNING_PROJECTS]
+        )
 
 
 def initialize_learning_projects():
     """Initialize learning projects with GitHub Pages detection.
 
-    This function populates the learning_projects_with_pages global list by
-    checking which learning projects have GitHub Pages available. For each
-    learning project, it copies the configuration, checks if GitHub Pages
-    is enabled, and adds the pages URL if available.
+    For each learning project, it copies the configuration and adds its
+    GitHub Pages status and URL, as last probed by the GitHub resource
+    cache. The function never waits for GitHub, projects that were not
+    probed yet are shown without a GitHub Pages link.
+
+    Returns:
+        list[dict]: Learning project configurations with their GitHub
+        Pages status
 
-    The function modifies the global learning_projects_with_pages list,
-    appending a dictionary for each learning project with its configuration
-    and GitHub Pages status.
     """
     learning_projects_with_pages = []
 
@@ -677,13 +678,11 @@ def initialize_learning_projects():
         project_config = repo.copy()
         project_name = repo["name"]
 
-        has_pages = check_github_pages_simple(GITHUB_USERNAME, project_name)
-        project_config["has_github_pages"] = has_pages
+        pages_url = gcu.get_github_pages_url(GITHUB_USERNAME, project_name)
+        project_config["has_github_pages"] = pages_url is not None
 
-        if has_pages:
-            project_config["pages_url"] = (
-                f"https://{GITHUB_USERNAME}.github.io/{project_name}/"
-            )
+        if pages_url is not None:
+            project_config["pages_url"] = pages_url
 
         project_config["show_simple_link"] = repo.get(
             "show_simple_link", False
@@ -753,10 +752,48 @@ register_modal_callbacks()
 register_carousel_callbacks()
 
 
+@callback(
+    [
+        Output(f"{module_name}_{repo['name']}_links_title", "children")
+        for repo in LEARNING_PROJECTS
+    ]
+    + [
+        Output(f"{module_name}_{repo['name']}_links_title", "style")
+        for repo in LEARNING_PROJECTS
+    ]
+    + [
+        Output(f"{module_name}_{repo['name']}_links", "children")
+        for repo in LEARNING_PROJECTS
+    ],
+    Input("repository_tabs", "active_tab"),
+)
+def update_learning_project_links(active_tab: str):
+    """Show the cached GitHub Pages links when the tab is activated."""
+    if active_tab != "learning_tab":
+        return [dash.no_update] * (len(LEARNING_PROJECTS) * 3)
+
+    refresh_github_resources()
+
+    project_links = [
+        create_learning_project_links(repo)
+        for repo in initialize_learning_projects()
+    ]
+
+    return (
+        [links_title for links_title, _ in project_links]
+        + [
+            {} if links_title else {"display": "none"}
+            for links_title, _ in project_links
+        ]
+        + [links for _, links in project_links]
+    )
+
+
 def load_project_image_urls(project_name: str, username: str) -> list[str]:
     """Load project image filenames from a single shared text file.
 
-    The loader reads one filename per line from app/pictures.txt.
+    The loader reads one filename per line from app/pictures.txt, as
+    cached by the GitHub resource cache, without waiting for GitHub.
     Lines starting with '#' and empty lines are ignored. The resulting
     filenames are joined with the standard GitHub raw path for the
     repository's docs/pictures folder.
@@ -765,37 +802,8 @@ def load_project_image_urls(project_name: str, username: str) -> list[str]:
     that contain the current project's name are used. If no matching
     entries are found, no carousel is shown.
     """
-    github_txt_url = (
-        f"https://raw.githubusercontent.com/{GITHUB_USERNAME}/"
-        "KiCAD_Symbols_Generator/main/app/pictures.txt"
-    )
-
     filenames: list[str] = []
-    loaded_text: str | None = None
-
-    try:
-        response = requests.get(github_txt_url, timeout=15)
-        if response.ok and response.text:
-            loaded_text = response.text
-        else:
-            logging.warning(
-                f"Failed to fetch pictures.txt from remote: "
-                f"Status {response.status_code}"
-            )
-    except requests.RequestException as e:
-        logging.error(f"Request error when fetching pictures.txt: {str(e)}")
-        try:
-            local_file_path = "app/pictures.txt"
-            with open(local_file_path, "r", encoding="utf-8") as f:
-                loaded_text = f.read()
-        except FileNotFoundError:
-            logging.error("Local pictures.txt file not found")
-            loaded_text = None
-        except Exception as local_error:
-            logging.error(
-                f"Error reading local pictures.txt: {str(local_error)}"
-            )
-            loaded_text = None
+    loaded_text = gcu.get_pictures_text()
 
     if loaded_text:
         try:
@@ -891,6 +899,8 @@ def load_images_on_tab_activation(active_tab: str):
     if active_tab != "additional_tab":
         return [dash.no_update] * (len(PROJECT_REPOS_WITH_LINKS) * 2)
 
+    refresh_github_resources()
+
     project_image_urls = {}
 
     for repo in PROJECT_REPOS_WITH_LINKS:
@@ -1070,6 +1080,53 @@ def create_project_section(module_name: str, repo_config: dict) -> list[Any]:
     ]
 
 
+def create_learning_project_links(
+    repo_config: dict,
+) -> tuple[str | None, list[html.A]]:
+    """Create the links shown next to a learning project's graphs.
+
+    Args:
+        repo_config (dict): Learning project configuration, as returned by
+            ``initialize_learning_projects``
+
+    Returns:
+        tuple[str | None, list[html.A]]: Title of the links column, or
+        None if the project has no links, and the links
+
+    """
+    project_name = repo_config["name"]
+    repo_link = html.A(
+        children=f"GitHub Repo -> {project_name.replace('_', ' ')}",
+        href=f"https://github.com/{GITHUB_USERNAME}/{project_name}",
+        target="_blank",
+    )
+
+    if repo_config.get("has_github_pages"):
+        return "Project Links", [
+            repo_link,
+            html.A(
+                children="🌐 View GitHub Pages Site",
+                href=repo_config["pages_url"],
+                target="_blank",
+                style={
+                    "color": "#28a745",
+                    "font-weight": "bold",
+                    "text-decoration": "none",
+                    "padding": "8px",
+                    "border": "2px solid #28a745",
+                    "border-radius": "4px",
+                    "display": "inline-block",
+                    "margin-top": "5px",
+                },
+            ),
+        ]
+
+    if repo_config.get("show_simple_link"):
+        return "Repository", [repo_link]
+
+    return None, []
+
+
 def create_learning_project_section(
     module_name: str, repo_config: dict
 ) -> list[Any]:
@@ -1089,67 +1146,35 @@ def create_learning_project_section(
     project_name = repo_config["name"]
     name_suffix = f"{module_name}_{project_name}"
 
-    has_pages = repo_config.get("has_github_pages")
-    show_simple_link = repo_config.get("show_simple_link")
     graphs_col = dbc.Col(
         children=create_repo_graphs(name_suffix),
         xs=12,
         md=9,
     )
 
-    cols = [graphs_col]
-
-    if has_pages:
-        links = [
-            html.A(
-                children=f"GitHub Repo -> {project_name.replace('_', ' ')}",
-                href=f"https://github.com/{GITHUB_USERNAME}/{project_name}",
-                target="_blank",
+    links_title, links = create_learning_project_links(repo_config)
+    links_col = dbc.Col(
+        [
+            html.H4(
+                links_title,
+                id=f"{name_suffix}_links_title",
+                style={} if links_title else {"display": "none"},
             ),
-            html.A(
-                children="🌐 View GitHub Pages Site",
-                href=repo_config["pages_url"],
-                target="_blank",
+            create_graph_time_range_controls(name_suffix),
+            html.Div(
+                children=links,
+                id=f"{name_suffix}_links",
                 style={
-                    "color": "#28a745",
-                    "font-weight": "bold",
-                    "text-decoration": "none",
-                    "padding": "8px",
-                    "border": "2px solid #28a745",
-                    "border-radius": "4px",
-                    "display": "inline-block",
-                    "margin-top": "5px",
+                    "display": "flex",
+                    "flexDirection": "column",
+                    "gap": "10px",
                 },
             ),
-        ]
-
-        links_col = dbc.Col(
-            [
-                html.H4("Project Links"),
-                create_graph_time_range_controls(name_suffix),
-                html.Div(
-                    children=links,
-                    style={
-                        "display": "flex",
-                        "flex-direction": "column",
-                        "gap": "10px",
-                    },
-                ),
-            ],
-            xs=12,
-            md=3,
-        )
-        cols.append(links_col)
-    elif show_simple_link:
-        cols.append(create_repo_link_column(project_name, name_suffix))
-    else:
-        cols.append(
-            dbc.Col(
-                create_graph_time_range_controls(name_suffix),
-                xs=12,
-                md=3,
-            )
-        )
+        ],
+        xs=12,
+        md=3,
+    )
+    cols = [graphs_col, links_col]
 
     return [
         dbc.Row(cols),
@@ -1575,185 +1600,22 @@ def display_links(links: list[dict] | None) -> html.Div | str:
     )
 
 
-def load_traffic_data(
-    github_url: str,
-    local_file: str,
-    rename_columns: dict[str, str] | None = None,
-) -> pd.DataFrame:
-    """Load traffic data from GitHub, fallback to local file if needed.
+def format_period_totals(period: tdu.TrafficPeriod | None) -> str:
+    """Format the totals of a traffic period for a graph title.
 
     Args:
-        github_url: URL of the CSV file on GitHub
-        local_file: Path to local CSV file
-        rename_columns: Optional dictionary to rename columns
+        period (tdu.TrafficPeriod | None): Displayed period, or None if
+            the whole history is displayed
 
     Returns:
-        DataFrame with traffic data, with missing dates filled with 0.
+        str: Total and unique counts of the period, or an empty string if
+        no period is selected
 
     """
-    try:
-        data_frame = pd.read_csv(github_url)
-    except (
-        pd.errors.ParserError,
-        pd.errors.EmptyDataError,
-        OSError,
-    ) as error_message:
-        print(f"Error reading github file: {error_message} from {github_url}")
-        try:
-            data_frame = pd.read_csv(local_file)
-        except (
-            FileNotFoundError,
-            pd.errors.ParserError,
-            pd.errors.EmptyDataError,
-        ) as error_message:
-            print(f"Error reading local file: {error_message}")
-            return pd.DataFrame({
-                "clone_timestamp": pd.Series(dtype="datetime64[ns]"),
-                "total_clones": pd.Series(dtype="int"),
-                "unique_clones": pd.Series(dtype="int"),
-            })
-
-    if rename_columns:
-        data_frame = data_frame.rename(columns=rename_columns)
-
-    data_frame["clone_timestamp"] = pd.to_datetime(
-        data_frame["clone_timestamp"],
-    )
-
-    if not data_frame.empty:
-        date_range = pd.date_range(
-            start=data_frame["clone_timestamp"].min(),
-            end=data_frame["clone_timestamp"].max(),
-        )
-        data_frame = (
-            data_frame
-            .set_index("clone_timestamp")
-            .reindex(date_range, fill_value=0)
-            .reset_index()
-            .rename(columns={"index": "clone_timestamp"})
-        )
-
-    return data_frame
+    if period is None:
+        return ""
 
-
-def get_period_bounds(
-    data_frame: pd.DataFrame,
-    range_type: str,
-    offset: int,
-) -> tuple[pd.Timestamp | None, pd.Timestamp | None, str]:
-    """Compute the start/end timestamps and label for a period offset.
-
-    Periods are ordered from most recent (offset 0) to oldest. If the
-    requested offset is beyond the oldest available period, it is
-    clamped to that oldest period.
-
-    Args:
-        data_frame: DataFrame containing a "clone_timestamp" column.
-        range_type: One of "week", "month", or "all".
-        offset: 0 for the most recent period, 1 for the previous one,
-            and so on.
-
-    Returns:
-        Tuple of ``(start, end, label)``. For "all" range type (or empty
-        data, or no periods available), ``start`` and ``end`` are ``None``
-        and ``label`` is an empty string.
-
-    """
-    if data_frame.empty or range_type not in ("week", "month"):
-        return None, None, ""
-
-    timestamps = pd.to_datetime(data_frame["clone_timestamp"])
-
-    if range_type == "week":
-        periods = sorted(
-            timestamps.dt.to_period("W-SUN").unique(), reverse=True
-        )
-        if not periods:
-            return None, None, ""
-
-        period = periods[min(max(offset, 0), len(periods) - 1)]
-        start, end = period.start_time, period.end_time
-        label = f"{start.strftime('%b %d')} - {end.strftime('%b %d, %Y')}"
-        return start, end, label
-
-    periods = sorted(timestamps.dt.to_period("M").unique(), reverse=True)
-    if not periods:
-        return None, None, ""
-
-    period = periods[min(max(offset, 0), len(periods) - 1)]
-    return period.start_time, period.end_time, period.strftime("%B %Y")
-
-
-def filter_dataframe_by_range(
-    data_frame: pd.DataFrame,
-    range_type: str,
-    offset: int,
-) -> pd.DataFrame:
-    """Filter a traffic DataFrame down to the selected time range.
-
-    Args:
-        data_frame: DataFrame containing a "clone_timestamp" column.
-        range_type: One of "week", "month", or "all".
-        offset: 0 for the most recent week/month, 1 for the previous
-            one, and so on. Ignored when ``range_type`` is "all".
-
-    Returns:
-        A filtered (and re-indexed) copy of the DataFrame.
-
-    """
-    if data_frame.empty or range_type == "all":
-        return data_frame
-
-    start, end, _ = get_period_bounds(data_frame, range_type, offset)
-    if start is None:
-        return data_frame
-
-    timestamps = pd.to_datetime(data_frame["clone_timestamp"])
-    mask = (timestamps >= start) & (timestamps <= end)
-    return data_frame.loc[mask].reset_index(drop=True)
-
-
-BASE_GITHUB_URL = (
-    f"https://raw.githubusercontent.com/{GITHUB_USERNAME}/"
-    "KiCAD_Symbols_Generator/main"
-)
-
-
-def load_repo_data(repo_config: dict) -> tuple[pd.DataFrame, pd.DataFrame]:
-    """Load clones and visitors data for a repository.
-
-    Args:
-        repo_config: Repository configuration dictionary, must contain
-            a "name" key.
-
-    Returns:
-        Tuple of (clones DataFrame, visitors DataFrame).
-
-    """
-    repo_name = repo_config["name"]
-    clones_csv = f"{repo_name.lower()}_clones_history.csv"
-    visitors_csv = f"{repo_name.lower()}_visitors_history.csv"
-
-    clones_source = {
-        "github_url": f"{BASE_GITHUB_URL}/repo_traffic_data/{clones_csv}",
-        "local_file": f"repo_traffic_data/{clones_csv}",
-        "rename_columns": None,
-    }
-
-    visitors_source = {
-        "github_url": (f"{BASE_GITHUB_URL}/repo_traffic_data/{visitors_csv}"),
-        "local_file": f"repo_traffic_data/{visitors_csv}",
-        "rename_columns": {
-            "visitor_timestamp": "clone_timestamp",
-            "total_visitors": "total_clones",
-            "unique_visitors": "unique_clones",
-        },
-    }
-
-    return (
-        load_traffic_data(**clones_source),
-        load_traffic_data(**visitors_source),
-    )
+    return f" ({period.total:,} total, {period.unique:,} unique)"
 
 
 def register_repo_graphs_callback(
@@ -1803,24 +1665,35 @@ def register_repo_graphs_callback(
             return dash.no_update, dash.no_update, dash.no_update
 
         repo_name = repo_config["name"]
-        clones_df, visitors_df = load_repo_data(repo_config)
+        traffic_data = tdu.get_traffic_data(repo_name)
 
         offset = period_offset or 0
 
-        filtered_clones = filter_dataframe_by_range(
-            clones_df, range_type, offset
+        clones_period = tdu.get_traffic_period(
+            traffic_data.clone_periods, range_type, offset
         )
-        filtered_visitors = filter_dataframe_by_range(
-            visitors_df, range_type, offset
+        visitors_period = tdu.get_traffic_period(
+            traffic_data.visitor_periods, range_type, offset
         )
-        _, _, period_label = get_period_bounds(clones_df, range_type, offset)
+
+        filtered_clones = (
+            clones_period.data_frame
+            if clones_period is not None
+            else traffic_data.clones
+        )
+        filtered_visitors = (
+            visitors_period.data_frame
+            if visitors_period is not None
+            else traffic_data.visitors
+        )
+        period_label = clones_period.label if clones_period is not None else ""
 
         clones_figure = create_figure(
             theme_switch=theme_switch,
             data_frames=[filtered_clones],
             trace_colors=repo_config["colors"],
             titles=(
-                f"{repo_name} Git Clones",
+                f"{repo_name} Git Clones{format_period_totals(clones_period)}",
                 "Clones",
                 "Unique Clones",
                 repo_name,
@@ -1832,7 +1705,8 @@ def register_repo_graphs_callback(
             data_frames=[filtered_visitors],
             trace_colors=repo_config["colors"],
             titles=(
-                f"{repo_name} Visitors",
+                f"{repo_name} Visitors"
+                f"{format_period_totals(visitors_period)}",
                 "Views",
                 "Unique Views",
                 repo_name,
@@ -1861,3 +1735,6 @@ for _repo in PROJECT_REPOS_WITH_LINKS:
     register_repo_graphs_callback(
         f"{module_name}_{_repo['name']}", _repo, "additional_tab"
     )
+
+tdu.refresh_traffic_data(repo["name"] for repo in REPO_CONFIGS)
+refresh_github_resources()
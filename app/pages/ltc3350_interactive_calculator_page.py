@@ -9,18 +9,43 @@ The page uses a responsive multi-column layout system that adapts
 to different screen sizes, displaying technical content alongside
 mathematical formulas.
 
+The interactive calculator also ranks the supercapacitors of the
+capacitor database that meet the backup requirements, and sweeps the
+capacitor parts over the backup power range and the stack sizes. Both
+are evaluated on plain NumPy arrays, units are only attached to the
+displayed values.
+
 """
 
+from typing import NamedTuple
+
 import forallpeople as si
 import numpy as np
+import pages.utils.dataset_utils as dsu
 import pandas as pd
+import plotly.graph_objects as go
 from dash import Input, Output, callback, dash_table, dcc, html, register_page
+from plotly.subplots import make_subplots
 
 si.environment("default")
 
 link_name = __name__.rsplit(".", maxsplit=1)[-1].replace("_page", "").title()
 module_name = __name__.rsplit(".", maxsplit=1)[-1]
 
+CAP_ESR_PAIRS_FILE = "cap_esr_pairs.csv"
+CAPACITOR_DATABASE_FILE = "data/UNITED_CAPACITORS_DATA_BASE.csv"
+SELECTION_MAX_ROWS = 10
+
+SWEEP_P_BACKUP_VALUES = np.arange(1, 101, dtype=float)
+STACK_N_VALUES = np.arange(1, 5)
+SWEEP_METRICS = {
+    "t_backup": ("Backup time", "t<sub>BACKUP EOL</sub>", "s"),
+    "v_stk_min": ("Minimum stack voltage", "V<sub>STK(MIN)</sub>", "V"),
+    "gamma_min": ("Minimum gamma", "γ<sub>MIN</sub>", ""),
+    "c_margin": ("Capacitance margin", "C<sub>EOL</sub> margin", "×"),
+    "esr_margin": ("ESR margin", "ESR<sub>EOL</sub> margin", "×"),
+}
+
 register_page(
     __name__,
     name=link_name,
@@ -711,45 +736,89 @@ def callback_update_slider_marks_theme(
         return styled_marks, tooltip
 
 
-def calculate_backup_time(
-    cap_si, esr_si, eta, n, p_backup_si, v_cell_max_si, i_peak
+class BackupTimeGrid(NamedTuple):
+    """Backup time results evaluated over a grid of design points.
+
+    All arrays share the broadcast shape of the inputs and hold plain SI
+    values. Design points that cannot deliver the backup power are NaN.
+
+    Attributes:
+        v_stk_min: Minimum stack voltage in V
+        gamma_max: Gamma at the maximum stack voltage
+        gamma_min: Gamma at the minimum stack voltage
+        v_loss_squared: Squared voltage loss in V²
+        t_backup: Backup time in s
+
+    """
+
+    v_stk_min: np.ndarray
+    gamma_max: np.ndarray
+    gamma_min: np.ndarray
+    v_loss_squared: np.ndarray
+    t_backup: np.ndarray
+
+
+def calculate_backup_time_grid(
+    cap, esr, eta, n, p_backup, v_cell_max, i_peak
 ):
-    """Calculate backup time for given capacitor parameters."""
-    v_stk_min_power = np.sqrt(4 * esr_si * n * p_backup_si / eta)
-    v_stk_min_current = (p_backup_si / (eta * i_peak)) + (n * esr_si * i_peak)
-    v_stk_min_calc = max(v_stk_min_power, v_stk_min_current)
-
-    gama_max_calc = 1 + np.sqrt(
-        1
-        - (
-            (4 * n * esr_si * p_backup_si)
-            / (eta * np.power(n * v_cell_max_si, 2))
-        )
-    )
-    gama_min_calc = 1 + np.sqrt(
-        1
-        - (
-            (4 * n * esr_si * p_backup_si)
-            / (eta * np.power(v_stk_min_calc, 2))
+    """Calculate backup times over broadcast arrays of design parameters.
+
+    The inputs are plain numbers or NumPy arrays in SI base units, so a
+    whole sweep is evaluated in a few array operations. Units are attached
+    by the caller when the results are displayed.
+
+    Args:
+        cap: Capacitance of one cell in F
+        esr: ESR of one cell in Ω
+        eta: Boost efficiency
+        n: Number of cells in series
+        p_backup: Backup power in W
+        v_cell_max: Maximum cell voltage in V
+        i_peak: Peak current limit in A
+
+    Returns:
+        BackupTimeGrid: Stack voltage, gamma, voltage loss and backup time
+
+    """
+    cap, esr, eta, n, p_backup, v_cell_max, i_peak = np.broadcast_arrays(
+        *(
+            np.asarray(value, dtype=float)
+            for value in (cap, esr, eta, n, p_backup, v_cell_max, i_peak)
         )
     )
+    v_stk_max = n * v_cell_max
+    loss_term = 4 * n * esr * p_backup / eta
 
-    v_loss_sq_calc = ((4 * n * esr_si * p_backup_si) / eta) * np.log(
-        (gama_max_calc * n * v_cell_max_si) / (gama_min_calc * v_stk_min_calc)
+    v_stk_min = np.maximum(
+        np.sqrt(loss_term),
+        p_backup / (eta * i_peak) + n * esr * i_peak,
     )
 
-    t_backup_calc = (
+    with np.errstate(invalid="ignore", divide="ignore"):
+        gamma_max = 1 + np.sqrt(1 - loss_term / v_stk_max**2)
+        gamma_min = 1 + np.sqrt(1 - loss_term / v_stk_min**2)
+        v_loss_squared = loss_term * np.log(
+            (gamma_max * v_stk_max) / (gamma_min * v_stk_min)
+        )
+
+    t_backup = (
         eta
-        * (cap_si / n)
-        / (4 * p_backup_si)
+        * (cap / n)
+        / (4 * p_backup)
         * (
-            gama_max_calc * (n * v_cell_max_si) ** 2
-            - gama_min_calc * v_stk_min_calc**2
-            - v_loss_sq_calc
+            gamma_max * v_stk_max**2
+            - gamma_min * v_stk_min**2
+            - v_loss_squared
         )
     )
 
-    return t_backup_calc
+    return BackupTimeGrid(
+        v_stk_min=v_stk_min,
+        gamma_max=gamma_max,
+        gamma_min=gamma_min,
+        v_loss_squared=v_loss_squared,
+        t_backup=t_backup,
+    )
 
 
 def create_markdown_div(content, class_name="col-12 text-center"):
@@ -766,18 +835,104 @@ def read_cap_esr_pairs_from_csv(csv_file_path):
     """Read data from a CSV file."""
     try:
         df = pd.read_csv(csv_file_path)
-        cap_esr_pairs = [
-            (
-                float(row["cap_value"]),
-                float(row["esr_value"]),
-                row["part_number"],
-            )
-            for _, row in df.iterrows()
-        ]
     except FileNotFoundError:
         print(f"Warning: CSV file {csv_file_path} not found.")
+        return []
 
-    return cap_esr_pairs
+    return list(
+        zip(
+            df["cap_value"].astype(float).tolist(),
+            df["esr_value"].astype(float).tolist(),
+            df["part_number"].tolist(),
+        )
+    )
+
+
+def select_supercapacitor_candidates(joined):
+    """Select the supercapacitors that can be used for the backup stack.
+
+    Parts of the ESR table missing from the database are kept without a
+    voltage rating, database parts without an ESR are dropped and can be
+    listed with ``find_supercapacitors_without_esr``.
+
+    Args:
+        joined: Supercapacitors returned by ``join_supercapacitor_esr``
+
+    Returns:
+        pd.DataFrame: One row per part with ``part_number``, ``cap_value``
+        in F, ``esr_value`` in Ω and ``voltage_rating`` in V columns
+
+    """
+    return joined.dropna(subset=["cap_value", "esr_value"])[
+        ["part_number", "cap_value", "esr_value", "voltage_rating"]
+    ].reset_index(drop=True)
+
+
+def find_supercapacitors_without_esr(joined):
+    """Find the database supercapacitors missing from the ESR table.
+
+    Args:
+        joined: Supercapacitors returned by ``join_supercapacitor_esr``
+
+    Returns:
+        list[str]: Part numbers of the excluded supercapacitors, sorted
+        by part number
+
+    """
+    excluded = joined["in_database"].notna() & joined["esr_value"].isna()
+    return joined.loc[excluded, "part_number"].tolist()
+
+
+def join_supercapacitor_esr(database_file, esr_file):
+    """Join the database supercapacitors with the ESR table.
+
+    The supercapacitors of the capacitor database are joined with the ESR
+    table by part number, since the database has no ESR column.
+
+    Args:
+        database_file: Path of the capacitor database CSV file
+        esr_file: Path of the CSV file with capacitance, ESR and part
+            number columns
+
+    Returns:
+        pd.DataFrame: Outer join by ``part_number``, with ``in_database``
+        set for the rows of database parts and NaN for missing values
+
+    """
+    database = dsu.load_dataset(database_file)
+    supercapacitors = database[
+        database["Capacitor Type"] == "Supercapacitor"
+    ]
+    database_parts = pd.DataFrame({
+        "part_number": supercapacitors["MPN"].astype(str),
+        "database_cap_value": pd.to_numeric(
+            supercapacitors["Value"].str.extract(r"^([\d.]+)\s*F$")[0],
+            errors="coerce",
+        ),
+        "voltage_rating": pd.to_numeric(
+            supercapacitors["Voltage Rating"].str.extract(r"^([\d.]+)")[0],
+            errors="coerce",
+        ),
+        "in_database": True,
+    })
+
+    try:
+        esr_table = pd.read_csv(esr_file)
+    except FileNotFoundError:
+        print(f"Warning: CSV file {esr_file} not found.")
+        esr_table = pd.DataFrame(
+            columns=["cap_value", "esr_value", "part_number"]
+        )
+
+    candidates = database_parts.merge(
+        esr_table.astype({"part_number": str}),
+        on="part_number",
+        how="outer",
+    )
+    candidates["cap_value"] = candidates["database_cap_value"].fillna(
+        candidates["cap_value"]
+    )
+    return candidates
 
 
 interactive_calculator = html.Div([
@@ -912,6 +1067,34 @@ interactive_calculator = html.Div([
     html.Hr(className="my-3"),
     html.Div(id="backup_time_table"),
     html.Hr(className="my-3"),
+    html.H5("Capacitor Selection", className="mt-3 mb-3 fw-bold text-primary"),
+    html.P(
+        "Supercapacitors of the capacitor database, ranked by the energy "
+        "stored in the stack, that meet the backup power and backup time at "
+        "end of life. The ESR of each part is taken from the ESR table of "
+        "the calculator, parts without an ESR are listed below the table."
+    ),
+    html.Div(id="capacitor_selection_table"),
+    html.Hr(className="my-3"),
+    html.H5("Design Space Sweep", className="mt-3 mb-3 fw-bold text-primary"),
+    html.P(
+        "End of life metrics of every capacitor part in the table above, "
+        "swept over the backup power range and the stack sizes. Backup "
+        "times are centered on the required backup time and margins on 1, "
+        "so blue cells meet the requirement and red cells do not. Blank "
+        "cells cannot deliver the backup power."
+    ),
+    dcc.RadioItems(
+        id="sweep_metric_radio",
+        options=[
+            {"label": html.Span(label, className="ms-1 me-3"), "value": key}
+            for key, (label, _, _) in SWEEP_METRICS.items()
+        ],
+        value="t_backup",
+        inline=True,
+    ),
+    dcc.Graph(id="sweep_graph"),
+    html.Hr(className="my-3"),
     html.H5(
         [html.Span("V"), html.Sub("CAP"), html.Span(" Feedback Resistors")],
         className="mt-3 mb-3 fw-bold text-primary",
@@ -1376,44 +1559,32 @@ def create_backup_time_table(
         )
     table_data.append(esr_row)
 
-    initial_time_row = {"Parameter": "t<sub>BACKUP Initial</sub>"}
-    for i, (cap_initial, esr_initial, _) in enumerate(cap_esr_pairs):
-        cap_si = cap_initial * si.F
-        esr_si = esr_initial * si.Ohm
-
-        t_backup_calc = calculate_backup_time(
-            cap_si, esr_si, eta, n, p_backup, v_cell_max, i_peak
-        )
-
-        time_value = float(t_backup_calc.value)
-        time_str = (
-            "N/A"
-            if time_value < 0 or np.isnan(time_value)
-            else f"{time_value * si.s:.1f}"
-        )
-        initial_time_row[f"Cap_{i + 1}"] = time_str.replace(".0", "")
-    table_data.append(initial_time_row)
-
-    eol_time_row = {"Parameter": "t<sub>BACKUP EOL</sub>"}
-    for i, (cap_initial, esr_initial, _) in enumerate(cap_esr_pairs):
-        cap_eol = cap_initial * 0.8
-        esr_eol_val = esr_initial * 2
-
-        cap_si = cap_eol * si.F
-        esr_si = esr_eol_val * si.Ohm
-
-        t_backup_calc = calculate_backup_time(
-            cap_si, esr_si, eta, n, p_backup, v_cell_max, i_peak
-        )
-
-        time_value = float(t_backup_calc.value)
-        time_str = (
-            "N/A"
-            if time_value < 0 or np.isnan(time_value)
-            else f"{time_value * si.s:.1f}"
-        )
-        eol_time_row[f"Cap_{i + 1}"] = time_str.replace(".0", "")
-    table_data.append(eol_time_row)
+    cap_values = np.array([cap for cap, _, _ in cap_esr_pairs], dtype=float)
+    esr_values = np.array([esr for _, esr, _ in cap_esr_pairs], dtype=float)
+    time_rows = [
+        ("t<sub>BACKUP Initial</sub>", cap_values, esr_values),
+        ("t<sub>BACKUP EOL</sub>", cap_values * 0.8, esr_values * 2),
+    ]
+    for parameter, cap, esr in time_rows:
+        t_backup_calc = calculate_backup_time_grid(
+            cap,
+            esr,
+            eta,
+            n,
+            float(p_backup.value),
+            float(v_cell_max.value),
+            float(i_peak.value),
+        ).t_backup
+
+        time_row = {"Parameter": parameter}
+        for i, time_value in enumerate(t_backup_calc.tolist()):
+            time_str = (
+                "N/A"
+                if time_value < 0 or np.isnan(time_value)
+                else f"{time_value * si.s:.1f}"
+            )
+            time_row[f"Cap_{i + 1}"] = time_str.replace(".0", "")
+        table_data.append(time_row)
 
     columns = [
         {"name": "Parameter", "id": "Parameter", "presentation": "markdown"}
@@ -1421,8 +1592,34 @@ def create_backup_time_table(
     for i in range(len(cap_esr_pairs)):
         columns.append({"name": f"Capacitor {i + 1}", "id": f"Cap_{i + 1}"})
 
+    return create_data_table(
+        table_data,
+        columns,
+        style_data_conditional=[
+            {
+                "if": {"column_id": "Parameter"},
+                "fontWeight": "bold",
+                "textAlign": "left",
+                "fontFamily": "inherit",
+            },
+        ],
+    )
+
+
+def create_data_table(data, columns, style_data_conditional=None):
+    """Create a transparent, theme-neutral result table.
+
+    Args:
+        data: Table rows as dictionaries keyed by column id
+        columns: Dash DataTable column definitions
+        style_data_conditional: Optional conditional cell styles
+
+    Returns:
+        dash_table.DataTable: Table styled like the page content
+
+    """
     return dash_table.DataTable(
-        data=table_data,
+        data=data,
         columns=columns,
         cell_selectable=False,
         markdown_options={"html": True},
@@ -1451,14 +1648,418 @@ def create_backup_time_table(
             "color": "inherit",
             "border": "1px solid rgba(100, 100, 100, 0.4)",
         },
-        style_data_conditional=[
-            {
-                "if": {"column_id": "Parameter"},
-                "fontWeight": "bold",
-                "textAlign": "left",
-                "fontFamily": "inherit",
+        style_data_conditional=style_data_conditional or [],
+    )
+
+
+def select_capacitors(
+    candidates, n_values, p_backup, t_backup, eta, v_cell_max, i_peak
+):
+    """Find the part and stack size combinations that meet the backup needs.
+
+    Every candidate part is evaluated for every stack size at once, at its
+    end of life values of 80 % of the initial capacitance and twice the
+    initial ESR. A combination qualifies if it delivers the backup power
+    for at least the backup time and the cell voltage does not exceed the
+    rated voltage of the part.
+
+    The qualifying combinations are ranked by the energy stored in the
+    stack, so the least oversized designs come first.
+
+    Args:
+        candidates: Parts returned by ``select_supercapacitor_candidates``
+        n_values: Numbers of cells in series
+        p_backup: Backup power in W
+        t_backup: Required backup time in s
+        eta: Boost efficiency
+        v_cell_max: Maximum cell voltage in V
+        i_peak: Peak current limit in A
+
+    Returns:
+        pd.DataFrame: Ranked combinations with ``part_number``, ``n``,
+        ``cap_value``, ``esr_value``, ``voltage_rating``, ``v_stk_min``,
+        ``t_backup`` and ``stored_energy`` columns
+
+    """
+    n = np.asarray(n_values, dtype=float)[:, None]
+    cap_value = candidates["cap_value"].to_numpy(dtype=float)
+    esr_value = candidates["esr_value"].to_numpy(dtype=float)
+    voltage_rating = candidates["voltage_rating"].to_numpy(dtype=float)
+
+    grid = calculate_backup_time_grid(
+        cap_value * 0.8, esr_value * 2, eta, n, p_backup, v_cell_max, i_peak
+    )
+    # Parts without a known rating are kept, the tolerance absorbs the
+    # rounding of the slider steps.
+    rated = ~(voltage_rating < v_cell_max - 1e-9)
+    n_index, part_index = np.nonzero((grid.t_backup >= t_backup) & rated)
+
+    selection = candidates.iloc[part_index].reset_index(drop=True)
+    selection.insert(1, "n", np.asarray(n_values)[n_index])
+    selection["v_stk_min"] = grid.v_stk_min[n_index, part_index]
+    selection["t_backup"] = grid.t_backup[n_index, part_index]
+    selection["stored_energy"] = (
+        0.5 * selection["n"] * selection["cap_value"] * v_cell_max**2
+    )
+
+    return selection.sort_values(
+        ["stored_energy", "n"], kind="stable"
+    ).reset_index(drop=True)
+
+
+def create_capacitor_selection_table(selection, t_backup, excluded_parts):
+    """Create the ranked capacitor selection table.
+
+    Args:
+        selection: Ranked combinations returned by ``select_capacitors``
+        t_backup: Required backup time in s
+        excluded_parts: Database part numbers without an ESR, returned by
+            ``find_supercapacitors_without_esr``
+
+    Returns:
+        html.Div: Table of the best combinations, or a note if no part
+        meets the requirements, followed by the excluded parts
+
+    """
+    excluded_note = (
+        html.P(
+            f"Not considered, no ESR available: {', '.join(excluded_parts)}",
+            className="text-muted small mt-2",
+        )
+        if excluded_parts
+        else None
+    )
+
+    if selection.empty:
+        return html.Div([
+            html.P(
+                "No supercapacitor in the database meets the backup "
+                "requirements at end of life within its rated voltage with "
+                f"up to {STACK_N_VALUES[-1]} cells in series.",
+                className="text-center fw-bold",
+            ),
+            excluded_note,
+        ])
+
+    table_data = []
+    for rank, row in enumerate(
+        selection.head(SELECTION_MAX_ROWS).itertuples(index=False), start=1
+    ):
+        voltage_rating = (
+            "N/A"
+            if np.isnan(row.voltage_rating)
+            else f"{row.voltage_rating * si.V:.1f}"
+        )
+        table_data.append({
+            "rank": rank,
+            "part_number": row.part_number,
+            "n": row.n,
+            "cap": (
+                f"{row.cap_value * si.F:.0f} "
+                f"({row.cap_value * 0.8 * si.F:.0f})"
+            ),
+            "esr": (
+                f"{row.esr_value * si.Ohm:.1f} "
+                f"({row.esr_value * 2 * si.Ohm:.1f})"
+            ),
+            "voltage_rating": voltage_rating,
+            "v_stk_min": f"{row.v_stk_min * si.V:.2f}",
+            "t_backup": f"{row.t_backup * si.s:.1f}",
+            "margin": f"{row.t_backup / t_backup:.2f}×",
+        })
+
+    columns = [
+        {"name": "Rank", "id": "rank"},
+        {"name": "Part Number", "id": "part_number"},
+        {"name": "n", "id": "n"},
+        {"name": "C (C EOL)", "id": "cap"},
+        {"name": "ESR (ESR EOL)", "id": "esr"},
+        {"name": "Rated Voltage", "id": "voltage_rating"},
+        {"name": "V STK(MIN)", "id": "v_stk_min"},
+        {"name": "t BACKUP EOL", "id": "t_backup"},
+        {"name": "Backup Time Margin", "id": "margin"},
+    ]
+
+    return html.Div([
+        html.Div(
+            create_data_table(table_data, columns),
+            style={"overflowX": "auto"},
+        ),
+        excluded_note,
+    ])
+
+
+@callback(
+    Output("capacitor_selection_table", "children"),
+    Input("p_backup_slider", "value"),
+    Input("t_backup_slider", "value"),
+    Input("eta_slider", "value"),
+    Input("v_cell_max_slider", "value"),
+    Input("r_snsc_slider", "value"),
+    Input("r_snsi_slider", "value"),
+)
+def update_capacitor_selection(
+    p_backup_slider_value,
+    t_backup_slider_value,
+    eta_slider_value,
+    v_cell_max_slider_value,
+    r_snsc_slider_value,
+    r_snsi_slider_value,
+):
+    """Rank the database supercapacitors for the current requirements.
+
+    Args:
+        p_backup_slider_value: Backup power in W.
+        t_backup_slider_value: Backup duration in s.
+        eta_slider_value: Converter efficiency (0–1).
+        v_cell_max_slider_value: Maximum cell voltage in V.
+        r_snsc_slider_value: Charge sense resistor in Ω.
+        r_snsi_slider_value: Input current sense resistor in Ω.
+
+    Returns:
+        html.Div: Ranked capacitor selection table
+
+    """
+    _, _, i_peak = calculate_current_limits(
+        r_snsi_slider_value * si.Ohm, r_snsc_slider_value * si.Ohm
+    )
+    joined = join_supercapacitor_esr(
+        CAPACITOR_DATABASE_FILE, CAP_ESR_PAIRS_FILE
+    )
+    candidates = select_supercapacitor_candidates(joined)
+
+    selection = select_capacitors(
+        candidates,
+        STACK_N_VALUES,
+        p_backup_slider_value,
+        t_backup_slider_value,
+        eta_slider_value,
+        v_cell_max_slider_value,
+        float(i_peak.value),
+    )
+
+    excluded_parts = find_supercapacitors_without_esr(joined)
+
+    return create_capacitor_selection_table(
+        selection, t_backup_slider_value, excluded_parts
+    )
+
+
+def calculate_sweep(
+    cap_esr_pairs,
+    p_backup_values,
+    n_values,
+    t_backup,
+    eta,
+    v_cell_max,
+    alpha_b,
+    i_peak,
+):
+    """Evaluate the EOL design metrics over P_BACKUP × n × capacitor part.
+
+    The capacitor parts are derated to their end of life values, 80 % of
+    the initial capacitance and twice the initial ESR. The C and ESR
+    margins compare them with the C_EOL and ESR_EOL required by the backup
+    requirements, so a margin of at least 1 meets the requirement.
+
+    Args:
+        cap_esr_pairs: Capacitance, ESR and part number of each part
+        p_backup_values: Backup powers in W
+        n_values: Numbers of cells in series
+        t_backup: Required backup time in s
+        eta: Boost efficiency
+        v_cell_max: Maximum cell voltage in V
+        alpha_b: Utilization factor
+        i_peak: Peak current limit in A
+
+    Returns:
+        dict: Arrays of shape (powers, stack sizes, parts) keyed by the
+        ``SWEEP_METRICS`` keys
+
+    """
+    p_backup = np.asarray(p_backup_values, dtype=float)[:, None, None]
+    n = np.asarray(n_values, dtype=float)[None, :, None]
+    cap_eol = (
+        np.array([cap for cap, _, _ in cap_esr_pairs], dtype=float) * 0.8
+    )
+    esr_eol = np.array([esr for _, esr, _ in cap_esr_pairs], dtype=float) * 2
+
+    grid = calculate_backup_time_grid(
+        cap_eol, esr_eol, eta, n, p_backup, v_cell_max, i_peak
+    )
+    c_eol_required, esr_eol_required = calculate_core_parameters(
+        p_backup, t_backup, n, eta, v_cell_max, alpha_b
+    )
+
+    return {
+        "t_backup": np.where(grid.t_backup < 0, np.nan, grid.t_backup),
+        "v_stk_min": grid.v_stk_min,
+        "gamma_min": grid.gamma_min,
+        "c_margin": np.broadcast_to(
+            cap_eol / c_eol_required, grid.t_backup.shape
+        ),
+        "esr_margin": np.broadcast_to(
+            esr_eol_required / esr_eol, grid.t_backup.shape
+        ),
+    }
+
+
+def create_sweep_figure(
+    sweep, metric, part_numbers, p_backup_values, n_values, reference, theme
+):
+    """Create one heatmap per stack size for a sweep metric.
+
+    Args:
+        sweep: Sweep arrays returned by ``calculate_sweep``
+        metric: Key of the displayed metric in ``SWEEP_METRICS``
+        part_numbers: Part number of each capacitor part
+        p_backup_values: Backup powers in W
+        n_values: Numbers of cells in series
+        reference: Value at which the logarithmic diverging color scale
+            is centered, or None for a linear sequential color scale
+        theme: True for light theme, False for dark theme
+
+    Returns:
+        go.Figure: Heatmaps sharing one color axis
+
+    """
+    _, label, unit = SWEEP_METRICS[metric]
+    values = sweep[metric]
+    title = f"{label} ({unit})" if unit else label
+    coloraxis = {
+        "colorscale": "Viridis",
+        "colorbar": {"title": {"text": title}},
+    }
+
+    colors = values
+    finite_values = values[np.isfinite(values) & (values > 0)]
+    if reference is not None and finite_values.size:
+        # Color by the decades above or below the reference, since the
+        # values of a sweep usually span several orders of magnitude.
+        with np.errstate(invalid="ignore", divide="ignore"):
+            colors = np.log10(values / reference)
+        decades = np.arange(
+            np.floor(np.log10(finite_values.min() / reference)),
+            np.ceil(np.log10(finite_values.max() / reference)) + 1,
+        )
+        coloraxis.update(
+            colorscale="RdBu",
+            cmid=0,
+            colorbar={
+                **coloraxis["colorbar"],
+                "tickvals": decades.tolist(),
+                "ticktext": [
+                    f"{reference * 10**decade:.3g}" for decade in decades
+                ],
             },
-        ],
+        )
+
+    figure = make_subplots(
+        rows=1,
+        cols=len(n_values),
+        shared_yaxes=True,
+        horizontal_spacing=0.02,
+        subplot_titles=[f"n = {n}" for n in n_values],
+    )
+    for column, n in enumerate(n_values):
+        figure.add_trace(
+            go.Heatmap(
+                x=part_numbers,
+                y=p_backup_values,
+                z=colors[:, column, :],
+                customdata=values[:, column, :],
+                coloraxis="coloraxis",
+                hovertemplate=(
+                    "%{x}<br>P<sub>BACKUP</sub> = %{y} W<br>"
+                    f"{label} = %{{customdata:.4g}} {unit}"
+                    f"<extra>n = {n}</extra>"
+                ),
+            ),
+            row=1,
+            col=column + 1,
+        )
+
+    figure.update_xaxes(tickangle=-45)
+    figure.update_yaxes(title_text="P<sub>BACKUP</sub> (W)", col=1)
+    figure.update_layout(
+        coloraxis=coloraxis,
+        height=500,
+        margin={"t": 40},
+        template="plotly" if theme else "plotly_dark",
+        paper_bgcolor="white" if theme else "#222222",
+        plot_bgcolor="white" if theme else "#222222",
+        font_color="black" if theme else "white",
+    )
+
+    return figure
+
+
+@callback(
+    Output("sweep_graph", "figure"),
+    Input("sweep_metric_radio", "value"),
+    Input("t_backup_slider", "value"),
+    Input("eta_slider", "value"),
+    Input("v_cell_max_slider", "value"),
+    Input("alpha_b_slider", "value"),
+    Input("r_snsc_slider", "value"),
+    Input("r_snsi_slider", "value"),
+    Input("theme_switch_value_store", "data"),
+)
+def update_sweep_graph(
+    metric,
+    t_backup_slider_value,
+    eta_slider_value,
+    v_cell_max_slider_value,
+    alpha_b_slider_value,
+    r_snsc_slider_value,
+    r_snsi_slider_value,
+    theme_switch,
+):
+    """Evaluate the design space sweep and render the selected metric.
+
+    Args:
+        metric: Key of the displayed metric in ``SWEEP_METRICS``
+        t_backup_slider_value: Backup duration in s.
+        eta_slider_value: Converter efficiency (0–1).
+        v_cell_max_slider_value: Maximum cell voltage in V.
+        alpha_b_slider_value: Voltage derating factor.
+        r_snsc_slider_value: Charge sense resistor in Ω.
+        r_snsi_slider_value: Input current sense resistor in Ω.
+        theme_switch: True for light theme, False for dark theme.
+
+    Returns:
+        go.Figure: Heatmaps of the selected metric, one per stack size
+
+    """
+    _, _, i_peak = calculate_current_limits(
+        r_snsi_slider_value * si.Ohm, r_snsc_slider_value * si.Ohm
+    )
+    cap_esr_pairs = read_cap_esr_pairs_from_csv(CAP_ESR_PAIRS_FILE)
+
+    sweep = calculate_sweep(
+        cap_esr_pairs,
+        SWEEP_P_BACKUP_VALUES,
+        STACK_N_VALUES,
+        t_backup_slider_value,
+        eta_slider_value,
+        v_cell_max_slider_value,
+        alpha_b_slider_value,
+        float(i_peak.value),
+    )
+    reference = {
+        "t_backup": t_backup_slider_value,
+        "c_margin": 1,
+        "esr_margin": 1,
+    }.get(metric)
+
+    return create_sweep_figure(
+        sweep,
+        metric,
+        [part_number for _, _, part_number in cap_esr_pairs],
+        SWEEP_P_BACKUP_VALUES,
+        STACK_N_VALUES.tolist(),
+        reference,
+        theme_switch,
     )
 
 
@@ -1721,7 +2322,7 @@ def calculate_values(
         ),
     ])
 
-    cap_esr_pairs = read_cap_esr_pairs_from_csv("cap_esr_pairs.csv")
+    cap_esr_pairs = read_cap_esr_pairs_from_csv(CAP_ESR_PAIRS_FILE)
     backup_time_table = html.Div(
         create_backup_time_table(
             cap_esr_pairs,
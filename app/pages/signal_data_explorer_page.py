@@ -5,12 +5,15 @@ visualizing signal data from CSV and ZIP files containing CSV data.
 
 Key Features:
 - File upload support for CSV and ZIP files
+- Binary NPZ captures, read without parsing text
 - GitHub file selection for remote repositories
 - Interactive selection of files, frames, records, and data channels
 - Dynamic data visualizations
+- Per-channel statistics and power spectral density analysis
 - Light and dark mode support
 """
 
+import zipfile
 from typing import Any, Dict, List, Tuple
 
 import dash_bootstrap_components as dbc
@@ -21,6 +24,7 @@ from dash import (
     Output,
     State,
     callback,
+    clientside_callback,
     ctx,
     dcc,
     html,
@@ -67,6 +71,7 @@ ABOUT = (
 
 FEATURES = [
     "Support for ZIP files containing multiple CSV data files",
+    "Support for NPZ binary captures, loaded without parsing text",
     "Interactive selection of files, frames, records, and channels",
     "Multi-axis plotting capabilities for comparing different data channels",
     "Dynamic updating of data visualization based on user selections",
@@ -74,12 +79,15 @@ FEATURES = [
     "Integrated signal processing utilities for advanced data analysis",
     "Support for oscilloscope segmented memory data",
     "Customizable Y-axis placement for optimal data comparison",
+    "Decimation of long captures with zoom-dependent resolution",
+    "Per-channel statistics and power spectral density of selected frames",
     "Theme switching between light and dark modes",
     "GitHub file selection feature for accessing remote signal data",
 ]
 
 USAGE_STEPS = [
-    "Upload a ZIP file containing CSV data using the drag-and-drop area",
+    "Upload a ZIP file containing CSV data or NPZ captures using the "
+    "drag-and-drop area",
     "Alternatively, select a file from a GitHub repository",
     "Use range sliders to select specific files within the archive",
     "Adjust the frames slider to navigate between different segments",
@@ -89,6 +97,10 @@ USAGE_STEPS = [
     "Click 'View selected data' to generate the visualization",
     "Interact with the multi-axis plot to explore relationships",
     "Use zoom and pan tools to investigate areas of interest",
+    "Choose LTTB or Min/Max decimation for long captures; zooming in "
+    "reloads the visible range at full resolution",
+    "Switch on 'Analysis' to show the statistics and spectra of the "
+    "selected files and frames below the plot",
     "Toggle between light and dark themes",
 ]
 
@@ -109,7 +121,7 @@ def create_file_upload_component() -> dcc.Upload:
     }
 
     upload_text = html.Div(
-        ["Drag and Drop or ", html.A("Select a zip with csv file(s)")],
+        ["Drag and Drop or ", html.A("Select a zip with csv or npz file(s)")],
         className="text-center",
     )
 
@@ -217,6 +229,34 @@ def create_control_buttons() -> dbc.Row:
         "padding-bottom": "10px",
     }
 
+    decimation_card = dbc.Card(
+        id=f"{module_name}_decimation_card",
+        children=[
+            dbc.Label("Decimation"),
+            dbc.RadioItems(
+                id=f"{module_name}_decimation",
+                options=[
+                    {"label": label, "value": mode}
+                    for mode, label in spu.DECIMATION_MODES.items()
+                ],
+                value="lttb",
+                inline=True,
+            ),
+        ],
+        body=True,
+        style={**legend_card_style, "display": ""},
+    )
+
+    analysis_card = dbc.Card(
+        id=f"{module_name}_analysis_card",
+        children=[
+            dbc.Label("Analysis"),
+            dbc.Switch(id=f"{module_name}_analysis_switch", value=False),
+        ],
+        body=True,
+        style={**legend_card_style, "display": ""},
+    )
+
     legend_card = dbc.Card(
         id="group_legend_card",
         children=[
@@ -238,6 +278,8 @@ def create_control_buttons() -> dbc.Row:
         dbc.Col(
             [
                 dbc.Row([
+                    dbc.Col([decimation_card, html.Br()], xs=12, md=8),
+                    dbc.Col([analysis_card, html.Br()], xs=12, md=4),
                     dbc.Col([legend_card, html.Br()], xs=12, md=6),
                     dbc.Col([view_button], xs=12, md=6),
                 ])
@@ -291,6 +333,8 @@ def create_layout() -> dbc.Container:
         dbc.Col(
             [
                 dcc.Store("filtering_store", data={}),
+                dcc.Store(id=f"{module_name}_x_range_store"),
+                dcc.Store(id=f"{module_name}_graph_width_store"),
                 dcc.Loading([dcc.Graph(id=f"{module_name}_data_graph")]),
                 html.Hr(),
             ],
@@ -299,12 +343,28 @@ def create_layout() -> dbc.Container:
         )
     ])
 
+    # Analysis section
+    analysis_section = dbc.Row([
+        dbc.Col(
+            [
+                dcc.Loading([
+                    dcc.Graph(id=f"{module_name}_spectrum_graph"),
+                    html.Div(id=f"{module_name}_statistics_table"),
+                ]),
+                html.Hr(),
+            ],
+            id="analysis_column",
+            style={"display": "none"},
+        )
+    ])
+
     # Combine all sections
     main_content = header + [
         dcc.Store(id=f"{module_name}_contents_store"),
         file_upload,
         selection_section,
         graph_section,
+        analysis_section,
     ]
 
     return dbc.Container([html.Div(main_content)], fluid=True)
@@ -324,46 +384,54 @@ layout = create_layout()
     prevent_initial_call=True,
 )
 def store_uploaded_file(contents: str, filename: str) -> Dict[str, str]:
-    """Store uploaded ZIP file contents.
+    """Store an uploaded ZIP file on the server.
+
+    Only the token of the stored file is kept in the browser, so the
+    archive is not sent with every callback request.
 
     Args:
         contents: Base64 encoded file contents
         filename: Name of the uploaded file
 
     Returns:
-        Dictionary with filename and content, or no_update if not
-        a ZIP file
+        Dictionary with filename and upload token, or no_update if not
+        a valid ZIP file
 
     """
     if filename.endswith(".zip"):
-        return {"filename": filename, "content": contents}
+        try:
+            upload_token = spu.store_upload(contents)
+        except (ValueError, zipfile.BadZipFile):
+            return no_update
+        return {"filename": filename, "token": upload_token}
     return no_update
 
 
 @callback(
     Output("selection_row", "style"),
     Output("graph_column", "style", allow_duplicate=True),
+    Output("analysis_column", "style", allow_duplicate=True),
     Input(f"{module_name}_upload", "filename"),
     prevent_initial_call=True,
 )
 def toggle_file_selection_visibility(
     upload_filename: str,
-) -> Tuple[Dict[str, str], Dict[str, str]]:
+) -> Tuple[Dict[str, str], Dict[str, str], Dict[str, str]]:
     """Show/hide selection controls based on uploaded file type.
 
     Args:
         upload_filename: Name of the uploaded file
 
     Returns:
-        Tuple of style dictionaries for selection row and graph
-        column
+        Tuple of style dictionaries for selection row, graph column and
+        analysis column
 
     """
     if ctx.triggered_id == f"{module_name}_upload":
         if upload_filename.lower().endswith(".zip"):
-            return {"display": ""}, {"display": "none"}
+            return {"display": ""}, {"display": "none"}, {"display": "none"}
 
-    return {"display": "none"}, {"display": "none"}
+    return {"display": "none"}, {"display": "none"}, {"display": "none"}
 
 
 # ============================================================================
@@ -380,6 +448,7 @@ def toggle_file_selection_visibility(
     Input(f"{module_name}_records_range_slider", "max"),
     State(f"{module_name}_data_sets_range_slider", "marks"),
     Input(f"{module_name}_contents_store", "data"),
+    Input(f"{module_name}_decimation", "value"),
     prevent_initial_call=True,
 )
 def update_filtering_store(
@@ -390,6 +459,7 @@ def update_filtering_store(
     records_max: int,
     marks: Dict[str, str],
     select_contents: Dict[str, str],
+    decimation: str,
 ) -> Dict[str, Any]:
     """Update filtering parameters based on slider selections.
 
@@ -400,7 +470,8 @@ def update_filtering_store(
         value: Selected data set indices
         records_max: Maximum number of records
         marks: Data sets slider marks
-        select_contents: Uploaded file contents and metadata
+        select_contents: Uploaded file name and upload token
+        decimation: Decimation mode of the plotted traces
 
     Returns:
         Updated filtering dictionary or no_update
@@ -408,13 +479,13 @@ def update_filtering_store(
     """
     try:
         filename = select_contents["filename"]
-        contents = select_contents["content"]
+        upload_token = select_contents["token"]
 
         if not filename.lower().endswith(".zip"):
             return no_update
 
         units_info = spu.extract_info_from_zip(
-            contents, ["Horizontal Units", "Vertical Units"]
+            upload_token, ["Horizontal Units", "Vertical Units"]
         )
         horizontal_units, vertical_units = units_info.values()
 
@@ -435,10 +506,11 @@ def update_filtering_store(
             "records_max": records_max,
             "Horizontal Units": horizontal_units,
             "Vertical Units": vertical_units,
+            "decimation": decimation,
         }
         return filtering
 
-    except (TypeError, KeyError):
+    except (TypeError, KeyError, ValueError, zipfile.BadZipFile):
         return no_update
 
 
@@ -447,49 +519,169 @@ def update_filtering_store(
 # ============================================================================
 
 
+clientside_callback(
+    f"""
+    function (_relayout_data) {{
+        const graph = document.getElementById("{module_name}_data_graph");
+        const width = graph ? graph.offsetWidth : 0;
+        return width > 0 ? width : window.dash_clientside.no_update;
+    }}
+    """,
+    Output(f"{module_name}_graph_width_store", "data"),
+    Input(f"{module_name}_data_graph", "relayoutData"),
+)
+
+
 @callback(
     Output(f"{module_name}_data_graph", "figure"),
     Output("graph_column", "style"),
+    Output(f"{module_name}_x_range_store", "data"),
     Input("view_data_button", "n_clicks"),
     Input("theme_switch_value_store", "data"),
+    Input(f"{module_name}_data_graph", "relayoutData"),
     State(f"{module_name}_contents_store", "data"),
     State("filtering_store", "data"),
+    State(f"{module_name}_x_range_store", "data"),
+    State(f"{module_name}_graph_width_store", "data"),
     prevent_initial_call=True,
 )
 def update_graph(
     _view_data_button: int,
     theme_switch: bool,
+    relayout_data: Dict[str, Any],
     select_contents: Dict[str, str],
     filtering: Dict[str, Any],
-) -> Tuple[Any, Dict[str, str]]:
+    last_view: Dict[str, Any],
+    graph_width: int,
+) -> Tuple[Any, Dict[str, str], Dict[str, Any]]:
     """Update graph with filtered data from uploaded file.
 
+    Zooming the x-axis reloads the traces for the visible range, so they
+    are decimated to the zoomed range instead of the whole selection. The
+    zoomed range is kept when the theme changes or the selection is viewed
+    again with the same x-axis data. Traces are decimated to the pixel
+    width of the graph, measured in the browser after every relayout.
+
     Args:
         _view_data_button: Button click count (unused,
             triggers callback)
         theme_switch: Current theme state (light/dark)
-        select_contents: Uploaded file contents and metadata
+        relayout_data: Latest zoom or pan event of the graph
+        select_contents: Uploaded file name and upload token
         filtering: Current filtering parameters
+        last_view: Zoomed x range and x-axis data of the last figure
+        graph_width: Width of the graph in pixels, None until measured
 
     Returns:
-        Tuple of (figure object, style dictionary)
+        Tuple of (figure object, style dictionary, shown x range)
 
     """
+    x_range = None
+    if ctx.triggered_id == f"{module_name}_data_graph":
+        x_range = spu.get_relayout_x_range(relayout_data)
+        if x_range is None and not relayout_data.get("xaxis.autorange"):
+            return no_update, no_update, no_update
+    elif last_view and last_view["x_axis_data"] == filtering.get(
+        "x_axis_data"
+    ):
+        x_range = last_view["x_range"]
+
     try:
         filename = select_contents["filename"]
-        contents = select_contents["content"]
+        upload_token = select_contents["token"]
         file_extension = filename.lower().split(".")[-1]
 
         if file_extension == "zip":
             figure = spu.plot_selected_zip_contents(
-                contents, filename, filtering, theme_switch
+                upload_token,
+                filename,
+                {
+                    **filtering,
+                    "x_range": x_range,
+                    "max_points": spu.get_max_points(graph_width),
+                },
+                theme_switch,
+            )
+            return (
+                figure,
+                {"display": ""},
+                {
+                    "x_range": x_range,
+                    "x_axis_data": filtering["x_axis_data"],
+                },
             )
-            return figure, {"display": ""}
 
     except (TypeError, KeyError):
-        return no_update, {"display": "none"}
+        return no_update, {"display": "none"}, no_update
 
-    return no_update, {"display": "none"}
+    return no_update, {"display": "none"}, no_update
+
+
+@callback(
+    Output(f"{module_name}_spectrum_graph", "figure"),
+    Output(f"{module_name}_statistics_table", "children"),
+    Output("analysis_column", "style"),
+    Input("view_data_button", "n_clicks"),
+    Input("theme_switch_value_store", "data"),
+    Input(f"{module_name}_analysis_switch", "value"),
+    State(f"{module_name}_contents_store", "data"),
+    State("filtering_store", "data"),
+    prevent_initial_call=True,
+)
+def update_analysis(
+    _view_data_button: int,
+    theme_switch: bool,
+    analysis_switch: bool,
+    select_contents: Dict[str, str],
+    filtering: Dict[str, Any],
+) -> Tuple[Any, Any, Dict[str, str]]:
+    """Update the statistics and spectra of the selected data.
+
+    The analysis is cached per selection, so switching the theme or the
+    panel only recreates the figure and the table.
+
+    Args:
+        _view_data_button: Button click count (unused,
+            triggers callback)
+        theme_switch: Current theme state (light/dark)
+        analysis_switch: Whether the analysis panel is shown
+        select_contents: Uploaded file name and upload token
+        filtering: Current filtering parameters
+
+    Returns:
+        Tuple of (spectrum figure, statistics table, style dictionary)
+
+    """
+    if not analysis_switch:
+        return no_update, no_update, {"display": "none"}
+
+    try:
+        filename = select_contents["filename"]
+        analysis = spu.analyze_selected_zip_contents(
+            select_contents["token"], filename, filtering
+        )
+    except (TypeError, KeyError, ValueError, zipfile.BadZipFile):
+        return no_update, no_update, {"display": "none"}
+
+    statistics = analysis.statistics.copy()
+    numeric_columns = statistics.select_dtypes("float").columns
+    statistics[numeric_columns] = statistics[numeric_columns].map(
+        "{:.6g}".format
+    )
+    statistics_table = dbc.Table.from_dataframe(
+        statistics,
+        striped=True,
+        bordered=True,
+        hover=True,
+        size="sm",
+        color=None if theme_switch else "dark",
+    )
+
+    return (
+        spu.create_spectrum_figure(analysis, filtering, theme_switch),
+        statistics_table,
+        {"display": ""},
+    )
 
 
 @callback(
@@ -4,24 +4,30 @@ This module provides a Dash page for generating and downloading sample data.
 It allows users to specify parameters such as number of channels, frames,
 records, and sample interval. The page includes interactive controls for
 data generation and a DataTable for displaying the generated data. Users can
-also download the generated data as a CSV file.
+also download the generated data as CSV files, or as NPZ captures that the
+Signal Data Explorer reads without parsing text. The ZIP file is streamed
+from a Flask route while it is generated, so it is never held in memory.
 
 The module uses Dash components and callbacks to create an interactive
 interface for data generation and visualization.
 """
 
-import sys
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, List, Tuple
+from urllib.parse import quote
 
 import dash_bootstrap_components as dbc
+import flask
 import pages.utils.dash_component_utils as dcu
 import pages.utils.signal_processing_utils as spu
+import pages.utils.style_utils as styles
 import pandas as pd
 from dash import (
     callback,
+    clientside_callback,
     ctx,
     dash_table,
     dcc,
+    get_app,
     html,
     no_update,
     register_page,
@@ -38,6 +44,7 @@ register_page(
     order=3,
     exclude_from_nav=True,
 )
+DOWNLOAD_PATH = "/signal_data_generator/download"
 
 
 TITLE = "Signal Data Generator"
@@ -53,6 +60,7 @@ features = [
     "Real-time data preview using a DataTable",
     "Generation of multiple CSV files with customizable parameters",
     "Packaging of generated CSV files into a downloadable ZIP file",
+    "Optional NPZ binary captures for fast loading of large data sets",
     "Dynamic calculation and display of generated data size",
     "Responsive layout with theme switching support",
 ]
@@ -61,6 +69,7 @@ usage_steps = [
     "channels, frames, records, and sample interval.",
     "Preview the generated data in the interactive DataTable.",
     "Specify the number of CSV files to generate and set the base filename.",
+    "Choose CSV or NPZ as the file format of the generated captures.",
     "Click the 'Check ZIP size' button to see the "
     "estimated size of the generated data.",
     "Click the 'Download ZIP' button to generate and download "
@@ -127,9 +136,25 @@ layout = dbc.Container(
                             value="my_zip_file",
                         ),
                         dcc.Store(id="data_store"),
-                        dcc.Download(id="download_dataframe_csv"),
+                        dcc.Store(id=f"{module_name}_download_url_store"),
                         dbc.Col(
                             [
+                                dbc.Label(
+                                    "File format",
+                                    className=styles.CENTER_CLASS_NAME,
+                                ),
+                                dbc.RadioItems(
+                                    id=f"{module_name}_file_format",
+                                    options=[
+                                        {"label": label, "value": file_format}
+                                        for file_format, label in (
+                                            spu.CAPTURE_FILE_FORMATS.items()
+                                        )
+                                    ],
+                                    value="csv",
+                                    inline=True,
+                                    className=styles.CENTER_CLASS_NAME,
+                                ),
                                 dbc.Row([
                                     dcu.create_labeled_button(
                                         f"{module_name}_check_size",
@@ -217,8 +242,56 @@ def store_buttons_states(*states: Any) -> Dict[str, Any]:
     return input_states
 
 
+@get_app().server.route(f"{DOWNLOAD_PATH}/<download_token>")
+def download_zip_file(download_token: str) -> flask.Response:
+    """Stream a zip file registered by ``download_multiple_csv``.
+
+    The zip file is generated while it is sent, so it is never held in
+    memory as a whole.
+
+    Args:
+        download_token (str): Token of the download.
+
+    Returns:
+        flask.Response: Streamed zip file, or 404 if the download expired.
+
+    """
+    try:
+        download = spu.get_zip_download(download_token)
+    except ValueError as error:
+        return flask.Response(str(error), status=404, mimetype="text/plain")
+
+    return flask.Response(
+        spu.iter_zip_file(
+            download.app_state,
+            download.channel_data,
+            download.base_filename,
+            download.module_prefix,
+            download.file_format,
+        ),
+        mimetype="application/zip",
+        headers={
+            "Content-Disposition": "attachment; filename*=UTF-8''"
+            + quote(download.zip_filename)
+        },
+    )
+
+
+clientside_callback(
+    """
+    function (download_url) {
+        if (download_url) {
+            window.location.assign(download_url);
+        }
+    }
+    """,
+    Input(f"{module_name}_download_url_store", "data"),
+    prevent_initial_call=True,
+)
+
+
 @callback(
-    Output("download_dataframe_csv", "data"),
+    Output(f"{module_name}_download_url_store", "data"),
     Output(f"{module_name}_download_zip_label", "children"),
     Output(f"{module_name}_check_size_label", "children"),
     Input(f"{module_name}_download_zip_button", "n_clicks"),
@@ -227,6 +300,7 @@ def store_buttons_states(*states: Any) -> Dict[str, Any]:
     State("data_store", "data"),
     State(f"{module_name}_csv_filename", "value"),
     State(f"{module_name}_zip_filename", "value"),
+    State(f"{module_name}_file_format", "value"),
     prevent_initial_call=True,
 )
 def download_multiple_csv(
@@ -236,13 +310,15 @@ def download_multiple_csv(
     data_store: Dict[str, Any],
     csv_filename: str,
     zip_filename: str,
-) -> Dict[str, Union[str, bytes]]:
-    """Generate multiple CSV files and package them into a zip file.
+    file_format: str,
+) -> Tuple[str, str, str]:
+    """Start the download of multiple CSV files packaged in a zip file.
 
-    This callback function is triggered when the download multiple CSV button
-    is clicked. It generates the specified number of CSV files, each
-    containing channel data and sine wave data, and packages them into a
-    single zip file for download.
+    This callback function is triggered when the download ZIP or check size
+    button is clicked. A download registers the zip file parameters and
+    returns the URL of ``download_zip_file``, which the browser opens to
+    stream the zip file. A size check writes the zip file to a byte counter
+    and reports its size.
 
     Args:
         _download_zip_button (int):
@@ -255,15 +331,32 @@ def download_multiple_csv(
             downloaded and column information for the DataFrame.
         csv_filename (str): The base name for the CSV files to be generated.
         zip_filename (str): The name for the resulting zip file.
+        file_format (str): The format of the generated files, a key of
+            ``spu.CAPTURE_FILE_FORMATS``.
 
     Returns:
-        Dict[str, Union[str, bytes]]: A dictionary with zip file data for
-        download, compatible with Dash's dcc.send_bytes function.
+        Tuple[str, str, str]: The download URL and the texts of the download
+        and check size labels.
 
     """
-    content = spu.create_zip_file(
-        state, data_store, csv_filename, module_name
-    )
+    trigger_id = ctx.triggered[0]["prop_id"].split(".")[0]
+
+    if trigger_id == f"{module_name}_download_zip_button":
+        download_token = spu.register_zip_download(
+            spu.ZipDownload(
+                state,
+                data_store,
+                csv_filename,
+                module_name,
+                file_format,
+                f"{zip_filename.split('.')[0]}.zip",
+            )
+        )
+        return (
+            f"{DOWNLOAD_PATH}/{download_token}",
+            "Download started",
+            no_update,
+        )
 
     def format_zip_size(size_bytes):
         if size_bytes < 1024:
@@ -272,16 +365,11 @@ def download_multiple_csv(
             return f"{size_bytes / 1024:.1f} kB"
         return f"{size_bytes / (1024**2):.1f} MB"
 
-    zip_size = format_zip_size(sys.getsizeof(content))
-
-    trigger_id = ctx.triggered[0]["prop_id"].split(".")[0]
-
-    if trigger_id == f"{module_name}_download_zip_button":
-        download_zip_file = dcc.send_bytes(
-            content, f"{zip_filename.split('.')[0]}.zip"
+    zip_size = format_zip_size(
+        spu.measure_zip_file(
+            state, data_store, csv_filename, module_name, file_format
         )
-        return download_zip_file, f"{zip_size} downloaded", no_update
-
+    )
     return no_update, no_update, f"{zip_size} to download"
 
 
@@ -23,27 +23,20 @@ comprehensive styling support for both light and dark themes.
 import dash_ag_grid as dag
 import dash_bootstrap_components as dbc
 import pages.utils.dash_component_utils as dcu
+import pages.utils.dataset_utils as dsu
 import pages.utils.style_utils as styles
-import pandas as pd
 from dash import dcc, html, register_page
 
 link_name = __name__.rsplit(".", maxsplit=1)[-1].replace("_page", "").title()
 module_name = __name__.rsplit(".", maxsplit=1)[-1]
 
-register_page(__name__, name=link_name, order=5)
+dataset_file = "data/UNITED_COUPLED_INDUCTORS_DATA_BASE.csv"
 
-ag_grid_data: pd.DataFrame = pd.read_csv(
-    "data/UNITED_COUPLED_INDUCTORS_DATA_BASE.csv"
-)
-total_rows = len(ag_grid_data)
-
-TITLE = f"Coupled inductors Database ({total_rows:,} items)"
-ABOUT = (
-    "The coupled inductors Database is an interactive web application that "
-    "provides a comprehensive view of inductor specifications.",
-    "It allows users to easily browse, search, and filter "
-    f"through a database of {total_rows:,} coupled inductors, "
-    "providing quick access to important information and datasheets.",
+register_page(
+    __name__,
+    name=link_name,
+    order=5,
+    dataset=dataset_file,
 )
 
 features = [
@@ -80,57 +73,89 @@ hidden_columns = [
 ]
 
 visible_columns = [
-    col for col in ag_grid_data.columns if col not in hidden_columns
+    col
+    for col in dsu.get_columns(dataset_file)
+    if col not in hidden_columns
 ]
 
-# Convert specific columns to markdown format links for AG Grid
+# Columns rendered as markdown format links in AG Grid
 url_columns = ["Datasheet", "Trustedparts Search", "3dviewer Link"]
 
-for col in url_columns:
-    if col in ag_grid_data.columns:
-        ag_grid_data[col] = ag_grid_data[col].apply(
-            lambda url: f"[{col}]({url})" if pd.notna(url) and url else ""
-        )
-
-layout = dbc.Container(
-    [
-        html.Div(
-            [
-                dbc.Row([dbc.Col([dcc.Link("Go back Home", href="/")])]),
-                dbc.Row([
-                    dbc.Col([
-                        html.H3(
-                            f"{link_name.replace('_', ' ')} "
-                            f"({total_rows:,} items)",
-                            style=styles.heading_3_style,
+
+def layout(**_kwargs: str) -> dbc.Container:
+    """Build the page layout.
+
+    The table rows are served by the grid's infinite row model, so the
+    database is only loaded once the grid requests its first block.
+
+    Args:
+        **_kwargs: URL query parameters passed by Dash pages (unused).
+
+    Returns:
+        dbc.Container: The page layout.
+
+    """
+    total_rows = dsu.get_row_count(dataset_file)
+    title = f"Coupled inductors Database ({total_rows:,} items)"
+    about = (
+        "The coupled inductors Database is an interactive web application "
+        "that provides a comprehensive view of inductor specifications.",
+        "It allows users to easily browse, search, and filter "
+        f"through a database of {total_rows:,} coupled inductors, "
+        "providing quick access to important information and datasheets.",
+    )
+
+    return dbc.Container(
+        [
+            html.Div(
+                [
+                    dbc.Row([dbc.Col([dcc.Link("Go back Home", href="/")])]),
+                    dbc.Row([
+                        dbc.Col([
+                            html.H3(
+                                f"{link_name.replace('_', ' ')} "
+                                f"({total_rows:,} items)",
+                                style=styles.heading_3_style,
+                            ),
+                        ]),
+                    ]),
+                    dbc.Row([
+                        dcu.app_description(
+                            title,
+                            about,
+                            features,
+                            usage_steps,
                         ),
                     ]),
-                ]),
-                dbc.Row([
-                    dcu.app_description(TITLE, ABOUT, features, usage_steps),
-                ]),
-                dcu.ag_grid_table_controls_row(
-                    module_name,
-                    ag_grid_data,
-                    visible_columns,
-                ),
-                dag.AgGrid(
-                    id=f"{module_name}_ag_grid_table",
-                    rowData=ag_grid_data.to_dict("records"),
-                    defaultColDef={"filter": True},
-                    style={"height": 200},
-                ),
-            ],
-            style=styles.GLOBAL_STYLE,
-        ),
-    ],
-    fluid=True,
-)
+                    dcu.ag_grid_table_controls_row(
+                        module_name,
+                        dsu.get_columns(dataset_file),
+                        visible_columns,
+                    ),
+                    dag.AgGrid(
+                        id=f"{module_name}_ag_grid_table",
+                        rowModelType="infinite",
+                        defaultColDef={"filter": True},
+                        style={"height": 200},
+                    ),
+                ],
+                style=styles.GLOBAL_STYLE,
+            ),
+        ],
+        fluid=True,
+    )
+
 
 dcu.callback_update_ag_grid_visible_table_columns(
     f"{module_name}_ag_grid_table",
     f"{module_name}_column_toggle",
-    ag_grid_data,
+    dsu.get_columns(dataset_file),
+    url_columns,
+)
+
+dcu.callback_update_ag_grid_rows(
+    f"{module_name}_ag_grid_table",
+    dataset_file,
     url_columns,
 )
 
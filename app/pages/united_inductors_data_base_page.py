@@ -20,33 +20,23 @@ Bootstrap components for a polished user interface and includes
 comprehensive styling support for both light and dark themes.
 """
 
-from typing import Any
-
 import dash_ag_grid as dag
 import dash_bootstrap_components as dbc
 import pages.utils.dash_component_utils as dcu
+import pages.utils.dataset_utils as dsu
 import pages.utils.style_utils as styles
-import pandas as pd
-import plotly.graph_objects as go
-from dash import Input, Output, callback, dcc, html, register_page
+from dash import dcc, html, register_page
 
 link_name = __name__.rsplit(".", maxsplit=1)[-1].replace("_page", "").title()
 module_name = __name__.rsplit(".", maxsplit=1)[-1]
 
-register_page(__name__, name=link_name, order=9)
-
-ag_grid_data: pd.DataFrame = pd.read_csv(
-    "data/UNITED_INDUCTORS_DATA_BASE.csv"
-)
-total_rows = len(ag_grid_data)
+dataset_file = "data/UNITED_INDUCTORS_DATA_BASE.csv"
 
-TITLE = f"Inductors Database ({total_rows:,} items)"
-ABOUT = (
-    "The Inductors Database is an interactive web application that "
-    "provides a comprehensive view of inductor specifications.",
-    "It allows users to easily browse, search, and filter "
-    f"through a database of {total_rows:,} inductors, "
-    "providing quick access to important information and datasheets.",
+register_page(
+    __name__,
+    name=link_name,
+    order=9,
+    dataset=dataset_file,
 )
 
 features = [
@@ -86,82 +76,126 @@ hidden_columns = [
 ]
 
 visible_columns = [
-    col for col in ag_grid_data.columns if col not in hidden_columns
+    col
+    for col in dsu.get_columns(dataset_file)
+    if col not in hidden_columns
 ]
 
-# Convert specific columns to markdown format links for AG Grid
+# Columns rendered as markdown format links in AG Grid
 url_columns = ["Datasheet", "Trustedparts Search", "3dviewer Link"]
 
-for col in url_columns:
-    if col in ag_grid_data.columns:
-        ag_grid_data[col] = ag_grid_data[col].apply(
-            lambda url: f"[{col}]({url})" if pd.notna(url) and url else ""
-        )
 
-layout = dbc.Container(
-    [
-        html.Div(
-            [
-                dbc.Row([dbc.Col([dcc.Link("Go back Home", href="/")])]),
-                dbc.Row([
-                    dbc.Col([
-                        html.H3(
-                            f"{link_name.replace('_', ' ')} "
-                            f"({total_rows:,} items)",
-                            style=styles.heading_3_style,
+def layout(**_kwargs: str) -> dbc.Container:
+    """Build the page layout, loading the database on first request.
+
+    Args:
+        **_kwargs: URL query parameters passed by Dash pages (unused).
+
+    Returns:
+        dbc.Container: The page layout.
+
+    """
+    total_rows = dsu.get_row_count(dataset_file)
+    title = f"Inductors Database ({total_rows:,} items)"
+    about = (
+        "The Inductors Database is an interactive web application that "
+        "provides a comprehensive view of inductor specifications.",
+        "It allows users to easily browse, search, and filter "
+        f"through a database of {total_rows:,} inductors, "
+        "providing quick access to important information and datasheets.",
+    )
+
+    ag_grid_data = dsu.load_dataset(dataset_file, url_columns)
+    slider_row, _ = dcu.generate_range_slider(
+        module_name,
+        ag_grid_data,
+        20,
+    )
+
+    return dbc.Container(
+        [
+            html.Div(
+                [
+                    dbc.Row([dbc.Col([dcc.Link("Go back Home", href="/")])]),
+                    dbc.Row([
+                        dbc.Col([
+                            html.H3(
+                                f"{link_name.replace('_', ' ')} "
+                                f"({total_rows:,} items)",
+                                style=styles.heading_3_style,
+                            ),
+                        ]),
+                    ]),
+                    dbc.Row([
+                        dcu.app_description(
+                            title,
+                            about,
+                            features,
+                            usage_steps,
                         ),
                     ]),
-                ]),
-                dbc.Row([
-                    dcu.app_description(TITLE, ABOUT, features, usage_steps),
-                ]),
-                dcu.generate_range_slider(module_name, ag_grid_data, 20)[0],
-                html.Hr(),
-                dbc.Row([
-                    dcc.Loading(
-                        [
-                            dcc.Graph(
-                                id=f"{module_name}_bar_graph",
-                                config={"displaylogo": False},
-                            ),
-                        ],
-                        delay_show=100,
-                        delay_hide=100,
+                    slider_row,
+                    html.Hr(),
+                    dbc.Row([
+                        dcc.Loading(
+                            [
+                                dcc.Graph(
+                                    id=f"{module_name}_bar_graph",
+                                    config={"displaylogo": False},
+                                ),
+                            ],
+                            delay_show=100,
+                            delay_hide=100,
+                        ),
+                    ]),
+                    dcu.ag_grid_table_controls_row(
+                        module_name,
+                        dsu.get_columns(dataset_file),
+                        visible_columns,
                     ),
-                ]),
-                dcu.ag_grid_table_controls_row(
-                    module_name,
-                    ag_grid_data,
-                    visible_columns,
-                ),
-                dag.AgGrid(
-                    id=f"{module_name}_ag_grid_table",
-                    rowData=ag_grid_data.to_dict("records"),
-                    defaultColDef={"filter": True},
-                    style={"height": 200},
-                ),
-            ],
-            style=styles.GLOBAL_STYLE,
-        ),
-    ],
-    fluid=True,
-)
+                    dag.AgGrid(
+                        id=f"{module_name}_ag_grid_table",
+                        rowModelType="infinite",
+                        defaultColDef={"filter": True},
+                        style={"height": 200},
+                    ),
+                ],
+                style=styles.GLOBAL_STYLE,
+            ),
+        ],
+        fluid=True,
+    )
+
+
+def get_initial_marks() -> dict[int, float]:
+    """Get the range slider marks of the database.
+
+    Returns:
+        dict[int, float]: Slider marks keyed by value index.
+
+    """
+    ag_grid_data = dsu.load_dataset(dataset_file, url_columns)
+    return dcu.generate_range_slider(module_name, ag_grid_data, 20)[1]
+
 
 dcu.callback_update_ag_grid_visible_table_columns(
     f"{module_name}_ag_grid_table",
     f"{module_name}_column_toggle",
-    ag_grid_data,
+    dsu.get_columns(dataset_file),
+    url_columns,
+)
+
+dcu.callback_update_ag_grid_rows(
+    f"{module_name}_ag_grid_table",
+    dataset_file,
     url_columns,
 )
 
 dcu.callback_update_ag_grid_table_theme(f"{module_name}_ag_grid_table")
 
-_, initial_marks = dcu.generate_range_slider(
-    module_name, ag_grid_data, 20
-)
 dcu.callback_update_rangeslider_marks_theme(
     f"{module_name}_value_rangeslider",
-    initial_marks,
+    get_initial_marks,
 )
 
 dcu.save_previous_slider_state_callback(
@@ -170,250 +204,21 @@ dcu.save_previous_slider_state_callback(
     20,
 )
 
-
-def get_visible_y_max(
-    figure_data: list[go.Bar],
-    x_range: tuple[int, int],
-) -> int:
-    """Get the maximum y value within the visible x range.
-
-    Args:
-        figure_data (list[go.Bar]): List of bar traces in the figure.
-        x_range (tuple[int, int]): The visible x-axis range.
-
-    Returns:
-        int: The maximum y value within the visible x range.
-
-    """
-    x_min, x_max = x_range
-    maximum_y_value = 0
-
-    for trace in figure_data:
-        # Get positions within range
-        positions = range(len(trace.x))
-        visible_positions = [
-            index for index in positions if x_min <= index <= x_max
-        ]
-
-        if visible_positions:
-            y_values = [trace.y[index] for index in visible_positions]
-            maximum_y_value += max(y_values)
-
-    return maximum_y_value
-
-
-@callback(
-    Output(f"{module_name}_bar_graph", "figure"),
-    Input("theme_switch_value_store", "data"),
-    Input(f"{module_name}_value_rangeslider", "value"),
+dcu.callback_update_value_distribution_graph(
+    f"{module_name}_bar_graph",
+    f"{module_name}_value_rangeslider",
+    dataset_file,
+    url_columns,
+    dcu.DistributionGraphConfig(
+        x_axis_title="Indunctance Value",
+        y_axis_title="Number of Inductors",
+        title="Indunctance Value Distribution (Tolerances: {groups})",
+        marker_hovertemplate=(
+            "Inductance: %{x}<br>MPN: %{text}<extra></extra>"
+        ),
+        bar_hovertemplate=(
+            "Indunctance: %{x}<br>"
+            "Number of Inductors: %{y}<extra></extra>"
+        ),
+    ),
 )
-def update_distribution_graph(
-    theme_switch: bool,  # noqa: FBT001
-    rangeslider_value: list[int],
-) -> tuple[Any, dict[str, Any]]:
-    """Create a bar graph showing the distribution of components values.
-
-    Args:
-        theme_switch (bool): Indicates the current theme (light/dark).
-        rangeslider_value:
-            Range slider values for filtering components values.
-
-    Returns:
-        Plotly figure with components distribution visualization.
-
-    """
-    # Prepare full data range
-    values, _ = dcu.extract_consecutive_value_groups(
-        ag_grid_data["Value"].to_list(),
-    )
-
-    # Dynamically extract all unique tolerances
-    tolerances = sorted(ag_grid_data["Tolerance"].unique())
-
-    # Create tolerance-based dataframes and configurations
-    tolerance_configs = [
-        {
-            "dataframe": ag_grid_data[ag_grid_data["Tolerance"] == tolerance],
-            "name": f"{tolerance} Tolerance",
-        }
-        for tolerance in tolerances
-    ]
-
-    # Existing figure layout configuration
-    figure_layout = {
-        "xaxis": {
-            "gridcolor": "#808080",
-            "griddash": "dash",
-            "zerolinecolor": "lightgray",
-            "zeroline": False,
-            "domain": (0.0, 1.0),
-            "showgrid": True,
-            "title": {
-                "text": "Indunctance Value",
-                "standoff": 10,
-                "font": {"color": "#808080"},
-            },
-            "title_font_weight": "bold",
-            "tickmode": "array",
-            "tickangle": -45,
-            "fixedrange": True,
-            "tickfont": {"color": "#808080", "weight": "bold"},
-        },
-        "yaxis": {
-            "gridcolor": "#808080",
-            "griddash": "dash",
-            "zerolinecolor": "lightgray",
-            "zeroline": False,
-            "tickangle": -45,
-            "title_font_weight": "bold",
-            "position": 0.0,
-            "title": {
-                "text": "Number of Inductors",
-                "font": {"color": "#808080"},
-            },
-            "fixedrange": True,
-            "tickfont": {"color": "#808080", "weight": "bold"},
-            "showgrid": True,
-            "anchor": "free",
-            "autorange": True,
-            "tickformat": ".0f",
-            "dtick": 2,
-            "tickmode": "linear",
-        },
-        "title": {
-            "text": "Indunctance Value Distribution "
-            f"(Tolerances: {', '.join(tolerances)})",
-            "x": 0.5,
-            "xanchor": "center",
-        },
-        "showlegend": True,
-    }
-
-    # Create the figure
-    figure = go.Figure(layout=figure_layout)
-
-    # Add traces for each tolerance group
-    for config in tolerance_configs:
-        # Extract values and counts
-        values_tolerance, counts_tolerance = (
-            dcu.extract_consecutive_value_groups(
-                config["dataframe"]["Value"].to_list(),
-            )
-        )
-
-        # Pad values and counts to match full range
-        values_tolerance, counts_tolerance = dcu.pad_values_and_counts(
-            values,
-            values_tolerance,
-            counts_tolerance,
-        )
-
-        # Add trace for this tolerance group
-        figure.add_trace(
-            go.Bar(
-                x=values_tolerance,
-                y=counts_tolerance,
-                name=config["name"],
-                textposition="none",
-                textangle=-30,
-                text=counts_tolerance,
-                hovertemplate=(
-                    "Indunctance: %{x}<br>"
-                    "Number of Inductors: %{y}<extra></extra>"
-                ),
-            ),
-        )
-
-    # In update_distribution_graph function:
-    x_min, x_max = rangeslider_value[0], rangeslider_value[1]
-    y_max = get_visible_y_max(figure.data, (x_min, x_max))
-
-    # Add scatter traces for all tolerances
-    for tolerance in tolerances:
-        tolerance_data = ag_grid_data[ag_grid_data["Tolerance"] == tolerance]
-        scatter_x = []
-        scatter_y = []
-        scatter_mpn = []  # Track MPN for each point
-
-        # Track cumulative heights at each x position
-        cumulative_heights = {}
-
-        for value in tolerance_data["Value"].unique():
-            value_data = tolerance_data[tolerance_data["Value"] == value]
-            count = len(value_data)
-            base_height = 0
-
-            # Get the base height from previous tolerance bars
-            for trace in figure.data:
-                if isinstance(trace, go.Bar):
-                    value_index = list(trace.x).index(value)
-                    if trace.name == f"{tolerance} Tolerance":
-                        break
-                    base_height += trace.y[value_index]
-
-            # Add dots stacked on top of base height
-            for dot_position, mpn in enumerate(value_data["MPN"]):
-                scatter_x.append(value)
-                scatter_y.append(base_height + dot_position + 0.5)
-                scatter_mpn.append(mpn)
-
-            cumulative_heights[value] = base_height + count
-
-        figure.add_trace(
-            go.Scatter(
-                x=scatter_x,
-                y=scatter_y,
-                mode="markers",
-                name=f"{tolerance} Values",
-                text=scatter_mpn,  # Add MPN as text
-                hovertemplate=(
-                    "Inductance: %{x}<br>MPN: %{text}<extra></extra>"
-                ),
-            ),
-        )
-
-    # Update layout with new ranges
-    figure.update_layout(
-        xaxis_range=[x_min - 0.5, x_max + 0.5],
-        yaxis_range=[0, y_max],
-        yaxis_autorange=False,
-        legend={
-            "orientation": "h",
-            "yanchor": "bottom",
-            "xanchor": "center",
-            "y": -0.5,
-            "x": 0.5,
-        },
-    )
-
-    # Define theme settings
-    theme = {
-        "template": "plotly" if theme_switch else "plotly_dark",
-        "paper_bgcolor": "white" if theme_switch else "#222222",
-        "plot_bgcolor": "white" if theme_switch else "#222222",
-        "font_color": "black" if theme_switch else "white",
-        "margin": {"l": 0, "r": 0, "t": 50, "b": 50},
-    }
-
-    # Update figure layout with theme and remove unnecessary modebar options
-    figure.update_layout(
-        **theme,
-        barmode="stack",
-        bargap=0.0,
-        bargroupgap=0.05,
-        modebar={
-            "remove": [
-                "zoom",
-                "pan",
-                "select2d",
-                "lasso2d",
-                "zoomIn2d",
-                "zoomOut2d",
-                "autoScale2d",
-                "resetScale2d",
-                "toImage",
-            ],
-        },
-    )
-
-    return figure
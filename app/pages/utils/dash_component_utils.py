@@ -4,16 +4,24 @@ This module contains utility functions for creating and managing
 Dash components, particularly for tables and their styling.
 """
 
-from typing import Any, Callable
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, NamedTuple
 
 import dash_bootstrap_components as dbc
+import numpy as np
+import pages.utils.dataset_utils as dsu
 import pages.utils.signal_processing_utils as spu
 import pages.utils.style_utils as styles
 import pandas as pd
-from dash import callback, ctx, dcc, html, no_update
+import plotly.graph_objects as go
+from dash import Patch, callback, ctx, dcc, html, no_update
 from dash.dependencies import ALL, MATCH, Input, Output, State, Union
 from dash.exceptions import PreventUpdate
 
+AG_GRID_BLOCK_SIZE = 100
+DISTRIBUTION_CACHE_SIZE = 8
+
 
 def app_description(
     title: str,
@@ -246,7 +254,7 @@ def callback_update_visible_columns(
 def callback_update_ag_grid_visible_table_columns(
     table_id: str,
     checklist_id: str,
-    dataframe: pd.DataFrame,
+    columns: list[str],
     url_columns: list[str],
 ) -> None:
     """Create a callback function to update AG Grid table columns visibility.
@@ -267,9 +275,9 @@ def callback_update_ag_grid_visible_table_columns(
         checklist_id (str):
             The ID of the Checklist component that controls column visibility.
             This component should have column names as its options.
-        dataframe (pd.DataFrame):
-            The source DataFrame containing all possible columns and data.
-            Used to filter and format data based on selected columns.
+        columns (list[str]):
+            All columns of the source database, in display order.
+            Used to build the column definitions of the visible columns.
         url_columns (list[str]):
             A list of column names that should be treated as URL links
 
@@ -278,6 +286,32 @@ def callback_update_ag_grid_visible_table_columns(
             This function registers a callback with Dash and doesn't return
 
     """
+    columnDefs = []
+    for col in columns:
+        col_def = {
+            "field": col,
+            "headerName": col,
+            "wrapText": True,
+            "autoHeight": True,
+            "maxWidth": 300,
+            "cellClass": "centered-cell",
+            "cellStyle": {
+                "white-space": "normal",
+                "line-height": "1.2em",
+                "padding": "15px",
+            },
+        }
+        if col in url_columns:
+            col_def.update({
+                "cellRenderer": "markdown",
+                "cellStyle": {
+                    "textAlign": "center",
+                    "white-space": "normal",
+                    "line-height": "1.2em",
+                    "padding": "15px",
+                },
+            })
+        columnDefs.append(col_def)
 
     @callback(
         Output(table_id, "columnDefs"),
@@ -308,35 +342,10 @@ def callback_update_ag_grid_visible_table_columns(
             "resizable": True,
             "suppressColumnVirtualisation": True,
             "animateRows": False,
+            "cacheBlockSize": AG_GRID_BLOCK_SIZE,
+            "maxBlocksInCache": 10,
         }
 
-        columnDefs = []
-        for col in dataframe.columns:
-            col_def = {
-                "field": col,
-                "headerName": col,
-                "wrapText": True,
-                "autoHeight": True,
-                "maxWidth": 300,
-                "cellClass": "centered-cell",
-                "cellStyle": {
-                    "white-space": "normal",
-                    "line-height": "1.2em",
-                    "padding": "15px",
-                },
-            }
-            if col in url_columns:
-                col_def.update({
-                    "cellRenderer": "markdown",
-                    "cellStyle": {
-                        "textAlign": "center",
-                        "white-space": "normal",
-                        "line-height": "1.2em",
-                        "padding": "15px",
-                    },
-                })
-            columnDefs.append(col_def)
-
         filtered_list = [
             item
             for item in columnDefs
@@ -363,6 +372,70 @@ def callback_update_ag_grid_visible_table_columns(
         return "autoSize"
 
 
+def callback_update_ag_grid_rows(
+    table_id: str,
+    dataset_file: str,
+    url_columns: list[str],
+) -> None:
+    """Create a callback serving AG Grid rows from the server.
+
+    The table must use the infinite row model. Whenever the grid requests a
+    block of rows, the callback filters and sorts the cached database with
+    the grid's filter and sort models and returns only that block, so the
+    full table is never sent to the browser.
+
+    Args:
+        table_id (str):
+            The ID of the AG Grid table component using
+            ``rowModelType="infinite"``.
+        dataset_file (str):
+            Path of the database CSV file shown in the table.
+        url_columns (list[str]):
+            A list of column names that should be treated as URL links
+
+    Returns:
+        None:
+            This function registers a callback with Dash and doesn't return
+
+    """
+
+    @callback(
+        Output(table_id, "getRowsResponse"),
+        Input(table_id, "getRowsRequest"),
+    )
+    def update_rows(request: dict | None) -> dict[str, Any]:
+        """Return the block of rows requested by the grid.
+
+        Args:
+            request: Block request with ``startRow``, ``endRow``,
+                ``filterModel`` and ``sortModel`` entries.
+
+        Returns:
+            Dictionary with the ``rowData`` of the block and the total
+            ``rowCount`` of the filtered table.
+
+        """
+        if request is None:
+            raise PreventUpdate
+
+        dataframe = dsu.query_dataset(
+            dataset_file,
+            url_columns,
+            request.get("filterModel"),
+            request.get("sortModel"),
+        )
+        start_row = request.get("startRow", 0)
+        end_row = request.get("endRow", start_row + AG_GRID_BLOCK_SIZE)
+        block = dataframe.iloc[start_row:end_row]
+
+        return {
+            "rowData": block.astype(object)
+            .where(block.notna(), None)
+            .to_dict("records"),
+            "rowCount": len(dataframe),
+        }
+
+
 def create_column_definitions(
     dataframe: pd.DataFrame,
     visible_columns: list[str] = None,
@@ -582,7 +655,7 @@ def table_controls_row(
 
 def ag_grid_table_controls_row(
     module_name: str,
-    dataframe: pd.DataFrame,
+    columns: list[str],
     visible_columns: list[str],
 ) -> dbc.Row:
     """Create a row of controls for a data table.
@@ -593,8 +666,8 @@ def ag_grid_table_controls_row(
 
     Args:
         module_name (str): A unique identifier prefix for component IDs.
-        dataframe (pd.DataFrame):
-            The source DataFrame to derive column options.
+        columns (list[str]):
+            All columns of the source database to derive column options.
         visible_columns (Optional[List[str]], optional):
             Initial list of visible columns.
             Defaults to all columns if not provided.
@@ -604,7 +677,7 @@ def ag_grid_table_controls_row(
 
     """
     if visible_columns is None:
-        visible_columns = list(dataframe.columns)
+        visible_columns = list(columns)
 
     col_right = dbc.Col(
         [
@@ -614,7 +687,7 @@ def ag_grid_table_controls_row(
                     id=f"{module_name}_column_toggle",
                     options=[
                         {"label": " ".join(col.split()), "value": col}
-                        for col in dataframe.columns
+                        for col in columns
                     ],
                     value=visible_columns,
                     inline=True,
@@ -766,24 +839,409 @@ def pad_values_and_counts(
         - A list of corresponding counts (with zero for missing values)
 
     """
-    padded_specific_values = []
-    padded_specific_counts = []
-
-    for val in values:
-        if val in specific_values:
-            index = specific_values.index(val)
-            padded_specific_values.append(val)
-            padded_specific_counts.append(specific_counts[index])
-        else:
-            padded_specific_values.append(val)
-            padded_specific_counts.append(0)
+    counts_by_value: dict[Any, int] = {}
+    for val, count in zip(specific_values, specific_counts):
+        counts_by_value.setdefault(val, count)
+
+    return list(values), [counts_by_value.get(val, 0) for val in values]
+
+
+class DistributionGraphConfig(NamedTuple):
+    """Labels and styling of a value distribution graph.
+
+    Attributes:
+        x_axis_title: Title of the value axis
+        y_axis_title: Title of the count axis
+        title: Graph title, ``{groups}`` is replaced by the group names
+        marker_hovertemplate: Hover template of the MPN markers
+        bar_hovertemplate: Hover template of the bars, or None to disable
+            bar hover labels
+        height: Graph height in pixels, or None for the default height
+        bargroupgap: Gap between bars of adjacent values
+
+    """
+
+    x_axis_title: str
+    y_axis_title: str
+    title: str
+    marker_hovertemplate: str
+    bar_hovertemplate: str | None = None
+    height: int | None = None
+    bargroupgap: float = 0.05
+
+
+class ValueDistribution(NamedTuple):
+    """Stacked value distribution of a component database.
+
+    Attributes:
+        values: Values in database order, one per bar
+        groups: Sorted tolerance groups, one bar trace per group
+        counts: Number of components per group and value, with shape
+            ``(len(groups), len(values))``
+        markers: Per group, the value, stacked height and MPN of every
+            component of the group
+
+    """
+
+    values: list[Any]
+    groups: list[Any]
+    counts: np.ndarray
+    markers: list[pd.DataFrame]
+
+
+_distribution_lock = threading.Lock()
+_distribution_cache: OrderedDict[
+    int,
+    tuple[pd.DataFrame, ValueDistribution],
+] = OrderedDict()
+_distribution_figure_cache: OrderedDict[
+    tuple[int, DistributionGraphConfig, bool],
+    tuple[pd.DataFrame, dict[str, Any]],
+] = OrderedDict()
+
+
+def build_value_distribution(dataframe: pd.DataFrame) -> ValueDistribution:
+    """Build the stacked value distribution of a component database.
+
+    Counts are computed with a single crosstab of tolerance and value, and
+    the stacked height of every MPN marker from the cumulative counts of
+    the preceding tolerance groups. Results are cached per frame, so the
+    distribution of a cached database is only computed once.
+
+    Args:
+        dataframe (pd.DataFrame): Database with ``Value``, ``Tolerance`` and
+            ``MPN`` columns
+
+    Returns:
+        ValueDistribution: Counts and marker positions of the database
 
-    return padded_specific_values, padded_specific_counts
+    """
+    with _distribution_lock:
+        cached = _distribution_cache.get(id(dataframe))
+        if cached is not None and cached[0] is dataframe:
+            _distribution_cache.move_to_end(id(dataframe))
+            return cached[1]
+
+    values, _ = extract_consecutive_value_groups(dataframe["Value"].to_list())
+    groups = sorted(dataframe["Tolerance"].unique())
+
+    counts = (
+        pd.crosstab(dataframe["Tolerance"], dataframe["Value"])
+        .reindex(index=groups, columns=values, fill_value=0)
+        .to_numpy()
+    )
+    bases = counts.cumsum(axis=0) - counts
+
+    value_positions: dict[Any, int] = {}
+    for position, value in enumerate(values):
+        value_positions.setdefault(value, position)
+
+    value_index = dataframe["Value"].map(value_positions).to_numpy()
+    group_index = (
+        dataframe["Tolerance"]
+        .map({group: index for index, group in enumerate(groups)})
+        .to_numpy()
+    )
+    dot_position = (
+        dataframe.groupby(["Tolerance", "Value"], sort=False)
+        .cumcount()
+        .to_numpy()
+    )
+    marker_frame = pd.DataFrame({
+        "group": group_index,
+        "position": value_index,
+        "Value": dataframe["Value"].to_numpy(),
+        "height": dot_position + 0.5,
+        "MPN": dataframe["MPN"].to_numpy(),
+    }).dropna(subset=["group", "position"])
+    marker_frame = marker_frame.astype({"group": int, "position": int})
+    marker_frame["height"] += bases[
+        marker_frame["group"].to_numpy(),
+        marker_frame["position"].to_numpy(),
+    ]
+    marker_frame = marker_frame.sort_values(
+        ["group", "position"],
+        kind="stable",
+    )
+
+    distribution = ValueDistribution(
+        values=values,
+        groups=groups,
+        counts=counts,
+        markers=[
+            marker_frame.loc[
+                marker_frame["group"] == index,
+                ["Value", "height", "MPN"],
+            ]
+            for index in range(len(groups))
+        ],
+    )
+
+    with _distribution_lock:
+        _distribution_cache[id(dataframe)] = (dataframe, distribution)
+        _distribution_cache.move_to_end(id(dataframe))
+        while len(_distribution_cache) > DISTRIBUTION_CACHE_SIZE:
+            _distribution_cache.popitem(last=False)
+
+    return distribution
+
+
+def get_visible_y_max(
+    distribution: ValueDistribution,
+    x_range: tuple[int, int],
+) -> int:
+    """Get the height of the stacked bars within the visible value range.
+
+    Args:
+        distribution (ValueDistribution): Value distribution of the graph
+        x_range (tuple[int, int]): First and last visible value index
+
+    Returns:
+        int: Sum of the per-group maximum counts within the range
+
+    """
+    x_min, x_max = x_range
+    visible_counts = distribution.counts[:, max(x_min, 0) : x_max + 1]
+    return int(visible_counts.max(axis=1, initial=0).sum())
+
+
+def create_value_distribution_figure(
+    dataframe: pd.DataFrame,
+    config: DistributionGraphConfig,
+    theme_switch: bool,  # noqa: FBT001
+) -> dict[str, Any]:
+    """Create the stacked value distribution figure of a database.
+
+    The figure holds one bar trace and one MPN marker trace per tolerance
+    group. It is cached per frame, configuration and theme, so switching
+    back to a theme or moving the range slider does not rebuild it.
+
+    Args:
+        dataframe (pd.DataFrame): Database with ``Value``, ``Tolerance`` and
+            ``MPN`` columns
+        config (DistributionGraphConfig): Labels and styling of the graph
+        theme_switch (bool): Indicates the current theme (light/dark)
+
+    Returns:
+        dict[str, Any]: Plotly figure dictionary without axis ranges
+
+    """
+    key = (id(dataframe), config, theme_switch)
+    with _distribution_lock:
+        cached = _distribution_figure_cache.get(key)
+        if cached is not None and cached[0] is dataframe:
+            _distribution_figure_cache.move_to_end(key)
+            return cached[1]
+
+    distribution = build_value_distribution(dataframe)
+
+    figure_layout = {
+        "xaxis": {
+            "gridcolor": "#808080",
+            "griddash": "dash",
+            "zerolinecolor": "lightgray",
+            "zeroline": False,
+            "domain": (0.0, 1.0),
+            "showgrid": True,
+            "title": {
+                "text": config.x_axis_title,
+                "standoff": 10,
+                "font": {"color": "#808080"},
+            },
+            "title_font_weight": "bold",
+            "tickmode": "array",
+            "tickangle": -45,
+            "fixedrange": True,
+            "tickfont": {"color": "#808080", "weight": "bold"},
+        },
+        "yaxis": {
+            "gridcolor": "#808080",
+            "griddash": "dash",
+            "zerolinecolor": "lightgray",
+            "zeroline": False,
+            "tickangle": -45,
+            "title_font_weight": "bold",
+            "position": 0.0,
+            "title": {
+                "text": config.y_axis_title,
+                "font": {"color": "#808080"},
+            },
+            "fixedrange": True,
+            "tickfont": {"color": "#808080", "weight": "bold"},
+            "showgrid": True,
+            "anchor": "free",
+            "autorange": False,
+            "tickformat": ".0f",
+            "dtick": 2,
+            "tickmode": "linear",
+        },
+        "title": {
+            "text": config.title.format(
+                groups=", ".join(map(str, distribution.groups)),
+            ),
+            "x": 0.5,
+            "xanchor": "center",
+        },
+        "showlegend": True,
+        "legend": {
+            "orientation": "h",
+            "yanchor": "bottom",
+            "xanchor": "center",
+            "y": -0.5,
+            "x": 0.5,
+        },
+        "template": "plotly" if theme_switch else "plotly_dark",
+        "paper_bgcolor": "white" if theme_switch else "#222222",
+        "plot_bgcolor": "white" if theme_switch else "#222222",
+        "font_color": "black" if theme_switch else "white",
+        "margin": {"l": 0, "r": 0, "t": 50, "b": 50},
+        "barmode": "stack",
+        "bargap": 0.0,
+        "bargroupgap": config.bargroupgap,
+        "modebar": {
+            "remove": [
+                "zoom",
+                "pan",
+                "select2d",
+                "lasso2d",
+                "zoomIn2d",
+                "zoomOut2d",
+                "autoScale2d",
+                "resetScale2d",
+                "toImage",
+            ],
+        },
+    }
+    if config.height is not None:
+        figure_layout["height"] = config.height
+
+    figure = go.Figure(layout=figure_layout)
+
+    # Add one stacked bar trace per tolerance group
+    for group, counts in zip(distribution.groups, distribution.counts):
+        hover = (
+            {"hovertemplate": config.bar_hovertemplate}
+            if config.bar_hovertemplate
+            else {"hoverinfo": "none", "showlegend": True}
+        )
+        figure.add_trace(
+            go.Bar(
+                x=distribution.values,
+                y=counts.tolist(),
+                name=f"{group} Tolerance",
+                textposition="none",
+                textangle=-30,
+                text=counts.tolist(),
+                **hover,
+            ),
+        )
+
+    # Add the MPN markers stacked on top of the bars of previous groups
+    for group, markers in zip(distribution.groups, distribution.markers):
+        figure.add_trace(
+            go.Scatter(
+                x=markers["Value"],
+                y=markers["height"],
+                mode="markers",
+                name=f"{group} Values",
+                text=markers["MPN"],
+                hovertemplate=config.marker_hovertemplate,
+            ),
+        )
+
+    figure_dict = figure.to_plotly_json()
+
+    with _distribution_lock:
+        _distribution_figure_cache[key] = (dataframe, figure_dict)
+        _distribution_figure_cache.move_to_end(key)
+        while len(_distribution_figure_cache) > DISTRIBUTION_CACHE_SIZE:
+            _distribution_figure_cache.popitem(last=False)
+
+    return figure_dict
+
+
+def callback_update_value_distribution_graph(
+    graph_id: str,
+    rangeslider_id: str,
+    dataset_file: str,
+    url_columns: list[str],
+    config: DistributionGraphConfig,
+) -> None:
+    """Create a callback updating a stacked value distribution graph.
+
+    The figure is built once per database and theme. Moving the range
+    slider only patches the axis ranges of the displayed figure, so the
+    bars and markers are neither rebuilt nor sent to the browser again.
+
+    Args:
+        graph_id (str): The ID of the Graph component.
+        rangeslider_id (str): The ID of the RangeSlider selecting the
+            visible value indices.
+        dataset_file (str): Path of the database CSV file.
+        url_columns (list[str]): Columns converted to markdown links, used
+            to share the cached database with the table.
+        config (DistributionGraphConfig): Labels and styling of the graph.
+
+    Returns:
+        None:
+            This function registers a callback with Dash and doesn't return
+
+    """
+
+    @callback(
+        Output(graph_id, "figure"),
+        Input("theme_switch_value_store", "data"),
+        Input(rangeslider_id, "value"),
+    )
+    def update_distribution_graph(
+        theme_switch: bool,  # noqa: FBT001
+        rangeslider_value: list[int],
+    ) -> dict[str, Any] | Patch:
+        """Create a bar graph showing the distribution of component values.
+
+        Args:
+            theme_switch (bool): Indicates the current theme (light/dark).
+            rangeslider_value:
+                Range slider values for filtering component values.
+
+        Returns:
+            Plotly figure with the component distribution, or a patch of
+            its axis ranges if only the range slider moved.
+
+        """
+        ag_grid_data = dsu.load_dataset(dataset_file, url_columns)
+        distribution = build_value_distribution(ag_grid_data)
+
+        x_min, x_max = rangeslider_value[0], rangeslider_value[1]
+        x_range = [x_min - 0.5, x_max + 0.5]
+        y_range = [0, get_visible_y_max(distribution, (x_min, x_max))]
+
+        if ctx.triggered_id == rangeslider_id:
+            patched_figure = Patch()
+            patched_figure["layout"]["xaxis"]["range"] = x_range
+            patched_figure["layout"]["yaxis"]["range"] = y_range
+            return patched_figure
+
+        figure = create_value_distribution_figure(
+            ag_grid_data,
+            config,
+            theme_switch,
+        )
+        layout = figure["layout"]
+
+        return {
+            "data": figure["data"],
+            "layout": {
+                **layout,
+                "xaxis": {**layout["xaxis"], "range": x_range},
+                "yaxis": {**layout["yaxis"], "range": y_range},
+            },
+        }
 
 
 def callback_update_rangeslider_marks_theme(
     rangeslider_id: str,
-    initial_marks: dict[int, float],
+    initial_marks: dict[int, float] | Callable[[], dict[int, float]],
 ) -> None:
     """Create a callback to update RangeSlider marks color based on theme.
 
@@ -792,8 +1250,10 @@ def callback_update_rangeslider_marks_theme(
 
     Args:
         rangeslider_id (str): The ID of the RangeSlider component.
-        initial_marks (dict[int, float]):
-            The initial marks dictionary with index as key and value as label.
+        initial_marks (dict[int, float] | Callable[[], dict[int, float]]):
+            The initial marks dictionary with index as key and value as label,
+            or a function returning it, called when the callback runs so the
+            marks can be derived from a lazily loaded dataset.
 
     Returns:
         None:
@@ -819,8 +1279,9 @@ def callback_update_rangeslider_marks_theme(
 
         """
         mark_color = "#000000" if switch else "#FFFFFF"
+        marks = initial_marks() if callable(initial_marks) else initial_marks
         styled_marks = {}
-        for index, value in initial_marks.items():
+        for index, value in marks.items():
             styled_marks[index] = {
                 "label": str(value),
                 "style": {"color": mark_color},
@@ -1131,7 +1592,7 @@ def callback_update_store_at_upload(
         prevent_initial_call=True,
     )
     def update_count_from_zip(
-        contents: str,
+        contents: dict[str, str],
         global_store: dict[str, Any],
         store: dict[str, Any],
     ) -> dict[str, Any]:
@@ -1142,7 +1603,8 @@ def callback_update_store_at_upload(
         accordingly.
 
         Args:
-            contents (str): Base64 encoded contents of the uploaded file.
+            contents (dict[str, str]): File name and upload token of the
+            uploaded file.
             global_store (Dict[str, Any]):
                 Global store containing additional context.
             store (Dict[str, Any]): Current state of the store.
@@ -1158,15 +1620,15 @@ def callback_update_store_at_upload(
         if contents["filename"].lower().endswith(".zip"):
             if process.__name__ == "extract_info_from_zip_as_int":
                 store["max_count"] = process(
-                    contents["content"], contents["filename"], search_key
+                    contents["token"], contents["filename"], search_key
                 )
                 return store, None
             if process.__name__ == "count_csv_files_from_zip":
-                store["max_count"] = process(contents["content"])
+                store["max_count"] = process(contents["token"])
                 return store, None
             if process.__name__ == "extract_data_frame_from_zip_contents":
                 names = process(
-                    contents["content"], contents["filename"], global_store
+                    contents["token"], contents["filename"], global_store
                 )
                 store["max_count"] = len(names)
                 marks = {
@@ -1178,7 +1640,7 @@ def callback_update_store_at_upload(
 
 
 def extract_info_from_zip_as_int(
-    contents: str,
+    upload_token: str,
     file_name: str,
     search_key: str,
 ) -> int:
@@ -1189,7 +1651,7 @@ def extract_info_from_zip_as_int(
     It then converts the first extracted value to an integer.
 
     Args:
-        contents (str): Base64 encoded string of the ZIP file contents.
+        upload_token (str): Token of the stored ZIP file.
         file_name (str): The name of the uploaded ZIP file.
         search_key (str): The key to search for in the ZIP file's CSV
         contents.
@@ -1211,7 +1673,9 @@ def extract_info_from_zip_as_int(
         return int(
             next(
                 iter(
-                    spu.extract_info_from_zip(contents, [search_key]).values()
+                    spu.extract_info_from_zip(
+                        upload_token, [search_key]
+                    ).values()
                 )
             )
         )
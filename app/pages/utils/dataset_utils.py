@@ -0,0 +1,410 @@
+"""Dataset Registry Utilities.
+
+This module provides a central registry for the component database CSV
+files displayed by the database pages.
+
+Key functionalities:
+1. Lazy loading: A database is parsed on the first request that needs it
+2. Caching: Parsed frames are kept in a least-recently-used cache that is
+   bounded by a memory budget
+3. Metadata index: Row counts and column names are read from a small JSON
+   index stored next to the databases, so page titles and navigation links
+   never parse a database
+4. Server-side queries: AG Grid filter and sort models are applied to the
+   cached frame, so only the requested block of rows is sent to the browser
+
+Cached frames and index entries are keyed by the size and modification time
+of the CSV file, so a regenerated database is picked up without restarting
+the server.
+
+Environment Variables:
+    DATASET_CACHE_MB (int): Memory budget of the dataset cache in MB
+        (default: 256)
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import pandas as pd
+
+DATASET_INDEX_FILE = Path("data/dataset_index.json")
+DATASET_CACHE_BUDGET = int(os.environ.get("DATASET_CACHE_MB", "256")) << 20
+QUERY_CACHE_SIZE = 32
+
+
+class DatasetMetadata(NamedTuple):
+    """Metadata index entry of a database CSV file.
+
+    Attributes:
+        row_count: Number of data rows, excluding the header
+        columns: Column names in file order
+        size: File size in bytes when the entry was computed
+        modified: File modification time in nanoseconds when the entry was
+            computed
+
+    """
+
+    row_count: int
+    columns: list[str]
+    size: int
+    modified: int
+
+
+class CachedDataset(NamedTuple):
+    """Parsed database held in the dataset cache.
+
+    Attributes:
+        dataframe: Parsed and normalized database
+        memory: Memory used by the frame in bytes
+        size: File size in bytes when the frame was parsed
+        modified: File modification time in nanoseconds when the frame was
+            parsed
+
+    """
+
+    dataframe: pd.DataFrame
+    memory: int
+    size: int
+    modified: int
+
+
+_lock = threading.Lock()
+_dataset_cache: OrderedDict[tuple[str, tuple[str, ...]], CachedDataset] = (
+    OrderedDict()
+)
+_metadata_index: dict[str, DatasetMetadata] | None = None
+_query_cache: OrderedDict[
+    tuple[int, str],
+    tuple[pd.DataFrame, pd.DataFrame],
+] = OrderedDict()
+
+
+def load_dataset(
+    dataset_file: str,
+    url_columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """Load a database, parsing it only if it is not cached yet.
+
+    URL columns are converted to markdown links for the AG Grid markdown
+    cell renderer. The returned frame is shared between requests and must
+    not be modified in place.
+
+    Args:
+        dataset_file (str): Path of the database CSV file
+        url_columns (list[str] | None): Columns to convert to markdown links
+
+    Returns:
+        pd.DataFrame: Parsed and normalized database
+
+    """
+    key = (dataset_file, tuple(url_columns or ()))
+    file_stat = Path(dataset_file).stat()
+
+    with _lock:
+        cached = _dataset_cache.get(key)
+        if (
+            cached is not None
+            and cached.size == file_stat.st_size
+            and cached.modified == file_stat.st_mtime_ns
+        ):
+            _dataset_cache.move_to_end(key)
+            return cached.dataframe
+
+    dataframe = pd.read_csv(dataset_file)
+    for col in url_columns or ():
+        if col in dataframe.columns:
+            dataframe[col] = dataframe[col].apply(
+                lambda url, col=col: (
+                    f"[{col}]({url})" if pd.notna(url) and url else ""
+                )
+            )
+
+    with _lock:
+        _dataset_cache[key] = CachedDataset(
+            dataframe=dataframe,
+            memory=int(dataframe.memory_usage(deep=True).sum()),
+            size=file_stat.st_size,
+            modified=file_stat.st_mtime_ns,
+        )
+        _dataset_cache.move_to_end(key)
+        _evict_datasets()
+
+    return dataframe
+
+
+def query_dataset(
+    dataset_file: str,
+    url_columns: list[str] | None = None,
+    filter_model: dict[str, Any] | None = None,
+    sort_model: list[dict[str, str]] | None = None,
+) -> pd.DataFrame:
+    """Filter and sort a database with AG Grid filter and sort models.
+
+    Results are cached per model, so fetching further blocks of the same
+    view only slices the cached result.
+
+    Args:
+        dataset_file (str): Path of the database CSV file
+        url_columns (list[str] | None): Columns to convert to markdown links
+        filter_model (dict[str, Any] | None): AG Grid filter model, keyed
+            by column
+        sort_model (list[dict[str, str]] | None): AG Grid sort model, with
+            ``colId`` and ``sort`` entries
+
+    Returns:
+        pd.DataFrame: Filtered and sorted database
+
+    """
+    dataframe = load_dataset(dataset_file, url_columns)
+    if not filter_model and not sort_model:
+        return dataframe
+
+    key = (
+        id(dataframe),
+        json.dumps([filter_model, sort_model], sort_keys=True, default=str),
+    )
+    with _lock:
+        cached = _query_cache.get(key)
+        if cached is not None and cached[0] is dataframe:
+            _query_cache.move_to_end(key)
+            return cached[1]
+
+    result = dataframe
+    for col, column_filter in (filter_model or {}).items():
+        if col in result.columns:
+            result = result[_filter_mask(result[col], column_filter)]
+
+    sort_columns = [
+        sort_entry
+        for sort_entry in sort_model or []
+        if sort_entry.get("colId") in result.columns
+    ]
+    if sort_columns:
+        result = result.sort_values(
+            by=[sort_entry["colId"] for sort_entry in sort_columns],
+            ascending=[
+                sort_entry.get("sort") != "desc" for sort_entry in sort_columns
+            ],
+            kind="stable",
+            na_position="last",
+        )
+
+    with _lock:
+        _query_cache[key] = (dataframe, result)
+        _query_cache.move_to_end(key)
+        while len(_query_cache) > QUERY_CACHE_SIZE:
+            _query_cache.popitem(last=False)
+
+    return result
+
+
+def _filter_mask(
+    series: pd.Series,
+    column_filter: dict[str, Any],
+) -> pd.Series:
+    """Build the row mask of an AG Grid column filter.
+
+    Supports text and number filters, including combined filters with two
+    or more conditions.
+
+    Args:
+        series (pd.Series): Column to filter
+        column_filter (dict[str, Any]): AG Grid filter model of the column
+
+    Returns:
+        pd.Series: Boolean mask of the matching rows
+
+    """
+    conditions = column_filter.get("conditions")
+    if conditions is None and "condition1" in column_filter:
+        conditions = [
+            column_filter[name]
+            for name in ("condition1", "condition2")
+            if column_filter.get(name)
+        ]
+
+    if conditions:
+        masks = [_filter_mask(series, condition) for condition in conditions]
+        combined = masks[0]
+        for mask in masks[1:]:
+            if column_filter.get("operator") == "OR":
+                combined = combined | mask
+            else:
+                combined = combined & mask
+        return combined
+
+    filter_type = column_filter.get("type", "contains")
+    if filter_type == "blank":
+        return series.isna() | (series.astype(str).str.strip() == "")
+    if filter_type == "notBlank":
+        return series.notna() & (series.astype(str).str.strip() != "")
+
+    if column_filter.get("filterType") == "number":
+        values = pd.to_numeric(series, errors="coerce")
+        number = column_filter.get("filter")
+        number_filters = {
+            "equals": lambda: values == number,
+            "notEqual": lambda: values != number,
+            "lessThan": lambda: values < number,
+            "lessThanOrEqual": lambda: values <= number,
+            "greaterThan": lambda: values > number,
+            "greaterThanOrEqual": lambda: values >= number,
+            "inRange": lambda: values.between(
+                number,
+                column_filter.get("filterTo"),
+            ),
+        }
+        return number_filters.get(filter_type, lambda: values == number)()
+
+    texts = series.fillna("").astype(str).str.lower()
+    text = str(column_filter.get("filter", "")).lower()
+    text_filters = {
+        "contains": lambda: texts.str.contains(text, regex=False),
+        "notContains": lambda: ~texts.str.contains(text, regex=False),
+        "equals": lambda: texts == text,
+        "notEqual": lambda: texts != text,
+        "startsWith": lambda: texts.str.startswith(text),
+        "endsWith": lambda: texts.str.endswith(text),
+    }
+    return text_filters.get(filter_type, text_filters["contains"])()
+
+
+def _evict_datasets() -> None:
+    """Evict least recently used datasets until the cache fits its budget.
+
+    The most recently used dataset is always kept, even if it exceeds the
+    budget on its own. Must be called with the registry lock held.
+    """
+    total_memory = sum(cached.memory for cached in _dataset_cache.values())
+    while total_memory > DATASET_CACHE_BUDGET and len(_dataset_cache) > 1:
+        _, evicted = _dataset_cache.popitem(last=False)
+        total_memory -= evicted.memory
+
+
+def get_dataset_metadata(dataset_file: str) -> DatasetMetadata:
+    """Get the metadata of a database from the metadata index.
+
+    Missing or outdated index entries are recomputed by scanning the CSV
+    file, without parsing it into a frame, and written back to the index.
+
+    Args:
+        dataset_file (str): Path of the database CSV file
+
+    Returns:
+        DatasetMetadata: Row count and columns of the database
+
+    """
+    global _metadata_index  # noqa: PLW0603
+
+    file_stat = Path(dataset_file).stat()
+
+    with _lock:
+        if _metadata_index is None:
+            _metadata_index = _read_metadata_index()
+
+        metadata = _metadata_index.get(dataset_file)
+        if (
+            metadata is not None
+            and metadata.size == file_stat.st_size
+            and metadata.modified == file_stat.st_mtime_ns
+        ):
+            return metadata
+
+    with Path(dataset_file).open(encoding="utf-8", newline="") as csv_file:
+        reader = csv.reader(csv_file)
+        columns = next(reader, [])
+        row_count = sum(1 for row in reader if row)
+
+    metadata = DatasetMetadata(
+        row_count=row_count,
+        columns=columns,
+        size=file_stat.st_size,
+        modified=file_stat.st_mtime_ns,
+    )
+
+    with _lock:
+        _metadata_index[dataset_file] = metadata
+        _write_metadata_index(_metadata_index)
+
+    return metadata
+
+
+def get_row_count(dataset_file: str) -> int:
+    """Get the number of rows of a database.
+
+    Args:
+        dataset_file (str): Path of the database CSV file
+
+    Returns:
+        int: Number of data rows
+
+    """
+    return get_dataset_metadata(dataset_file).row_count
+
+
+def get_columns(dataset_file: str) -> list[str]:
+    """Get the column names of a database.
+
+    Args:
+        dataset_file (str): Path of the database CSV file
+
+    Returns:
+        list[str]: Column names in file order
+
+    """
+    return list(get_dataset_metadata(dataset_file).columns)
+
+
+def _read_metadata_index() -> dict[str, DatasetMetadata]:
+    """Read the metadata index file.
+
+    A missing or malformed index is treated as empty.
+
+    Returns:
+        dict[str, DatasetMetadata]: Index entries keyed by database path
+
+    """
+    try:
+        with DATASET_INDEX_FILE.open(encoding="utf-8") as index_file:
+            entries = json.load(index_file)
+        return {
+            dataset_file: DatasetMetadata(**entry)
+            for dataset_file, entry in entries.items()
+        }
+    except (OSError, ValueError, TypeError, AttributeError):
+        return {}
+
+
+def _write_metadata_index(index: dict[str, DatasetMetadata]) -> None:
+    """Write the metadata index file atomically.
+
+    Failing to write the index is not fatal, since it is only a cache.
+
+    Args:
+        index (dict[str, DatasetMetadata]): Entries keyed by database path
+
+    """
+    temporary_file = DATASET_INDEX_FILE.with_name(
+        f"{DATASET_INDEX_FILE.name}.{os.getpid()}.tmp",
+    )
+    try:
+        with temporary_file.open("w", encoding="utf-8") as index_file:
+            json.dump(
+                {
+                    dataset_file: metadata._asdict()
+                    for dataset_file, metadata in sorted(index.items())
+                },
+                index_file,
+                indent=2,
+            )
+        os.replace(temporary_file, DATASET_INDEX_FILE)
+    except OSError as error:
+        logging.warning(f"Could not write dataset index: {error}")
@@ -0,0 +1,322 @@
+"""GitHub Resource Cache.
+
+This module probes the GitHub resources referenced by the home page, the
+GitHub Pages sites of the learning projects and the shared list of
+project pictures, and keeps the results in a cache, so building the page
+layout and its callbacks never wait for GitHub.
+
+Key functionalities:
+1. Background refresh: All resources are probed concurrently in a shared
+   thread pool, through a pooled HTTP session with a timeout
+2. Persistent cache: Results are written to a JSON file and read back on
+   startup, so the page shows the last known state immediately
+3. Fallbacks: A resource that cannot be reached keeps its cached state,
+   and the bundled pictures.txt is used until the remote copy is loaded
+
+The URLs are module constants read at call time, so the cache can be
+pointed at a local HTTP server.
+
+Environment Variables:
+    GITHUB_CACHE_FILE (str): Path of the JSON cache file
+        (default: home_page_github_cache.json in the temporary directory)
+    GITHUB_CACHE_TTL (int): Seconds after which the cached resources are
+        probed again (default: 3600)
+    GITHUB_PROBE_WORKERS (int): Concurrent probes (default: 8)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable
+
+import requests
+from requests.adapters import HTTPAdapter
+
+GITHUB_PAGES_URL = "https://{username}.github.io/{repo_name}/"
+PICTURES_URL = (
+    "https://raw.githubusercontent.com/ionutms/KiCAD_Symbols_Generator/"
+    "main/app/pictures.txt"
+)
+PICTURES_LOCAL_FILE = Path("pictures.txt")
+GITHUB_CACHE_FILE = Path(
+    os.environ.get(
+        "GITHUB_CACHE_FILE",
+        Path(tempfile.gettempdir()) / "home_page_github_cache.json",
+    )
+)
+GITHUB_CACHE_TTL = int(os.environ.get("GITHUB_CACHE_TTL", "3600"))
+GITHUB_PROBE_WORKERS = int(os.environ.get("GITHUB_PROBE_WORKERS", "8"))
+GITHUB_PROBE_TIMEOUT = 15
+
+_lock = threading.Lock()
+_cache: dict[str, Any] | None = None
+_pending_refresh: Future | None = None
+_refresh_executor = ThreadPoolExecutor(
+    max_workers=1,
+    thread_name_prefix="github_refresh",
+)
+_probe_executor = ThreadPoolExecutor(
+    max_workers=max(GITHUB_PROBE_WORKERS, 1),
+    thread_name_prefix="github_probe",
+)
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(pool_maxsize=max(GITHUB_PROBE_WORKERS, 1)),
+)
+_session.mount(
+    "http://",
+    HTTPAdapter(pool_maxsize=max(GITHUB_PROBE_WORKERS, 1)),
+)
+
+
+def get_github_pages_url(username: str, repo_name: str) -> str | None:
+    """Get the GitHub Pages URL of a repository from the cache.
+
+    Args:
+        username (str): GitHub user owning the repository
+        repo_name (str): Name of the repository
+
+    Returns:
+        str | None: URL of the GitHub Pages site, or None if the site is
+        not available or was not probed yet
+
+    """
+    cache = _get_cache()
+    pages_url = GITHUB_PAGES_URL.format(username=username, repo_name=repo_name)
+    return pages_url if cache["pages"].get(pages_url) else None
+
+
+def get_pictures_text() -> str | None:
+    """Get the contents of the shared pictures list.
+
+    The remote copy is served from the cache once it has been loaded, the
+    bundled copy until then.
+
+    Returns:
+        str | None: Contents of pictures.txt, or None if no copy exists
+
+    """
+    pictures_text = _get_cache()["pictures"]
+    if pictures_text is not None:
+        return pictures_text
+
+    try:
+        return PICTURES_LOCAL_FILE.read_text(encoding="utf-8")
+    except OSError as error:
+        logging.error(f"Error reading local pictures.txt: {error}")
+        return None
+
+
+def is_github_cache_stale() -> bool:
+    """Check if the cached resources are older than the time to live.
+
+    Returns:
+        bool: True if the resources should be probed again
+
+    """
+    return time.time() - _get_cache()["updated"] > GITHUB_CACHE_TTL
+
+
+def refresh_github_cache(
+    username: str,
+    repo_names: Iterable[str],
+) -> Future:
+    """Probe the GitHub resources of the home page in the background.
+
+    A refresh that is already running is returned instead of starting a
+    new one.
+
+    Args:
+        username (str): GitHub user owning the repositories
+        repo_names (Iterable[str]): Repositories whose GitHub Pages sites
+            are probed
+
+    Returns:
+        Future: The running refresh
+
+    """
+    global _pending_refresh  # noqa: PLW0603
+
+    pages_urls = [
+        GITHUB_PAGES_URL.format(username=username, repo_name=repo_name)
+        for repo_name in repo_names
+    ]
+    with _lock:
+        if _pending_refresh is None:
+            _pending_refresh = _refresh_executor.submit(
+                _refresh_cache, pages_urls
+            )
+        return _pending_refresh
+
+
+def _get_cache() -> dict[str, Any]:
+    """Return the cache, reading the cache file on first use.
+
+    Returns:
+        dict[str, Any]: Cache with ``pages``, ``pictures`` and ``updated``
+        entries
+
+    """
+    global _cache  # noqa: PLW0603
+
+    with _lock:
+        if _cache is None:
+            _cache = _read_cache_file()
+        return _cache
+
+
+def _refresh_cache(pages_urls: list[str]) -> None:
+    """Probe all resources concurrently and publish the results.
+
+    The cache only counts as updated if every resource could be reached,
+    so resources missed because of a network error are probed again on
+    the next refresh.
+
+    Args:
+        pages_urls (list[str]): GitHub Pages URLs to probe
+
+    """
+    global _cache, _pending_refresh  # noqa: PLW0603
+
+    try:
+        pictures_future = _probe_executor.submit(_fetch_pictures)
+        pages_futures = {
+            pages_url: _probe_executor.submit(_probe_pages, pages_url)
+            for pages_url in pages_urls
+        }
+        pictures_text = pictures_future.result()
+        pages = {
+            pages_url: future.result()
+            for pages_url, future in pages_futures.items()
+        }
+
+        previous = _get_cache()
+        cache = {
+            "pages": {
+                **previous["pages"],
+                **{
+                    pages_url: available
+                    for pages_url, available in pages.items()
+                    if available is not None
+                },
+            },
+            "pictures": (
+                pictures_text
+                if pictures_text is not None
+                else previous["pictures"]
+            ),
+            "updated": (
+                time.time()
+                if pictures_text is not None and None not in pages.values()
+                else previous["updated"]
+            ),
+        }
+
+        with _lock:
+            _cache = cache
+            _write_cache_file(cache)
+    finally:
+        with _lock:
+            _pending_refresh = None
+
+
+def _probe_pages(pages_url: str) -> bool | None:
+    """Check if a GitHub Pages site is available.
+
+    Args:
+        pages_url (str): URL of the site
+
+    Returns:
+        bool | None: Whether the site responds with status 200, or None if
+        it could not be reached
+
+    """
+    try:
+        response = _session.head(
+            pages_url,
+            timeout=GITHUB_PROBE_TIMEOUT,
+            allow_redirects=True,
+        )
+    except requests.RequestException as error:
+        logging.warning(f"Could not probe {pages_url}: {error}")
+        return None
+
+    return response.status_code == 200
+
+
+def _fetch_pictures() -> str | None:
+    """Download the shared pictures list.
+
+    Returns:
+        str | None: Contents of pictures.txt, or None if it could not be
+        downloaded
+
+    """
+    try:
+        response = _session.get(PICTURES_URL, timeout=GITHUB_PROBE_TIMEOUT)
+    except requests.RequestException as error:
+        logging.error(f"Request error when fetching pictures.txt: {error}")
+        return None
+
+    if not response.ok or not response.text:
+        logging.warning(
+            "Failed to fetch pictures.txt from remote: "
+            f"Status {response.status_code}"
+        )
+        return None
+
+    return response.text
+
+
+def _read_cache_file() -> dict[str, Any]:
+    """Read the cache file.
+
+    A missing or malformed file is treated as an empty, stale cache.
+
+    Returns:
+        dict[str, Any]: Cache with ``pages``, ``pictures`` and ``updated``
+        entries
+
+    """
+    try:
+        with GITHUB_CACHE_FILE.open(encoding="utf-8") as cache_file:
+            cache = json.load(cache_file)
+        return {
+            "pages": {
+                str(pages_url): bool(available)
+                for pages_url, available in cache["pages"].items()
+            },
+            "pictures": cache["pictures"],
+            "updated": float(cache["updated"]),
+        }
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        return {"pages": {}, "pictures": None, "updated": 0.0}
+
+
+def _write_cache_file(cache: dict[str, Any]) -> None:
+    """Write the cache file atomically.
+
+    Failing to write the file is not fatal, since it is only a cache.
+
+    Args:
+        cache (dict[str, Any]): Cache to write
+
+    """
+    temporary_file = GITHUB_CACHE_FILE.with_name(
+        f"{GITHUB_CACHE_FILE.name}.{os.getpid()}.tmp",
+    )
+    try:
+        GITHUB_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with temporary_file.open("w", encoding="utf-8") as cache_file:
+            json.dump(cache, cache_file, indent=2, sort_keys=True)
+        os.replace(temporary_file, GITHUB_CACHE_FILE)
+    except OSError as error:
+        logging.warning(f"Could not write GitHub cache: {error}")
@@ -22,7 +22,7 @@ information, and create complex multi-axis plots.
 Functions in this module can be used individually or combined to create more
 complex signal processing pipelines. They support operations such as:
 - Generating synthetic sine wave data with added noise
-- Creating ZIP files with multiple CSV files
+- Creating ZIP files with multiple CSV files, streamed to the browser
 - Extracting and processing data from ZIP archives
 - Configuring and styling Plotly figures with multiple y-axes
 - Filtering and selecting specific data for visualization
@@ -30,19 +30,58 @@ complex signal processing pipelines. They support operations such as:
 This module is particularly useful for tasks involving time-series data,
 multi-channel signals, and comparative data analysis across multiple files.
 
+Uploaded archives are stored once on the server, under a token derived
+from a hash of the archive, and only the token is kept in the browser.
+Stored archives are kept in a least-recently-used cache together with the
+CSV frames parsed from them, so callbacks reacting to the same upload do
+not read and parse it again. The CSV files of an archive are parsed
+concurrently in a shared thread pool, each with its own archive handle.
+
 Functions:
     write_data_frame_to_buffer: Write a DataFrame to a StringIO buffer.
-    generate_sine_wave_data: Generate sine wave data with added noise.
-    create_zip_file: Generate multiple CSV files and package into a zip file.
+    iter_sine_wave_samples: Generate sine wave data in blocks of rows.
+    format_csv_rows: Format a block of samples as CSV rows.
+    write_sine_wave_frames: Write repeated frames of sine wave data.
+    write_npz_capture: Write a capture file in the NPZ format.
+    write_zip_file: Stream multiple capture files into a zip file.
+    measure_zip_file: Compute the size of a zip file without storing it.
+    iter_zip_file: Stream a zip file in chunks from a background thread.
+    register_zip_download: Store the parameters of a zip file download.
+    get_zip_download: Get the parameters of a stored zip file download.
+    decode_zip_contents: Decode base64 encoded upload contents.
+    store_upload: Store an uploaded zip file on the server.
+    get_cached_upload: Get a stored upload from the upload cache.
+    open_cached_upload: Open the archive of a cached upload.
+    read_cached_csv: Read a CSV file of a cached upload, parsing it once.
+    read_csv_windows: Stream selected rows and columns of a CSV file.
+    is_npz_capture: Check if a capture file is in the NPZ format.
+    load_npz_capture: Load an NPZ capture without copying its data.
+    read_npz_windows: Select rows and columns of an NPZ capture.
+    map_upload_files: Apply a function to CSV files in the parse pool.
+    lttb_indices: Select samples with Largest-Triangle-Three-Buckets.
+    min_max_indices: Select the minimum and maximum sample of each bucket.
+    downsample_trace: Limit a trace to the visible range and point budget.
+    get_max_points: Get the point budget of a graph from its pixel width.
+    get_relayout_x_range: Get the x-axis range from Plotly relayout data.
     count_csv_files_from_zip: Count CSV files in a zip archive.
-    find_first_empty_row_index: Find consistent first empty row across CSVs.
+    find_first_empty_row: Find the first empty row of a CSV file.
+    find_cached_first_empty_row_index: Find consistent first empty row
+        across the CSVs of an upload.
     extract_info_from_zip: Extract specific information from CSV files in zip.
     read_and_validate_zip: Read and validate a zip file from encoded contents.
     get_csv_file_list: Get list of CSV files from zip, applying filters.
     create_and_style_figure: Create and style a Plotly figure.
+    get_frame_windows: Get the data rows of every selected frame.
+    read_selected_frames: Read the selected columns and frames of a file.
     process_one_csv_file_for_scatter_data: Process CSV file for scatter data.
     process_multiple_csv_files_for_scatter_data: Process multiple CSV files.
     plot_selected_zip_contents: Plot selected contents from zip with CSVs.
+    stack_frames: Stack the rows of equally sized frames into one array.
+    compute_frame_statistics: Compute statistics of all frames at once.
+    compute_power_spectral_density: Compute the PSD averaged over frames.
+    analyze_one_csv_file: Compute statistics and spectra of one file.
+    analyze_selected_zip_contents: Analyze the selected frames, cached.
+    create_spectrum_figure: Create the power spectral density figure.
     create_base_layout_configuration: Create base layout for Plotly figure.
     update_layout_with_y_axes: Update layout with multiple y-axes.
     separate_left_right_axes: Separate y-axes into left and right lists.
@@ -56,17 +95,165 @@ Functions:
 """
 
 import base64
+import contextlib
 import csv
+import functools
+import hashlib
 import io
 import itertools
+import json
+import os
+import queue
+import re
+import secrets
+import struct
+import tempfile
+import threading
+import time
 import zipfile
-from typing import Any, Dict, List, Tuple, Union
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from dash.exceptions import PreventUpdate
 
+UPLOAD_CACHE_BUDGET = int(os.environ.get("UPLOAD_CACHE_MB", "512")) << 20
+UPLOAD_STORE_DIR = Path(
+    os.environ.get(
+        "UPLOAD_STORE_DIR",
+        Path(tempfile.gettempdir()) / "signal_data_explorer_uploads",
+    )
+)
+UPLOAD_STORE_MAX_AGE = 24 * 60 * 60
+ZIP_DOWNLOAD_DIR = UPLOAD_STORE_DIR / "downloads"
+ZIP_DOWNLOAD_MAX_AGE = 60 * 60
+ZIP_STREAM_QUEUE_SIZE = 4
+UPLOAD_TOKEN_PATTERN = re.compile(r"[0-9a-f]{64}")
+CSV_CHUNK_SIZE = 1 << 20
+SINE_WAVE_CHUNK_ROWS = 1 << 14
+SINE_WAVE_FRAME_CACHE_SIZE = 64 << 20
+# Fixed point budget of spectra, and of traces until the graph is measured
+MAX_POINTS_PER_TRACE = 2000
+POINTS_PER_PIXEL = 2
+SCATTERGL_THRESHOLD = 20000
+DECIMATION_MODES = {"lttb": "LTTB", "min_max": "Min/Max"}
+ANALYSIS_CACHE_SIZE = 8
+CAPTURE_FILE_FORMATS = {"csv": "CSV", "npz": "NPZ"}
+UPLOAD_PARSE_WORKERS = int(
+    os.environ.get("UPLOAD_PARSE_WORKERS", min(8, os.cpu_count() or 1))
+)
+UPLOAD_REQUEST_WORKERS = int(os.environ.get("UPLOAD_REQUEST_WORKERS", "4"))
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+class ZipDownload(NamedTuple):
+    """Parameters of a zip file streamed by ``iter_zip_file``.
+
+    Attributes:
+        app_state: The current state of the application, see
+            ``write_zip_file``
+        channel_data: Channel data and column information
+        base_filename: Base name for the capture files
+        module_prefix: Prefix used to construct state keys
+        file_format: Capture file format, a key of ``CAPTURE_FILE_FORMATS``
+        zip_filename: Name of the downloaded zip file
+
+    """
+
+    app_state: Dict[str, Any]
+    channel_data: Dict[str, Any]
+    base_filename: str
+    module_prefix: str
+    file_format: str
+    zip_filename: str
+
+
+class NpzCapture(NamedTuple):
+    """Capture file in the NPZ format, see ``write_npz_capture``.
+
+    Attributes:
+        header_rows: Metadata table, including its header
+        columns: Names of the data columns
+        data: Data array with one row per record. For captures stored
+            uncompressed, this is a read-only view of the upload contents
+        memory: Memory used by the data array in bytes, 0 for views
+
+    """
+
+    header_rows: List[List[str]]
+    columns: List[str]
+    data: np.ndarray
+    memory: int
+
+
+class SignalAnalysis(NamedTuple):
+    """Statistics and spectra of the selected frames of an upload.
+
+    Attributes:
+        statistics: Minimum, maximum, mean, RMS and peak-to-peak value of
+            every selected file, frame and channel
+        spectra: Trace name, frequencies and power spectral density of
+            every selected file and channel, averaged over the frames
+
+    """
+
+    statistics: pd.DataFrame
+    spectra: List[Tuple[str, np.ndarray, np.ndarray]]
+
+
+class CachedUpload(NamedTuple):
+    """Decoded upload held in the upload cache.
+
+    Attributes:
+        contents: Decoded ZIP archive
+        csv_files: Names of the CSV and NPZ capture files in the archive,
+            in archive order
+        header_rows: First rows of every CSV file, keyed by file name
+        empty_row_indexes: Results of
+            ``find_cached_first_empty_row_index``, keyed by the tuple of CSV
+            file names
+        data_frames: Parsed CSV files, keyed by file name, skipped rows,
+            selected columns and selected row windows
+        captures: Loaded NPZ captures, keyed by file name
+        analyses: Results of ``analyze_selected_zip_contents``, keyed by
+            the selected files, frames, records and columns
+
+    """
+
+    contents: bytes
+    csv_files: List[str]
+    header_rows: Dict[str, List[List[str]]]
+    empty_row_indexes: Dict[Tuple[str, ...], Dict[str, int]]
+    data_frames: Dict[Tuple[Any, ...], pd.DataFrame]
+    captures: Dict[str, NpzCapture]
+    analyses: Dict[Tuple[Any, ...], SignalAnalysis]
+
+
+_upload_lock = threading.Lock()
+_upload_cache: OrderedDict[str, CachedUpload] = OrderedDict()
+_parse_executor = ThreadPoolExecutor(
+    max_workers=max(UPLOAD_PARSE_WORKERS, 1),
+    thread_name_prefix="upload_parse",
+)
+
 
 def write_data_frame_to_buffer(
     data_frame: pd.DataFrame,
@@ -86,173 +273,1080 @@ def write_data_frame_to_buffer(
     buffer.write("\n")
 
 
-def generate_sine_wave_data(
+def iter_sine_wave_samples(
     records: int,
     channels: int,
     sample_interval: float,
-    noise_level: float = 0.01,
-) -> pd.DataFrame:
-    """Generate sine wave data with added noise for multiple channels.
+    noise_level: float,
+    seed: np.random.SeedSequence,
+) -> Iterator[np.ndarray]:
+    """Generate one frame of sine wave data in blocks of rows.
+
+    The TIME column spans the sample interval centered on zero, and each
+    channel is a sine wave with added Gaussian noise. At most
+    ``SINE_WAVE_CHUNK_ROWS`` rows are computed at a time. The noise is
+    drawn from a generator created from the seed, so iterating again with
+    the same seed yields the same samples.
 
     Args:
         records (int): Number of data points to generate.
         channels (int): Number of channels to generate data for.
         sample_interval (float): Total time interval for the data.
         noise_level (float): Standard deviation of the Gaussian noise to add.
+        seed (np.random.SeedSequence): Seed of the noise generator.
 
-    Returns:
-        pd.DataFrame: DataFrame with TIME and channel columns.
+    Yields:
+        np.ndarray: Blocks of rows, with the TIME column followed by the
+        channel columns.
 
     """
     half_interval = sample_interval / 2
-    time_points = np.linspace(-half_interval, half_interval, records)
-
     total_time_range = 2 * half_interval
     frequency = 6 / total_time_range
-    ch_values = 3 * np.sin(2 * np.pi * frequency * time_points)
+    # Same arithmetic as np.linspace, so the time points are identical
+    time_step = total_time_range / (records - 1) if records > 1 else 0.0
+    rng = np.random.default_rng(seed)
+
+    for start in range(0, records, SINE_WAVE_CHUNK_ROWS):
+        stop = min(start + SINE_WAVE_CHUNK_ROWS, records)
+        samples = np.empty((stop - start, channels + 1))
+        samples[:, 0] = np.arange(start, stop) * time_step + -half_interval
+        if stop == records and records > 1:
+            samples[-1, 0] = half_interval
+
+        ch_values = 3 * np.sin(2 * np.pi * frequency * samples[:, 0])
+        samples[:, 1:] = ch_values[:, np.newaxis] + rng.normal(
+            0, noise_level, (stop - start, channels)
+        )
+        yield samples
+
+
+def format_csv_rows(samples: np.ndarray) -> bytes:
+    """Format a block of samples as CSV rows.
+
+    All values are formatted with a single string operation, using the same
+    representation as ``DataFrame.to_csv``.
+
+    Args:
+        samples (np.ndarray): Two-dimensional block of samples.
 
-    data = {"TIME": time_points}
-    for channel_index in range(1, channels + 1):
-        noise = np.random.normal(0, noise_level, records)
-        data[f"CH{channel_index}"] = ch_values + noise
+    Returns:
+        bytes: UTF-8 encoded CSV rows, without header.
 
-    return pd.DataFrame(data)
+    """
+    row_format = ",".join(["%r"] * samples.shape[1]) + "\n"
+    return (
+        (row_format * len(samples)) % tuple(samples.ravel().tolist())
+    ).encode("utf-8")
 
 
-def create_zip_file(
+def write_sine_wave_frames(
+    output: IO[bytes],
+    encode_samples: Callable[[np.ndarray], bytes],
+    records: int,
+    channels: int,
+    sample_interval: float,
+    frames: int,
+    noise_level: float,
+    seed: np.random.SeedSequence,
+) -> None:
+    """Write repeated frames of sine wave data to a binary file.
+
+    The encoded rows of the first frame are kept and written again for the
+    other frames while they fit in ``SINE_WAVE_FRAME_CACHE_SIZE``, otherwise
+    every frame is generated again from the same seed.
+
+    Args:
+        output (IO[bytes]): The file to write to.
+        encode_samples (Callable[[np.ndarray], bytes]):
+            Function encoding a block of samples.
+        records (int): Number of data points per frame.
+        channels (int): Number of channels to generate data for.
+        sample_interval (float): Total time interval of a frame.
+        frames (int): Number of times the frame is repeated.
+        noise_level (float): Standard deviation of the Gaussian noise to add.
+        seed (np.random.SeedSequence): Seed of the noise generator.
+
+    """
+
+    def iter_frame_chunks() -> Iterator[bytes]:
+        for samples in iter_sine_wave_samples(
+            records, channels, sample_interval, noise_level, seed
+        ):
+            yield encode_samples(samples)
+
+    frame_chunks: Optional[List[bytes]] = []
+    frame_size = 0
+    for chunk in iter_frame_chunks():
+        output.write(chunk)
+        if frame_chunks is not None:
+            frame_size += len(chunk)
+            if frame_size > SINE_WAVE_FRAME_CACHE_SIZE:
+                frame_chunks = None
+            else:
+                frame_chunks.append(chunk)
+
+    for _ in range(frames - 1):
+        for chunk in (
+            frame_chunks if frame_chunks is not None else iter_frame_chunks()
+        ):
+            output.write(chunk)
+
+
+def write_npz_capture(
+    output: IO[bytes],
+    header_rows: List[List[str]],
+    columns: List[str],
+    rows: int,
+    write_data: Callable[[IO[bytes]], None],
+    force_zip64: bool = False,
+) -> None:
+    """Write a capture file in the NPZ format.
+
+    The capture is an uncompressed NPZ archive with the arrays ``header``,
+    the metadata table that precedes the data in CSV captures, ``columns``,
+    the column names, and ``data``, a float64 array with one row per
+    record. The data array is streamed, so it is never held in memory.
+
+    Args:
+        output (IO[bytes]): The file to write to, which may be unseekable.
+        header_rows (List[List[str]]): Metadata table, including its header.
+        columns (List[str]): Names of the data columns.
+        rows (int): Number of data rows written by ``write_data``.
+        write_data (Callable[[IO[bytes]], None]): Function writing the data
+            rows as raw little-endian float64 values.
+        force_zip64 (bool): Whether the data array may exceed 2 GiB.
+
+    """
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_STORED) as npz_archive:
+        for name, array in (
+            ("header.npy", np.array(header_rows, dtype=str)),
+            ("columns.npy", np.array(columns, dtype=str)),
+        ):
+            with npz_archive.open(name, "w") as npy_file:
+                np.lib.format.write_array(npy_file, array)
+
+        with npz_archive.open(
+            "data.npy", "w", force_zip64=force_zip64
+        ) as npy_file:
+            np.lib.format.write_array_header_2_0(
+                npy_file,
+                {
+                    "descr": "<f8",
+                    "fortran_order": False,
+                    "shape": (rows, len(columns)),
+                },
+            )
+            write_data(npy_file)
+
+
+def write_zip_file(
+    output: IO[bytes],
     app_state: Dict[str, Any],
     channel_data: Dict[str, Any],
     base_filename: str,
     module_prefix: str,
-) -> bytes:
-    """Generate multiple CSV files and package them into a zip file.
+    file_format: str = "csv",
+) -> None:
+    """Generate multiple capture files and write them to a zip file.
 
-    This function creates a zip file containing multiple CSV files. Each CSV
-    file includes channel data and repeated sine wave data based on the
-    specified parameters.
+    The channel table is formatted once and shared by all files. The sine
+    wave rows are streamed into each zip member in chunks, so the memory
+    used does not grow with the number of records, frames and files.
 
-    The function uses in-memory buffers to create the CSV content and the zip
-    file, avoiding the need for temporary files on disk.
+    CSV captures are compressed. NPZ captures are stored uncompressed, so
+    the explorer can access their data without copying it.
 
     Args:
-        app_state:
-            A dictionary containing the current state of the application,
+        output (IO[bytes]): The binary file to write the zip file to.
+        app_state (Dict[str, Any]): The current state of the application,
             including button states for number of files, records, channels,
             and frames.
-        channel_data:
-            A dictionary containing channel data and column information.
-        base_filename: Base name for the CSV files.
-        module_prefix: Prefix used to construct state keys.
-
-    Returns:
-        The content of the zip file as a bytes object.
+        channel_data (Dict[str, Any]): Channel data and column information.
+        base_filename (str): Base name for the capture files.
+        module_prefix (str): Prefix used to construct state keys.
+        file_format (str): Capture file format, a key of
+            ``CAPTURE_FILE_FORMATS``.
 
     """
-    zip_buffer = io.BytesIO()
+    file_count = int(app_state[f"{module_prefix}_csv_files_button"])
+    records = int(app_state[f"{module_prefix}_records_button"])
+    channels = int(app_state[f"{module_prefix}_channels_button"])
+    frames = int(app_state[f"{module_prefix}_frames_button"])
+    sample_interval = float(
+        app_state[f"{module_prefix}_sample_interval_button"]
+    )
+
+    channel_df = pd.DataFrame(data=channel_data["channel_data"])
+    channel_df.columns = [
+        col_info["name"][0] for col_info in channel_data["columns"]
+    ]
+    channel_buffer = io.StringIO()
+    write_data_frame_to_buffer(channel_df, channel_buffer)
+    channel_table = channel_buffer.getvalue().encode("utf-8")
+    columns = ["TIME"] + [
+        f"CH{channel_index}" for channel_index in range(1, channels + 1)
+    ]
+
+    # Rough upper bound of the member size, 25 bytes per formatted value
+    large_members = (
+        records * frames * (channels + 1) * 25 > zipfile.ZIP64_LIMIT
+    )
+    file_seeds = np.random.SeedSequence().spawn(file_count)
+
     with zipfile.ZipFile(
-        zip_buffer, "a", zipfile.ZIP_DEFLATED, False
+        output, "w", zipfile.ZIP_DEFLATED, allowZip64=True
     ) as zip_archive:
-        for file_index in range(
-            int(app_state[f"{module_prefix}_csv_files_button"])
-        ):
-            csv_buffer = io.StringIO()
-
-            channel_df = pd.DataFrame(data=channel_data["channel_data"])
-            column_names = [
-                col_info["name"][0] for col_info in channel_data["columns"]
-            ]
-            channel_df.columns = column_names
-            write_data_frame_to_buffer(channel_df, csv_buffer)
-
-            sine_wave_df = generate_sine_wave_data(
-                int(app_state[f"{module_prefix}_records_button"]),
-                int(app_state[f"{module_prefix}_channels_button"]),
-                float(app_state[f"{module_prefix}_sample_interval_button"]),
-                noise_level=0.2 - 0.05 * file_index,
+        for file_index, file_seed in enumerate(file_seeds):
+            member_info = zipfile.ZipInfo(
+                f"{base_filename.split('.')[0]}_{file_index + 1}"
+                f".{file_format}",
+                time.localtime()[:6],
+            )
+            member_info.compress_type = (
+                zipfile.ZIP_STORED
+                if file_format == "npz"
+                else zipfile.ZIP_DEFLATED
             )
 
-            repeated_sine_df = pd.concat(
-                [sine_wave_df]
-                * int(app_state[f"{module_prefix}_frames_button"]),
-                ignore_index=True,
+            write_frames = functools.partial(
+                write_sine_wave_frames,
+                records=records,
+                channels=channels,
+                sample_interval=sample_interval,
+                frames=frames,
+                noise_level=max(0.2 - 0.05 * file_index, 0.0),
+                seed=file_seed,
             )
-            write_data_frame_to_buffer(repeated_sine_df, csv_buffer)
 
-            output_filename = (
-                f"{base_filename.split('.')[0]}_{file_index + 1}.csv"
+            with zip_archive.open(
+                member_info, "w", force_zip64=large_members
+            ) as capture_file:
+                if file_format == "npz":
+                    write_npz_capture(
+                        capture_file,
+                        [list(channel_df.columns)]
+                        + channel_df.astype(str).values.tolist(),
+                        columns,
+                        records * frames,
+                        functools.partial(
+                            write_frames,
+                            encode_samples=lambda samples: samples.astype(
+                                "<f8"
+                            ).tobytes(),
+                        ),
+                        large_members,
+                    )
+                else:
+                    capture_file.write(channel_table)
+                    capture_file.write(
+                        (",".join(columns) + "\n").encode("utf-8")
+                    )
+                    write_frames(capture_file, format_csv_rows)
+                    capture_file.write(b"\n")
+
+
+class _ChunkWriter:
+    """Unseekable binary file passing the written data on in chunks."""
+
+    def __init__(self, send: Callable[[bytes], None], chunk_size: int) -> None:
+        self._send = send
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        while len(self._buffer) >= self._chunk_size:
+            self._send(bytes(self._buffer[: self._chunk_size]))
+            del self._buffer[: self._chunk_size]
+        return len(data)
+
+    def flush(self) -> None:
+        if self._buffer:
+            self._send(bytes(self._buffer))
+            self._buffer.clear()
+
+
+def measure_zip_file(
+    app_state: Dict[str, Any],
+    channel_data: Dict[str, Any],
+    base_filename: str,
+    module_prefix: str,
+    file_format: str = "csv",
+) -> int:
+    """Compute the size of the zip file created by ``write_zip_file``.
+
+    The zip file is written to a sink that only counts the bytes, so it is
+    never held in memory. The noise differs between runs, so the size of
+    compressed captures varies slightly.
+
+    Args:
+        app_state (Dict[str, Any]): The current state of the application.
+        channel_data (Dict[str, Any]): Channel data and column information.
+        base_filename (str): Base name for the capture files.
+        module_prefix (str): Prefix used to construct state keys.
+        file_format (str): Capture file format, a key of
+            ``CAPTURE_FILE_FORMATS``.
+
+    Returns:
+        int: Size of the zip file in bytes.
+
+    """
+    size = 0
+
+    def count(chunk: bytes) -> None:
+        nonlocal size
+        size += len(chunk)
+
+    output = _ChunkWriter(count, CSV_CHUNK_SIZE)
+    write_zip_file(
+        output,  # type: ignore[arg-type]
+        app_state,
+        channel_data,
+        base_filename,
+        module_prefix,
+        file_format,
+    )
+    output.flush()
+    return size
+
+
+def iter_zip_file(
+    app_state: Dict[str, Any],
+    channel_data: Dict[str, Any],
+    base_filename: str,
+    module_prefix: str,
+    file_format: str = "csv",
+) -> Iterator[bytes]:
+    """Stream the zip file created by ``write_zip_file`` in chunks.
+
+    The zip file is written by a background thread into a queue of at most
+    ``ZIP_STREAM_QUEUE_SIZE`` chunks of ``CSV_CHUNK_SIZE`` bytes, so the
+    memory used does not grow with the size of the zip file. Closing the
+    iterator, e.g. when the client disconnects, stops the thread.
+
+    Args:
+        app_state (Dict[str, Any]): The current state of the application.
+        channel_data (Dict[str, Any]): Channel data and column information.
+        base_filename (str): Base name for the capture files.
+        module_prefix (str): Prefix used to construct state keys.
+        file_format (str): Capture file format, a key of
+            ``CAPTURE_FILE_FORMATS``.
+
+    Yields:
+        bytes: The next chunk of the zip file.
+
+    """
+    chunks: queue.Queue = queue.Queue(maxsize=ZIP_STREAM_QUEUE_SIZE)
+    cancelled = threading.Event()
+
+    def send(item: Union[bytes, Exception, None]) -> None:
+        while not cancelled.is_set():
+            try:
+                chunks.put(item, timeout=1.0)
+                return
+            except queue.Full:
+                pass
+        raise BrokenPipeError("Zip file stream closed")
+
+    def produce() -> None:
+        try:
+            output = _ChunkWriter(send, CSV_CHUNK_SIZE)
+            write_zip_file(
+                output,  # type: ignore[arg-type]
+                app_state,
+                channel_data,
+                base_filename,
+                module_prefix,
+                file_format,
             )
-            zip_archive.writestr(output_filename, csv_buffer.getvalue())
+            output.flush()
+            send(None)
+        except BrokenPipeError:
+            pass
+        except Exception as error:  # noqa: BLE001
+            with contextlib.suppress(BrokenPipeError):
+                send(error)
+
+    threading.Thread(target=produce, name="zip_stream", daemon=True).start()
+    try:
+        while (chunk := chunks.get()) is not None:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+    finally:
+        cancelled.set()
 
-    return zip_buffer.getvalue()
 
+def register_zip_download(download: ZipDownload) -> str:
+    """Store the parameters of a zip file download on the server.
 
-def count_csv_files_from_zip(
-    file_contents: str,
-) -> int:
-    """Count the number of CSV files in a zip archive.
+    The parameters are stored in the upload store, so any worker can serve
+    the download. Downloads older than ``ZIP_DOWNLOAD_MAX_AGE`` are removed.
 
     Args:
-        file_contents (str): Base64 encoded string of the zip file contents.
+        download (ZipDownload): Parameters of the zip file.
 
     Returns:
-        int: Number of CSV files found in the zip archive.
+        str: Token identifying the download.
+
+    """
+    download_token = secrets.token_hex(32)
+    ZIP_DOWNLOAD_DIR.mkdir(parents=True, exist_ok=True)
+    download_file = ZIP_DOWNLOAD_DIR / f"{download_token}.json"
+    download_file.write_text(json.dumps(download._asdict()), "utf-8")
+
+    expiry_time = time.time() - ZIP_DOWNLOAD_MAX_AGE
+    for expired_file in ZIP_DOWNLOAD_DIR.glob("*.json"):
+        try:
+            if expired_file.stat().st_mtime < expiry_time:
+                expired_file.unlink()
+        except OSError:
+            pass
+    return download_token
+
+
+def get_zip_download(download_token: str) -> ZipDownload:
+    """Get the parameters of a download stored by ``register_zip_download``.
+
+    Args:
+        download_token (str): Token returned by ``register_zip_download``.
+
+    Returns:
+        ZipDownload: Parameters of the zip file.
+
+    Raises:
+        ValueError: If the token is invalid or the download is not stored.
+
+    """
+    if not UPLOAD_TOKEN_PATTERN.fullmatch(download_token):
+        raise ValueError("Invalid download token")
+
+    download_file = ZIP_DOWNLOAD_DIR / f"{download_token}.json"
+    try:
+        return ZipDownload(**json.loads(download_file.read_text("utf-8")))
+    except FileNotFoundError as error:
+        raise ValueError("Download expired, please try again") from error
+
+
+def decode_zip_contents(file_contents: str) -> bytes:
+    """Decode base64 encoded upload contents.
+
+    Args:
+        file_contents (str): Base64 encoded contents, with or without the
+            data URL prefix added by ``dcc.Upload``.
+
+    Returns:
+        bytes: Decoded file contents.
 
     """
     try:
-        decoded_contents = base64.b64decode(file_contents.split(",")[1])
+        return base64.b64decode(file_contents.split(",")[1])
     except IndexError:
-        decoded_contents = base64.b64decode(file_contents)
+        return base64.b64decode(file_contents)
+
+
+def store_upload(file_contents: str) -> str:
+    """Store an uploaded zip file on the server.
+
+    The archive is written to the upload store once and identified by a
+    token, so callbacks only exchange the token with the browser instead of
+    the encoded archive. Stored archives older than a day are removed.
+
+    Args:
+        file_contents (str): Base64 encoded string of the zip file contents.
 
+    Returns:
+        str: Token identifying the stored upload.
+
+    Raises:
+        zipfile.BadZipFile: If the contents are not a zip archive.
+
+    """
+    decoded_contents = decode_zip_contents(file_contents)
+    upload_token = hashlib.sha256(decoded_contents).hexdigest()
+    upload = _cache_upload(upload_token, decoded_contents)
+
+    UPLOAD_STORE_DIR.mkdir(parents=True, exist_ok=True)
+    upload_file = UPLOAD_STORE_DIR / f"{upload_token}.zip"
+    if upload_file.exists():
+        os.utime(upload_file)
+    else:
+        temporary_file = upload_file.with_name(
+            f"{upload_token}.{os.getpid()}.tmp"
+        )
+        temporary_file.write_bytes(upload.contents)
+        os.replace(temporary_file, upload_file)
+
+    _remove_expired_uploads()
+    return upload_token
+
+
+def _remove_expired_uploads() -> None:
+    """Remove stored uploads that were not uploaded again within a day."""
+    expiry_time = time.time() - UPLOAD_STORE_MAX_AGE
+    for upload_file in UPLOAD_STORE_DIR.glob("*.zip"):
+        try:
+            if upload_file.stat().st_mtime < expiry_time:
+                upload_file.unlink()
+        except OSError:
+            pass
+
+
+def get_cached_upload(upload_token: str) -> CachedUpload:
+    """Get a stored upload from the upload cache.
+
+    The upload is read from the upload store only if it is not cached.
+    Least recently used uploads are evicted once the cached archives and
+    frames exceed the cache budget.
+
+    Args:
+        upload_token (str): Token returned by ``store_upload``.
+
+    Returns:
+        CachedUpload: Decoded archive and the data parsed from it so far.
+
+    Raises:
+        ValueError: If the token is invalid or the upload is not stored.
+        zipfile.BadZipFile: If the stored upload is not a zip archive.
+
+    """
+    with _upload_lock:
+        upload = _upload_cache.get(upload_token)
+        if upload is not None:
+            _upload_cache.move_to_end(upload_token)
+            return upload
+
+    if not UPLOAD_TOKEN_PATTERN.fullmatch(upload_token):
+        raise ValueError("Invalid upload token")
+
+    upload_file = UPLOAD_STORE_DIR / f"{upload_token}.zip"
+    try:
+        decoded_contents = upload_file.read_bytes()
+    except FileNotFoundError as error:
+        raise ValueError("Upload not found, please upload it again") from error
+
+    return _cache_upload(upload_token, decoded_contents)
+
+
+def _cache_upload(upload_token: str, decoded_contents: bytes) -> CachedUpload:
+    """Add a decoded upload to the upload cache.
+
+    Args:
+        upload_token (str): Token identifying the upload.
+        decoded_contents (bytes): Decoded zip archive.
+
+    Returns:
+        CachedUpload: The cached upload, or the one cached concurrently.
+
+    Raises:
+        zipfile.BadZipFile: If the contents are not a zip archive.
+
+    """
     with zipfile.ZipFile(io.BytesIO(decoded_contents)) as zip_file:
         csv_file_list = [
             csv_file
             for csv_file in zip_file.namelist()
-            if csv_file.lower().endswith(".csv")
+            if Path(csv_file).suffix.lower()[1:] in CAPTURE_FILE_FORMATS
         ]
-    return len(csv_file_list)
 
+    upload = CachedUpload(
+        contents=decoded_contents,
+        csv_files=csv_file_list,
+        header_rows={},
+        empty_row_indexes={},
+        data_frames={},
+        captures={},
+        analyses={},
+    )
 
-def find_first_empty_row_index(
-    zip_file: zipfile.ZipFile,
-    csv_file_list: List[str],
-    chunk_size: int = 20,
+    with _upload_lock:
+        upload = _upload_cache.setdefault(upload_token, upload)
+        _upload_cache.move_to_end(upload_token)
+        _evict_uploads()
+
+    return upload
+
+
+def open_cached_upload(upload: CachedUpload) -> zipfile.ZipFile:
+    """Open the archive of a cached upload.
+
+    Args:
+        upload (CachedUpload): Cached upload.
+
+    Returns:
+        zipfile.ZipFile: The archive, read from the cached contents.
+
+    """
+    return zipfile.ZipFile(io.BytesIO(upload.contents))
+
+
+def read_cached_csv(
+    upload: CachedUpload,
+    csv_file_name: str,
+    skiprows: int,
+    columns: Optional[List[str]] = None,
+    windows: Optional[List[Tuple[int, int]]] = None,
+) -> pd.DataFrame:
+    """Read a CSV file of a cached upload, parsing it only once.
+
+    The CSV file is streamed from the archive. If columns or row windows
+    are given, only those are parsed, see ``read_csv_windows``. NPZ
+    captures are read with ``read_npz_windows`` instead, ignoring the
+    skipped rows. The returned frame is shared between callbacks and must
+    not be modified in place.
+
+    Args:
+        upload (CachedUpload): Cached upload containing the CSV file.
+        csv_file_name (str): Name of the CSV file in the archive.
+        skiprows (int): Number of rows to skip before the column header.
+        columns (Optional[List[str]]): Columns to parse, or None for all.
+        windows (Optional[List[Tuple[int, int]]]):
+            Data row windows to parse, or None for all rows.
+
+    Returns:
+        pd.DataFrame: Parsed CSV file, indexed by data row number.
+
+    """
+    key = (
+        csv_file_name,
+        skiprows,
+        tuple(columns) if columns is not None else None,
+        tuple(map(tuple, windows)) if windows is not None else None,
+    )
+    data_frame = upload.data_frames.get(key)
+    if data_frame is not None:
+        return data_frame
+
+    if is_npz_capture(csv_file_name):
+        data_frame = read_npz_windows(
+            load_npz_capture(upload, csv_file_name), columns, windows
+        )
+    else:
+        with open_cached_upload(upload) as zip_file, zip_file.open(
+            csv_file_name
+        ) as csv_file:
+            if windows is None:
+                data_frame = pd.read_csv(
+                    csv_file, skiprows=skiprows, usecols=columns
+                )
+            else:
+                data_frame = read_csv_windows(
+                    csv_file, skiprows, columns, windows
+                )
+
+    with _upload_lock:
+        data_frame = upload.data_frames.setdefault(key, data_frame)
+        _evict_uploads()
+
+    return data_frame
+
+
+def read_csv_windows(
+    csv_file: IO[bytes],
+    skiprows: int,
+    columns: Optional[List[str]],
+    windows: List[Tuple[int, int]],
+) -> pd.DataFrame:
+    """Stream selected rows and columns of a CSV file.
+
+    The file is read in chunks. Rows outside the windows are skipped by
+    counting line breaks, without decoding or parsing them, and reading
+    stops after the last window, so only the selected rows are ever held
+    in memory.
+
+    Args:
+        csv_file (IO[bytes]): Binary CSV file, such as a zip member.
+        skiprows (int): Number of rows to skip before the column header.
+        columns (Optional[List[str]]): Columns to parse, or None for all.
+        windows (List[Tuple[int, int]]):
+            Start (inclusive) and stop (exclusive) data row numbers of the
+            rows to parse. Windows may overlap and be given in any order.
+
+    Returns:
+        pd.DataFrame:
+            Selected rows, indexed by their data row number, counted from
+            0 after the column header.
+
+    Raises:
+        ValueError: If the selected rows cannot be parsed consistently.
+
+    """
+    chunks = iter(lambda: csv_file.read(CSV_CHUNK_SIZE), b"")
+    buffer = b""
+    offset = 0
+
+    def read_lines(count: int, keep: bool = True) -> bytes:
+        nonlocal buffer, offset
+        parts = []
+        while count > 0:
+            line_breaks = buffer.count(b"\n", offset)
+            if line_breaks >= count:
+                end = offset
+                for _ in range(count):
+                    end = buffer.index(b"\n", end) + 1
+                if keep:
+                    parts.append(buffer[offset:end])
+                offset = end
+                break
+            if keep:
+                parts.append(buffer[offset:])
+            count -= line_breaks
+            buffer, offset = next(chunks, b""), 0
+            if not buffer:
+                break
+        return b"".join(parts)
+
+    read_lines(skiprows, keep=False)
+    header = read_lines(1)
+    while header and not header.strip():
+        header = read_lines(1)
+
+    selected_lines = []
+    row_numbers = []
+    position = 0
+    for start, stop in _merge_windows(windows):
+        read_lines(start - position, keep=False)
+        block = read_lines(stop - start).splitlines(keepends=True)
+        for row_number, line in enumerate(block, start):
+            if line.strip():
+                selected_lines.append(line)
+                row_numbers.append(row_number)
+        position = stop
+        if len(block) < stop - start:
+            break
+
+    if selected_lines and not selected_lines[-1].endswith(b"\n"):
+        selected_lines[-1] += b"\n"
+
+    data_frame = pd.read_csv(
+        io.BytesIO(header + b"".join(selected_lines)), usecols=columns
+    )
+    if len(data_frame) != len(row_numbers):
+        raise ValueError(f"Unexpected row layout in {csv_file}")
+    data_frame.index = pd.Index(row_numbers, dtype="int64")
+    return data_frame
+
+
+def _merge_windows(windows: List[Tuple[int, int]]) -> List[List[int]]:
+    """Sort row windows and merge the overlapping ones.
+
+    Args:
+        windows (List[Tuple[int, int]]):
+            Start (inclusive) and stop (exclusive) row numbers.
+
+    Returns:
+        List[List[int]]: Disjoint, non-empty windows in ascending order.
+
+    """
+    merged_windows: List[List[int]] = []
+    for start, stop in sorted(windows):
+        if merged_windows and start <= merged_windows[-1][1]:
+            merged_windows[-1][1] = max(merged_windows[-1][1], stop)
+        elif stop > start:
+            merged_windows.append([start, stop])
+    return merged_windows
+
+
+def is_npz_capture(file_name: str) -> bool:
+    """Check if a capture file of an upload is in the NPZ format.
+
+    Args:
+        file_name (str): Name of the capture file in the archive.
+
+    Returns:
+        bool: True for NPZ captures, False for CSV files.
+
+    """
+    return file_name.lower().endswith(".npz")
+
+
+def _stored_member_offset(
+    contents: bytes,
+    member_info: zipfile.ZipInfo,
+    archive_offset: int = 0,
+) -> Optional[int]:
+    """Get the offset of the data of an uncompressed zip member.
+
+    Args:
+        contents (bytes): Bytes containing the archive.
+        member_info (zipfile.ZipInfo): Member of the archive.
+        archive_offset (int): Offset of the archive in the contents.
+
+    Returns:
+        Optional[int]: Offset of the member data in the contents, or None
+        if the member is compressed.
+
+    """
+    if member_info.compress_type != zipfile.ZIP_STORED:
+        return None
+
+    # The local header has a fixed size of 30 bytes, followed by the file
+    # name and an extra field whose lengths are stored at its end
+    header_offset = archive_offset + member_info.header_offset
+    name_length, extra_length = struct.unpack_from(
+        "<HH", contents, header_offset + 26
+    )
+    return header_offset + 30 + name_length + extra_length
+
+
+def load_npz_capture(upload: CachedUpload, file_name: str) -> NpzCapture:
+    """Load an NPZ capture of a cached upload, loading it only once.
+
+    If both the capture and its data array are stored uncompressed, the
+    data array is a view of the upload contents, so no data is copied.
+    Otherwise the data array is read into memory.
+
+    Args:
+        upload (CachedUpload): Cached upload containing the capture.
+        file_name (str): Name of the capture file in the archive.
+
+    Returns:
+        NpzCapture: The loaded capture.
+
+    Raises:
+        ValueError: If the capture is not a valid NPZ capture.
+
+    """
+    capture = upload.captures.get(file_name)
+    if capture is not None:
+        return capture
+
+    with open_cached_upload(upload) as zip_file, zip_file.open(
+        file_name
+    ) as npz_file:
+        capture_offset = _stored_member_offset(
+            upload.contents, zip_file.getinfo(file_name)
+        )
+        try:
+            with np.load(npz_file) as npz:
+                header_rows = npz["header"].tolist()
+                columns = npz["columns"].tolist()
+
+                data_offset = (
+                    None
+                    if capture_offset is None
+                    else _stored_member_offset(
+                        upload.contents,
+                        npz.zip.getinfo("data.npy"),
+                        capture_offset,
+                    )
+                )
+                if data_offset is None:
+                    data = npz["data"]
+                    memory = data.nbytes
+                else:
+                    with npz.zip.open("data.npy") as npy_file:
+                        version = np.lib.format.read_magic(npy_file)
+                        shape, fortran_order, dtype = (
+                            np.lib.format.read_array_header_1_0(npy_file)
+                            if version == (1, 0)
+                            else np.lib.format.read_array_header_2_0(
+                                npy_file
+                            )
+                        )
+                        data_offset += npy_file.tell()
+                    data = np.frombuffer(
+                        upload.contents,
+                        dtype,
+                        int(np.prod(shape)),
+                        data_offset,
+                    ).reshape(shape, order="F" if fortran_order else "C")
+                    memory = 0
+        except (KeyError, OSError) as error:
+            raise ValueError(
+                f"{file_name} is not a valid NPZ capture: {error}"
+            ) from error
+
+    if data.ndim != 2 or data.shape[1] != len(columns):
+        raise ValueError(f"{file_name} has an unexpected data layout")
+
+    capture = NpzCapture(
+        header_rows=header_rows,
+        columns=columns,
+        data=data,
+        memory=memory,
+    )
+    with _upload_lock:
+        capture = upload.captures.setdefault(file_name, capture)
+        _evict_uploads()
+
+    return capture
+
+
+def read_npz_windows(
+    capture: NpzCapture,
+    columns: Optional[List[str]],
+    windows: Optional[List[Tuple[int, int]]],
+) -> pd.DataFrame:
+    """Select rows and columns of an NPZ capture.
+
+    Only the selected values are copied into the returned frame.
+
+    Args:
+        capture (NpzCapture): Loaded capture.
+        columns (Optional[List[str]]): Columns to select, or None for all.
+        windows (Optional[List[Tuple[int, int]]]):
+            Start (inclusive) and stop (exclusive) row numbers of the rows
+            to select, or None for all rows.
+
+    Returns:
+        pd.DataFrame: Selected rows, indexed by their row number.
+
+    Raises:
+        ValueError: If a selected column is not in the capture.
+
+    """
+    if columns is None:
+        columns = capture.columns
+    column_indexes = [capture.columns.index(column) for column in columns]
+
+    row_count = len(capture.data)
+    row_numbers = (
+        np.arange(row_count)
+        if windows is None
+        else np.concatenate(
+            [
+                np.arange(start, min(stop, row_count))
+                for start, stop in _merge_windows(windows)
+            ]
+            + [np.arange(0)]
+        )
+    )
+
+    return pd.DataFrame(
+        capture.data[np.ix_(row_numbers, column_indexes)],
+        columns=columns,
+        index=pd.Index(row_numbers, dtype="int64"),
+    )
+
+
+def map_upload_files(
+    function: Callable[[_T], _R],
+    items: List[_T],
+    max_workers: int = UPLOAD_REQUEST_WORKERS,
+) -> List[_R]:
+    """Apply a function to CSV files of an upload in the parse pool.
+
+    The pool is shared by all requests, and a single request never has
+    more than ``max_workers`` items in flight, so one large upload cannot
+    occupy the whole pool. Functions must open their own archive handle,
+    for example with ``open_cached_upload``, and must not use the pool
+    themselves.
+
+    Args:
+        function (Callable[[_T], _R]): Function applied to every item.
+        items (List[_T]): Items to process, typically CSV file names.
+        max_workers (int): Maximum number of items processed at once.
+
+    Returns:
+        List[_R]: Results in the order of the items.
+
+    """
+    if len(items) <= 1 or max_workers <= 1:
+        return [function(item) for item in items]
+
+    results: List[Any] = [None] * len(items)
+    remaining = iter(enumerate(items))
+    pending = {
+        _parse_executor.submit(function, item): index
+        for index, item in itertools.islice(remaining, max_workers)
+    }
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            results[pending.pop(future)] = future.result()
+            for index, item in itertools.islice(remaining, 1):
+                pending[_parse_executor.submit(function, item)] = index
+
+    return results
+
+
+def _evict_uploads() -> None:
+    """Evict least recently used uploads until the cache fits its budget.
+
+    The most recently used upload is always kept, even if it exceeds the
+    budget on its own. Must be called with the upload lock held.
+    """
+
+    def upload_memory(upload: CachedUpload) -> int:
+        return (
+            len(upload.contents)
+            + sum(
+                int(data_frame.memory_usage(deep=False).sum())
+                for data_frame in list(upload.data_frames.values())
+            )
+            + sum(
+                capture.memory for capture in list(upload.captures.values())
+            )
+            + sum(
+                int(analysis.statistics.memory_usage(deep=True).sum())
+                + sum(
+                    frequencies.nbytes + density.nbytes
+                    for _, frequencies, density in analysis.spectra
+                )
+                for analysis in list(upload.analyses.values())
+            )
+        )
+
+    total_memory = sum(
+        upload_memory(upload) for upload in _upload_cache.values()
+    )
+    while total_memory > UPLOAD_CACHE_BUDGET and len(_upload_cache) > 1:
+        _, evicted = _upload_cache.popitem(last=False)
+        total_memory -= upload_memory(evicted)
+
+
+def count_csv_files_from_zip(
+    upload_token: str,
 ) -> int:
-    """Find the consistent first empty row index across multiple CSV files.
+    """Count the number of CSV files in a zip archive.
+
+    Args:
+        upload_token (str): Token of the stored zip file.
+
+    Returns:
+        int: Number of CSV files found in the zip archive.
+
+    """
+    return len(get_cached_upload(upload_token).csv_files)
 
-    An empty row is defined as a row where all fields are empty or contain
-    only whitespace. The function returns the index of the first empty row
-    if it's consistent across all CSV files, otherwise 0.
 
-    The function reads CSV files in chunks to handle large files efficiently.
+def find_first_empty_row(csv_file: IO[bytes], chunk_size: int = 20) -> int:
+    """Find the index of the first empty row of a CSV file.
 
     Args:
-        zip_file (zipfile.ZipFile): The ZIP file containing CSV files.
-        csv_file_list (List[str]): List of CSV file names in the ZIP file.
+        csv_file (IO[bytes]): Binary CSV file, such as a zip member.
         chunk_size (int): Number of rows to read in each chunk. Default 20.
 
     Returns:
-        int:
-            The index of the first empty row (0-based) if consistent
-            across all CSVs, or 0 if not consistent or not found.
+        int: The index of the first empty row (0-based), or 0 if not found.
 
     """
+    csv_reader = csv.reader(io.TextIOWrapper(csv_file, "utf-8"))
+    for chunk_start, chunk in enumerate(
+        iter(lambda: list(itertools.islice(csv_reader, chunk_size)), [])
+    ):
+        for row_index, row in enumerate(chunk):
+            if not any(field.strip() for field in row):
+                return chunk_start * chunk_size + row_index
+    return 0
 
-    def process_csv(file):
-        csv_reader = csv.reader(io.TextIOWrapper(file, "utf-8"))
-        for chunk_start, chunk in enumerate(
-            iter(lambda: list(itertools.islice(csv_reader, chunk_size)), [])
-        ):
-            for row_index, row in enumerate(chunk):
-                if not any(field.strip() for field in row):
-                    return chunk_start * chunk_size + row_index
-        return 0
 
-    first_empty_row_index_list: List[int] = []
+def _combine_first_empty_rows(
+    first_empty_row_index_list: List[int],
+) -> Dict[str, int]:
+    """Combine the first empty row indexes of multiple CSV files.
+
+    Args:
+        first_empty_row_index_list (List[int]): Index of every CSV file.
 
-    for csv_file_name in csv_file_list:
-        with zip_file.open(csv_file_name) as file:
-            first_empty_row_index_list.append(process_csv(file))
+    Returns:
+        Dict[str, int]:
+            The index before the first empty row if consistent across all
+            CSVs, or 0 otherwise.
 
+    """
     results = {"first_empty_row_index": 0}
 
     if first_empty_row_index_list and all(
@@ -264,14 +1358,53 @@ def find_first_empty_row_index(
     return results
 
 
+def find_cached_first_empty_row_index(
+    upload: CachedUpload,
+    csv_file_list: List[str],
+) -> Dict[str, int]:
+    """Find the consistent first empty row index of CSV files in an upload.
+
+    An empty row is a row where all fields are empty or contain only
+    whitespace. The CSV files are scanned concurrently in the parse pool,
+    and the result is cached in the upload.
+
+    Args:
+        upload (CachedUpload): Cached upload containing the CSV files.
+        csv_file_list (List[str]): List of CSV file names in the upload.
+
+    Returns:
+        Dict[str, int]:
+            The index before the first empty row under the
+            ``first_empty_row_index`` key if consistent across all CSVs,
+            or 0 otherwise.
+
+    """
+    def scan_csv_file(csv_file_name: str) -> int:
+        # The metadata table of NPZ captures ends where the CSV one would
+        if is_npz_capture(csv_file_name):
+            return len(load_npz_capture(upload, csv_file_name).header_rows)
+        with open_cached_upload(upload) as zip_file:
+            with zip_file.open(csv_file_name) as csv_file:
+                return find_first_empty_row(csv_file)
+
+    key = tuple(csv_file_list)
+    results = upload.empty_row_indexes.get(key)
+    if results is None:
+        results = _combine_first_empty_rows(
+            map_upload_files(scan_csv_file, csv_file_list)
+        )
+        upload.empty_row_indexes[key] = results
+    return results
+
+
 def extract_info_from_zip(
-    file_contents: str,
+    upload_token: str,
     keywords: List[str],
 ) -> Dict[str, Union[str, List[str]]]:
     """Extract specific information from CSV files in a zip archive.
 
     Args:
-        file_contents (str): Base64 encoded string of the zip file contents.
+        upload_token (str): Token of the stored zip file.
         keywords (List[str]): List of keywords to search for in the CSV files.
 
     Returns:
@@ -281,9 +1414,7 @@ def extract_info_from_zip(
 
     """
 
-    def process_csv_file(file_object, search_keywords):
-        csv_reader = csv.reader(io.TextIOWrapper(file_object, "utf-8"))
-        chunk = list(itertools.islice(csv_reader, 20))
+    def process_csv_file(chunk, search_keywords):
         return {
             keyword: [
                 row[index + 1]
@@ -298,23 +1429,32 @@ def extract_info_from_zip(
         unique_values = list(dict.fromkeys(value_list))
         return unique_values[0] if len(unique_values) == 1 else unique_values
 
-    try:
-        decoded_contents = base64.b64decode(file_contents.split(",")[1])
-    except IndexError:
-        decoded_contents = base64.b64decode(file_contents)
+    def read_header_rows(csv_filename):
+        if is_npz_capture(csv_filename):
+            return load_npz_capture(upload, csv_filename).header_rows[:20]
+        with open_cached_upload(upload) as zip_archive:
+            with zip_archive.open(csv_filename) as csv_file:
+                csv_reader = csv.reader(io.TextIOWrapper(csv_file, "utf-8"))
+                return list(itertools.islice(csv_reader, 20))
+
+    upload = get_cached_upload(upload_token)
     extraction_results = {keyword: [] for keyword in keywords}
 
-    with zipfile.ZipFile(io.BytesIO(decoded_contents)) as zip_archive:
-        csv_file_list = [
-            filename
-            for filename in zip_archive.namelist()
-            if filename.lower().endswith(".csv")
-        ]
-        for csv_filename in csv_file_list:
-            with zip_archive.open(csv_filename) as csv_file:
-                file_results = process_csv_file(csv_file, keywords)
-                for keyword, values in file_results.items():
-                    extraction_results[keyword].extend(values)
+    missing_files = [
+        csv_filename
+        for csv_filename in upload.csv_files
+        if csv_filename not in upload.header_rows
+    ]
+    for csv_filename, chunk in zip(
+        missing_files, map_upload_files(read_header_rows, missing_files)
+    ):
+        upload.header_rows[csv_filename] = chunk
+
+    for csv_filename in upload.csv_files:
+        chunk = upload.header_rows[csv_filename]
+        file_results = process_csv_file(chunk, keywords)
+        for keyword, values in file_results.items():
+            extraction_results[keyword].extend(values)
     return {
         keyword: simplify_result_values(values)
         for keyword, values in extraction_results.items()
@@ -322,39 +1462,35 @@ def extract_info_from_zip(
 
 
 def read_and_validate_zip(
-    file_contents: str,
+    upload_token: str,
     file_name: str,
-) -> zipfile.ZipFile:
-    """Read and validate a zip file from base64 encoded contents.
+) -> CachedUpload:
+    """Read and validate a zip file from the upload store.
 
     Args:
-        file_contents (str): Base64 encoded file contents.
+        upload_token (str): Token of the stored zip file.
         file_name (str): Name of the file.
 
     Returns:
-        zipfile.ZipFile: A ZipFile object.
+        CachedUpload: The decoded upload from the upload cache.
 
     Raises:
-        ValueError: If the file is not a zip file.
+        ValueError: If the file is not a zip file or is not stored.
 
     """
     if not file_name.lower().endswith(".zip"):
         raise ValueError("Not a zip file")
-    try:
-        decoded_contents = base64.b64decode(file_contents.split(",")[1])
-    except IndexError:
-        decoded_contents = base64.b64decode(file_contents)
-    return zipfile.ZipFile(io.BytesIO(decoded_contents))
+    return get_cached_upload(upload_token)
 
 
 def get_csv_file_list(
-    zip_file: zipfile.ZipFile,
+    upload: CachedUpload,
     filtering: Dict[str, Any],
 ) -> List[str]:
     """Get a list of CSV files from the zip file, applying any filters.
 
     Args:
-        zip_file (zipfile.ZipFile): The zip file object.
+        upload (CachedUpload): The cached upload.
         filtering (Dict[str, Any]):
             Dictionary containing filtering information.
 
@@ -365,11 +1501,7 @@ def get_csv_file_list(
         ValueError: If no CSV files are found in the zip.
 
     """
-    csv_file_list = [
-        csv_file
-        for csv_file in zip_file.namelist()
-        if csv_file.lower().endswith(".csv")
-    ]
+    csv_file_list = upload.csv_files
     if not csv_file_list:
         raise ValueError("No CSV files found in zip")
     try:
@@ -438,8 +1570,265 @@ def create_and_style_figure(
     return scatter_fig
 
 
+def lttb_indices(
+    x_values: np.ndarray,
+    y_values: np.ndarray,
+    max_points: int,
+) -> np.ndarray:
+    """Select samples with the Largest-Triangle-Three-Buckets algorithm.
+
+    The first and last samples are kept. The samples in between are split
+    into ``max_points - 2`` buckets, and from each bucket the sample
+    forming the largest triangle with the previously selected sample and
+    the average of the next bucket is kept, which preserves the visual
+    shape of the signal.
+
+    Args:
+        x_values (np.ndarray): Numeric x values, in ascending order.
+        y_values (np.ndarray): Numeric y values.
+        max_points (int): Maximum number of samples to keep.
+
+    Returns:
+        np.ndarray: Indices of the kept samples, in ascending order.
+
+    """
+    sample_count = len(y_values)
+    if max_points >= sample_count or max_points < 3:
+        return np.arange(sample_count)
+
+    bucket_edges = np.linspace(1, sample_count - 1, max_points - 1).astype(int)
+    bucket_edges = np.append(bucket_edges, sample_count)
+
+    # Averages of every bucket, the last one being the final sample
+    bucket_sizes = np.diff(bucket_edges)
+    average_x = np.add.reduceat(x_values, bucket_edges[:-1]) / bucket_sizes
+    average_y = np.add.reduceat(y_values, bucket_edges[:-1]) / bucket_sizes
+
+    indices = np.empty(max_points, dtype=int)
+    indices[0] = 0
+    indices[-1] = sample_count - 1
+
+    previous_x, previous_y = float(x_values[0]), float(y_values[0])
+    for bucket in range(max_points - 2):
+        start, stop = bucket_edges[bucket], bucket_edges[bucket + 1]
+        next_x = float(average_x[bucket + 1])
+        next_y = float(average_y[bucket + 1])
+
+        # Twice the triangle area, expanded to one term per coordinate
+        areas = np.abs(
+            (previous_x - next_x) * y_values[start:stop]
+            + (next_y - previous_y) * x_values[start:stop]
+            + (previous_y * next_x - previous_x * next_y)
+        )
+        selected = start + int(areas.argmax())
+        indices[bucket + 1] = selected
+        previous_x = float(x_values[selected])
+        previous_y = float(y_values[selected])
+
+    return indices
+
+
+def min_max_indices(y_values: np.ndarray, max_points: int) -> np.ndarray:
+    """Select the minimum and maximum sample of equally sized buckets.
+
+    The resulting envelope keeps every peak of the signal, which makes it
+    suited for noisy or high-frequency captures.
+
+    Args:
+        y_values (np.ndarray): Numeric y values.
+        max_points (int): Maximum number of samples to keep.
+
+    Returns:
+        np.ndarray: Indices of the kept samples, in ascending order.
+
+    """
+    sample_count = len(y_values)
+    if max_points >= sample_count or max_points < 2:
+        return np.arange(sample_count)
+
+    bucket_size = -(-sample_count // (max_points // 2))
+    bucket_count = -(-sample_count // bucket_size)
+    padded = np.full(bucket_count * bucket_size, np.nan)
+    padded[:sample_count] = y_values
+    buckets = padded.reshape(bucket_count, bucket_size)
+    missing = np.isnan(buckets)
+
+    offsets = np.arange(bucket_count) * bucket_size
+    minimums = np.where(missing, np.inf, buckets).argmin(axis=1) + offsets
+    maximums = np.where(missing, -np.inf, buckets).argmax(axis=1) + offsets
+
+    indices = np.unique(np.concatenate([minimums, maximums]))
+    return indices[indices < sample_count]
+
+
+def downsample_trace(
+    x_series: pd.Series,
+    y_series: pd.Series,
+    mode: str = "lttb",
+    x_range: Optional[List[float]] = None,
+    max_points: int = MAX_POINTS_PER_TRACE,
+) -> Tuple[pd.Series, pd.Series]:
+    """Limit a trace to the visible x range and a point budget.
+
+    Samples outside the visible range are dropped, keeping one sample on
+    each side so the trace reaches the plot edges, before the remaining
+    samples are decimated.
+
+    Args:
+        x_series (pd.Series): X values of the trace.
+        y_series (pd.Series): Y values of the trace.
+        mode (str): Decimation mode, ``"lttb"`` or ``"min_max"``.
+        x_range (Optional[List[float]]):
+            Visible x range, or None for the whole trace.
+        max_points (int): Maximum number of points to keep.
+
+    Returns:
+        Tuple[pd.Series, pd.Series]: Decimated x and y values.
+
+    """
+    x_numeric = pd.api.types.is_numeric_dtype(x_series)
+    x_values = (
+        x_series.to_numpy(dtype=float)
+        if x_numeric
+        else np.arange(len(x_series), dtype=float)
+    )
+
+    if x_range is not None and x_numeric and len(x_values):
+        visible = np.flatnonzero(
+            (x_values >= x_range[0]) & (x_values <= x_range[1])
+        )
+        if visible.size:
+            start = max(visible[0] - 1, 0)
+            stop = min(visible[-1] + 2, len(x_values))
+        else:
+            start = stop = 0
+        x_series = x_series.iloc[start:stop]
+        y_series = y_series.iloc[start:stop]
+        x_values = x_values[start:stop]
+
+    if len(y_series) <= max_points:
+        return x_series, y_series
+
+    y_values = pd.to_numeric(y_series, errors="coerce").to_numpy(dtype=float)
+    if mode == "min_max":
+        indices = min_max_indices(y_values, max_points)
+    else:
+        indices = lttb_indices(x_values, y_values, max_points)
+
+    return x_series.iloc[indices], y_series.iloc[indices]
+
+
+def get_max_points(graph_width: Optional[float]) -> int:
+    """Get the point budget of the traces of a graph.
+
+    Two points per pixel keep the minimum and maximum of every pixel
+    column with Min/Max decimation.
+
+    Args:
+        graph_width (Optional[float]): Width of the graph in pixels, or
+            None if it was not measured yet.
+
+    Returns:
+        int: ``POINTS_PER_PIXEL`` points per pixel of the graph width, or
+        ``MAX_POINTS_PER_TRACE`` if the width is unknown.
+
+    """
+    if not graph_width or graph_width <= 0:
+        return MAX_POINTS_PER_TRACE
+    return int(graph_width * POINTS_PER_PIXEL)
+
+
+def get_relayout_x_range(
+    relayout_data: Optional[Dict[str, Any]],
+) -> Optional[List[float]]:
+    """Get the x-axis range from Plotly relayout data.
+
+    Args:
+        relayout_data (Optional[Dict[str, Any]]):
+            ``relayoutData`` of a ``dcc.Graph``.
+
+    Returns:
+        Optional[List[float]]:
+            Zoomed x range, or None if the relayout did not set one.
+
+    """
+    if not relayout_data:
+        return None
+    if "xaxis.range[0]" in relayout_data and "xaxis.range[1]" in relayout_data:
+        x_range = [
+            relayout_data["xaxis.range[0]"],
+            relayout_data["xaxis.range[1]"],
+        ]
+    elif "xaxis.range" in relayout_data:
+        x_range = list(relayout_data["xaxis.range"])
+    else:
+        return None
+    try:
+        return sorted(float(value) for value in x_range)
+    except (TypeError, ValueError):
+        return None
+
+
+def get_frame_windows(filtering: Dict[str, Any]) -> Dict[int, Tuple[int, int]]:
+    """Get the data rows of every selected frame.
+
+    Args:
+        filtering (Dict[str, Any]):
+            Dictionary containing filtering information.
+
+    Returns:
+        Dict[int, Tuple[int, int]]: Start (inclusive) and stop (exclusive)
+        data row numbers, keyed by frame index, in selection order.
+
+    """
+    records_slice = filtering["records_slice"]
+    slice_size = records_slice[1] - records_slice[0]
+    frame_windows = {}
+    for frame_index in filtering["frames_to_keep"]:
+        start = filtering["records_max"] * frame_index + records_slice[0]
+        frame_windows[frame_index] = (start, start + slice_size)
+    return frame_windows
+
+
+def read_selected_frames(
+    upload: CachedUpload,
+    csv_file_name: str,
+    filtering: Dict[str, Any],
+    process_result: Dict[str, Any],
+) -> pd.DataFrame:
+    """Read the selected columns and frames of a capture file.
+
+    Only the x axis and data set columns of the frame windows are parsed.
+    The plot and the analysis of a selection share the parsed frame.
+
+    Args:
+        upload (CachedUpload): The cached upload containing the file.
+        csv_file_name (str): Name of the capture file.
+        filtering (Dict[str, Any]):
+            Dictionary containing filtering information.
+        process_result (Dict[str, Any]):
+            Dictionary containing processing results.
+
+    Returns:
+        pd.DataFrame: Selected rows, indexed by their data row number.
+
+    """
+    return read_cached_csv(
+        upload,
+        csv_file_name,
+        process_result["first_empty_row_index"] + 1,
+        list(
+            dict.fromkeys([
+                filtering["x_axis_data"],
+                *filtering["y_axis_data"],
+            ])
+        ),
+        list(get_frame_windows(filtering).values()),
+    )
+
+
 def process_one_csv_file_for_scatter_data(
-    zip_file: zipfile.ZipFile,
+    upload: CachedUpload,
     csv_file_name: str,
     filtering: Dict[str, Any],
     process_result: Dict[str, Any],
@@ -447,7 +1836,7 @@ def process_one_csv_file_for_scatter_data(
     """Process a single CSV file and generate scatter data.
 
     Args:
-        zip_file (zipfile.ZipFile): The zip file object.
+        upload (CachedUpload): The cached upload containing the CSV file.
         csv_file_name (str): Name of the CSV file to process.
         filtering (Dict[str, Any]):
             Dictionary containing filtering information.
@@ -458,16 +1847,15 @@ def process_one_csv_file_for_scatter_data(
         List[go.Scatter]: List of Scatter objects for plotting.
 
     """
-    csv_contents = zip_file.read(csv_file_name).decode("utf-8")
-    skiprows = process_result["first_empty_row_index"] + 1
-    data_frame = pd.read_csv(io.StringIO(csv_contents), skiprows=skiprows)
+    frame_windows = get_frame_windows(filtering)
+    data_frame = read_selected_frames(
+        upload, csv_file_name, filtering, process_result
+    )
 
     scatter_data = []
-    records_slice = filtering["records_slice"]
-    slice_size = records_slice[1] - records_slice[0]
 
     for frame_index in filtering["frames_to_keep"]:
-        start = filtering["records_max"] * frame_index + records_slice[0]
+        start, stop = frame_windows[frame_index]
         for channel_name in filtering["y_axis_data"]:
             trace_name = (
                 f"{channel_name} frame{frame_index + 1} {csv_file_name}"
@@ -478,14 +1866,18 @@ def process_one_csv_file_for_scatter_data(
                 if channel_name in list(filtering["y_axis_selection"].keys()):
                     yaxis = filtering["y_axis_selection"][channel_name]
 
+            x_values, y_values = downsample_trace(
+                data_frame[filtering["x_axis_data"]].loc[start : stop - 1],
+                data_frame[f"{channel_name}"].loc[start : stop - 1],
+                filtering.get("decimation", "lttb"),
+                filtering.get("x_range"),
+                filtering.get("max_points", MAX_POINTS_PER_TRACE),
+            )
+
             scatter_data.append(
                 go.Scatter(
-                    x=data_frame[filtering["x_axis_data"]][
-                        start : start + slice_size
-                    ],
-                    y=data_frame[f"{channel_name}"][
-                        start : start + slice_size
-                    ],
+                    x=x_values,
+                    y=y_values,
                     yaxis=yaxis,
                     name=trace_name,
                     legendgroup=channel_name
@@ -497,19 +1889,20 @@ def process_one_csv_file_for_scatter_data(
 
 
 def process_multiple_csv_files_for_scatter_data(
-    validated_zip: zipfile.ZipFile,
+    validated_zip: CachedUpload,
     csv_files: List[str],
     skiprows: int,
     filtering: Dict[str, Any],
 ) -> List[Dict[str, Any]]:
     """Process multiple CSV files from a ZIP archive.
 
-    This function iterates through the provided CSV files, processes each one
-    to extract scatter plot data, and combines the results into a single list.
+    This function processes the provided CSV files concurrently to extract
+    scatter plot data, and combines the results into a single list in the
+    order of the files.
 
     Args:
-        validated_zip (ZipFile):
-            A validated ZIP file object containing the CSV files.
+        validated_zip (CachedUpload):
+            A validated cached upload containing the CSV files.
         csv_files (List[str]): A list of CSV file names to process.
         skiprows (int):
             The number of rows to skip at the beginning of each CSV file.
@@ -527,24 +1920,31 @@ def process_multiple_csv_files_for_scatter_data(
 
     """
     scatter_data_list = []
-    for csv_file_name in csv_files:
-        for trace in process_one_csv_file_for_scatter_data(
+    for traces in map_upload_files(
+        lambda csv_file_name: process_one_csv_file_for_scatter_data(
             validated_zip, csv_file_name, filtering, skiprows
-        ):
-            scatter_data_list.append(trace)
+        ),
+        csv_files,
+    ):
+        scatter_data_list.extend(traces)
     return scatter_data_list
 
 
 def plot_selected_zip_contents(
-    zip_contents: str,
+    upload_token: str,
     zip_name: str,
     filtering: Dict[str, Any],
     use_selected_theme: bool,
 ) -> go.Figure:
     """Plot selected contents from a zip files.
 
+    Every trace is limited to the ``x_range`` of the filtering, if set, and
+    decimated to the ``max_points`` of the filtering, by default
+    ``MAX_POINTS_PER_TRACE``, with its ``decimation`` mode. Figures with
+    more than ``SCATTERGL_THRESHOLD`` points are drawn with WebGL.
+
     Args:
-        zip_contents (str): Base64 encoded file contents.
+        upload_token (str): Token of the stored zip file.
         zip_name (str): Name of the zip file.
         filtering (Dict[str, Any]):
             Dictionary containing filtering information.
@@ -558,26 +1958,324 @@ def plot_selected_zip_contents(
 
     """
     try:
-        validated_zip = read_and_validate_zip(zip_contents, zip_name)
+        validated_zip = read_and_validate_zip(upload_token, zip_name)
         csv_file_names = get_csv_file_list(validated_zip, filtering)
-        skiprows = find_first_empty_row_index(validated_zip, csv_file_names)
+        skiprows = find_cached_first_empty_row_index(
+            validated_zip, csv_file_names
+        )
 
         scatter_data = process_multiple_csv_files_for_scatter_data(
             validated_zip, csv_file_names, skiprows, filtering
         )
 
+        # WebGL renders large point counts much faster than SVG
+        if sum(len(trace.x) for trace in scatter_data) > SCATTERGL_THRESHOLD:
+            scatter_data = [
+                go.Scattergl({
+                    key: value
+                    for key, value in trace.to_plotly_json().items()
+                    if key != "type"
+                })
+                for trace in scatter_data
+            ]
+
         layout_configuration = create_base_layout_configuration(filtering)
         update_layout_with_y_axes(layout_configuration, filtering)
+        if filtering.get("x_range") is not None:
+            layout_configuration["xaxis"]["range"] = filtering["x_range"]
 
         return create_and_style_figure(
             scatter_data, use_selected_theme, layout_configuration
         )
 
-    except (base64.binascii.Error, zipfile.BadZipFile, ValueError) as error:
+    except (zipfile.BadZipFile, ValueError) as error:
         print(f"Error: {str(error)}")
         return PreventUpdate
 
 
+def stack_frames(
+    data_frame: pd.DataFrame,
+    frame_windows: List[Tuple[int, int]],
+    columns: List[str],
+) -> np.ndarray:
+    """Stack the rows of equally sized frames into one array.
+
+    Frames are cut to the longest length that all of them have, so rows
+    missing at the end of the capture do not misalign the frames.
+
+    Args:
+        data_frame (pd.DataFrame): Rows indexed by data row number.
+        frame_windows (List[Tuple[int, int]]):
+            Start and stop data row numbers of every frame.
+        columns (List[str]): Columns to stack.
+
+    Returns:
+        np.ndarray: Values with shape (columns, frames, records), so the
+        records of every frame are contiguous. Non-numeric values are NaN.
+
+    """
+    values = (
+        data_frame[columns]
+        .apply(pd.to_numeric, errors="coerce")
+        .to_numpy(dtype=float)
+        .T.copy()
+    )
+    record_count = max(
+        (stop - start for start, stop in frame_windows), default=0
+    )
+    frame_starts = np.array(
+        [start for start, _ in frame_windows], dtype="int64"
+    )
+    row_numbers = frame_starts[:, np.newaxis] + np.arange(record_count)
+    positions = data_frame.index.get_indexer(row_numbers.ravel()).reshape(
+        row_numbers.shape
+    )
+
+    missing = (positions < 0).any(axis=0)
+    if missing.any():
+        positions = positions[:, : int(np.argmax(missing))]
+    return values[:, positions]
+
+
+def compute_frame_statistics(samples: np.ndarray) -> Dict[str, np.ndarray]:
+    """Compute the statistics of every frame and channel at once.
+
+    Args:
+        samples (np.ndarray): Values with shape (channels, frames, records).
+
+    Returns:
+        Dict[str, np.ndarray]: Minimum, maximum, mean, RMS and peak-to-peak
+        values with shape (channels, frames), keyed by statistic name.
+
+    """
+    record_count = samples.shape[-1]
+    if not record_count:
+        empty = np.full(samples.shape[:-1], np.nan)
+        return {
+            name: empty
+            for name in ("Min", "Max", "Mean", "RMS", "Peak-to-peak")
+        }
+
+    minimum = samples.min(axis=-1)
+    maximum = samples.max(axis=-1)
+    return {
+        "Min": minimum,
+        "Max": maximum,
+        "Mean": samples.mean(axis=-1),
+        "RMS": np.sqrt(
+            np.einsum("...i,...i->...", samples, samples) / record_count
+        ),
+        "Peak-to-peak": maximum - minimum,
+    }
+
+
+def compute_power_spectral_density(
+    samples: np.ndarray,
+    sample_spacing: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the power spectral density of frames, averaged over frames.
+
+    The spectra of all frames and channels are computed with one FFT. Each
+    frame is a segment of Welch's method: its mean is removed and it is
+    weighted with a Hann window.
+
+    Args:
+        samples (np.ndarray): Values with shape (channels, frames, records).
+        sample_spacing (float): Spacing of the samples on the x axis.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: One-sided frequencies, and the power
+        spectral density with shape (channels, frequencies).
+
+    """
+    record_count = samples.shape[-1]
+    window = np.hanning(record_count)
+    spectrum = np.fft.rfft(
+        (samples - samples.mean(axis=-1, keepdims=True)) * window
+    )
+    density = np.mean(np.square(np.abs(spectrum)), axis=1) * (
+        sample_spacing / np.sum(np.square(window))
+    )
+
+    # Fold the negative frequencies, except for DC and Nyquist
+    density[:, 1 : record_count - record_count // 2] *= 2
+
+    return np.fft.rfftfreq(record_count, sample_spacing), density
+
+
+def analyze_one_csv_file(
+    upload: CachedUpload,
+    csv_file_name: str,
+    filtering: Dict[str, Any],
+    process_result: Dict[str, Any],
+) -> Tuple[pd.DataFrame, List[Tuple[str, np.ndarray, np.ndarray]]]:
+    """Compute the statistics and spectra of a single capture file.
+
+    Args:
+        upload (CachedUpload): The cached upload containing the file.
+        csv_file_name (str): Name of the capture file to analyze.
+        filtering (Dict[str, Any]):
+            Dictionary containing filtering information.
+        process_result (Dict[str, Any]):
+            Dictionary containing processing results.
+
+    Returns:
+        Tuple[pd.DataFrame, List[Tuple[str, np.ndarray, np.ndarray]]]:
+        Statistics and spectra of the file, see ``SignalAnalysis``.
+
+    """
+    frame_windows = get_frame_windows(filtering)
+    channel_names = filtering["y_axis_data"]
+    samples = stack_frames(
+        read_selected_frames(upload, csv_file_name, filtering, process_result),
+        list(frame_windows.values()),
+        [filtering["x_axis_data"], *channel_names],
+    )
+
+    statistics = pd.DataFrame({
+        "File": csv_file_name,
+        "Frame": np.repeat(
+            np.array(list(frame_windows), dtype="int64") + 1,
+            len(channel_names),
+        ),
+        "Channel": np.tile(channel_names, len(frame_windows)),
+        **{
+            name: values.T.ravel()
+            for name, values in compute_frame_statistics(samples[1:]).items()
+        },
+    })
+
+    spectra = []
+    sample_spacing = (
+        float(np.median(np.diff(samples[0], axis=-1)))
+        if samples.shape[1] and samples.shape[2] > 1
+        else np.nan
+    )
+    if np.isfinite(sample_spacing) and sample_spacing > 0:
+        frequencies, density = compute_power_spectral_density(
+            samples[1:], sample_spacing
+        )
+        spectra = [
+            (f"{channel_name} {csv_file_name}", frequencies, density[index])
+            for index, channel_name in enumerate(channel_names)
+        ]
+
+    return statistics, spectra
+
+
+def analyze_selected_zip_contents(
+    upload_token: str,
+    zip_name: str,
+    filtering: Dict[str, Any],
+) -> SignalAnalysis:
+    """Compute the statistics and spectra of the selected frames.
+
+    The analysis uses the same parsed frames as the plot of the selection,
+    and its result is cached per selection in the upload cache, so only
+    the figure has to be created again when the theme changes.
+
+    Args:
+        upload_token (str): Token of the stored zip file.
+        zip_name (str): Name of the zip file.
+        filtering (Dict[str, Any]):
+            Dictionary containing filtering information.
+
+    Returns:
+        SignalAnalysis: Statistics and spectra of the selection.
+
+    Raises:
+        ValueError: If the upload is not stored or cannot be parsed.
+        zipfile.BadZipFile: If the upload is not a zip archive.
+
+    """
+    upload = read_and_validate_zip(upload_token, zip_name)
+    csv_file_names = get_csv_file_list(upload, filtering)
+    key = (
+        tuple(csv_file_names),
+        tuple(filtering["frames_to_keep"]),
+        filtering["x_axis_data"],
+        tuple(filtering["y_axis_data"]),
+        tuple(filtering["records_slice"]),
+        filtering["records_max"],
+    )
+    analysis = upload.analyses.get(key)
+    if analysis is not None:
+        return analysis
+
+    process_result = find_cached_first_empty_row_index(upload, csv_file_names)
+    results = map_upload_files(
+        lambda csv_file_name: analyze_one_csv_file(
+            upload, csv_file_name, filtering, process_result
+        ),
+        csv_file_names,
+    )
+    analysis = SignalAnalysis(
+        statistics=pd.concat(
+            [statistics for statistics, _ in results], ignore_index=True
+        )
+        if results
+        else pd.DataFrame(),
+        spectra=[spectrum for _, spectra in results for spectrum in spectra],
+    )
+
+    with _upload_lock:
+        analysis = upload.analyses.setdefault(key, analysis)
+        while len(upload.analyses) > ANALYSIS_CACHE_SIZE:
+            upload.analyses.pop(next(iter(upload.analyses)))
+        _evict_uploads()
+
+    return analysis
+
+
+def create_spectrum_figure(
+    analysis: SignalAnalysis,
+    filtering: Dict[str, Any],
+    use_selected_theme: bool,
+) -> go.Figure:
+    """Create the power spectral density figure of an analysis.
+
+    Every spectrum is decimated to the fixed ``MAX_POINTS_PER_TRACE``
+    points with the min/max mode, so narrow peaks are kept.
+
+    Args:
+        analysis (SignalAnalysis): Analysis of the selection.
+        filtering (Dict[str, Any]):
+            Dictionary containing filtering information.
+        use_selected_theme (bool):
+            Indicates light (True) or dark (False) theme.
+
+    Returns:
+        go.Figure: Spectra on a logarithmic density axis.
+
+    """
+    horizontal_units = filtering["Horizontal Units"]
+    frequency_units = (
+        "Hz" if horizontal_units == "s" else f"1/{horizontal_units}"
+    )
+
+    spectrum_data = []
+    for trace_name, frequencies, density in analysis.spectra:
+        x_values, y_values = downsample_trace(
+            pd.Series(frequencies), pd.Series(density), "min_max"
+        )
+        spectrum_data.append(
+            go.Scatter(x=x_values, y=y_values, name=trace_name)
+        )
+
+    layout_configuration = create_base_layout_configuration(filtering)
+    layout_configuration["xaxis"]["title"]["text"] = (
+        f"Frequency ({frequency_units})"
+    )
+    layout_configuration["yaxis"]["title"]["text"] = (
+        f"PSD ({filtering['Vertical Units']}²/{frequency_units})"
+    )
+    layout_configuration["yaxis"]["type"] = "log"
+
+    return create_and_style_figure(
+        spectrum_data, use_selected_theme, layout_configuration
+    )
+
+
 def create_base_layout_configuration(
     filtering: Dict[str, Any],
 ) -> Dict[str, Any]:
@@ -780,13 +2478,13 @@ def create_y_axis_config(
 
 
 def get_csv_files_from_zip(
-    zip_file: zipfile.ZipFile,
+    upload: CachedUpload,
     filtering: Dict[str, Any],
 ) -> List[str]:
     """Get a list of CSV files from the zip file, applying any filters.
 
     Args:
-        zip_file (zipfile.ZipFile): The zip file object.
+        upload (CachedUpload): The cached upload.
         filtering (Dict[str, Any]):
             Dictionary containing filtering information.
 
@@ -794,11 +2492,7 @@ def get_csv_files_from_zip(
         List[str]: List of CSV file names.
 
     """
-    csv_file_list = [
-        csv_file
-        for csv_file in zip_file.namelist()
-        if csv_file.lower().endswith(".csv")
-    ]
+    csv_file_list = upload.csv_files
     try:
         return [
             item
@@ -829,24 +2523,24 @@ def process_csv_file_for_data_frame_extraction(
         List[str]: A list of column names from the CSV file.
 
     """
-    csv_contents = zip_file.read(csv_file_name).decode("utf-8")
-    data_frame = pd.read_csv(
-        io.StringIO(csv_contents),
-        skiprows=process_result["first_empty_row_index"] + 1,
-        nrows=1,
-    )
+    with zip_file.open(csv_file_name) as csv_file:
+        data_frame = pd.read_csv(
+            csv_file,
+            skiprows=process_result["first_empty_row_index"] + 1,
+            nrows=1,
+        )
     return list(data_frame.columns)
 
 
 def extract_data_frame_from_zip_contents(
-    file_contents: str,
+    upload_token: str,
     file_name: str,
     filtering: Dict[str, Any],
 ) -> List[List[str]]:
     """Parse and extract contents of CSV files within an uploaded ZIP file.
 
     Args:
-        file_contents (str): Base64 encoded contents of the ZIP file.
+        upload_token (str): Token of the stored ZIP file.
         file_name (str): Name of the uploaded ZIP file.
         filtering (Dict[str, Any]):
             Dictionary containing filtering information.
@@ -863,28 +2557,26 @@ def extract_data_frame_from_zip_contents(
         return []
 
     try:
-        try:
-            decoded_contents = base64.b64decode(file_contents.split(",")[1])
-        except IndexError:
-            decoded_contents = base64.b64decode(file_contents)
-
-        with zipfile.ZipFile(io.BytesIO(decoded_contents)) as zip_file:
-            csv_files = get_csv_files_from_zip(zip_file, filtering)
+        upload = get_cached_upload(upload_token)
+        csv_files = get_csv_files_from_zip(upload, filtering)
 
-            if not csv_files:
-                print("No CSV files found in the zip archive.")
-                return []
+        if not csv_files:
+            print("No CSV files found in the zip archive.")
+            return []
 
-            first_empty_row_index = find_first_empty_row_index(
-                zip_file, csv_files
-            )
+        first_empty_row_index = find_cached_first_empty_row_index(
+            upload, csv_files
+        )
 
-            data_frames = [
-                process_csv_file_for_data_frame_extraction(
+        def read_column_names(csv_file):
+            if is_npz_capture(csv_file):
+                return load_npz_capture(upload, csv_file).columns
+            with open_cached_upload(upload) as zip_file:
+                return process_csv_file_for_data_frame_extraction(
                     zip_file, csv_file, first_empty_row_index
                 )
-                for csv_file in csv_files
-            ]
+
+        data_frames = map_upload_files(read_column_names, csv_files)
 
         return (
             data_frames[0]
@@ -892,6 +2584,6 @@ def extract_data_frame_from_zip_contents(
             else []
         )
 
-    except (base64.binascii.Error, zipfile.BadZipFile) as error_msg:
+    except (zipfile.BadZipFile, ValueError) as error_msg:
         print(f"There was an error processing the file: {str(error_msg)}")
         return []
@@ -0,0 +1,470 @@
+"""Traffic Data Service.
+
+This module loads the GitHub traffic history, clones and visitors, of the
+repositories shown on the home page and keeps it in memory, so the graph
+callbacks never wait for the network.
+
+Key functionalities:
+1. Concurrent fetching: The CSV files of all repositories are downloaded
+   in a shared thread pool, through a pooled HTTP session with a timeout
+2. TTL cache: Parsed frames are served from memory. Frames older than the
+   time to live are still served, while a background refresh replaces them
+3. Fallbacks: Downloaded files are also stored in a cache directory. If a
+   download fails, the last parsed frames are kept, and repositories that
+   have none are loaded from the cache directory or from the bundled
+   traffic data directory
+4. Period rollups: The weekly and monthly periods of every frame, with
+   their rows and totals, are computed once when the frame is loaded, so
+   navigating between periods is a lookup
+
+The base URL and directories are module constants read at call time, so
+the service can be pointed at a local HTTP server.
+
+Environment Variables:
+    TRAFFIC_DATA_URL (str): Base URL of the traffic CSV files
+        (default: repo_traffic_data of the KiCAD_Symbols_Generator
+        repository on GitHub)
+    TRAFFIC_CACHE_TTL (int): Seconds after which cached traffic data is
+        refreshed (default: 900)
+    TRAFFIC_CACHE_DIR (str): Directory where downloaded CSV files are
+        stored (default: repo_traffic_data_cache in the temporary directory)
+    TRAFFIC_FETCH_WORKERS (int): Concurrent downloads (default: 8)
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+import numpy as np
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+TRAFFIC_DATA_URL = os.environ.get(
+    "TRAFFIC_DATA_URL",
+    "https://raw.githubusercontent.com/ionutms/KiCAD_Symbols_Generator/"
+    "main/repo_traffic_data",
+)
+TRAFFIC_LOCAL_DIR = Path("repo_traffic_data")
+TRAFFIC_CACHE_DIR = Path(
+    os.environ.get(
+        "TRAFFIC_CACHE_DIR",
+        Path(tempfile.gettempdir()) / "repo_traffic_data_cache",
+    )
+)
+TRAFFIC_CACHE_TTL = int(os.environ.get("TRAFFIC_CACHE_TTL", "900"))
+TRAFFIC_FETCH_WORKERS = int(os.environ.get("TRAFFIC_FETCH_WORKERS", "8"))
+TRAFFIC_FETCH_TIMEOUT = 15
+PERIOD_FREQUENCIES = {"week": "W-SUN", "month": "M"}
+VISITORS_COLUMNS = {
+    "visitor_timestamp": "clone_timestamp",
+    "total_visitors": "total_clones",
+    "unique_visitors": "unique_clones",
+}
+
+
+class TrafficPeriod(NamedTuple):
+    """Week or month of a traffic frame.
+
+    Attributes:
+        start: First instant of the period
+        end: Last instant of the period
+        label: Display label of the period
+        data_frame: Rows of the traffic frame within the period
+        total: Sum of the total clones or visitors of the period
+        unique: Sum of the unique clones or visitors of the period
+
+    """
+
+    start: pd.Timestamp
+    end: pd.Timestamp
+    label: str
+    data_frame: pd.DataFrame
+    total: int
+    unique: int
+
+
+class TrafficData(NamedTuple):
+    """Traffic history of a repository held in the traffic cache.
+
+    Attributes:
+        clones: Daily total and unique clones, with missing days filled
+            with 0
+        visitors: Daily total and unique visitors, using the column names
+            of the clones frame
+        clone_periods: Periods of the clones frame, keyed by range type
+            and ordered from most recent to oldest
+        visitor_periods: Periods of the visitors frame, keyed by range type
+            and ordered from most recent to oldest
+        loaded_at: Monotonic time at which the data was loaded
+
+    """
+
+    clones: pd.DataFrame
+    visitors: pd.DataFrame
+    clone_periods: dict[str, tuple[TrafficPeriod, ...]]
+    visitor_periods: dict[str, tuple[TrafficPeriod, ...]]
+    loaded_at: float
+
+
+_lock = threading.Lock()
+_traffic_cache: dict[str, TrafficData] = {}
+_pending_refreshes: dict[str, Future] = {}
+_fetch_executor = ThreadPoolExecutor(
+    max_workers=max(TRAFFIC_FETCH_WORKERS, 1),
+    thread_name_prefix="traffic_fetch",
+)
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(pool_maxsize=max(TRAFFIC_FETCH_WORKERS, 1)),
+)
+_session.mount(
+    "http://",
+    HTTPAdapter(pool_maxsize=max(TRAFFIC_FETCH_WORKERS, 1)),
+)
+
+
+def get_traffic_data(repo_name: str) -> TrafficData:
+    """Get the traffic history of a repository.
+
+    Cached data is returned immediately, and a background refresh is
+    started if it is older than the time to live. Only the first request
+    for a repository waits, for the refresh that is already running or
+    for a new one. If that refresh fails, empty traffic data is returned
+    without caching it, so the next request tries again.
+
+    Args:
+        repo_name (str): Name of the repository
+
+    Returns:
+        TrafficData: Clones and visitors of the repository
+
+    """
+    with _lock:
+        cached = _traffic_cache.get(repo_name)
+
+    if cached is None:
+        future = refresh_traffic_data([repo_name])[0]
+        try:
+            future.result()
+        except Exception as error:  # noqa: BLE001
+            logging.error(f"Could not load traffic data {repo_name}: {error}")
+
+        with _lock:
+            cached = _traffic_cache.get(repo_name)
+        if cached is None:
+            empty_frame = empty_traffic_frame()
+            empty_periods = build_traffic_periods(empty_frame)
+            return TrafficData(
+                clones=empty_frame,
+                visitors=empty_frame,
+                clone_periods=empty_periods,
+                visitor_periods=empty_periods,
+                loaded_at=time.monotonic(),
+            )
+        return cached
+
+    if time.monotonic() - cached.loaded_at > TRAFFIC_CACHE_TTL:
+        refresh_traffic_data([repo_name])
+
+    return cached
+
+
+def refresh_traffic_data(repo_names: Iterable[str]) -> list[Future]:
+    """Reload the traffic history of repositories in the background.
+
+    A repository that is already being refreshed is not submitted again,
+    the running refresh is returned instead.
+
+    Args:
+        repo_names (Iterable[str]): Names of the repositories
+
+    Returns:
+        list[Future]: Refresh of every repository, in the given order
+
+    """
+    futures = []
+    with _lock:
+        for repo_name in repo_names:
+            future = _pending_refreshes.get(repo_name)
+            if future is None:
+                future = _fetch_executor.submit(_refresh_repo, repo_name)
+                _pending_refreshes[repo_name] = future
+            futures.append(future)
+
+    return futures
+
+
+def _refresh_repo(repo_name: str) -> None:
+    """Load the traffic history of a repository into the cache.
+
+    Frames that cannot be loaded keep their previously cached value, or
+    are empty if the repository was not cached yet. The periods of the
+    frames are computed before the data is published to the cache.
+
+    Args:
+        repo_name (str): Name of the repository
+
+    """
+    try:
+        clones = load_traffic_frame(f"{repo_name.lower()}_clones_history.csv")
+        visitors = load_traffic_frame(
+            f"{repo_name.lower()}_visitors_history.csv",
+            VISITORS_COLUMNS,
+        )
+
+        with _lock:
+            previous = _traffic_cache.get(repo_name)
+        if clones is None:
+            clones = (
+                previous.clones
+                if previous is not None
+                else empty_traffic_frame()
+            )
+        if visitors is None:
+            visitors = (
+                previous.visitors
+                if previous is not None
+                else empty_traffic_frame()
+            )
+
+        traffic_data = TrafficData(
+            clones=clones,
+            visitors=visitors,
+            clone_periods=build_traffic_periods(clones),
+            visitor_periods=build_traffic_periods(visitors),
+            loaded_at=time.monotonic(),
+        )
+        with _lock:
+            _traffic_cache[repo_name] = traffic_data
+    finally:
+        with _lock:
+            _pending_refreshes.pop(repo_name, None)
+
+
+def build_traffic_periods(
+    data_frame: pd.DataFrame,
+) -> dict[str, tuple[TrafficPeriod, ...]]:
+    """Split a traffic frame into its weeks and months.
+
+    The frame has one row per day in chronological order, so every period
+    is a contiguous block of rows. The blocks are found from the changes
+    of the period ordinals and summed with a single reduction per range
+    type.
+
+    Args:
+        data_frame (pd.DataFrame): Traffic frame with missing days filled
+
+    Returns:
+        dict[str, tuple[TrafficPeriod, ...]]: Periods keyed by range type,
+        ordered from most recent to oldest
+
+    """
+    if data_frame.empty:
+        return {range_type: () for range_type in PERIOD_FREQUENCIES}
+
+    total_values = data_frame["total_clones"].to_numpy()
+    unique_values = data_frame["unique_clones"].to_numpy()
+
+    periods = {}
+    for range_type, frequency in PERIOD_FREQUENCIES.items():
+        period_index = pd.PeriodIndex(
+            data_frame["clone_timestamp"], freq=frequency
+        )
+        ordinals = period_index.asi8
+        row_starts = np.flatnonzero(
+            np.concatenate(([True], ordinals[1:] != ordinals[:-1]))
+        )
+        row_stops = np.append(row_starts[1:], len(ordinals))
+        totals = np.add.reduceat(total_values, row_starts)
+        uniques = np.add.reduceat(unique_values, row_starts)
+
+        range_periods = []
+        for row_start, row_stop, total, unique in zip(
+            row_starts, row_stops, totals, uniques
+        ):
+            period = period_index[row_start]
+            start, end = period.start_time, period.end_time
+            label = (
+                f"{start.strftime('%b %d')} - {end.strftime('%b %d, %Y')}"
+                if range_type == "week"
+                else period.strftime("%B %Y")
+            )
+            range_periods.append(
+                TrafficPeriod(
+                    start=start,
+                    end=end,
+                    label=label,
+                    data_frame=(
+                        data_frame.iloc[row_start:row_stop].reset_index(
+                            drop=True
+                        )
+                    ),
+                    total=int(total),
+                    unique=int(unique),
+                )
+            )
+        periods[range_type] = tuple(reversed(range_periods))
+
+    return periods
+
+
+def get_traffic_period(
+    periods: dict[str, tuple[TrafficPeriod, ...]],
+    range_type: str,
+    offset: int,
+) -> TrafficPeriod | None:
+    """Look up the period at an offset from the most recent one.
+
+    An offset beyond the oldest period is clamped to that period.
+
+    Args:
+        periods (dict[str, tuple[TrafficPeriod, ...]]): Periods returned by
+            ``build_traffic_periods``
+        range_type (str): One of "week", "month" or "all"
+        offset (int): 0 for the most recent period, 1 for the previous one,
+            and so on
+
+    Returns:
+        TrafficPeriod | None: Selected period, or None for the "all" range
+        type or if there are no periods
+
+    """
+    range_periods = periods.get(range_type)
+    if not range_periods:
+        return None
+
+    return range_periods[min(max(offset, 0), len(range_periods) - 1)]
+
+
+def load_traffic_frame(
+    file_name: str,
+    rename_columns: dict[str, str] | None = None,
+) -> pd.DataFrame | None:
+    """Load a traffic CSV file, falling back to the on-disk copies.
+
+    The file is downloaded first. If the download or parsing fails, the
+    last downloaded copy in the cache directory is used, and then the copy
+    in the bundled traffic data directory.
+
+    Args:
+        file_name (str): Name of the CSV file
+        rename_columns (dict[str, str] | None): Columns to rename to the
+            clones column names
+
+    Returns:
+        pd.DataFrame | None: Traffic frame with missing days filled with 0,
+        or None if no copy of the file could be loaded
+
+    """
+    text = fetch_traffic_csv(file_name)
+    if text is not None:
+        data_frame = parse_traffic_csv(io.StringIO(text), rename_columns)
+        if data_frame is not None:
+            return data_frame
+
+    for directory in (TRAFFIC_CACHE_DIR, TRAFFIC_LOCAL_DIR):
+        local_file = directory / file_name
+        if local_file.is_file():
+            data_frame = parse_traffic_csv(local_file, rename_columns)
+            if data_frame is not None:
+                return data_frame
+
+    return None
+
+
+def fetch_traffic_csv(file_name: str) -> str | None:
+    """Download a traffic CSV file and store a copy in the cache directory.
+
+    Args:
+        file_name (str): Name of the CSV file
+
+    Returns:
+        str | None: Contents of the file, or None if the download failed
+
+    """
+    url = f"{TRAFFIC_DATA_URL}/{file_name}"
+    try:
+        response = _session.get(url, timeout=TRAFFIC_FETCH_TIMEOUT)
+        response.raise_for_status()
+    except requests.RequestException as error:
+        logging.warning(f"Could not download {url}: {error}")
+        return None
+
+    text = response.text
+    temporary_file = TRAFFIC_CACHE_DIR / f"{file_name}.{os.getpid()}.tmp"
+    try:
+        TRAFFIC_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        temporary_file.write_text(text, encoding="utf-8")
+        os.replace(temporary_file, TRAFFIC_CACHE_DIR / file_name)
+    except OSError as error:
+        logging.warning(f"Could not cache {file_name}: {error}")
+
+    return text
+
+
+def parse_traffic_csv(
+    source: io.StringIO | Path,
+    rename_columns: dict[str, str] | None = None,
+) -> pd.DataFrame | None:
+    """Parse a traffic CSV file and fill in the missing days.
+
+    Args:
+        source (io.StringIO | Path): Contents or path of the CSV file
+        rename_columns (dict[str, str] | None): Columns to rename to the
+            clones column names
+
+    Returns:
+        pd.DataFrame | None: Traffic frame with missing days filled with 0,
+        or None if the file is malformed
+
+    """
+    try:
+        data_frame = pd.read_csv(source)
+        if rename_columns:
+            data_frame = data_frame.rename(columns=rename_columns)
+        data_frame["clone_timestamp"] = pd.to_datetime(
+            data_frame["clone_timestamp"],
+        )
+    except (ValueError, KeyError, OSError) as error:
+        logging.warning(f"Could not parse traffic data {source}: {error}")
+        return None
+
+    if not data_frame.empty:
+        date_range = pd.date_range(
+            start=data_frame["clone_timestamp"].min(),
+            end=data_frame["clone_timestamp"].max(),
+        )
+        data_frame = (
+            data_frame.set_index("clone_timestamp")
+            .reindex(date_range, fill_value=0)
+            .reset_index()
+            .rename(columns={"index": "clone_timestamp"})
+        )
+
+    return data_frame
+
+
+def empty_traffic_frame() -> pd.DataFrame:
+    """Create an empty traffic frame.
+
+    Returns:
+        pd.DataFrame: Frame with the clones columns and no rows
+
+    """
+    return pd.DataFrame(
+        {
+            "clone_timestamp": pd.Series(dtype="datetime64[ns]"),
+            "total_clones": pd.Series(dtype="int"),
+            "unique_clones": pd.Series(dtype="int"),
+        }
+    )
@@ -0,0 +1,702 @@
+"""Parallel build orchestrator for all component families.
+
+This script discovers every ``mpn_*_generator.py`` module under the
+``scripts/`` directory, fans the per-series work of all families out across
+a process pool and then merges the generated parts of each family into its
+``UNITED_*`` CSV and ``.kicad_sym`` files.
+
+Series results are collected in specification order and families are
+processed in alphabetical order, so the generated files are identical to the
+ones produced by running each family generator on its own.
+
+The content hash and written files of every series are recorded in a build
+manifest. The generators report the files they write by opening them with
+``file_handler_utilities.open_output_file``. A series is only skipped when
+its hash is unchanged and all its recorded files still exist, and a hash is
+only recorded when the series was generated without errors.
+
+Usage:
+    Rebuild all families:
+        python scripts/build_all_libraries.py
+    Rebuild selected families with 4 worker processes:
+        python scripts/build_all_libraries.py capacitors diodes --jobs 4
+    Write compact unified symbol libraries with shared drawings:
+        python scripts/build_all_libraries.py --shared-drawings --compact
+
+Note:
+    Like the family generators, this script must be run from the repository
+    root, since all output paths are relative to it.
+
+"""
+
+import argparse
+import importlib
+import inspect
+import os
+import sys
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, NamedTuple
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+CACHE_DIR = Path(".build_cache")
+MANIFEST_FILE = CACHE_DIR / "manifest.json"
+
+# Series spec fields naming the footprint files a series writes. Series
+# sharing any of these values write the same file and are built together.
+FOOTPRINT_FIELDS = (
+    "footprint",
+    "package",
+    "case_code_in",
+    "value_case_codes_in",
+)
+
+sys.path.append(str(SCRIPTS_DIR))
+
+from utilities import (  # noqa: E402
+    build_manifest_utilities,
+    file_handler_utilities,
+    print_message_utilities,
+)
+
+
+class FamilyInfo(NamedTuple):
+    """Location of a component family generator.
+
+    Attributes:
+        name: Family name, equal to its directory name (e.g. 'capacitors')
+        directory: Directory containing the family scripts
+        module_name: Name of the family's mpn generator module
+
+    """
+
+    name: str
+    directory: str
+    module_name: str
+
+
+class SeriesResult(NamedTuple):
+    """Outcome of generating the files of one series.
+
+    Attributes:
+        parts: PartInfo instances generated for the series
+        outputs: Files written while generating the series
+        failed: True if the generator reported an error
+
+    """
+
+    parts: list
+    outputs: list[str]
+    failed: bool
+
+
+class UnifiedResult(NamedTuple):
+    """Outcome of generating the unified files of a family.
+
+    Attributes:
+        part_count: Number of parts written to the unified files
+        outputs: Files written while generating the unified files
+        failed: True if the generator reported an error
+
+    """
+
+    part_count: int
+    outputs: list[str]
+    failed: bool
+
+
+def discover_families(scripts_dir: Path = SCRIPTS_DIR) -> list[FamilyInfo]:
+    """Find all component families that provide an mpn generator.
+
+    Args:
+        scripts_dir: Directory containing one sub-directory per family
+
+    Returns:
+        list[FamilyInfo]: Discovered families sorted by name
+
+    """
+    return [
+        FamilyInfo(
+            name=generator_path.parent.name,
+            directory=str(generator_path.parent),
+            module_name=generator_path.stem,
+        )
+        for generator_path in sorted(scripts_dir.glob("*/mpn_*_generator.py"))
+    ]
+
+
+def add_family_paths(families: list[FamilyInfo]) -> None:
+    """Add the family directories to ``sys.path``.
+
+    The generator modules import their sibling symbol and footprint modules
+    directly, and worker processes need the same paths to unpickle the
+    PartInfo instances of every family.
+
+    Args:
+        families: Families whose directories should be importable
+
+    Returns:
+        None
+
+    """
+    for family in families:
+        if family.directory not in sys.path:
+            sys.path.insert(0, family.directory)
+
+
+def load_generator(family: FamilyInfo) -> Any:  # noqa: ANN401
+    """Import the mpn generator module of a family.
+
+    Args:
+        family: Family to load the generator for
+
+    Returns:
+        module: The imported mpn generator module
+
+    """
+    add_family_paths([family])
+    return importlib.import_module(family.module_name)
+
+
+def uses_shared_footprints(generator: Any) -> bool:  # noqa: ANN401
+    """Check if a generator deduplicates footprints across its series.
+
+    Such generators take a ``generated_footprints`` set that must be shared
+    by all series of the family, so their series are built in one task.
+
+    Args:
+        generator: The imported mpn generator module
+
+    Returns:
+        bool: True if the series of the family must be built together
+
+    """
+    parameters = inspect.signature(generator.generate_files_for_series)
+    return "generated_footprints" in parameters.parameters
+
+
+def get_footprint_keys(series_spec: Any) -> set[str]:  # noqa: ANN401
+    """Collect the values of a series spec that name footprint files.
+
+    Args:
+        series_spec: SeriesSpec entry of the series
+
+    Returns:
+        set[str]: Footprint names, packages and case codes of the series
+
+    """
+    footprint_keys: set[str] = set()
+    for field in FOOTPRINT_FIELDS:
+        value = getattr(series_spec, field, None)
+        if isinstance(value, dict):
+            values = value.values()
+        elif isinstance(value, (list, tuple, set)):
+            values = value
+        else:
+            values = [value]
+        footprint_keys.update(str(item) for item in values if item)
+    return footprint_keys
+
+
+def group_series(
+    family: FamilyInfo,
+    generator: Any,  # noqa: ANN401
+    series_outputs: dict[str, list[str]],
+) -> list[list[str]]:
+    """Split the series of a family into batches that share no files.
+
+    Several series of a family often write the same footprint file, such as
+    one ``{package}.kicad_mod`` per diode package. Building them in
+    different processes would let them write the file concurrently, so
+    series sharing a footprint key, or a file recorded by the previous
+    build, end up in the same batch. Each batch keeps specification order,
+    so the last writer of a shared file is the same as in a serial build.
+
+    Args:
+        family: Family the series belong to
+        generator: The imported mpn generator module
+        series_outputs: Files recorded for each series by the previous
+            build, keyed by ``family/series``
+
+    Returns:
+        list[list[str]]: Batches of series names, in specification order
+
+    """
+    series_names = list(generator.SERIES_SPECS)
+    if uses_shared_footprints(generator):
+        return [series_names]
+
+    parents = {series: series for series in series_names}
+
+    def find_root(series: str) -> str:
+        """Return the first series of the batch a series belongs to."""
+        while parents[series] != series:
+            series = parents[series]
+        return series
+
+    key_owners: dict[str, str] = {}
+    for series, series_spec in generator.SERIES_SPECS.items():
+        shared_keys = get_footprint_keys(series_spec)
+        shared_keys.update(
+            series_outputs.get(f"{family.name}/{series}", []),
+        )
+        for key in shared_keys:
+            owner = key_owners.setdefault(key, series)
+            roots = sorted(
+                {find_root(owner), find_root(series)},
+                key=series_names.index,
+            )
+            for root in roots[1:]:
+                parents[root] = roots[0]
+
+    series_batches: dict[str, list[str]] = {}
+    for series in series_names:
+        series_batches.setdefault(find_root(series), []).append(series)
+    return list(series_batches.values())
+
+
+def get_source_digest(family: FamilyInfo, generator: Any) -> str:  # noqa: ANN401
+    """Compute the digest of the sources a family generator depends on.
+
+    Args:
+        family: Family to compute the digest for
+        generator: The imported mpn generator module
+
+    Returns:
+        str: Hexadecimal SHA-256 digest
+
+    """
+    series_spec = next(iter(generator.SERIES_SPECS.values()))
+    specs_file = Path(sys.modules[type(series_spec).__module__].__file__)
+    source_files = [
+        source_file
+        for source_file in Path(family.directory).glob("*.py")
+        if source_file.resolve() != specs_file.resolve()
+    ]
+    source_files.extend((SCRIPTS_DIR / "utilities").glob("*.py"))
+    return build_manifest_utilities.compute_source_digest(
+        source_files,
+        specs_file,
+    )
+
+
+def build_series(
+    family: FamilyInfo,
+    series_names: list[str],
+) -> list[SeriesResult]:
+    """Generate the series files of a family and return the generated parts.
+
+    Runs in a worker process. The generators report errors through
+    ``print_error`` instead of raising, so a series counts as failed when
+    the error count grew while generating it.
+
+    Args:
+        family: Family the series belong to
+        series_names: Names of the series to generate, in build order
+
+    Returns:
+        list[SeriesResult]: Result of each series, in build order
+
+    """
+    generator = load_generator(family)
+    series_results: list[SeriesResult] = []
+    generated_footprints: set[str] = set()
+
+    for series in series_names:
+        print_message_utilities.print_info(
+            f"\nGenerating files for {series} series ({family.name}):",
+        )
+        parts_list: list = []
+        error_count = print_message_utilities.get_error_count()
+        with file_handler_utilities.record_outputs() as outputs:
+            if uses_shared_footprints(generator):
+                generator.generate_files_for_series(
+                    series,
+                    parts_list,
+                    generated_footprints,
+                )
+            else:
+                generator.generate_files_for_series(series, parts_list)
+        series_results.append(
+            SeriesResult(
+                parts_list,
+                sorted(outputs),
+                print_message_utilities.get_error_count() > error_count,
+            )
+        )
+
+    return series_results
+
+
+def build_unified_files(
+    family: FamilyInfo,
+    all_parts: list,
+    shared_drawings: bool = False,
+    compact: bool = False,
+) -> UnifiedResult:
+    """Merge the parts of a family into its unified database files.
+
+    Runs in a worker process.
+
+    Args:
+        family: Family to generate the unified files for
+        all_parts: PartInfo instances of all series of the family
+        shared_drawings: Write parts sharing a drawing as derived symbols
+            extending the first of them
+        compact: Write the unified symbol file without indentation
+
+    Returns:
+        UnifiedResult: Part count, written files and error state
+
+    """
+    generator = load_generator(family)
+    print_message_utilities.print_info(
+        f"\nGenerating unified files ({family.name}):",
+    )
+    error_count = print_message_utilities.get_error_count()
+    with file_handler_utilities.record_outputs() as outputs:
+        generator.generate_unified_files(
+            all_parts,
+            generator.UNIFIED_CSV,
+            generator.UNIFIED_SYMBOL,
+            shared_drawings,
+            compact,
+        )
+    return UnifiedResult(
+        len(all_parts),
+        sorted(outputs),
+        print_message_utilities.get_error_count() > error_count,
+    )
+
+
+def build_families(
+    families: list[FamilyInfo],
+    jobs: int,
+    force: bool = False,
+    shared_drawings: bool = False,
+    compact: bool = False,
+) -> bool:
+    """Build the given families using a pool of worker processes.
+
+    Series are grouped into tasks by ``group_series``, so series writing
+    the same footprint file never run concurrently. Batches whose content
+    hashes match the build manifest and whose recorded files all exist are
+    skipped and their cached parts are reused. Once all series of a family
+    are available, the family's unified files are generated as a separate
+    task, but only if at least one series changed or a unified file is
+    missing, and never if a series of the family failed.
+
+    Args:
+        families: Families to build
+        jobs: Maximum number of worker processes
+        force: Rebuild all series and unified files, ignoring the manifest
+        shared_drawings: Write the unified symbol libraries with shared
+            drawings
+        compact: Write the unified symbol libraries without indentation
+
+    Returns:
+        bool: True if every task finished without errors
+
+    """
+    success = True
+
+    add_family_paths(families)
+    manifest = build_manifest_utilities.load_manifest(MANIFEST_FILE)
+    series_manifest = manifest["series"]
+    unified_manifest = manifest["unified"]
+    series_outputs = manifest["series_outputs"]
+    unified_outputs = manifest["unified_outputs"]
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=add_family_paths,
+        initargs=(families,),
+    ) as executor:
+        series_futures: dict[Future, tuple[FamilyInfo, int]] = {}
+        family_batches: dict[str, list[list[str]]] = {}
+        family_hashes: dict[str, dict[str, str]] = {}
+        pending_results: dict[str, dict[str, list | None]] = {}
+        changed_families: set[str] = set()
+        failed_families: set[str] = set()
+        unified_futures: dict[Future, tuple[FamilyInfo, str]] = {}
+
+        def merge_family(family: FamilyInfo) -> None:
+            """Submit the unified files task once all series are done."""
+            results = pending_results[family.name]
+            if any(result is None for result in results.values()):
+                return
+
+            if family.name in failed_families:
+                # Merging incomplete parts would overwrite good files
+                print_message_utilities.print_error(
+                    f"Skipping unified {family.name} files, since some "
+                    "series failed.",
+                )
+                return
+
+            generator = load_generator(family)
+            if not hasattr(generator, "UNIFIED_CSV"):
+                return
+
+            unified_hash = build_manifest_utilities.compute_unified_hash(
+                list(family_hashes[family.name].values()),
+                shared_drawings,
+                compact,
+            )
+            if (
+                not force
+                and family.name not in changed_families
+                and unified_manifest.get(family.name) == unified_hash
+                and build_manifest_utilities.outputs_exist(
+                    unified_outputs.get(family.name)
+                )
+            ):
+                print_message_utilities.print_info(
+                    f"Unified {family.name} files are up to date.",
+                )
+                return
+
+            # Merge in specification order for deterministic output
+            all_parts = [
+                part
+                for series in family_hashes[family.name]
+                for part in results[series]
+            ]
+            future = executor.submit(
+                build_unified_files,
+                family,
+                all_parts,
+                shared_drawings,
+                compact,
+            )
+            unified_futures[future] = (family, unified_hash)
+
+        for family in families:
+            generator = load_generator(family)
+            source_digest = get_source_digest(family, generator)
+            family_hashes[family.name] = {
+                series: build_manifest_utilities.compute_series_hash(
+                    source_digest,
+                    series_spec,
+                )
+                for series, series_spec in generator.SERIES_SPECS.items()
+            }
+
+            series_batches = group_series(family, generator, series_outputs)
+            family_batches[family.name] = series_batches
+            pending_results[family.name] = dict.fromkeys(
+                generator.SERIES_SPECS,
+            )
+            for index, batch in enumerate(series_batches):
+                cached_parts = (
+                    None
+                    if force
+                    else load_up_to_date_parts(
+                        family,
+                        batch,
+                        family_hashes[family.name],
+                        manifest,
+                    )
+                )
+                if cached_parts is not None:
+                    pending_results[family.name].update(
+                        zip(batch, cached_parts),
+                    )
+                    continue
+
+                changed_families.add(family.name)
+                future = executor.submit(build_series, family, batch)
+                series_futures[future] = (family, index)
+
+            skipped_count = sum(
+                result is not None
+                for result in pending_results[family.name].values()
+            )
+            if skipped_count:
+                print_message_utilities.print_info(
+                    f"Skipping {skipped_count} up-to-date {family.name} "
+                    "series.",
+                )
+            merge_family(family)
+
+        for future in as_completed(series_futures):
+            family, index = series_futures[future]
+            batch = family_batches[family.name][index]
+            try:
+                series_results = future.result()
+            except Exception as error:  # noqa: BLE001
+                # Keep going, so the manifest of the other series is saved
+                print_message_utilities.print_error(
+                    f"Error generating {family.name} files: {error}",
+                )
+                series_results = [SeriesResult([], [], True) for _ in batch]
+
+            for series, result in zip(batch, series_results):
+                key = f"{family.name}/{series}"
+                pending_results[family.name][series] = result.parts
+                if result.failed:
+                    # Forget the previous build so the series is retried
+                    print_message_utilities.print_error(
+                        f"Failed to generate {series} series ({family.name}).",
+                    )
+                    series_manifest.pop(key, None)
+                    series_outputs.pop(key, None)
+                    failed_families.add(family.name)
+                    success = False
+                    continue
+
+                content_hash = family_hashes[family.name][series]
+                build_manifest_utilities.save_cached_parts(
+                    CACHE_DIR,
+                    family.name,
+                    content_hash,
+                    result.parts,
+                    series_manifest.get(key),
+                )
+                series_manifest[key] = content_hash
+                series_outputs[key] = result.outputs
+
+            merge_family(family)
+
+        for future in as_completed(unified_futures):
+            family, unified_hash = unified_futures[future]
+            try:
+                result = future.result()
+            except Exception as error:  # noqa: BLE001
+                print_message_utilities.print_error(
+                    f"Error generating unified {family.name} files: {error}",
+                )
+                result = UnifiedResult(0, [], True)
+
+            if result.failed:
+                print_message_utilities.print_error(
+                    f"Failed to generate unified {family.name} files.",
+                )
+                unified_manifest.pop(family.name, None)
+                unified_outputs.pop(family.name, None)
+                success = False
+            else:
+                print_message_utilities.print_success(
+                    f"Unified {family.name} files generated "
+                    f"with {result.part_count} parts.",
+                )
+                unified_manifest[family.name] = unified_hash
+                unified_outputs[family.name] = result.outputs
+
+    build_manifest_utilities.save_manifest(manifest, MANIFEST_FILE)
+
+    return success
+
+
+def load_up_to_date_parts(
+    family: FamilyInfo,
+    series_names: list[str],
+    series_hashes: dict[str, str],
+    manifest: dict[str, Any],
+) -> list[list] | None:
+    """Return the cached parts of a batch if all its series are up to date.
+
+    A series is up to date if its recorded hash matches and every file it
+    wrote in the previous build still exists.
+
+    Args:
+        family: Family the series belong to
+        series_names: Names of the series in the batch
+        series_hashes: Current content hash of every series of the family
+        manifest: Build manifest of the previous build
+
+    Returns:
+        list[list] | None: Cached parts of each series, or None if any
+            series of the batch has to be rebuilt
+
+    """
+    series_parts = []
+    for series in series_names:
+        key = f"{family.name}/{series}"
+        content_hash = series_hashes[series]
+        if manifest["series"].get(key) != content_hash:
+            return None
+        if not build_manifest_utilities.outputs_exist(
+            manifest["series_outputs"].get(key)
+        ):
+            return None
+
+        parts_list = build_manifest_utilities.load_cached_parts(
+            CACHE_DIR,
+            family.name,
+            content_hash,
+        )
+        if parts_list is None:
+            return None
+        series_parts.append(parts_list)
+
+    return series_parts
+
+
+if __name__ == "__main__":
+    available_families = discover_families()
+
+    parser = argparse.ArgumentParser(
+        description=(
+            "Generate the series and unified files of all component "
+            "families in parallel"
+        )
+    )
+    parser.add_argument(
+        "families",
+        nargs="*",
+        help="Families to build (default: all discovered families)",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild everything, ignoring the incremental build manifest",
+    )
+    parser.add_argument(
+        "--shared-drawings",
+        action="store_true",
+        help=(
+            "Write each distinct drawing of the unified symbol libraries "
+            "once and let the other parts extend it"
+        ),
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write the unified symbol libraries without indentation",
+    )
+
+    args = parser.parse_args()
+
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    family_names = [family.name for family in available_families]
+    unknown_families = sorted(set(args.families) - set(family_names))
+    if unknown_families:
+        parser.error(
+            f"unknown families: {', '.join(unknown_families)} "
+            f"(available: {', '.join(family_names)})"
+        )
+
+    selected_families = [
+        family
+        for family in available_families
+        if not args.families or family.name in args.families
+    ]
+
+    if not build_families(
+        selected_families,
+        args.jobs,
+        args.force,
+        args.shared_drawings,
+        args.compact,
+    ):
+        sys.exit(1)
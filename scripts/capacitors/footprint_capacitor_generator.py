@@ -5,15 +5,13 @@ mount and radial capacitors. Uses manufacturer specifications to create
 accurate footprints with appropriate pad dimensions and clearances.
 """
 
-from pathlib import Path
-
 from footprint_capacitor_specs import (
     FOOTPRINTS_SPECS,
     FootprintSpecs,
     RadialFootprintSpecs,
 )
 from symbol_capacitors_specs import SERIES_SPECS, SeriesSpec
-from utilities import footprint_utils
+from utilities import file_handler_utilities, footprint_utils
 
 
 def generate_radial_footprint(
@@ -268,7 +266,9 @@ def generate_footprint_file(
     )
     default_file_path: str = f"{output_path}/{default_filename}"
 
-    with Path.open(default_file_path, "w", encoding="utf-8") as file_handle:
+    with file_handler_utilities.open_output_file(
+        default_file_path,
+    ) as file_handle:
         file_handle.write(default_footprint_content)
 
     if series_spec.value_footprints:
@@ -306,5 +306,7 @@ def generate_footprint_file(
 
             footprint_part = f"C_{case_code_in}_{case_code_mm}Metric"
             specific_file_path = f"{output_path}/{footprint_part}.kicad_mod"
-            with Path.open(specific_file_path, "w", encoding="utf-8") as fh:
+            with file_handler_utilities.open_output_file(
+                specific_file_path,
+            ) as fh:
                 fh.write(specific_footprint_content)
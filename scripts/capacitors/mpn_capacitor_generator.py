@@ -49,6 +49,11 @@ HEADER_MAPPING: Final[dict] = {
     "Capacitor Type": lambda part: part.capacitor_type,
 }
 
+# Series to generate and unified database file names
+SERIES_SPECS: Final[dict] = symbol_capacitors_specs.SERIES_SPECS
+UNIFIED_CSV: Final[str] = "UNITED_CAPACITORS_DATA_BASE.csv"
+UNIFIED_SYMBOL: Final[str] = "UNITED_CAPACITORS_DATA_BASE.kicad_sym"
+
 
 def generate_files_for_series(
     series_name: str,
@@ -92,7 +97,7 @@ def generate_files_for_series(
     parts_list = symbol_capacitors_specs.PartInfo.generate_part_numbers(specs)
     parts_list.sort(key=lambda part: part.value)
 
-    file_handler_utilities.write_to_csv(
+    component_data_list = file_handler_utilities.write_to_csv(
         parts_list,
         csv_filepath,
         HEADER_MAPPING,
@@ -102,8 +107,8 @@ def generate_files_for_series(
     )
 
     try:
-        symbol_capacitor_generator.generate_kicad_symbol(
-            csv_filepath,
+        symbol_capacitor_generator.generate_kicad_symbol_from_data(
+            component_data_list,
             f"series_kicad_sym/{symbol_filename}",
         )
         print_message_utilities.print_success(
@@ -148,6 +153,8 @@ def generate_unified_files(
     all_parts: list[symbol_capacitors_specs.PartInfo],
     unified_csv: str,
     unified_symbol: str,
+    shared_drawings: bool = False,
+    compact: bool = False,
 ) -> None:
     """Generate unified component database files containing all series.
 
@@ -155,6 +162,9 @@ def generate_unified_files(
         all_parts: Complete list of parts to include in unified files
         unified_csv: Name of the unified CSV file
         unified_symbol: Name of the unified symbol file
+        shared_drawings: Write parts sharing a drawing as derived symbols
+            extending the first of them
+        compact: Write the unified symbol file without indentation
 
     Raises:
         FileNotFoundError: If unified CSV file creation fails
@@ -171,7 +181,7 @@ def generate_unified_files(
     all_parts.sort(key=lambda part: part.value)
 
     unified_csv_path = f"app/data/{unified_csv}"
-    file_handler_utilities.write_to_csv(
+    component_data_list = file_handler_utilities.write_to_csv(
         all_parts,
         unified_csv_path,
         HEADER_MAPPING,
@@ -181,9 +191,11 @@ def generate_unified_files(
     )
 
     try:
-        symbol_capacitor_generator.generate_kicad_symbol(
-            unified_csv_path,
+        symbol_capacitor_generator.generate_kicad_symbol_from_data(
+            component_data_list,
             f"symbols/{unified_symbol}",
+            shared_drawings,
+            compact,
         )
         print_message_utilities.print_success(
             "Unified KiCad symbol file generated successfully.",
@@ -206,14 +218,12 @@ if __name__ == "__main__":
     try:
         unified_parts: list[symbol_capacitors_specs.PartInfo] = []
 
-        for series in symbol_capacitors_specs.SERIES_SPECS:
+        for series in SERIES_SPECS:
             print_message_utilities.print_info(
                 f"\nGenerating files for {series} series:",
             )
             generate_files_for_series(series, unified_parts)
 
-        UNIFIED_CSV = "UNITED_CAPACITORS_DATA_BASE.csv"
-        UNIFIED_SYMBOL = "UNITED_CAPACITORS_DATA_BASE.kicad_sym"
         print_message_utilities.print_info("\nGenerating unified files:")
         generate_unified_files(unified_parts, UNIFIED_CSV, UNIFIED_SYMBOL)
 
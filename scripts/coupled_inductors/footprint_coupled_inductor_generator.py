@@ -6,11 +6,9 @@ appropriate pad dimensions, clearances, and silkscreen markings for surface
 mount power inductors.
 """
 
-from pathlib import Path
-
 import symbol_coupled_inductors_specs
 from footprint_coupled_inductor_specs import FOOTPRINTS_SPECS, FootprintSpecs
-from utilities import footprint_utils
+from utilities import file_handler_utilities, footprint_utils
 
 
 def generate_footprint(
@@ -90,5 +88,5 @@ def generate_footprint_file(
     filename = f"{part_info.series}.kicad_mod"
     file_path = f"{output_path}/{filename}"
 
-    with Path.open(file_path, "w", encoding="utf-8") as file_handle:
+    with file_handler_utilities.open_output_file(file_path) as file_handle:
         file_handle.write(footprint_content)
@@ -17,7 +17,6 @@ Dependencies:
     - csv (Python standard library)
 """
 
-from pathlib import Path
 from typing import TextIO
 
 from symbol_coupled_inductors_specs import SYMBOLS_SPECS, SidePinConfig
@@ -41,13 +40,39 @@ def generate_kicad_symbol(
 
     """
     component_data_list = file_handler_utilities.read_csv_data(input_csv_file)
-    all_properties = symbol_utils.get_all_properties(component_data_list)
+    generate_kicad_symbol_from_data(component_data_list, output_symbol_file)
 
-    with Path.open(output_symbol_file, "w", encoding="utf-8") as symbol_file:
-        symbol_utils.write_header(symbol_file)
-        for component_data in component_data_list:
-            write_component(symbol_file, component_data, all_properties)
-        symbol_file.write(")")
+
+def generate_kicad_symbol_from_data(
+    component_data_list: list[dict[str, str]],
+    output_symbol_file: str,
+    shared_drawings: bool = False,
+    compact: bool = False,
+) -> None:
+    """Generate a KiCad symbol file from in-memory component data.
+
+    Lets the part number generators emit symbols from the same rows they
+    write to the CSV file, without reading the CSV file back.
+
+    Args:
+        component_data_list (list[dict[str, str]]):
+            Component rows keyed by CSV header.
+        output_symbol_file (str): Path to the output symbol file.
+        shared_drawings (bool): Write components sharing a drawing as
+            derived symbols extending the first of them.
+        compact (bool): Write the symbol file without indentation.
+
+    """
+    with file_handler_utilities.open_output_file(
+        output_symbol_file,
+    ) as symbol_file:
+        symbol_utils.write_symbol_library(
+            symbol_file,
+            component_data_list,
+            write_component,
+            shared_drawings,
+            compact,
+        )
 
 
 def convert_pin_config(spec_config: SidePinConfig) -> dict[str, list]:
@@ -6,12 +6,11 @@ appropriate pad dimensions, clearances, and silkscreen markings for surface
 mount diodes.
 """
 
-from pathlib import Path
 from uuid import uuid4
 
 import symbol_diode_specs
 from footprint_diode_specs import FOOTPRINTS_SPECS, FootprintSpecs
-from utilities import footprint_utils
+from utilities import file_handler_utilities, footprint_utils
 
 
 def generate_footprint(
@@ -282,5 +281,5 @@ def generate_footprint_file(
     filename = f"{part_info.package}.kicad_mod"
     file_path = f"{output_path}/{filename}"
 
-    with Path.open(file_path, "w", encoding="utf-8") as file_handle:
+    with file_handler_utilities.open_output_file(file_path) as file_handle:
         file_handle.write(footprint_content)
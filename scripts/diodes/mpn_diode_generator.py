@@ -64,6 +64,11 @@ HEADER_MAPPING: Final[dict] = {
     "Diode Type": lambda part: part.diode_type,
 }
 
+# Series to generate and unified database file names
+SERIES_SPECS: Final[dict] = symbol_diode_specs.SYMBOLS_SPECS
+UNIFIED_CSV: Final[str] = "UNITED_DIODES_DATA_BASE.csv"
+UNIFIED_SYMBOL: Final[str] = "UNITED_DIODES_DATA_BASE.kicad_sym"
+
 # Define the data directory
 DATA_DIR = "app/data"
 
@@ -115,7 +120,7 @@ def generate_files_for_series(
     # Generate part numbers and write to CSV
     try:
         parts_list = symbol_diode_specs.PartInfo.generate_part_numbers(specs)
-        file_handler_utilities.write_to_csv(
+        component_data_list = file_handler_utilities.write_to_csv(
             parts_list,
             csv_file_path,
             HEADER_MAPPING,
@@ -125,8 +130,8 @@ def generate_files_for_series(
         )
 
         # Generate KiCad symbol file
-        symbol_diode_generator.generate_kicad_symbol(
-            csv_file_path,
+        symbol_diode_generator.generate_kicad_symbol_from_data(
+            component_data_list,
             f"series_kicad_sym/{symbol_filename}",
         )
         print_message_utilities.print_success(
@@ -177,6 +182,8 @@ def generate_unified_files(
     all_parts: list[symbol_diode_specs.PartInfo],
     unified_csv: str,
     unified_symbol: str,
+    shared_drawings: bool = False,
+    compact: bool = False,
 ) -> None:
     """Generate unified component database files containing all series.
 
@@ -188,6 +195,9 @@ def generate_unified_files(
         all_parts: List of all PartInfo instances across all series
         unified_csv: Name of the unified CSV file to generate
         unified_symbol: Name of the unified KiCad symbol file to generate
+        shared_drawings: Write parts sharing a drawing as derived symbols
+            extending the first of them
+        compact: Write the unified symbol file without indentation
 
     Raises:
         FileNotFoundError: If CSV file creation fails
@@ -200,7 +210,7 @@ def generate_unified_files(
     """
     # Write unified CSV file
     unified_csv_path = f"{DATA_DIR}/{unified_csv}"
-    file_handler_utilities.write_to_csv(
+    component_data_list = file_handler_utilities.write_to_csv(
         all_parts,
         unified_csv_path,
         HEADER_MAPPING,
@@ -212,9 +222,11 @@ def generate_unified_files(
 
     # Generate unified KiCad symbol file
     try:
-        symbol_diode_generator.generate_kicad_symbol(
-            unified_csv_path,
+        symbol_diode_generator.generate_kicad_symbol_from_data(
+            component_data_list,
             f"symbols/{unified_symbol}",
+            shared_drawings,
+            compact,
         )
         print_message_utilities.print_success(
             "Unified KiCad symbol file generated successfully.",
@@ -237,15 +249,13 @@ if __name__ == "__main__":
     try:
         unified_parts: list[symbol_diode_specs.PartInfo] = []
 
-        for series in symbol_diode_specs.SYMBOLS_SPECS:
+        for series in SERIES_SPECS:
             print_message_utilities.print_info(
                 f"\nGenerating files for {series} series:",
             )
             generate_files_for_series(series, unified_parts)
 
         # Generate unified files after all series are processed
-        UNIFIED_CSV = "UNITED_DIODES_DATA_BASE.csv"
-        UNIFIED_SYMBOL = "UNITED_DIODES_DATA_BASE.kicad_sym"
         print_message_utilities.print_info("\nGenerating unified files:")
         generate_unified_files(unified_parts, UNIFIED_CSV, UNIFIED_SYMBOL)
 
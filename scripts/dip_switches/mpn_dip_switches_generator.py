@@ -34,6 +34,11 @@ HEADER_MAPPING: Final[dict] = {
     "Number of Rows": lambda part: part.number_of_rows,
 }
 
+# Series to generate and unified database file names
+SERIES_SPECS: Final[dict] = symbol_dip_switches_specs.SYMBOLS_SPECS
+UNIFIED_CSV: Final[str] = "UNITED_DIP_SWITCHES_DATA_BASE.csv"
+UNIFIED_SYMBOL: Final[str] = "UNITED_DIP_SWITCHES_DATA_BASE.kicad_sym"
+
 
 def generate_files_for_series(
     series_name: str,
@@ -89,7 +94,7 @@ def generate_files_for_series(
     parts_list = symbol_dip_switches_specs.PartInfo.generate_part_numbers(
         specs
     )
-    file_handler_utilities.write_to_csv(
+    component_data_list = file_handler_utilities.write_to_csv(
         parts_list,
         csv_path,
         HEADER_MAPPING,
@@ -100,8 +105,8 @@ def generate_files_for_series(
 
     # Generate KiCad symbol file
     try:
-        symbol_dip_switches_generator.generate_kicad_symbol(
-            csv_path,
+        symbol_dip_switches_generator.generate_kicad_symbol_from_data(
+            component_data_list,
             f"series_kicad_sym/{symbol_filename}",
         )
         print_message_utilities.print_success(
@@ -151,6 +156,8 @@ def generate_unified_files(
     all_parts: list[symbol_dip_switches_specs.PartInfo],
     unified_csv: str,
     unified_symbol: str,
+    shared_drawings: bool = False,
+    compact: bool = False,
 ) -> None:
     """Generate unified component database files containing all series.
 
@@ -162,6 +169,9 @@ def generate_unified_files(
         all_parts: List of all PartInfo instances across all series
         unified_csv: Name of the unified CSV file to generate
         unified_symbol: Name of the unified KiCad symbol file to generate
+        shared_drawings: Write parts sharing a drawing as derived symbols
+            extending the first of them
+        compact: Write the unified symbol file without indentation
 
     Raises:
         csv.Error: If CSV processing fails or data formatting is invalid
@@ -173,7 +183,7 @@ def generate_unified_files(
     """
     # Write unified CSV file with full path
     unified_csv_path = f"app/data/{unified_csv}"
-    file_handler_utilities.write_to_csv(
+    component_data_list = file_handler_utilities.write_to_csv(
         all_parts,
         unified_csv_path,
         HEADER_MAPPING,
@@ -184,9 +194,11 @@ def generate_unified_files(
 
     # Generate unified KiCad symbol file
     try:
-        symbol_dip_switches_generator.generate_kicad_symbol(
-            unified_csv_path,
+        symbol_dip_switches_generator.generate_kicad_symbol_from_data(
+            component_data_list,
             f"symbols/{unified_symbol}",
+            shared_drawings,
+            compact,
         )
         print_message_utilities.print_success(
             "Unified KiCad symbol file generated successfully.",
@@ -210,7 +222,7 @@ if __name__ == "__main__":
         unified_parts: list[symbol_dip_switches_specs.PartInfo] = []
         generated_footprints: set[str] = set()  # Track generated footprints
 
-        for series in symbol_dip_switches_specs.SYMBOLS_SPECS:
+        for series in SERIES_SPECS:
             print_message_utilities.print_info(
                 f"\nGenerating files for {series} series:",
             )
@@ -219,8 +231,6 @@ if __name__ == "__main__":
             )
 
         # Generate unified files after all series are processed
-        UNIFIED_CSV = "UNITED_DIP_SWITCHES_DATA_BASE.csv"
-        UNIFIED_SYMBOL = "UNITED_DIP_SWITCHES_DATA_BASE.kicad_sym"
         print_message_utilities.print_info("\nGenerating unified files:")
         generate_unified_files(unified_parts, UNIFIED_CSV, UNIFIED_SYMBOL)
 
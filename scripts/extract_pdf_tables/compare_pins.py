@@ -7,7 +7,13 @@ those stored as ``(alternate ...)`` entries in the symbol.
 """
 
 import csv
+import os
 import re
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities import sexpr_utilities
 
 COMPARISONS = [
     {
@@ -161,9 +167,10 @@ def parse_csv(csv_path):
 def parse_kicad_sym(sym_path, symbol_name=None):
     """Parse pin definitions from a KiCad ``.kicad_sym`` file.
 
-    Each ``(pin ...)`` block is parsed for its name and number.
-    Alternate function names are read from ``(alternate "NAME" ...)``
-    child entries that follow each pin block.
+    Each ``(pin ...)`` node, including those nested in symbol units,
+    is read for its name and number. Pins with an empty name or number
+    are skipped. Alternate function names are read from its
+    ``(alternate "NAME" ...)`` child entries.
 
     Args:
         sym_path: Path to the ``.kicad_sym`` file.
@@ -179,45 +186,28 @@ def parse_kicad_sym(sym_path, symbol_name=None):
         of all function tokens with slash-compound names expanded).
 
     """
-    with open(sym_path, encoding="utf-8") as sym_file:
-        content = sym_file.read()
-
-    if symbol_name:
-        sym_block_re = re.compile(
-            r'\(symbol\s+"' + re.escape(symbol_name) + r'"'
-            r"[\s\S]*?"
-            r'(?=\n\t\(symbol\s+"|\Z)',
-        )
-        sym_match = sym_block_re.search(content)
-        content = sym_match.group(0) if sym_match else ""
-
-    pin_header_pattern = re.compile(
-        r"\(pin\s+\w+\s+\w+\s*"
-        r"(?:\(at[^)]+\)\s*)?"
-        r"\(length[^)]+\)\s*"
-        r'\(name\s+"([^"]+)"[\s\S]*?'
-        r'\(number\s+"([^"]+)"',
-    )
-
-    alternate_pattern = re.compile(r'\(alternate\s+"([^"]+)"')
-
-    header_matches = [
-        (match.start(), match.end(), match.group(1), match.group(2))
-        for match in pin_header_pattern.finditer(content)
+    libraries = sexpr_utilities.read_sexpr_file(sym_path)
+    symbols = [
+        symbol
+        for library in libraries
+        for symbol in library.find_all("symbol")
+        if not symbol_name or symbol.values[:1] == [symbol_name]
     ]
+    if symbol_name:
+        symbols = symbols[:1]
 
+    pins = [pin for symbol in symbols for pin in symbol.walk("pin")]
     kicad_pins = {}
 
-    for index, (_start, end, pin_name, pin_number) in enumerate(
-        header_matches
-    ):
-        if index + 1 < len(header_matches):
-            next_start = header_matches[index + 1][0]
-        else:
-            next_start = len(content)
-
-        block = content[end:next_start]
-        alternates = set(alternate_pattern.findall(block))
+    for pin in pins:
+        pin_name = pin.find("name").values[0]
+        pin_number = pin.find("number").values[0]
+        # Unnamed pins, such as passive terminals, have no functions
+        if not pin_name or not pin_number:
+            continue
+        alternates = {
+            alternate.values[0] for alternate in pin.find_all("alternate")
+        }
 
         expanded_alternates = expand_slash_names(alternates)
 
@@ -4,18 +4,32 @@ Provides utilities for extracting tables from PDF files,
 iterating over each page and saving all detected tables as CSV
 files, with table names extracted from the text above each table.
 Supports merging tables that span multiple pages and per-PDF
-configuration for multiple tables.
+configuration for multiple tables. Pages are extracted concurrently
+by a pool of worker processes, and the tables found on each page are
+kept in an optional on-disk cache keyed by the PDF content hash, so
+later runs only re-apply filters and column exclusions.
 """
 
 import csv
+import hashlib
+import json
+import os
+import pickle
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from itertools import repeat
 from pathlib import Path
 
 import camelot
 import pandas as pd
 import pdfplumber
 
+CACHE_VERSION = 1
+CAMELOT_OPTIONS = {"flavor": "lattice"}
+
+_worker_pdf: pdfplumber.PDF | None = None
+
 
 @dataclass
 class TableConfig:
@@ -302,101 +316,414 @@ def _exclude_cols_by_name(
     ]
 
 
+def _hash_pdf(pdf_path: str) -> str:
+    """Compute the content hash of a PDF file.
+
+    Args:
+        pdf_path: Path to the PDF file.
+
+    Returns:
+        Hexadecimal SHA-256 digest of the file contents.
+
+    """
+    digest = hashlib.sha256()
+    with open(pdf_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _page_cache_path(cache_dir: Path, pdf_hash: str, page_num: int) -> Path:
+    """Return the path of the cached tables of a page.
+
+    The file name includes a digest of the extraction parameters, so
+    changing Camelot options or upgrading Camelot never reuses tables
+    extracted with different settings.
+
+    Args:
+        cache_dir: Root directory of the table cache.
+        pdf_hash: Content hash of the PDF file.
+        page_num: Page number, starting at 1.
+
+    Returns:
+        Location of the pickled page tables.
+
+    """
+    params_digest = hashlib.sha256(
+        repr((
+            CACHE_VERSION,
+            camelot.__version__,
+            sorted(CAMELOT_OPTIONS.items()),
+        )).encode("utf-8")
+    ).hexdigest()[:16]
+    return cache_dir / pdf_hash / f"page_{page_num:04d}_{params_digest}.pickle"
+
+
+def _load_cached_page(
+    cache_dir: Path,
+    pdf_hash: str,
+    page_num: int,
+) -> list[dict] | None:
+    """Load the cached tables of a page.
+
+    Args:
+        cache_dir: Root directory of the table cache.
+        pdf_hash: Content hash of the PDF file.
+        page_num: Page number, starting at 1.
+
+    Returns:
+        The cached page tables, or None if the page is not cached.
+
+    """
+    try:
+        with open(_page_cache_path(cache_dir, pdf_hash, page_num), "rb") as f:
+            return pickle.load(f)  # noqa: S301
+    except (OSError, pickle.UnpicklingError, AttributeError, EOFError):
+        return None
+
+
+def _save_cached_page(
+    cache_dir: Path,
+    pdf_hash: str,
+    page_num: int,
+    page_tables: list[dict],
+) -> None:
+    """Cache the tables extracted from a page.
+
+    The file is written atomically, so an interrupted run never leaves
+    a truncated cache entry behind.
+
+    Args:
+        cache_dir: Root directory of the table cache.
+        pdf_hash: Content hash of the PDF file.
+        page_num: Page number, starting at 1.
+        page_tables: Tables extracted from the page.
+
+    """
+    cache_file = _page_cache_path(cache_dir, pdf_hash, page_num)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    temporary_file = cache_file.with_suffix(".tmp")
+    with open(temporary_file, "wb") as f:
+        pickle.dump(page_tables, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary_file, cache_file)
+
+
+def _load_page_texts(cache_dir: Path, pdf_hash: str) -> dict[int, str]:
+    """Load the cached page texts used by the prefilter.
+
+    Args:
+        cache_dir: Root directory of the table cache.
+        pdf_hash: Content hash of the PDF file.
+
+    Returns:
+        Page texts keyed by page number. Empty if nothing is cached.
+
+    """
+    try:
+        with open(
+            cache_dir / pdf_hash / "page_texts.json", encoding="utf-8"
+        ) as f:
+            return {int(page): text for page, text in json.load(f).items()}
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def _save_page_texts(
+    cache_dir: Path,
+    pdf_hash: str,
+    page_texts: dict[int, str],
+) -> None:
+    """Cache the page texts used by the prefilter.
+
+    Args:
+        cache_dir: Root directory of the table cache.
+        pdf_hash: Content hash of the PDF file.
+        page_texts: Page texts keyed by page number.
+
+    """
+    texts_file = cache_dir / pdf_hash / "page_texts.json"
+    texts_file.parent.mkdir(parents=True, exist_ok=True)
+    temporary_file = texts_file.with_suffix(".tmp")
+    with open(temporary_file, "w", encoding="utf-8") as f:
+        json.dump(page_texts, f)
+    os.replace(temporary_file, texts_file)
+
+
+def _open_worker_pdf(pdf_path: str) -> None:
+    """Open the PDF once per worker process.
+
+    Used as the process pool initializer, so every page extracted by a
+    worker reuses the same pdfplumber document for table name lookups.
+
+    Args:
+        pdf_path: Path to the PDF file.
+
+    """
+    global _worker_pdf  # noqa: PLW0603
+    _worker_pdf = pdfplumber.open(pdf_path)
+
+
+def _extract_page_tables(pdf_path: str, page_num: int) -> list[dict] | None:
+    """Extract all tables of a single page.
+
+    Runs in a worker process opened with ``_open_worker_pdf``. The
+    tables are returned unfiltered, so the result can be cached and
+    reused for any table name filter and header row count. The page is
+    closed afterwards, so the worker does not keep the parsed objects of
+    every page it processed.
+
+    Args:
+        pdf_path: Path to the PDF file.
+        page_num: Page number to process, starting at 1.
+
+    Returns:
+        A list of dicts with keys: bbox, rows, name, accuracy, or None
+        if Camelot failed to render the page.
+
+    """
+    tables = None
+    for attempt in range(1, 4):
+        try:
+            tables = camelot.read_pdf(
+                pdf_path,
+                pages=str(page_num),
+                **CAMELOT_OPTIONS,
+            )
+            break
+        except KeyboardInterrupt:
+            if attempt < 3:
+                print(
+                    f"\n  Warning: pypdfium2 rendering error on"
+                    f" page {page_num}, retrying"
+                    f" ({attempt}/3)..."
+                )
+            else:
+                print(
+                    f"\n  Warning: pypdfium2 rendering error on"
+                    f" page {page_num} after 3 attempts"
+                    f" — skipping."
+                )
+
+    if tables is None:
+        return None
+
+    page = _worker_pdf.pages[page_num - 1]
+    page_height = page.height
+
+    page_tables = [
+        {
+            "bbox": table._bbox,
+            "rows": table.df.values.tolist(),
+            "name": get_table_name(
+                page,
+                camelot_bbox_to_pdfplumber(table._bbox, page_height),
+            ),
+            "accuracy": table.accuracy,
+        }
+        for table in tables
+    ]
+    page.close()
+    return page_tables
+
+
+def _filter_page_tables(
+    page_num: int,
+    page_tables: list[dict],
+    table_name_filter: str | None,
+    header_rows: int = 2,
+) -> list[dict]:
+    """Keep the tables of a page that match the filter.
+
+    Duplicate header rows are removed from each kept table before
+    merging.
+
+    Args:
+        page_num: Page number the tables were extracted from.
+        page_tables: Tables returned by ``_extract_page_tables``.
+        table_name_filter: Optional filter string to match table names.
+        header_rows: Number of rows forming the header block.
+
+    Returns:
+        A list of dicts with keys: page, bbox, df, name, accuracy.
+
+    """
+    matching_tables = []
+
+    for table in page_tables:
+        table_name = table["name"]
+
+        if table_name_filter:
+            is_match = matches_filter(table_name, table_name_filter)
+            is_cont = is_continued_table(table_name) and matches_filter(
+                table_name, table_name_filter
+            )
+            if not is_match and not is_cont:
+                continue
+
+        rows = _remove_duplicate_headers(
+            table["rows"],
+            header_rows=header_rows,
+        )
+
+        matching_tables.append({
+            "page": page_num,
+            "bbox": table["bbox"],
+            "df": pd.DataFrame(rows),
+            "name": table_name,
+            "accuracy": table["accuracy"],
+        })
+
+    return matching_tables
+
+
+def _find_candidate_pages(
+    pdf: pdfplumber.PDF,
+    pages: list[int],
+    table_name_filter: str,
+    page_texts: dict[int, str],
+) -> list[int]:
+    """Find the pages that may contain a table matching the filter.
+
+    Table names, including those of continued tables, are read from
+    the text above each table, so a page can only hold a matching table
+    if its text matches the filter. Checking the page text is much
+    cheaper than running the lattice detection on the page.
+
+    Args:
+        pdf: The opened PDF document.
+        pages: Page numbers to check, starting at 1.
+        table_name_filter: Filter string to match table names.
+        page_texts: Already extracted page texts keyed by page number.
+            Texts of the remaining pages are extracted and added.
+
+    Returns:
+        The page numbers whose text matches the filter, in input order.
+
+    """
+    candidate_pages = []
+
+    for page_num in pages:
+        if page_num not in page_texts:
+            page = pdf.pages[page_num - 1]
+            page_texts[page_num] = page.extract_text() or ""
+            page.close()
+        if matches_filter(page_texts[page_num], table_name_filter):
+            candidate_pages.append(page_num)
+
+    print(
+        f"Prefilter kept {len(candidate_pages)} of {len(pages)} pages "
+        f"mentioning '{table_name_filter}'."
+    )
+    return candidate_pages
+
+
 def _collect_tables(
     pdf_path: str,
     table_name_filter: str | None,
     page_range: str = "all",
     header_rows: int = 2,
+    jobs: int | None = None,
+    cache_dir: Path | None = None,
 ) -> list[dict]:
     """Collect all matching tables from a PDF with their metadata.
 
-    Duplicate header rows are removed from each table immediately
-    after extraction, before merging.
+    When a filter is given, pages whose text cannot contain a matching
+    table name are skipped before the lattice detection. The remaining
+    pages are read from the table cache or extracted concurrently by a
+    pool of worker processes, and the results are collected in page
+    order, so tables that continue across pages stay adjacent for
+    merging.
 
     Args:
         pdf_path: Path to the PDF file.
         table_name_filter: Optional filter string to match table names.
         page_range: Page range to process e.g. '78-105' or 'all'.
         header_rows: Number of rows forming the header block.
+        jobs: Maximum number of worker processes. Defaults to the
+            number of CPUs.
+        cache_dir: Optional directory of the persistent table cache.
+            Pages are cached by PDF content hash, so a cache entry is
+            reused by every config and every later run on the same PDF.
 
     Returns:
-        A list of dicts with keys: page, bbox, df, name.
+        A list of dicts with keys: page, bbox, df, name, accuracy.
 
     """
-    all_tables = []
+    pdf_hash = _hash_pdf(pdf_path) if cache_dir else ""
 
     with pdfplumber.open(pdf_path) as pdf:
-        total_pages = len(pdf.pages)
-        pages_to_process = _parse_page_range(page_range, total_pages)
-        total = len(pages_to_process)
-
-        for page_idx, page_num in enumerate(pages_to_process, start=1):
-            print(
-                f"Processing page {page_num} ({page_idx}/{total})...",
-                end="\r",
+        pages_to_process = _parse_page_range(page_range, len(pdf.pages))
+        if table_name_filter:
+            page_texts = (
+                _load_page_texts(cache_dir, pdf_hash) if cache_dir else {}
+            )
+            known_pages = len(page_texts)
+            pages_to_process = _find_candidate_pages(
+                pdf, pages_to_process, table_name_filter, page_texts
+            )
+            if cache_dir and len(page_texts) > known_pages:
+                _save_page_texts(cache_dir, pdf_hash, page_texts)
+
+    page_results: dict[int, list[dict]] = {}
+    if cache_dir:
+        for page_num in pages_to_process:
+            cached_tables = _load_cached_page(cache_dir, pdf_hash, page_num)
+            if cached_tables is not None:
+                page_results[page_num] = cached_tables
+        if page_results:
+            print(f"Reusing {len(page_results)} cached pages.")
+
+    pending_pages = [
+        page_num
+        for page_num in pages_to_process
+        if page_num not in page_results
+    ]
+    total = len(pending_pages)
+
+    if pending_pages:
+        with ProcessPoolExecutor(
+            max_workers=min(jobs or os.cpu_count() or 1, total),
+            initializer=_open_worker_pdf,
+            initargs=(pdf_path,),
+        ) as executor:
+            extracted_pages = executor.map(
+                _extract_page_tables,
+                repeat(pdf_path),
+                pending_pages,
             )
 
-            tables = None
-            for attempt in range(1, 4):
-                try:
-                    tables = camelot.read_pdf(
-                        pdf_path,
-                        pages=str(page_num),
-                        flavor="lattice",
-                    )
-                    break
-                except KeyboardInterrupt:
-                    if attempt < 3:
-                        print(
-                            f"\n  Warning: pypdfium2 rendering error on"
-                            f" page {page_num}, retrying"
-                            f" ({attempt}/3)..."
-                        )
-                    else:
-                        print(
-                            f"\n  Warning: pypdfium2 rendering error on"
-                            f" page {page_num} after 3 attempts"
-                            f" — skipping."
-                        )
-
-            if tables is None:
-                continue
-
-            page = pdf.pages[page_num - 1]
-            page_height = page.height
-
-            for table in tables:
-                plumber_bbox = camelot_bbox_to_pdfplumber(
-                    table._bbox, page_height
-                )
-                table_name = get_table_name(page, plumber_bbox)
-
-                if table_name_filter:
-                    is_match = matches_filter(table_name, table_name_filter)
-                    is_cont = is_continued_table(
-                        table_name
-                    ) and matches_filter(table_name, table_name_filter)
-                    if not is_match and not is_cont:
-                        continue
-
-                rows = _remove_duplicate_headers(
-                    table.df.values.tolist(),
-                    header_rows=header_rows,
-                )
-                clean_df = pd.DataFrame(rows)
-
+            for page_idx, (page_num, page_tables) in enumerate(
+                zip(pending_pages, extracted_pages),
+                start=1,
+            ):
                 print(
-                    f"  Found '{table_name}' on page {page_num} "
-                    f"({clean_df.shape[0]} rows, "
-                    f"accuracy: {table.accuracy:.1f}%)"
+                    f"Processed page {page_num} ({page_idx}/{total})...",
+                    end="\r",
                 )
+                if page_tables is None:
+                    page_tables = []
+                elif cache_dir:
+                    _save_cached_page(
+                        cache_dir, pdf_hash, page_num, page_tables
+                    )
+                page_results[page_num] = page_tables
+
+    all_tables = []
 
-                all_tables.append({
-                    "page": page_num,
-                    "bbox": table._bbox,
-                    "df": clean_df,
-                    "name": table_name,
-                })
+    for page_num in pages_to_process:
+        page_tables = _filter_page_tables(
+            page_num,
+            page_results[page_num],
+            table_name_filter,
+            header_rows,
+        )
+        for table in page_tables:
+            print(
+                f"  Found '{table['name']}' on page {page_num} "
+                f"({table['df'].shape[0]} rows, "
+                f"accuracy: {table['accuracy']:.1f}%)"
+            )
+        all_tables.extend(page_tables)
 
     return all_tables
 
@@ -545,6 +872,8 @@ def extract_tables_from_pdf(
     pdf_path: str,
     output_dir: str = "tables",
     table_configs: list[TableConfig] | None = None,
+    jobs: int | None = None,
+    cache_dir: str | None = None,
 ) -> None:
     """Extract tables from a PDF file and save each as a CSV.
 
@@ -560,6 +889,11 @@ def extract_tables_from_pdf(
         table_configs: List of TableConfig objects defining which
             tables to extract and how. Defaults to extracting all
             tables with default settings.
+        jobs: Maximum number of worker processes used to extract
+            pages. Defaults to the number of CPUs.
+        cache_dir: Optional directory of the persistent table cache.
+            Tables found on each page are cached there and reused by
+            later runs on the same PDF, whatever their configs.
 
     """
     output_path = Path(output_dir)
@@ -584,6 +918,8 @@ def extract_tables_from_pdf(
                 config.table_name_filter or None,
                 config.page_range,
                 config.header_rows,
+                jobs,
+                Path(cache_dir) if cache_dir else None,
             )
 
             print(
@@ -694,5 +1030,6 @@ if __name__ == "__main__":
             extract_tables_from_pdf(
                 str(pdf_file),
                 output_dir=str(script_dir / "tables" / pdf_file.stem),
+                cache_dir=str(script_dir / ".table_cache"),
                 table_configs=configs,
             )
@@ -41,6 +41,11 @@ HEADER_MAPPING: Final[dict] = {
     "Maximum DC Resistance (mΩ)": lambda part: f"{part.max_dc_resistance}",
 }
 
+# Series to generate and unified database file names
+SERIES_SPECS: Final[dict] = symbol_inductors_specs.SYMBOLS_SPECS
+UNIFIED_CSV: Final[str] = "UNITED_INDUCTORS_DATA_BASE.csv"
+UNIFIED_SYMBOL: Final[str] = "UNITED_INDUCTORS_DATA_BASE.kicad_sym"
+
 # Define the data directory
 DATA_DIR = "app/data"
 
@@ -90,7 +95,7 @@ def generate_files_for_series(
             specs,
         )
         parts_list.sort(key=lambda part: part.value)
-        file_handler_utilities.write_to_csv(
+        component_data_list = file_handler_utilities.write_to_csv(
             parts_list,
             csv_file_path,
             HEADER_MAPPING,
@@ -100,8 +105,8 @@ def generate_files_for_series(
         )
 
         # Generate KiCad symbol file
-        symbol_inductor_generator.generate_kicad_symbol(
-            csv_file_path,
+        symbol_inductor_generator.generate_kicad_symbol_from_data(
+            component_data_list,
             f"series_kicad_sym/{symbol_filename}",
         )
         print_message_utilities.print_success(
@@ -152,6 +157,8 @@ def generate_unified_files(
     all_parts: list[symbol_inductors_specs.PartInfo],
     unified_csv: str,
     unified_symbol: str,
+    shared_drawings: bool = False,
+    compact: bool = False,
 ) -> None:
     """Generate unified component database files containing all series.
 
@@ -163,13 +170,16 @@ def generate_unified_files(
         all_parts: List of all PartInfo instances across all series
         unified_csv: Name of the unified CSV file to generate
         unified_symbol: Name of the unified KiCad symbol file to generate
+        shared_drawings: Write parts sharing a drawing as derived symbols
+            extending the first of them
+        compact: Write the unified symbol file without indentation
 
     """
     # Sort all parts by value before writing
     all_parts.sort(key=lambda part: part.value)
     # Write unified CSV file
     unified_csv_path = f"{DATA_DIR}/{unified_csv}"
-    file_handler_utilities.write_to_csv(
+    component_data_list = file_handler_utilities.write_to_csv(
         all_parts,
         unified_csv_path,
         HEADER_MAPPING,
@@ -181,9 +191,11 @@ def generate_unified_files(
 
     # Generate unified KiCad symbol file
     try:
-        symbol_inductor_generator.generate_kicad_symbol(
-            unified_csv_path,
+        symbol_inductor_generator.generate_kicad_symbol_from_data(
+            component_data_list,
             f"symbols/{unified_symbol}",
+            shared_drawings,
+            compact,
         )
         print_message_utilities.print_success(
             "Unified KiCad symbol file generated successfully.",
@@ -206,15 +218,13 @@ if __name__ == "__main__":
     try:
         unified_parts: list[symbol_inductors_specs.PartInfo] = []
 
-        for series in symbol_inductors_specs.SYMBOLS_SPECS:
+        for series in SERIES_SPECS:
             print_message_utilities.print_info(
                 f"\nGenerating files for {series} series:",
             )
             generate_files_for_series(series, unified_parts)
 
         # Generate unified files after all series are processed
-        UNIFIED_CSV = "UNITED_INDUCTORS_DATA_BASE.csv"
-        UNIFIED_SYMBOL = "UNITED_INDUCTORS_DATA_BASE.kicad_sym"
         print_message_utilities.print_info("\nGenerating unified files:")
         generate_unified_files(unified_parts, UNIFIED_CSV, UNIFIED_SYMBOL)
 
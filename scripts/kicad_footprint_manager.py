@@ -21,6 +21,8 @@ import re
 import sys
 from pathlib import Path
 
+from utilities import sexpr_utilities
+
 
 def parse_kicad_pcb(file_path):
     """Parse a KiCad PCB file and extract footprint data by reference.
@@ -30,37 +32,33 @@ def parse_kicad_pcb(file_path):
 
     Returns:
         tuple: (file_content, dict mapping reference designators to footprint
-        data), including the start and end positions in the file
+        data), including the start and end byte positions in the file
+        content, which is returned as bytes
 
     """
-    with open(file_path, "r", encoding="utf-8") as file:
-        content = file.read()
+    content = Path(file_path).read_bytes()
 
     footprints = {}
 
-    for match in re.finditer(r"\(footprint", content):
-        start_pos = match.start()
-
-        paren_count = 0
-        for i in range(start_pos, len(content)):
-            if content[i] == "(":
-                paren_count += 1
-            elif content[i] == ")":
-                paren_count -= 1
-                if paren_count == 0:
-                    footprint_raw = content[start_pos : i + 1]
-
-                    ref_match = re.search(
-                        r'\(property "Reference"\s+"([^\"]+)"', footprint_raw
-                    )
-                    if ref_match:
-                        ref = ref_match.group(1)
-                        footprints[ref] = {
-                            "full_data": footprint_raw,
-                            "start_pos": start_pos,
-                            "end_pos": i + 1,
-                        }
-                    break
+    # Footprint properties are nested three levels deep, skip the rest
+    for board in sexpr_utilities.parse_sexpr(content, max_depth=3):
+        for footprint in board.find_all("footprint"):
+            reference = next(
+                (
+                    property_node.values[1]
+                    for property_node in footprint.find_all("property")
+                    if property_node.values[:1] == ["Reference"]
+                ),
+                None,
+            )
+            if reference:
+                footprints[reference] = {
+                    "full_data": content[
+                        footprint.start : footprint.end
+                    ].decode("utf-8"),
+                    "start_pos": footprint.start,
+                    "end_pos": footprint.end,
+                }
 
     return content, footprints
 
@@ -87,10 +85,13 @@ def replace_footprint_in_file(file_path, reference, new_footprint_code):
     start_pos = footprint_info["start_pos"]
     end_pos = footprint_info["end_pos"]
 
-    new_content = content[:start_pos] + new_footprint_code + content[end_pos:]
+    new_content = (
+        content[:start_pos]
+        + new_footprint_code.encode("utf-8")
+        + content[end_pos:]
+    )
 
-    with open(file_path, "w", encoding="utf-8") as file:
-        file.write(new_content)
+    Path(file_path).write_bytes(new_content)
 
     print(f"Successfully replaced footprint for reference {reference}")
     return True
@@ -8,46 +8,41 @@ CSV file with headers determined from the properties found in the symbols.
 from __future__ import annotations
 
 import csv
-import re
 import sys
 from pathlib import Path
 
+from utilities import sexpr_utilities
 
-def parse_kicad_symbol_file(content: str) -> dict[str, dict[str, str]]:
+
+def parse_kicad_symbol_file(file_path: Path) -> dict[str, dict[str, str]]:
     """Parse a KiCad symbol file and extract symbol names and properties."""
     symbols = {}
 
-    # Regular expression to find all symbols
-    symbol_pattern = r'\(symbol\s+"([^"]+)"(.*?)\)\s*(?=\(symbol|$)'
-    property_pattern = r'\(property\s+"([^"]+)"\s+"([^"]+)"(?:\s+[^\)]*)?\)'
-
-    # Extract symbols and their properties
     print("\nDebug: Starting symbol extraction")
-    for symbol_match in re.finditer(symbol_pattern, content, re.DOTALL):
-        symbol_name = symbol_match.group(1)
-        print(f"\nFound symbol: {symbol_name}")
-
-        # Only exclude if this specific symbol ends with _0_1
-        if symbol_name.endswith("_0_1"):
-            print(f"Skipping {symbol_name} as it ends with _0_1")
-            continue
-
-        symbol_body = symbol_match.group(2)
-        properties = {}
-
-        # Extract properties for the current symbol
-        print(f"Looking for properties in {symbol_name}")
-        for property_match in re.finditer(property_pattern, symbol_body):
-            name = property_match.group(1)
-            value = property_match.group(2)
-            properties[name] = value
-            print(f"  Found property: {name} = {value}")
-
-        if properties:
-            symbols[symbol_name] = properties
-            print(f"Added {symbol_name} with {len(properties)} properties")
-        else:
-            print(f"Warning: No properties found for {symbol_name}")
+    # Symbol properties are nested three levels deep, skip the rest
+    for library in sexpr_utilities.read_sexpr_file(file_path, max_depth=3):
+        # Only top-level symbols carry properties, their units are nested
+        for symbol in library.find_all("symbol"):
+            symbol_name = symbol.values[0]
+            print(f"\nFound symbol: {symbol_name}")
+
+            properties = {}
+
+            # Extract properties for the current symbol
+            print(f"Looking for properties in {symbol_name}")
+            for property_node in symbol.find_all("property"):
+                name, value = property_node.values[:2]
+                # Skip empty properties, so they do not add empty columns
+                if not value:
+                    continue
+                properties[name] = value
+                print(f"  Found property: {name} = {value}")
+
+            if properties:
+                symbols[symbol_name] = properties
+                print(f"Added {symbol_name} with {len(properties)} properties")
+            else:
+                print(f"Warning: No properties found for {symbol_name}")
 
     print(f"\nTotal symbols found: {len(symbols)}")
     return symbols
@@ -126,12 +121,8 @@ if __name__ == "__main__":
             print(f"Error: Input file not found: {input_path}")
             sys.exit(1)
 
-        # Read the file
-        with input_path.open() as file:
-            content = file.read()
-
         # Parse and write results to CSV
-        symbols = parse_kicad_symbol_file(content)
+        symbols = parse_kicad_symbol_file(input_path)
 
         # Create data directory if it doesn't exist
         output_path.parent.mkdir(parents=True, exist_ok=True)
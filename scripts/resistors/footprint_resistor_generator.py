@@ -5,11 +5,9 @@ resistors. Uses manufacturer specifications to create accurate footprints
 with appropriate pad dimensions and clearances.
 """
 
-from pathlib import Path
-
 from footprint_resistor_specs import FOOTPRINTS_SPECS, FootprintSpecs
 from symbol_resistors_specs import SYMBOLS_SPECS, SeriesSpec
-from utilities import footprint_utils
+from utilities import file_handler_utilities, footprint_utils
 
 
 def generate_footprint(
@@ -88,5 +86,5 @@ def generate_footprint_file(
     )
     file_path: str = f"{output_path}/{filename}"
 
-    with Path.open(file_path, "w", encoding="utf-8") as file_handle:
+    with file_handler_utilities.open_output_file(file_path) as file_handle:
         file_handle.write(footprint_content)
@@ -12,11 +12,9 @@ and pitches, generating complete footprint definitions including:
 - Mounting holes and pads
 """
 
-from pathlib import Path
-
 import symbol_slide_switches_specs as symbol_slide_switches_specs
 from footprint_slide_switches_specs import SLIDE_SWITCHES_SPECS
-from utilities import footprint_utils
+from utilities import file_handler_utilities, footprint_utils
 
 
 def generate_footprint(part_info, footprint_specs):
@@ -174,5 +172,5 @@ def generate_footprint_file(part_info, output_path):
     filename = f"{footprint_name}.kicad_mod"
     file_path = f"{output_path}/{filename}"
 
-    with Path.open(file_path, "w", encoding="utf-8") as file_handle:
+    with file_handler_utilities.open_output_file(file_path) as file_handle:
         file_handle.write(footprint_content)
@@ -13,14 +13,12 @@ and pitches, generating complete footprint definitions including:
 - Mounting holes and pads
 """
 
-from pathlib import Path
-
 import symbol_tactile_switches_specs as symbol_tactile_switches_specs
 from footprint_tactile_switches_specs import (
     TACTILE_SWITCHES_SPECS,
     FootprintSpecs,
 )
-from utilities import footprint_utils
+from utilities import file_handler_utilities, footprint_utils
 
 
 def generate_footprint(  # noqa: C901
@@ -224,5 +222,5 @@ def generate_footprint_file(
     filename = f"{footprint_name}.kicad_mod"
     file_path = f"{output_path}/{filename}"
 
-    with Path.open(file_path, "w", encoding="utf-8") as file_handle:
+    with file_handler_utilities.open_output_file(file_path) as file_handle:
         file_handle.write(footprint_content)
@@ -13,11 +13,9 @@ and pitches, generating complete footprint definitions including:
 - 3D model references
 """
 
-from pathlib import Path
-
 import symbol_terminal_block_specs
 from footprint_terminal_block_specs import CONNECTOR_SPECS, FootprintSpecs
-from utilities import footprint_utils
+from utilities import file_handler_utilities, footprint_utils
 
 
 def generate_footprint(
@@ -127,5 +125,5 @@ def generate_footprint_file(
     filename = f"{part_info.mpn}.kicad_mod"
     file_path = f"{output_path}/{filename}"
 
-    with Path.open(file_path, "w", encoding="utf-8") as file_handle:
+    with file_handler_utilities.open_output_file(file_path) as file_handle:
         file_handle.write(footprint_content)
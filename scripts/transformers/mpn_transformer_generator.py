@@ -67,6 +67,11 @@ HEADER_MAPPING: Final[dict] = {
     ),
 }
 
+# Series to generate and unified database file names
+SERIES_SPECS: Final[dict] = symbol_transformer_specs.SYMBOLS_SPECS
+UNIFIED_CSV: Final[str] = "UNITED_TRANSFORMERS_DATA_BASE.csv"
+UNIFIED_SYMBOL: Final[str] = "UNITED_TRANSFORMERS_DATA_BASE.kicad_sym"
+
 
 def generate_files_for_series(
     series_name: str,
@@ -111,7 +116,7 @@ def generate_files_for_series(
         parts_list = symbol_transformer_specs.PartInfo.generate_part_numbers(
             specs,
         )
-        file_handler_utilities.write_to_csv(
+        component_data_list = file_handler_utilities.write_to_csv(
             parts_list,
             f"app/data/{csv_filename}",
             HEADER_MAPPING,
@@ -122,8 +127,8 @@ def generate_files_for_series(
         )
 
         # Generate KiCad symbol file
-        symbol_transformer_generator.generate_kicad_symbol(
-            f"app/data/{csv_filename}",
+        symbol_transformer_generator.generate_kicad_symbol_from_data(
+            component_data_list,
             f"series_kicad_sym/{symbol_filename}",
         )
         print_message_utilities.print_success(
@@ -174,6 +179,8 @@ def generate_unified_files(
     all_parts: list[symbol_transformer_specs.PartInfo],
     unified_csv: str,
     unified_symbol: str,
+    shared_drawings: bool = False,
+    compact: bool = False,
 ) -> None:
     """Generate unified component database files containing all series.
 
@@ -185,6 +192,9 @@ def generate_unified_files(
         all_parts: List of all PartInfo instances from all series
         unified_csv: Filename for the unified CSV file
         unified_symbol: Filename for the unified KiCad symbol file
+        shared_drawings: Write parts sharing a drawing as derived symbols
+            extending the first of them
+        compact: Write the unified symbol file without indentation
 
     Raises:
         csv.Error: If there is an error processing the CSV file
@@ -195,7 +205,7 @@ def generate_unified_files(
 
     """
     # Write unified CSV file
-    file_handler_utilities.write_to_csv(
+    component_data_list = file_handler_utilities.write_to_csv(
         all_parts,
         f"app/data/{unified_csv}",
         HEADER_MAPPING,
@@ -206,9 +216,11 @@ def generate_unified_files(
 
     # Generate unified KiCad symbol file
     try:
-        symbol_transformer_generator.generate_kicad_symbol(
-            f"app/data/{unified_csv}",
+        symbol_transformer_generator.generate_kicad_symbol_from_data(
+            component_data_list,
             f"symbols/{unified_symbol}",
+            shared_drawings,
+            compact,
         )
         print_message_utilities.print_success(
             "Unified KiCad symbol file generated successfully.",
@@ -231,15 +243,13 @@ if __name__ == "__main__":
     try:
         unified_parts: list[symbol_transformer_specs.PartInfo] = []
 
-        for series in symbol_transformer_specs.SYMBOLS_SPECS:
+        for series in SERIES_SPECS:
             print_message_utilities.print_info(
                 f"\nGenerating files for {series} series:",
             )
             generate_files_for_series(series, unified_parts)
 
         # Generate unified files after all series are processed
-        UNIFIED_CSV = "UNITED_TRANSFORMERS_DATA_BASE.csv"
-        UNIFIED_SYMBOL = "UNITED_TRANSFORMERS_DATA_BASE.kicad_sym"
         print_message_utilities.print_info("\nGenerating unified files:")
         generate_unified_files(unified_parts, UNIFIED_CSV, UNIFIED_SYMBOL)
 
@@ -0,0 +1,300 @@
+"""Utility functions for incremental library builds.
+
+This module contains the content-hash manifest used by the build
+orchestrator to skip series whose specification and generator sources did
+not change since the previous build. The parts of every built series are
+cached next to the manifest, so unified files can still be merged without
+regenerating up-to-date series. The files written by every series and
+unified build are recorded as well, so deleted outputs are regenerated.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import os
+import pickle
+from pathlib import Path
+from typing import Any
+
+MANIFEST_VERSION = 2
+
+
+def compute_source_digest(
+    source_files: list[Path],
+    specs_file: Path | None = None,
+) -> str:
+    """Compute a digest of the source files a family generator depends on.
+
+    The symbol specification module is hashed without its module-level
+    ``*_SPECS`` tables, since every series entry is hashed on its own by
+    ``compute_series_hash``. Editing one series therefore only invalidates
+    that series, while any code change invalidates the whole family.
+
+    Args:
+        source_files: Python source files to hash in full
+        specs_file: Symbol specification module, hashed without its
+            series tables
+
+    Returns:
+        str: Hexadecimal SHA-256 digest
+
+    """
+    digest = hashlib.sha256()
+
+    for source_file in sorted(source_files):
+        digest.update(source_file.name.encode("utf-8"))
+        digest.update(source_file.read_bytes())
+
+    if specs_file is not None:
+        tree = ast.parse(specs_file.read_text(encoding="utf-8"))
+        tree.body = [node for node in tree.body if not _is_specs_table(node)]
+        digest.update(specs_file.name.encode("utf-8"))
+        digest.update(ast.dump(tree).encode("utf-8"))
+
+    return digest.hexdigest()
+
+
+def _is_specs_table(node: ast.stmt) -> bool:
+    """Check if a module-level statement assigns a ``*_SPECS`` table.
+
+    Args:
+        node: Module-level statement
+
+    Returns:
+        bool: True if the statement assigns a name ending in ``SPECS``
+
+    """
+    if isinstance(node, ast.Assign):
+        targets = node.targets
+    elif isinstance(node, ast.AnnAssign):
+        targets = [node.target]
+    else:
+        return False
+
+    return any(
+        isinstance(target, ast.Name) and target.id.endswith("SPECS")
+        for target in targets
+    )
+
+
+def compute_series_hash(source_digest: str, series_spec: Any) -> str:  # noqa: ANN401
+    """Compute the content hash of a single series.
+
+    Args:
+        source_digest: Digest of the family sources
+        series_spec: SeriesSpec entry of the series
+
+    Returns:
+        str: Hexadecimal SHA-256 digest
+
+    """
+    digest = hashlib.sha256()
+    digest.update(source_digest.encode("utf-8"))
+    digest.update(_canonical_repr(series_spec).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _canonical_repr(value: Any) -> str:  # noqa: ANN401
+    """Return a representation of a spec value that is stable across runs.
+
+    Sets are sorted, since the iteration order of string sets depends on
+    the hash seed of the interpreter.
+
+    Args:
+        value: Spec value to represent
+
+    Returns:
+        str: Stable representation of the value
+
+    """
+    if isinstance(value, (set, frozenset)):
+        items = sorted(_canonical_repr(item) for item in value)
+        return "{" + ", ".join(items) + "}"
+    if isinstance(value, dict):
+        items = [
+            f"{_canonical_repr(key)}: {_canonical_repr(item)}"
+            for key, item in value.items()
+        ]
+        return "{" + ", ".join(items) + "}"
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        items = [
+            f"{field}={_canonical_repr(item)}"
+            for field, item in zip(value._fields, value)
+        ]
+        return f"{type(value).__name__}(" + ", ".join(items) + ")"
+    if isinstance(value, (list, tuple)):
+        items = [_canonical_repr(item) for item in value]
+        return "[" + ", ".join(items) + "]"
+    return repr(value)
+
+
+def compute_unified_hash(
+    series_hashes: list[str],
+    shared_drawings: bool = False,
+    compact: bool = False,
+) -> str:
+    """Compute the content hash of a family's unified files.
+
+    Args:
+        series_hashes: Hashes of all series of the family, in build order
+        shared_drawings: Whether the unified symbol library is written with
+            shared drawings
+        compact: Whether the unified symbol library is written without
+            indentation
+
+    Returns:
+        str: Hexadecimal SHA-256 digest
+
+    """
+    digest = hashlib.sha256("\n".join(series_hashes).encode("utf-8"))
+    if shared_drawings:
+        digest.update(b"\nshared-drawings")
+    if compact:
+        digest.update(b"\ncompact")
+    return digest.hexdigest()
+
+
+def load_manifest(manifest_file: Path) -> dict[str, Any]:
+    """Load the build manifest.
+
+    A missing, unreadable or outdated manifest is treated as empty, which
+    results in a full rebuild.
+
+    Args:
+        manifest_file: Path of the manifest JSON file
+
+    Returns:
+        dict: Manifest with ``series`` and ``unified`` hash mappings and
+            the matching ``series_outputs`` and ``unified_outputs`` file
+            lists
+
+    """
+    empty_manifest: dict[str, Any] = {
+        "version": MANIFEST_VERSION,
+        "series": {},
+        "unified": {},
+        "series_outputs": {},
+        "unified_outputs": {},
+    }
+
+    try:
+        with Path.open(manifest_file, "r", encoding="utf-8") as file_handle:
+            manifest = json.load(file_handle)
+    except (OSError, ValueError):
+        return empty_manifest
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        return empty_manifest
+
+    return manifest
+
+
+def save_manifest(
+    manifest: dict[str, Any],
+    manifest_file: Path,
+) -> None:
+    """Write the build manifest atomically.
+
+    Args:
+        manifest: Manifest to write
+        manifest_file: Path of the manifest JSON file
+
+    Returns:
+        None
+
+    """
+    manifest_file.parent.mkdir(parents=True, exist_ok=True)
+    temporary_file = manifest_file.with_suffix(".tmp")
+    with Path.open(temporary_file, "w", encoding="utf-8") as file_handle:
+        json.dump(manifest, file_handle, indent=2, sort_keys=True)
+    os.replace(temporary_file, manifest_file)
+
+
+def outputs_exist(output_files: list[str] | None) -> bool:
+    """Check if all recorded output files of a build step still exist.
+
+    Args:
+        output_files: Files recorded for the step, or None if the step
+            has no recorded outputs
+
+    Returns:
+        bool: True if outputs were recorded and none of them is missing
+
+    """
+    return bool(output_files) and all(
+        Path(output_file).is_file() for output_file in output_files
+    )
+
+
+def get_cached_parts_path(
+    cache_dir: Path, family: str, content_hash: str
+) -> Path:
+    """Return the path of the cached parts of a series.
+
+    Args:
+        cache_dir: Root directory of the build cache
+        family: Family the series belongs to
+        content_hash: Content hash of the series
+
+    Returns:
+        Path: Location of the pickled parts list
+
+    """
+    return cache_dir / "parts" / family / f"{content_hash}.pickle"
+
+
+def load_cached_parts(
+    cache_dir: Path,
+    family: str,
+    content_hash: str,
+) -> list | None:
+    """Load the cached parts of an up-to-date series.
+
+    Args:
+        cache_dir: Root directory of the build cache
+        family: Family the series belongs to
+        content_hash: Content hash of the series
+
+    Returns:
+        list | None: Cached PartInfo instances, or None if not cached
+
+    """
+    parts_path = get_cached_parts_path(cache_dir, family, content_hash)
+    try:
+        with Path.open(parts_path, "rb") as file_handle:
+            return pickle.load(file_handle)  # noqa: S301
+    except (OSError, pickle.UnpicklingError, AttributeError, EOFError):
+        return None
+
+
+def save_cached_parts(
+    cache_dir: Path,
+    family: str,
+    content_hash: str,
+    parts_list: list,
+    previous_hash: str | None = None,
+) -> None:
+    """Cache the parts of a freshly built series.
+
+    Args:
+        cache_dir: Root directory of the build cache
+        family: Family the series belongs to
+        content_hash: Content hash of the series
+        parts_list: PartInfo instances generated for the series
+        previous_hash: Hash of the replaced cache entry, removed if given
+
+    Returns:
+        None
+
+    """
+    parts_path = get_cached_parts_path(cache_dir, family, content_hash)
+    parts_path.parent.mkdir(parents=True, exist_ok=True)
+    with Path.open(parts_path, "wb") as file_handle:
+        pickle.dump(parts_list, file_handle, protocol=pickle.HIGHEST_PROTOCOL)
+
+    if previous_hash and previous_hash != content_hash:
+        get_cached_parts_path(cache_dir, family, previous_hash).unlink(
+            missing_ok=True,
+        )
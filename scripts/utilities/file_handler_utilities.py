@@ -2,50 +2,176 @@
 
 This module contains utility functions for file handling, such as writing
 to CSV files and creating directories.
+
+Generated files are opened with ``open_output_file``, so the build
+orchestrator can record the files written by every build step with
+``record_outputs``.
 """
 
+from __future__ import annotations
+
 import csv
+import os
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Final, NamedTuple
+from typing import Callable, Iterator, NamedTuple, TextIO
 
 from .print_message_utilities import print_info
 
+_recorded_outputs: set[str] | None = None
 
-def write_to_csv(
+
+def open_output_file(
+    output_file: str | Path,
+    encoding: str = "utf-8",
+    newline: str | None = None,
+) -> TextIO:
+    """Open a generated file for writing.
+
+    Inside a ``record_outputs`` block, the file is recorded as an output
+    of the current build step.
+
+    Args:
+        output_file: Path of the generated file
+        encoding: Character encoding
+        newline: Newline translation, as for ``open``
+
+    Returns:
+        TextIO: The file opened for writing
+
+    """
+    if _recorded_outputs is not None:
+        _recorded_outputs.add(os.path.relpath(output_file))
+    return Path.open(
+        Path(output_file), "w", encoding=encoding, newline=newline
+    )
+
+
+@contextmanager
+def record_outputs() -> Iterator[set[str]]:
+    """Record the files opened with ``open_output_file`` inside the block.
+
+    Once the block exits, the set holds the paths, relative to the working
+    directory, of the recorded files that still exist.
+
+    Yields:
+        set[str]: Recorded output files, complete once the block exits
+
+    """
+    global _recorded_outputs  # noqa: PLW0603
+
+    recorded: set[str] = set()
+    _recorded_outputs = recorded
+    try:
+        yield recorded
+    finally:
+        _recorded_outputs = None
+        existing = {
+            output_file
+            for output_file in recorded
+            if Path(output_file).is_file()
+        }
+        recorded.clear()
+        recorded.update(existing)
+
+
+def materialize_rows(
     parts_list: list[NamedTuple],
+    header_mapping: dict[str, Callable[[NamedTuple], object]],
+) -> list[dict[str, str]]:
+    """Convert parts into CSV rows keyed by header.
+
+    Values are converted to text exactly like the CSV writer does, so the
+    rows are identical to the ones read back from the written CSV file.
+
+    Args:
+        parts_list: List of parts to convert
+        header_mapping: Mapping of CSV headers to part attribute getters
+
+    Returns:
+        list[dict[str, str]]: One row per part, in header order
+
+    """
+    headers = list(header_mapping.keys())
+    getters = list(header_mapping.values())
+    return [
+        dict(
+            zip(
+                headers,
+                [_to_csv_text(getter(part)) for getter in getters],
+            )
+        )
+        for part in parts_list
+    ]
+
+
+def _to_csv_text(value: object) -> str:
+    """Convert a single value to its CSV text representation.
+
+    Args:
+        value: Value to convert
+
+    Returns:
+        str: Empty string for None, the string value otherwise
+
+    """
+    if value is None:
+        return ""
+    return value if isinstance(value, str) else str(value)
+
+
+def write_rows_to_csv(
+    rows: list[dict[str, str]],
+    headers: list[str],
     output_file: str,
-    header_mapping: list[str],
     encoding: str = "utf-8",
 ) -> None:
-    """Write specifications to CSV file using global header mapping.
+    """Write materialized rows to a CSV file.
 
     Args:
-        parts_list: List of parts to write
+        rows: Rows keyed by header, as returned by materialize_rows
+        headers: CSV headers, in column order
         output_file: Output filename
-        header_mapping: todo
         encoding: Character encoding
 
     Returns:
         None
 
     """
-    # Prepare all rows before opening file
-    headers: Final[list[str]] = list(header_mapping.keys())
-    rows = [headers]
-    rows.extend([
-        [header_mapping[header](part) for header in headers]
-        for part in parts_list
-    ])
-
-    # Write all rows at once
-    with Path.open(
-        f"{output_file}",
-        "w",
-        newline="",
+    with open_output_file(
+        output_file,
         encoding=encoding,
+        newline="",
     ) as csvfile:
         writer = csv.writer(csvfile)
-        writer.writerows(rows)
+        writer.writerow(headers)
+        writer.writerows([row[header] for header in headers] for row in rows)
+
+
+def write_to_csv(
+    parts_list: list[NamedTuple],
+    output_file: str,
+    header_mapping: dict[str, Callable[[NamedTuple], object]],
+    encoding: str = "utf-8",
+) -> list[dict[str, str]]:
+    """Write specifications to CSV file using global header mapping.
+
+    The rows are materialized once and returned, so callers can generate
+    the KiCad symbols from them without reading the CSV file back.
+
+    Args:
+        parts_list: List of parts to write
+        output_file: Output filename
+        header_mapping: Mapping of CSV headers to part attribute getters
+        encoding: Character encoding
+
+    Returns:
+        list[dict[str, str]]: The rows written to the CSV file
+
+    """
+    rows = materialize_rows(parts_list, header_mapping)
+    write_rows_to_csv(rows, list(header_mapping.keys()), output_file, encoding)
+    return rows
 
 
 def ensure_directory_exists(directory: str) -> None:
@@ -9,6 +9,8 @@ from colorama import Fore, Style, init
 
 init(autoreset=True)
 
+_error_count = 0
+
 
 def print_success(message: str) -> None:
     """Print a success message in green color.
@@ -27,9 +29,25 @@ def print_error(message: str) -> None:
         message (str): The error message to be printed
 
     """
+    global _error_count  # noqa: PLW0603
+    _error_count += 1
     print(f"{Fore.RED}{message}{Style.RESET_ALL}")
 
 
+def get_error_count() -> int:
+    """Get the number of error messages printed by this process.
+
+    Generators report the errors they recover from through
+    ``print_error``, so comparing the count before and after a step tells
+    whether the step failed.
+
+    Returns:
+        int: Number of ``print_error`` calls so far
+
+    """
+    return _error_count
+
+
 def print_info(message: str) -> None:
     """Print an informational message in yellow color.
 
@@ -0,0 +1,357 @@
+"""Utilities for reading and writing KiCad S-expression files.
+
+This module contains the buffered writer used by the symbol generators,
+the S-expression splitting helpers shared by the symbol utilities and the
+S-expression parser shared by the KiCad file readers.
+Key features:
+- Collect written fragments in memory and flush them in large chunks.
+- Optionally compact the output by removing indentation whitespace.
+- Split text into top-level S-expressions, skipping quoted strings.
+- Parse memory-mapped KiCad files into a node tree in a single pass.
+
+"""
+
+from __future__ import annotations
+
+import mmap
+import re
+import sys
+from pathlib import Path
+from typing import Iterator, NamedTuple, TextIO
+
+CHUNK_SIZE = 1 << 20
+
+SEXPR_TOKEN_PATTERN = re.compile(r'"(?:[^"\\]|\\.)*"|[()]')
+WHITESPACE_PATTERN = re.compile(r'"(?:[^"\\]|\\.)*"|\s+')
+SYMBOL_START = '(symbol "'
+SEXPR_BYTES_TOKEN_PATTERN = re.compile(
+    rb'"[^"\\]*(?:\\.[^"\\]*)*"|[()]|[^\s()"]+'
+)
+ESCAPE_PATTERN = re.compile(r"\\(.)")
+
+
+class SExpressionNode(NamedTuple):
+    """Parsed S-expression list, such as ``(pin input line ...)``.
+
+    Attributes:
+        name: Leading atom of the list (e.g. 'pin'), empty if the list
+            does not start with an atom
+        children: Remaining atoms and nested nodes, in file order. Quoted
+            atoms are unquoted and unescaped.
+        start: Byte offset of the opening parenthesis
+        end: Byte offset just past the closing parenthesis
+
+    """
+
+    name: str
+    children: list[str | SExpressionNode]
+    start: int
+    end: int
+
+    @property
+    def values(self) -> list[str]:
+        """Atoms of the list after its name, without nested nodes."""
+        return [child for child in self.children if isinstance(child, str)]
+
+    def find(self, name: str) -> SExpressionNode | None:
+        """Return the first direct child node with the given name.
+
+        Args:
+            name: Name of the child node
+
+        Returns:
+            SExpressionNode | None: Matching child, or None if not found
+
+        """
+        return next(self.find_all(name), None)
+
+    def find_all(self, name: str) -> Iterator[SExpressionNode]:
+        """Iterate over the direct child nodes with the given name.
+
+        Args:
+            name: Name of the child nodes
+
+        Yields:
+            SExpressionNode: Matching children, in file order
+
+        """
+        for child in self.children:
+            if isinstance(child, SExpressionNode) and child.name == name:
+                yield child
+
+    def walk(self, name: str) -> Iterator[SExpressionNode]:
+        """Iterate over the descendant nodes with the given name.
+
+        Args:
+            name: Name of the descendant nodes
+
+        Yields:
+            SExpressionNode: Matching descendants, in file order
+
+        """
+        for child in self.children:
+            if isinstance(child, SExpressionNode):
+                if child.name == name:
+                    yield child
+                yield from child.walk(name)
+
+
+class SExpressionWriter:
+    """Buffered, optionally compacting writer for S-expression files.
+
+    The writer is a drop-in replacement for the text file passed to the
+    ``write_*`` helpers of ``symbol_utils``. Fragments are joined and
+    written to the underlying file once the buffer exceeds the chunk size.
+
+    In compact mode the indentation whitespace of the templates is removed:
+    whitespace next to parentheses is dropped, other whitespace runs become
+    a single space and every symbol starts on a new line. Quoted strings are
+    left unchanged.
+
+    Attributes:
+        output_file: Underlying text file
+        compact: Whether indentation whitespace is removed
+        chunk_size: Number of buffered characters that triggers a flush
+
+    """
+
+    def __init__(
+        self,
+        output_file: TextIO,
+        compact: bool = False,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            output_file: Text file to write to
+            compact: Whether to remove indentation whitespace
+            chunk_size: Number of buffered characters that triggers a flush
+
+        """
+        self.output_file = output_file
+        self.compact = compact
+        self.chunk_size = chunk_size
+        self._fragments: list[str] = []
+        self._buffered_size = 0
+        self._pending_whitespace = ""
+        self._previous_char = ""
+
+    def __enter__(self) -> SExpressionWriter:
+        """Return the writer for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Flush the remaining buffered output."""
+        self.flush()
+
+    def write(self, text: str) -> int:
+        """Buffer a fragment of S-expression text.
+
+        Args:
+            text: Fragment to write
+
+        Returns:
+            int: Number of characters buffered
+
+        """
+        self._fragments.append(text)
+        self._buffered_size += len(text)
+        if self._buffered_size >= self.chunk_size:
+            self._write_chunk(final=False)
+        return len(text)
+
+    def flush(self) -> None:
+        """Write all buffered output to the underlying file."""
+        self._write_chunk(final=True)
+        self.output_file.flush()
+
+    def _write_chunk(self, final: bool) -> None:
+        """Join the buffered fragments and write them out.
+
+        In compact mode, trailing whitespace is held back until the next
+        chunk, since how it is compacted depends on the following text.
+
+        Args:
+            final: Whether no more fragments will follow
+
+        """
+        text = self._pending_whitespace + "".join(self._fragments)
+        self._fragments.clear()
+        self._buffered_size = 0
+        self._pending_whitespace = ""
+
+        if self.compact:
+            if not final:
+                content = text.rstrip()
+                self._pending_whitespace = text[len(content) :]
+                text = content
+            text = compact_sexpr(text, self._previous_char)
+
+        if text:
+            self.output_file.write(text)
+            self._previous_char = text[-1]
+
+
+def compact_sexpr(text: str, previous_char: str = "") -> str:
+    """Remove indentation whitespace from S-expression text.
+
+    Args:
+        text: S-expression text, possibly spanning several expressions
+        previous_char: Last character written before the text, if any
+
+    Returns:
+        str: Equivalent text without redundant whitespace
+
+    """
+
+    def replace_whitespace(match: re.Match) -> str:
+        token = match.group()
+        if token[0] == '"':
+            return token
+
+        start, end = match.span()
+        before = text[start - 1] if start else previous_char
+        if not before or end == len(text):
+            return ""
+        if text.startswith(SYMBOL_START, end):
+            return "\n"
+        if before in "()" or text[end] in "()":
+            return ""
+        return " "
+
+    return WHITESPACE_PATTERN.sub(replace_whitespace, text)
+
+
+def split_expressions(text: str) -> list[str]:
+    """Split text into its top-level S-expressions.
+
+    Args:
+        text: Text containing zero or more S-expressions
+
+    Returns:
+        list[str]: Text of every top-level expression, in order
+
+    """
+    expressions = []
+    depth = 0
+    start = 0
+
+    for match in SEXPR_TOKEN_PATTERN.finditer(text):
+        token = match.group()
+        if token == "(":
+            if depth == 0:
+                start = match.start()
+            depth += 1
+        elif token == ")":
+            depth -= 1
+            if depth == 0:
+                expressions.append(text[start : match.end()])
+
+    return expressions
+
+
+def parse_sexpr(
+    data: bytes | mmap.mmap,
+    max_depth: int | None = None,
+) -> list[SExpressionNode]:
+    """Parse S-expression data into a tree of nodes.
+
+    The data is tokenized in a single pass, so parsing time is linear in
+    the data size and nested lists are matched by their parentheses, not
+    by their layout.
+
+    Args:
+        data: UTF-8 encoded S-expression data
+        max_depth: Deepest nesting level kept in the tree, where top-level
+            nodes are at level 1. Deeper lists are skipped without building
+            nodes for them. Defaults to keeping all levels.
+
+    Returns:
+        list[SExpressionNode]: Top-level nodes, in order
+
+    Raises:
+        ValueError: If the parentheses are not balanced
+
+    """
+    if max_depth is None:
+        max_depth = sys.maxsize
+
+    nodes: list[SExpressionNode] = []
+    stack: list[tuple[int, list[str | SExpressionNode]]] = []
+    items: list[str | SExpressionNode] = nodes
+    start = -1
+    depth = 0
+
+    for match in SEXPR_BYTES_TOKEN_PATTERN.finditer(data):
+        token = match[0]
+        if token == b"(":
+            depth += 1
+            if depth <= max_depth:
+                stack.append((start, items))
+                start = match.start()
+                items = []
+        elif token == b")":
+            if not depth:
+                message = f"Unexpected ')' at byte {match.start()}"
+                raise ValueError(message)
+            depth -= 1
+            if depth < max_depth:
+                node = (
+                    SExpressionNode(items[0], items[1:], start, match.end())
+                    if items and isinstance(items[0], str)
+                    else SExpressionNode("", items, start, match.end())
+                )
+                start, items = stack.pop()
+                items.append(node)
+        elif 0 < depth <= max_depth:
+            items.append(_decode_atom(token))
+
+    if depth:
+        message = f"Unbalanced parentheses, {depth} '(' left unclosed"
+        raise ValueError(message)
+
+    return nodes
+
+
+def read_sexpr_file(
+    file_path: str | Path,
+    max_depth: int | None = None,
+) -> list[SExpressionNode]:
+    """Parse an S-expression file through a memory map.
+
+    Args:
+        file_path: Path of the KiCad file
+        max_depth: Deepest nesting level kept in the tree, as for
+            ``parse_sexpr``
+
+    Returns:
+        list[SExpressionNode]: Top-level nodes of the file, in order
+
+    """
+    file_path = Path(file_path)
+    if not file_path.stat().st_size:
+        return []
+
+    with file_path.open("rb") as file_handle:
+        with mmap.mmap(
+            file_handle.fileno(), 0, access=mmap.ACCESS_READ
+        ) as data:
+            return parse_sexpr(data, max_depth)
+
+
+def _decode_atom(token: bytes) -> str:
+    """Decode an atom token, unquoting and unescaping quoted strings.
+
+    Args:
+        token: Raw atom token
+
+    Returns:
+        str: Atom text
+
+    """
+    if token[:1] != b'"':
+        return token.decode("utf-8")
+
+    text = token[1:-1].decode("utf-8")
+    return ESCAPE_PATTERN.sub(r"\1", text) if "\\" in text else text
@@ -8,10 +8,18 @@ Key features:
 - Write properties for a single symbol.
 - Write graphical representation of electronic components.
 - Write pins for electronic components.
+- Write symbol libraries where parts sharing a drawing extend one symbol.
+- Write symbol libraries through a buffered, optionally compact writer.
 
 """
 
-from typing import List, TextIO, Tuple
+import io
+import re
+from typing import Callable, List, TextIO, Tuple
+
+from .sexpr_utilities import SExpressionWriter, split_expressions
+
+SYMBOL_NAME_PATTERN = re.compile(r'\(symbol\s+"((?:[^"\\]|\\.)*)"')
 
 
 def write_header(
@@ -93,6 +101,128 @@ def get_all_properties(
     return result
 
 
+def write_symbol_library(
+    symbol_file: TextIO,
+    component_data_list: list[dict[str, str]],
+    write_component: Callable[[TextIO, dict[str, str], list[str]], None],
+    shared_drawings: bool = False,
+    compact: bool = False,
+) -> None:
+    """Write a complete KiCad symbol library.
+
+    With shared drawings enabled, the first component using a given drawing
+    is written in full and every later component with an identical drawing
+    is written as a derived symbol that extends it, carrying only its own
+    properties.
+
+    All output is routed through an ``SExpressionWriter``, which writes
+    the library in large chunks and can drop the indentation whitespace.
+
+    Args:
+        symbol_file (TextIO): File object for writing the symbol file.
+        component_data_list (list[dict[str, str]]): List of component data.
+        write_component (Callable): Family function writing one complete
+            symbol from component data and the property order.
+        shared_drawings (bool): Whether to share identical drawings through
+            KiCad symbol inheritance.
+        compact (bool): Whether to write the library without indentation.
+
+    Returns:
+        None
+
+    """
+    property_order = get_all_properties(component_data_list)
+    root_symbols: dict[str, str] = {}
+
+    with SExpressionWriter(symbol_file, compact) as symbol_writer:
+        write_header(symbol_writer)
+        for component_data in component_data_list:
+            if not shared_drawings:
+                write_component(symbol_writer, component_data, property_order)
+                continue
+
+            component_buffer = io.StringIO()
+            write_component(component_buffer, component_data, property_order)
+            write_shared_drawing_symbol(
+                symbol_writer,
+                component_buffer.getvalue(),
+                root_symbols,
+            )
+        symbol_writer.write(")")
+
+
+def write_shared_drawing_symbol(
+    symbol_file: TextIO,
+    symbol_text: str,
+    root_symbols: dict[str, str],
+) -> None:
+    """Write a symbol, extending an earlier symbol with the same drawing.
+
+    Args:
+        symbol_file (TextIO): File object for writing the symbol file.
+        symbol_text (str): Complete symbol expression as written by the
+            family generator.
+        root_symbols (dict[str, str]): Names of the symbols written in full,
+            keyed by their drawing. Updated in place.
+
+    Returns:
+        None
+
+    """
+    symbol_name, children = split_symbol_expression(symbol_text)
+    properties = [
+        child for child in children if child.startswith("(property")
+    ]
+    drawing = [
+        child for child in children if not child.startswith("(property")
+    ]
+
+    # Sub-symbol names embed the symbol name, e.g. "C_0402_100nF_0_1"
+    drawing_key = "\n".join(drawing).replace(
+        f'"{symbol_name}_',
+        '"<symbol>_',
+    )
+
+    root_name = root_symbols.get(drawing_key)
+    if root_name is None:
+        root_symbols[drawing_key] = symbol_name
+        symbol_file.write(symbol_text)
+        return
+
+    symbol_file.write(f"""
+        (symbol "{symbol_name}"
+            (extends "{root_name}")""")
+    for symbol_property in properties:
+        symbol_file.write(f"\n        {symbol_property}")
+    symbol_file.write("\n        )")
+
+
+def split_symbol_expression(symbol_text: str) -> Tuple[str, List[str]]:
+    """Split a symbol expression into its name and child expressions.
+
+    Args:
+        symbol_text (str): Text containing exactly one symbol expression.
+
+    Returns:
+        Tuple[str, List[str]]: Symbol name and the text of every child
+            expression, in file order.
+
+    Raises:
+        ValueError: If the text is not a single symbol expression.
+
+    """
+    expressions = split_expressions(symbol_text)
+    name_match = (
+        SYMBOL_NAME_PATTERN.match(expressions[0]) if expressions else None
+    )
+    if len(expressions) != 1 or name_match is None:
+        msg = "Expected exactly one symbol expression"
+        raise ValueError(msg)
+
+    children = split_expressions(expressions[0][name_match.end() : -1])
+    return name_match.group(1), children
+
+
 def write_property(
     symbol_file: TextIO,
     property_name: str,
@@ -581,6 +711,8 @@ def write_ferrite_bead_symbol_drawing(
         )
         """)
 
+    symbol_file.write(f'\t\t(symbol "{symbol_name}_1_1"\n')
+
     write_pin(symbol_file, -5.08, 0, 0, "1")
     write_pin(symbol_file, 5.08, 0, 180, "2")
 
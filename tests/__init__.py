@@ -0,0 +1,4 @@
+"""Unit tests for the library build scripts and the web application.
+
+Run from the repository root with ``python -m unittest discover tests``.
+"""
@@ -0,0 +1,44 @@
+"""Local file server standing in for remote sites in the tests."""
+
+import functools
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    """File handler that does not log requests."""
+
+    def log_message(self, format, *args):  # noqa: A002
+        """Keep the test output clean."""
+
+
+def start_file_server(directory, handler_class=QuietHandler):
+    """Serve the files of a directory from a background thread.
+
+    Args:
+        directory: Directory whose files are served
+        handler_class: Request handler class, QuietHandler or a subclass
+
+    Returns:
+        ThreadingHTTPServer: Running server, bound to a free local port
+
+    """
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0),
+        functools.partial(handler_class, directory=str(directory)),
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def stop_file_server(server):
+    """Shut a server started by start_file_server down."""
+    server.shutdown()
+    server.server_close()
+
+
+def start_patches(test_case, patches):
+    """Start patches and stop them when the test case is cleaned up."""
+    for patch in patches:
+        patch.start()
+        test_case.addCleanup(patch.stop)
@@ -0,0 +1,133 @@
+"""Tests for the series batching of the build_all_libraries orchestrator."""
+
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from typing import NamedTuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(REPO_ROOT / "scripts"))
+
+import build_all_libraries  # noqa: E402
+
+FAMILY = build_all_libraries.FamilyInfo("diodes", "diodes", "generator")
+
+
+class DiodeSpec(NamedTuple):
+    """Minimal stand-in for a SeriesSpec with a package field."""
+
+    footprint: str
+    package: str
+
+
+def make_generator(series_specs, shared_footprints=False):
+    """Return a stand-in generator module with the given series specs."""
+    if shared_footprints:
+
+        def generate_files_for_series(series, parts, generated_footprints):
+            """Accept a shared footprint set like the switch generators."""
+
+    else:
+
+        def generate_files_for_series(series, parts):
+            """Accept the arguments of a regular generator."""
+
+    return SimpleNamespace(
+        SERIES_SPECS=series_specs,
+        generate_files_for_series=generate_files_for_series,
+    )
+
+
+class GroupSeriesTest(unittest.TestCase):
+    """Tests for grouping series that write the same footprint files."""
+
+    def test_shared_package_is_one_batch(self):
+        """Series sharing a package are batched in specification order."""
+        generator = make_generator(
+            {
+                "A": DiodeSpec("diode_footprints:SOD323", "SOD323"),
+                "B": DiodeSpec("diode_footprints:SMA", "SMA"),
+                "C": DiodeSpec("diode_footprints:SOD323", "SOD323"),
+                "D": DiodeSpec("diode_footprints:SOT23", "SOT23"),
+            }
+        )
+        self.assertEqual(
+            build_all_libraries.group_series(FAMILY, generator, {}),
+            [["A", "C"], ["B"], ["D"]],
+        )
+
+    def test_transitive_sharing_joins_batches(self):
+        """A series sharing keys with two batches merges them."""
+        generator = make_generator(
+            {
+                "A": DiodeSpec("fp:A", "P1"),
+                "B": DiodeSpec("fp:B", "P2"),
+                "C": DiodeSpec("fp:A", "P2"),
+            }
+        )
+        self.assertEqual(
+            build_all_libraries.group_series(FAMILY, generator, {}),
+            [["A", "B", "C"]],
+        )
+
+    def test_recorded_outputs_join_batches(self):
+        """Series that wrote the same file in the last build stay together."""
+        generator = make_generator(
+            {
+                "A": DiodeSpec("fp:A", "P1"),
+                "B": DiodeSpec("fp:B", "P2"),
+            }
+        )
+        series_outputs = {
+            "diodes/A": ["a.csv", "shared.kicad_mod"],
+            "diodes/B": ["b.csv", "shared.kicad_mod"],
+        }
+        self.assertEqual(
+            build_all_libraries.group_series(
+                FAMILY, generator, series_outputs
+            ),
+            [["A", "B"]],
+        )
+
+    def test_case_codes_and_lists_are_keys(self):
+        """Case codes, value case codes and footprint lists are compared."""
+        capacitor_spec = NamedTuple(
+            "CapacitorSpec",
+            [
+                ("footprint", list),
+                ("case_code_in", str),
+                ("value_case_codes_in", dict),
+            ],
+        )
+        generator = make_generator(
+            {
+                "A": capacitor_spec(["fp:A"], "0402", {}),
+                "B": capacitor_spec(["fp:B"], "0805", {1e-6: "0603"}),
+                "C": capacitor_spec(["fp:C"], "0603", {}),
+                "D": capacitor_spec(["fp:D", "fp:A"], "1206", {}),
+                "E": capacitor_spec(None, "1210", None),
+            }
+        )
+        self.assertEqual(
+            build_all_libraries.group_series(FAMILY, generator, {}),
+            [["A", "D"], ["B", "C"], ["E"]],
+        )
+
+    def test_shared_footprint_generators_are_one_batch(self):
+        """Generators sharing footprint state build all series together."""
+        generator = make_generator(
+            {
+                "A": DiodeSpec("fp:A", "P1"),
+                "B": DiodeSpec("fp:B", "P2"),
+            },
+            shared_footprints=True,
+        )
+        self.assertEqual(
+            build_all_libraries.group_series(FAMILY, generator, {}),
+            [["A", "B"]],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
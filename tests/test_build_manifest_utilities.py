@@ -0,0 +1,186 @@
+"""Tests for the incremental build manifest of build_manifest_utilities."""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from typing import NamedTuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(REPO_ROOT / "scripts"))
+
+from utilities import build_manifest_utilities  # noqa: E402
+
+
+class SampleSpec(NamedTuple):
+    """Minimal stand-in for a family SeriesSpec."""
+
+    footprint: str
+    values: set
+    ratings: dict
+
+
+class SeriesHashTest(unittest.TestCase):
+    """Tests for the series and unified content hashes."""
+
+    def test_series_hash_ignores_set_order(self):
+        """Sets with the same items hash the same in any insertion order."""
+        first = SampleSpec("R_0603", {"1k", "2k2", "4k7"}, {"a": 1})
+        second = SampleSpec("R_0603", {"4k7", "1k", "2k2"}, {"a": 1})
+        self.assertEqual(
+            build_manifest_utilities.compute_series_hash("src", first),
+            build_manifest_utilities.compute_series_hash("src", second),
+        )
+
+    def test_series_hash_changes_with_spec_and_sources(self):
+        """Spec fields and the source digest both invalidate the hash."""
+        spec = SampleSpec("R_0603", {"1k"}, {"a": 1})
+        base = build_manifest_utilities.compute_series_hash("src", spec)
+        self.assertNotEqual(
+            base,
+            build_manifest_utilities.compute_series_hash(
+                "src", spec._replace(footprint="R_0805")
+            ),
+        )
+        self.assertNotEqual(
+            base,
+            build_manifest_utilities.compute_series_hash("other", spec),
+        )
+
+    def test_unified_hash_depends_on_output_flags(self):
+        """Shared drawings and compact output get their own hashes."""
+        hashes = {
+            build_manifest_utilities.compute_unified_hash(
+                ["a", "b"], shared_drawings, compact
+            )
+            for shared_drawings in (False, True)
+            for compact in (False, True)
+        }
+        self.assertEqual(len(hashes), 4)
+        self.assertNotEqual(
+            build_manifest_utilities.compute_unified_hash(["a", "b"]),
+            build_manifest_utilities.compute_unified_hash(["b", "a"]),
+        )
+
+    def test_source_digest_ignores_specs_tables(self):
+        """Editing a series table leaves the family source digest as is."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            specs_file = Path(temp_dir) / "symbol_specs.py"
+            specs_file.write_text('SERIES_SPECS = {"A": 1}\nVERSION = 1\n')
+            digest = build_manifest_utilities.compute_source_digest(
+                [], specs_file
+            )
+
+            specs_file.write_text('SERIES_SPECS = {"B": 2}\nVERSION = 1\n')
+            self.assertEqual(
+                digest,
+                build_manifest_utilities.compute_source_digest([], specs_file),
+            )
+
+            specs_file.write_text('SERIES_SPECS = {"B": 2}\nVERSION = 2\n')
+            self.assertNotEqual(
+                digest,
+                build_manifest_utilities.compute_source_digest([], specs_file),
+            )
+
+
+class ManifestFileTest(unittest.TestCase):
+    """Tests for loading and saving the manifest and the parts cache."""
+
+    def setUp(self):
+        """Create a temporary cache directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.temp_dir.name)
+        self.manifest_file = self.cache_dir / "manifest.json"
+
+    def tearDown(self):
+        """Remove the temporary cache directory."""
+        self.temp_dir.cleanup()
+
+    def test_missing_manifest_is_empty(self):
+        """A missing manifest loads as empty, with all mappings present."""
+        manifest = build_manifest_utilities.load_manifest(self.manifest_file)
+        self.assertEqual(
+            manifest,
+            {
+                "version": build_manifest_utilities.MANIFEST_VERSION,
+                "series": {},
+                "unified": {},
+                "series_outputs": {},
+                "unified_outputs": {},
+            },
+        )
+
+    def test_manifest_round_trip(self):
+        """A saved manifest loads back unchanged."""
+        manifest = build_manifest_utilities.load_manifest(self.manifest_file)
+        manifest["series"]["resistors/RC0603"] = "abc"
+        manifest["series_outputs"]["resistors/RC0603"] = ["a.csv"]
+        build_manifest_utilities.save_manifest(manifest, self.manifest_file)
+        self.assertEqual(
+            build_manifest_utilities.load_manifest(self.manifest_file),
+            manifest,
+        )
+
+    def test_outdated_or_corrupt_manifest_is_empty(self):
+        """Other manifest versions and invalid JSON force a full rebuild."""
+        self.manifest_file.write_text(
+            json.dumps({"version": 1, "series": {"a/b": "abc"}})
+        )
+        manifest = build_manifest_utilities.load_manifest(self.manifest_file)
+        self.assertEqual(manifest["series"], {})
+
+        self.manifest_file.write_text("{not json")
+        manifest = build_manifest_utilities.load_manifest(self.manifest_file)
+        self.assertEqual(manifest["series"], {})
+
+    def test_cached_parts_replace_previous_entry(self):
+        """Saving parts under a new hash removes the previous entry."""
+        build_manifest_utilities.save_cached_parts(
+            self.cache_dir, "diodes", "old", ["part"]
+        )
+        build_manifest_utilities.save_cached_parts(
+            self.cache_dir, "diodes", "new", ["part", "other"], "old"
+        )
+        self.assertIsNone(
+            build_manifest_utilities.load_cached_parts(
+                self.cache_dir, "diodes", "old"
+            )
+        )
+        self.assertEqual(
+            build_manifest_utilities.load_cached_parts(
+                self.cache_dir, "diodes", "new"
+            ),
+            ["part", "other"],
+        )
+
+
+class OutputsExistTest(unittest.TestCase):
+    """Tests for checking the recorded files of a build step."""
+
+    def setUp(self):
+        """Switch to a temporary working directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.previous_cwd = Path.cwd()
+        os.chdir(self.temp_dir.name)
+
+    def tearDown(self):
+        """Restore the working directory and remove the temporary one."""
+        os.chdir(self.previous_cwd)
+        self.temp_dir.cleanup()
+
+    def test_outputs_exist(self):
+        """Outputs only count as present if recorded and none is missing."""
+        Path("series.csv").write_text("")
+        self.assertTrue(build_manifest_utilities.outputs_exist(["series.csv"]))
+        self.assertFalse(
+            build_manifest_utilities.outputs_exist(["series.csv", "gone.csv"])
+        )
+        self.assertFalse(build_manifest_utilities.outputs_exist([]))
+        self.assertFalse(build_manifest_utilities.outputs_exist(None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,199 @@
+"""Tests for the dataset registry of the web application."""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(REPO_ROOT / "app"))
+
+import pages.utils.dataset_utils as dsu  # noqa: E402
+
+DATASET_TEXT = """MPN,Value,Package,Datasheet
+RC0402-1K,1000,0402,https://example.com/rc0402
+RC0603-2K2,2200,0603,
+RC0805-4K7,4700,0805,https://example.com/rc0805
+CRCW0603-10K,10000,0603,
+"""
+
+
+class DatasetRegistryTest(unittest.TestCase):
+    """Tests for loading, querying and indexing database CSV files."""
+
+    def setUp(self):
+        """Write a sample database and isolate the registry state."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        temp_path = Path(self.temp_dir.name)
+        self.dataset_file = str(temp_path / "UNITED_SAMPLE_DATA_BASE.csv")
+        Path(self.dataset_file).write_text(DATASET_TEXT, encoding="utf-8")
+        self.index_file = temp_path / "dataset_index.json"
+
+        patches = [
+            mock.patch.object(dsu, "DATASET_INDEX_FILE", self.index_file),
+            mock.patch.object(dsu, "_metadata_index", None),
+            mock.patch.object(
+                dsu, "_dataset_cache", type(dsu._dataset_cache)()
+            ),
+            mock.patch.object(dsu, "_query_cache", type(dsu._query_cache)()),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        """Remove the temporary database and index."""
+        self.temp_dir.cleanup()
+
+    def rewrite_dataset(self, text):
+        """Replace the sample database with a newer file."""
+        Path(self.dataset_file).write_text(text, encoding="utf-8")
+        file_stat = Path(self.dataset_file).stat()
+        os.utime(
+            self.dataset_file,
+            ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 10**9),
+        )
+
+    def query(self, filter_model=None, sort_model=None):
+        """Return the MPNs of a query on the sample database."""
+        result = dsu.query_dataset(
+            self.dataset_file,
+            ["Datasheet"],
+            filter_model,
+            sort_model,
+        )
+        return list(result["MPN"])
+
+    def test_url_columns_become_markdown_links(self):
+        """URL cells are rendered as links and empty cells stay empty."""
+        dataframe = dsu.load_dataset(self.dataset_file, ["Datasheet"])
+        self.assertEqual(
+            list(dataframe["Datasheet"]),
+            [
+                "[Datasheet](https://example.com/rc0402)",
+                "",
+                "[Datasheet](https://example.com/rc0805)",
+                "",
+            ],
+        )
+
+    def test_text_filters(self):
+        """Text filters are case insensitive."""
+        self.assertEqual(
+            self.query({"MPN": {"type": "startsWith", "filter": "rc0"}}),
+            ["RC0402-1K", "RC0603-2K2", "RC0805-4K7"],
+        )
+        self.assertEqual(
+            self.query({"MPN": {"type": "notContains", "filter": "K"}}),
+            [],
+        )
+        self.assertEqual(
+            self.query({"Datasheet": {"type": "blank"}}),
+            ["RC0603-2K2", "CRCW0603-10K"],
+        )
+
+    def test_number_and_combined_filters(self):
+        """Number filters and combined conditions follow AG Grid models."""
+        self.assertEqual(
+            self.query(
+                {
+                    "Value": {
+                        "filterType": "number",
+                        "type": "inRange",
+                        "filter": 2000,
+                        "filterTo": 5000,
+                    }
+                }
+            ),
+            ["RC0603-2K2", "RC0805-4K7"],
+        )
+        self.assertEqual(
+            self.query(
+                {
+                    "Value": {
+                        "filterType": "number",
+                        "operator": "OR",
+                        "conditions": [
+                            {
+                                "filterType": "number",
+                                "type": "lessThan",
+                                "filter": 2000,
+                            },
+                            {
+                                "filterType": "number",
+                                "type": "greaterThanOrEqual",
+                                "filter": 10000,
+                            },
+                        ],
+                    }
+                }
+            ),
+            ["RC0402-1K", "CRCW0603-10K"],
+        )
+        self.assertEqual(
+            self.query(
+                {
+                    "Package": {"type": "equals", "filter": "603"},
+                    "MPN": {"type": "contains", "filter": "crcw"},
+                }
+            ),
+            ["CRCW0603-10K"],
+        )
+
+    def test_sort_is_stable_and_skips_unknown_columns(self):
+        """Sorting keeps file order for ties and ignores unknown columns."""
+        self.assertEqual(
+            self.query(
+                sort_model=[
+                    {"colId": "Unknown", "sort": "asc"},
+                    {"colId": "Package", "sort": "desc"},
+                ]
+            ),
+            ["RC0805-4K7", "RC0603-2K2", "CRCW0603-10K", "RC0402-1K"],
+        )
+
+    def test_rewritten_dataset_is_reloaded(self):
+        """A regenerated database replaces the cached frame and query."""
+        filter_model = {"MPN": {"type": "contains", "filter": "0603"}}
+        self.assertEqual(len(self.query(filter_model)), 2)
+
+        self.rewrite_dataset(DATASET_TEXT + "RC0603-47K,47000,0603,\n")
+        self.assertEqual(len(self.query(filter_model)), 3)
+
+    def test_metadata_index_tracks_file_changes(self):
+        """Row counts are written to the index and refreshed on change."""
+        self.assertEqual(dsu.get_row_count(self.dataset_file), 4)
+        self.assertEqual(
+            dsu.get_columns(self.dataset_file),
+            ["MPN", "Value", "Package", "Datasheet"],
+        )
+        index = json.loads(self.index_file.read_text(encoding="utf-8"))
+        self.assertEqual(index[self.dataset_file]["row_count"], 4)
+
+        self.rewrite_dataset(DATASET_TEXT + "RC0603-47K,47000,0603,\n\n")
+        self.assertEqual(dsu.get_row_count(self.dataset_file), 5)
+
+    def test_stale_index_file_is_not_trusted(self):
+        """An index entry of an older file version is recomputed."""
+        file_stat = Path(self.dataset_file).stat()
+        self.index_file.write_text(
+            json.dumps(
+                {
+                    self.dataset_file: {
+                        "row_count": 99,
+                        "columns": ["MPN"],
+                        "size": file_stat.st_size,
+                        "modified": file_stat.st_mtime_ns - 1,
+                    }
+                }
+            ),
+            encoding="utf-8",
+        )
+        self.assertEqual(dsu.get_row_count(self.dataset_file), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
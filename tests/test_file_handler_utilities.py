@@ -0,0 +1,71 @@
+"""Tests for recording the files written through file_handler_utilities."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(REPO_ROOT / "scripts"))
+
+from utilities import file_handler_utilities  # noqa: E402
+
+
+class OutputRecordingTest(unittest.TestCase):
+    """Tests for recording the files written by a build step."""
+
+    def setUp(self):
+        """Switch to a temporary working directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.previous_cwd = Path.cwd()
+        os.chdir(self.temp_dir.name)
+
+    def tearDown(self):
+        """Restore the working directory and remove the temporary one."""
+        os.chdir(self.previous_cwd)
+        self.temp_dir.cleanup()
+
+    def test_records_output_files_only(self):
+        """Only files opened with open_output_file are recorded."""
+        Path("input.csv").write_text("a,b\n")
+        Path("out").mkdir()
+
+        with file_handler_utilities.record_outputs() as outputs:
+            Path("input.csv").read_text()
+            Path("out/scratch.txt").write_text("not an output\n")
+            with file_handler_utilities.open_output_file(
+                "out/library.kicad_sym",
+            ) as symbol_file:
+                symbol_file.write("(kicad_symbol_lib)\n")
+            file_handler_utilities.write_rows_to_csv(
+                [{"a": "1", "b": "2"}], ["a", "b"], "out/series.csv"
+            )
+            with file_handler_utilities.open_output_file(
+                Path("out/deleted.csv"),
+            ):
+                pass
+            Path("out/deleted.csv").unlink()
+
+        self.assertEqual(
+            outputs,
+            {
+                os.path.join("out", "series.csv"),
+                os.path.join("out", "library.kicad_sym"),
+            },
+        )
+        self.assertEqual(
+            Path("out/series.csv").read_bytes(), b"a,b\r\n1,2\r\n"
+        )
+
+    def test_records_nothing_outside_the_block(self):
+        """Files written after the block are not added to the set."""
+        with file_handler_utilities.record_outputs() as outputs:
+            pass
+        with file_handler_utilities.open_output_file("late.csv"):
+            pass
+        self.assertEqual(outputs, set())
+
+
+if __name__ == "__main__":
+    unittest.main()
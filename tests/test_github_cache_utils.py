@@ -0,0 +1,154 @@
+"""Tests for the GitHub resource cache against a local HTTP server."""
+
+import logging
+import socket
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(REPO_ROOT / "app"))
+
+import pages.utils.github_cache_utils as gcu  # noqa: E402
+
+from tests.local_http_server import (  # noqa: E402
+    start_file_server,
+    start_patches,
+    stop_file_server,
+)
+
+PICTURES_TEXT = "https://example.com/board.png\n"
+
+
+def get_closed_port():
+    """Return a local port that refuses connections."""
+    with socket.socket() as probe_socket:
+        probe_socket.bind(("127.0.0.1", 0))
+        return probe_socket.getsockname()[1]
+
+
+class GitHubCacheTest(unittest.TestCase):
+    """Tests for probing, caching and persisting GitHub resources."""
+
+    def setUp(self):
+        """Start a file server standing in for GitHub."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        temp_path = Path(self.temp_dir.name)
+        served_dir = temp_path / "served"
+        (served_dir / "user" / "site").mkdir(parents=True)
+        (served_dir / "user" / "site" / "index.html").write_text("site")
+        (served_dir / "pictures.txt").write_text(PICTURES_TEXT)
+
+        self.server = start_file_server(served_dir)
+        server_url = f"http://127.0.0.1:{self.server.server_port}"
+        self.site_url = f"{server_url}/user/site/"
+        self.missing_url = f"{server_url}/user/missing/"
+        self.unreachable_url = (
+            f"http://127.0.0.1:{get_closed_port()}/user/site/"
+        )
+        self.cache_file = temp_path / "github_cache.json"
+
+        patches = [
+            mock.patch.object(
+                gcu,
+                "GITHUB_PAGES_URL",
+                server_url + "/{username}/{repo_name}/",
+            ),
+            mock.patch.object(
+                gcu, "PICTURES_URL", f"{server_url}/pictures.txt"
+            ),
+            mock.patch.object(gcu, "GITHUB_CACHE_FILE", self.cache_file),
+            mock.patch.object(gcu, "GITHUB_PROBE_TIMEOUT", 5),
+            mock.patch.object(gcu, "_cache", None),
+        ]
+        start_patches(self, patches)
+
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+
+    def tearDown(self):
+        """Stop the file server and remove the temporary directory."""
+        stop_file_server(self.server)
+        self.temp_dir.cleanup()
+
+    def set_previous_cache(self):
+        """Install the cache of an earlier refresh."""
+        gcu._cache = {
+            "pages": {self.unreachable_url: True},
+            "pictures": "old pictures",
+            "updated": 123.0,
+        }
+
+    def test_complete_refresh_updates_cache(self):
+        """A refresh reaching every resource marks the cache as updated."""
+        started = time.time()
+        gcu.refresh_github_cache("user", ["site", "missing"]).result(
+            timeout=10
+        )
+
+        self.assertEqual(
+            gcu.get_github_pages_url("user", "site"), self.site_url
+        )
+        self.assertIsNone(gcu.get_github_pages_url("user", "missing"))
+        self.assertEqual(gcu.get_pictures_text(), PICTURES_TEXT)
+        self.assertGreaterEqual(gcu._cache["updated"], started)
+        self.assertFalse(gcu.is_github_cache_stale())
+
+    def test_unreachable_pages_keep_cached_state(self):
+        """Unreachable sites keep their state and the cache stays stale."""
+        self.set_previous_cache()
+        gcu._refresh_cache([self.site_url, self.unreachable_url])
+
+        self.assertEqual(
+            gcu._cache["pages"],
+            {self.site_url: True, self.unreachable_url: True},
+        )
+        self.assertEqual(gcu._cache["pictures"], PICTURES_TEXT)
+        self.assertEqual(gcu._cache["updated"], 123.0)
+
+    def test_unreachable_pictures_keep_cached_text(self):
+        """An unreachable pictures list keeps the cached text."""
+        self.set_previous_cache()
+        unreachable_pictures = self.unreachable_url + "pictures.txt"
+        with mock.patch.object(gcu, "PICTURES_URL", unreachable_pictures):
+            gcu._refresh_cache([self.site_url])
+
+        self.assertEqual(gcu._cache["pictures"], "old pictures")
+        self.assertTrue(gcu._cache["pages"][self.site_url])
+        self.assertEqual(gcu._cache["updated"], 123.0)
+
+    def test_cache_file_round_trip(self):
+        """The written cache file reads back as the published cache."""
+        gcu._refresh_cache([self.site_url, self.missing_url])
+
+        self.assertTrue(self.cache_file.is_file())
+        self.assertEqual(gcu._read_cache_file(), gcu._cache)
+
+        gcu._cache = None
+        self.assertEqual(
+            gcu.get_github_pages_url("user", "site"),
+            self.site_url,
+        )
+
+    def test_malformed_cache_file_is_empty_and_stale(self):
+        """A malformed cache file reads as an empty, stale cache."""
+        self.cache_file.write_text('{"pages": []}')
+        self.assertEqual(
+            gcu._read_cache_file(),
+            {"pages": {}, "pictures": None, "updated": 0.0},
+        )
+        self.assertTrue(gcu.is_github_cache_stale())
+
+    def test_bundled_pictures_until_remote_copy_loads(self):
+        """The bundled pictures list is used before the first refresh."""
+        local_file = Path(self.temp_dir.name) / "pictures.txt"
+        local_file.write_text("bundled\n")
+        with mock.patch.object(gcu, "PICTURES_LOCAL_FILE", local_file):
+            self.assertEqual(gcu.get_pictures_text(), "bundled\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
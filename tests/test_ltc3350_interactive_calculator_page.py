@@ -0,0 +1,220 @@
+"""Tests for the calculations of the LTC3350 calculator page."""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(REPO_ROOT / "app"))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+# The page registers itself with the Dash app, which the tests do not create
+with mock.patch("dash.register_page"):
+    import pages.ltc3350_interactive_calculator_page as ltc  # noqa: E402
+
+
+class BackupTimeGridTest(unittest.TestCase):
+    """Tests for the backup time of broadcast design points."""
+
+    def setUp(self):
+        """Evaluate two equivalent design points and an infeasible one.
+
+        Both feasible points have a loss term of 0.36 V², a maximum stack
+        voltage of 1 V and a minimum stack voltage of 0.2 + 0.45 = 0.65 V,
+        so gamma is 1 + 0.8 = 1.8 at the maximum and 1 + 0.25 / 0.65 =
+        18 / 13 at the minimum stack voltage.
+        """
+        self.grid = ltc.calculate_backup_time_grid(
+            cap=[10, 20, 10],
+            esr=[0.09, 0.045, 1],
+            eta=[1, 0.8, 1],
+            n=[1, 2, 1],
+            p_backup=[1, 0.8, 1],
+            v_cell_max=[1, 0.5, 1],
+            i_peak=5,
+        )
+
+    def test_feasible_design_points(self):
+        """Stack voltage, gamma and backup time match hand calculations."""
+        np.testing.assert_allclose(self.grid.v_stk_min[:2], [0.65, 0.65])
+        np.testing.assert_allclose(self.grid.gamma_max[:2], [1.8, 1.8])
+        np.testing.assert_allclose(self.grid.gamma_min[:2], [18 / 13] * 2)
+        # V_LOSS² = 0.36 · ln(1.8 · 1 / (18 / 13 · 0.65)) = 0.36 · ln 2
+        np.testing.assert_allclose(
+            self.grid.v_loss_squared[:2], [0.36 * np.log(2)] * 2
+        )
+        # t = 2.5 s/V² · (1.8 - 18 / 13 · 0.4225 - 0.36 · ln 2) V²
+        np.testing.assert_allclose(
+            self.grid.t_backup[:2], [3.0375 - 0.9 * np.log(2)] * 2
+        )
+
+    def test_infeasible_design_point_is_nan(self):
+        """A loss term above the squared maximum stack voltage gives NaN."""
+        self.assertAlmostEqual(self.grid.v_stk_min[2], 0.2 + 5)
+        self.assertTrue(np.isnan(self.grid.gamma_max[2]))
+        self.assertTrue(np.isnan(self.grid.t_backup[2]))
+
+    def test_scalar_inputs(self):
+        """Plain numbers give zero-dimensional results."""
+        grid = ltc.calculate_backup_time_grid(10, 0.09, 1, 1, 1, 1, 5)
+        self.assertEqual(grid.t_backup.shape, ())
+        self.assertAlmostEqual(float(grid.t_backup), 3.0375 - 0.9 * np.log(2))
+
+
+class SweepTest(unittest.TestCase):
+    """Tests for the design space sweep over power, stack size and part."""
+
+    def setUp(self):
+        """Sweep three parts over three powers and two stack sizes."""
+        self.sweep = ltc.calculate_sweep(
+            [(10, 0.0625, "A"), (20, 0.0625, "B"), (1, 1e-6, "C")],
+            p_backup_values=[1, 2, 100],
+            n_values=[1, 2],
+            t_backup=1,
+            eta=1,
+            v_cell_max=1,
+            alpha_b=0.5,
+            i_peak=5,
+        )
+
+    def test_metric_shapes(self):
+        """Every metric has one value per power, stack size and part."""
+        self.assertEqual(set(self.sweep), set(ltc.SWEEP_METRICS))
+        for name, values in self.sweep.items():
+            with self.subTest(metric=name):
+                self.assertEqual(values.shape, (3, 2, 3))
+
+    def test_margins(self):
+        """Margins compare the EOL part values with the required ones."""
+        # ESR_EOL required = 0.5 · n / (4 · P_BACKUP), ESR_EOL = 0.125 Ω
+        np.testing.assert_allclose(
+            self.sweep["esr_margin"][:2, :, 0], [[1, 2], [0.5, 1]]
+        )
+
+        # ln((1 + √α) / √(1 - α)) is artanh(√α)
+        root = np.sqrt(0.5)
+        c_eol_required = 4 / (0.5 + root - 0.5 * np.arctanh(root))
+        self.assertAlmostEqual(
+            self.sweep["c_margin"][0, 0, 0], 8 / c_eol_required
+        )
+        np.testing.assert_allclose(
+            self.sweep["c_margin"][:, :, 1],
+            2 * self.sweep["c_margin"][:, :, 0],
+        )
+        np.testing.assert_allclose(
+            self.sweep["c_margin"][1, 1], self.sweep["c_margin"][0, 0]
+        )
+
+    def test_backup_times(self):
+        """Backup times use the EOL values and infeasible ones are NaN."""
+        self.assertAlmostEqual(
+            self.sweep["t_backup"][0, 0, 0],
+            float(
+                ltc.calculate_backup_time_grid(
+                    8, 0.125, 1, 1, 1, 1, 5
+                ).t_backup
+            ),
+        )
+        # 100 W needs a stack voltage of at least 20 V at the current limit
+        self.assertTrue(np.isnan(self.sweep["t_backup"][2]).all())
+
+
+class CapacitorSelectionTest(unittest.TestCase):
+    """Tests for ranking the supercapacitors that meet the backup needs."""
+
+    def setUp(self):
+        """Rank synthetic parts for 5 s of 1 W backup at 1 V per cell."""
+        self.candidates = pd.DataFrame(
+            {
+                "part_number": ["EOL", "LOW", "UNRATED", "RATED"],
+                "cap_value": [6.0, 100.0, 20.0, 10.0],
+                "esr_value": [1e-3] * 4,
+                "voltage_rating": [2.7, 0.5, np.nan, 2.7],
+            }
+        )
+        self.arguments = {
+            "n_values": [1, 2],
+            "p_backup": 1,
+            "t_backup": 5,
+            "eta": 1,
+            "v_cell_max": 1,
+            "i_peak": 5,
+        }
+        self.selection = ltc.select_capacitors(
+            self.candidates, **self.arguments
+        )
+
+    def test_parts_missing_backup_time_at_end_of_life_are_dropped(self):
+        """A part meeting the backup time only when new is dropped."""
+        new = ltc.calculate_backup_time_grid(6, 1e-3, 1, 2, 1, 1, 5).t_backup
+        end_of_life = ltc.calculate_backup_time_grid(
+            6 * 0.8, 1e-3 * 2, 1, 2, 1, 1, 5
+        ).t_backup
+        self.assertGreaterEqual(new, 5)
+        self.assertLess(end_of_life, 5)
+        self.assertNotIn("EOL", list(self.selection["part_number"]))
+
+    def test_voltage_ratings(self):
+        """Parts rated below the cell voltage are dropped, unrated kept."""
+        part_numbers = set(self.selection["part_number"])
+        self.assertNotIn("LOW", part_numbers)
+        self.assertIn("UNRATED", part_numbers)
+
+    def test_ranked_by_stored_energy_then_n(self):
+        """The least stored energy comes first, ties by stack size."""
+        self.assertEqual(
+            list(zip(self.selection["part_number"], self.selection["n"])),
+            [("UNRATED", 1), ("RATED", 2), ("UNRATED", 2)],
+        )
+        self.assertEqual(list(self.selection["stored_energy"]), [10, 10, 20])
+        self.assertTrue((self.selection["t_backup"] >= 5).all())
+
+
+class SupercapacitorDatabaseTest(unittest.TestCase):
+    """Tests for joining the capacitor database with the ESR table."""
+
+    def setUp(self):
+        """Join a small database with an ESR table."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        database_file = Path(temp_dir.name) / "database.csv"
+        esr_file = Path(temp_dir.name) / "cap_esr_pairs.csv"
+        pd.DataFrame(
+            {
+                "MPN": ["SC1", "SC2", "C1"],
+                "Value": ["5 F", "10 F", "1 uF"],
+                "Voltage Rating": ["2.7 V", "3 V", "50 V"],
+                "Capacitor Type": ["Supercapacitor", "Supercapacitor", "MLCC"],
+            }
+        ).to_csv(database_file, index=False)
+        pd.DataFrame(
+            {
+                "cap_value": [4.0, 1.0],
+                "esr_value": [0.05, 0.2],
+                "part_number": ["SC1", "SC3"],
+            }
+        ).to_csv(esr_file, index=False)
+        self.joined = ltc.join_supercapacitor_esr(str(database_file), esr_file)
+
+    def test_parts_without_esr_are_excluded(self):
+        """Database parts missing from the ESR table are listed."""
+        self.assertEqual(
+            ltc.find_supercapacitors_without_esr(self.joined), ["SC2"]
+        )
+
+    def test_candidates(self):
+        """Candidates use the database values where the part is listed."""
+        candidates = ltc.select_supercapacitor_candidates(self.joined)
+        self.assertEqual(list(candidates["part_number"]), ["SC1", "SC3"])
+        self.assertEqual(list(candidates["cap_value"]), [5.0, 1.0])
+        self.assertEqual(list(candidates["esr_value"]), [0.05, 0.2])
+        self.assertEqual(candidates["voltage_rating"][0], 2.7)
+        self.assertTrue(np.isnan(candidates["voltage_rating"][1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
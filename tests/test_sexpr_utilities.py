@@ -0,0 +1,170 @@
+"""Tests for the S-expression writer and parser of sexpr_utilities."""
+
+import io
+import sys
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(REPO_ROOT / "scripts"))
+
+from utilities import sexpr_utilities  # noqa: E402
+
+LIBRARY_TEXT = b"""(kicad_symbol_lib
+\t(version 20241209)
+\t(symbol "R_1k"
+\t\t(property "Reference" "R"
+\t\t\t(at 0 0 0)
+\t\t)
+\t\t(property "Description" "Say \\"hi\\" \\\\ bye")
+\t\t(symbol "R_1k_1_1"
+\t\t\t(pin passive line
+\t\t\t\t(name "~")
+\t\t\t\t(number "1")
+\t\t\t)
+\t\t)
+\t)
+)
+"""
+
+
+def strip_offsets(nodes):
+    """Return the nodes as nested tuples without their byte offsets."""
+    return [
+        (
+            node.name,
+            [
+                child if isinstance(child, str) else strip_offsets([child])[0]
+                for child in node.children
+            ],
+        )
+        for node in nodes
+    ]
+
+
+class ParseSexprTest(unittest.TestCase):
+    """Tests for parse_sexpr and read_sexpr_file."""
+
+    def test_builds_tree_with_names_values_and_offsets(self):
+        """Nodes carry their name, atoms, children and byte span."""
+        (library,) = sexpr_utilities.parse_sexpr(LIBRARY_TEXT)
+
+        self.assertEqual(library.name, "kicad_symbol_lib")
+        self.assertEqual(library.start, 0)
+        self.assertEqual(library.end, LIBRARY_TEXT.rindex(b")") + 1)
+        self.assertEqual(library.find("version").values, ["20241209"])
+
+        symbol = library.find("symbol")
+        self.assertEqual(symbol.values, ["R_1k"])
+        self.assertEqual(
+            LIBRARY_TEXT[symbol.start : symbol.end].split(b"\n")[0],
+            b'(symbol "R_1k"',
+        )
+        self.assertEqual(
+            [node.values for node in symbol.find_all("property")],
+            [["Reference", "R"], ["Description", 'Say "hi" \\ bye']],
+        )
+
+    def test_walk_finds_nested_nodes(self):
+        """Nested unit nodes are reached by walk, not by find."""
+        (library,) = sexpr_utilities.parse_sexpr(LIBRARY_TEXT)
+        symbol = library.find("symbol")
+
+        self.assertIsNone(symbol.find("pin"))
+        pins = list(symbol.walk("pin"))
+        self.assertEqual(len(pins), 1)
+        self.assertEqual(pins[0].values, ["passive", "line"])
+        self.assertEqual(pins[0].find("name").values, ["~"])
+
+    def test_parentheses_in_strings_are_not_structure(self):
+        """Quoted parentheses are part of the atom."""
+        (node,) = sexpr_utilities.parse_sexpr(b'(name "a (b" ")")')
+
+        self.assertEqual(node.values, ["a (b", ")"])
+
+    def test_max_depth_skips_deeper_lists(self):
+        """Lists deeper than max_depth are not built."""
+        (library,) = sexpr_utilities.parse_sexpr(LIBRARY_TEXT, max_depth=2)
+        self.assertEqual(library.find("symbol").children, ["R_1k"])
+
+        (library,) = sexpr_utilities.parse_sexpr(LIBRARY_TEXT, max_depth=3)
+        symbol = library.find("symbol")
+        reference = symbol.find("property")
+        self.assertEqual(reference.children, ["Reference", "R"])
+        self.assertEqual(symbol.find("symbol").children, ["R_1k_1_1"])
+
+    def test_unbalanced_parentheses_raise(self):
+        """Missing or extra parentheses are reported."""
+        with self.assertRaises(ValueError):
+            sexpr_utilities.parse_sexpr(b"(a (b)")
+        with self.assertRaises(ValueError):
+            sexpr_utilities.parse_sexpr(b"(a (b)))")
+
+    def test_empty_input(self):
+        """Empty data has no nodes."""
+        self.assertEqual(sexpr_utilities.parse_sexpr(b""), [])
+        self.assertEqual(sexpr_utilities.parse_sexpr(b"  \n"), [])
+
+    def test_committed_libraries_parse(self):
+        """Every committed symbol library is a single balanced library."""
+        library_files = sorted(
+            [
+                *(REPO_ROOT / "series_kicad_sym").glob("*.kicad_sym"),
+                *(REPO_ROOT / "symbols").glob("*.kicad_sym"),
+            ]
+        )
+        self.assertTrue(library_files)
+
+        for library_file in library_files:
+            with self.subTest(library_file=library_file.name):
+                nodes = sexpr_utilities.read_sexpr_file(
+                    library_file, max_depth=2
+                )
+                self.assertEqual(
+                    [node.name for node in nodes], ["kicad_symbol_lib"]
+                )
+
+
+class SExpressionWriterTest(unittest.TestCase):
+    """Tests for the buffered, compacting S-expression writer."""
+
+    def test_plain_output_is_unchanged(self):
+        """Without compaction the fragments are written as given."""
+        output = io.StringIO()
+        with sexpr_utilities.SExpressionWriter(output, chunk_size=8) as writer:
+            for line in LIBRARY_TEXT.decode().splitlines(keepends=True):
+                writer.write(line)
+
+        self.assertEqual(output.getvalue(), LIBRARY_TEXT.decode())
+
+    def test_compact_output_keeps_structure(self):
+        """Compaction removes indentation but not strings or structure."""
+        for chunk_size in (1, 7, 1 << 20):
+            with self.subTest(chunk_size=chunk_size):
+                output = io.StringIO()
+                with sexpr_utilities.SExpressionWriter(
+                    output, compact=True, chunk_size=chunk_size
+                ) as writer:
+                    for line in LIBRARY_TEXT.decode().splitlines(True):
+                        writer.write(line)
+
+                compact_text = output.getvalue()
+                self.assertNotIn("\t", compact_text)
+                self.assertIn('\n(symbol "R_1k_1_1"', compact_text)
+                self.assertEqual(
+                    strip_offsets(
+                        sexpr_utilities.parse_sexpr(compact_text.encode())
+                    ),
+                    strip_offsets(sexpr_utilities.parse_sexpr(LIBRARY_TEXT)),
+                )
+
+    def test_split_expressions(self):
+        """Top-level expressions are split, ignoring quoted parentheses."""
+        self.assertEqual(
+            sexpr_utilities.split_expressions('(a ")") (b (c)) x'),
+            ['(a ")")', "(b (c))"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
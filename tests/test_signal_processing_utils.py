@@ -0,0 +1,641 @@
+"""Tests for the zip, upload and trace helpers of the signal pages."""
+
+import base64
+import hashlib
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+import zipfile
+from collections import OrderedDict
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(REPO_ROOT / "app"))
+
+import numpy as np  # noqa: E402
+import pages.utils.signal_processing_utils as spu  # noqa: E402
+import pandas as pd  # noqa: E402
+
+CAPTURE_HEADER = b"Model,Scope\nChannels,2\n,\n"
+
+
+def make_csv_capture(rows, header=CAPTURE_HEADER):
+    """Return a CSV capture with a metadata table and numbered rows."""
+    lines = [b"TIME,CH1,CH2\n"]
+    lines.extend(
+        f"{row},{row * 10},{row * 100}\n".encode() for row in range(rows)
+    )
+    return header + b"".join(lines)
+
+
+def make_upload(files, compression=zipfile.ZIP_DEFLATED):
+    """Return a cached upload holding the given archive members."""
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w", compression) as zip_file:
+        for file_name, contents in files.items():
+            zip_file.writestr(file_name, contents)
+
+    return spu.CachedUpload(
+        contents=archive.getvalue(),
+        csv_files=list(files),
+        header_rows={},
+        empty_row_indexes={},
+        data_frames={},
+        captures={},
+        analyses={},
+    )
+
+
+class UploadParsingTest(unittest.TestCase):
+    """Tests for scanning the CSV files of an upload concurrently."""
+
+    def test_consistent_empty_rows_are_combined(self):
+        """Files with the same metadata table share one skip count."""
+        upload = make_upload(
+            {
+                "a.csv": make_csv_capture(3),
+                "b.csv": make_csv_capture(5),
+            }
+        )
+        result = spu.find_cached_first_empty_row_index(
+            upload, ["a.csv", "b.csv"]
+        )
+        self.assertEqual(result, {"first_empty_row_index": 1})
+        self.assertIs(
+            upload.empty_row_indexes[("a.csv", "b.csv")],
+            result,
+        )
+
+    def test_inconsistent_empty_rows_give_zero(self):
+        """Files with different metadata tables are not skipped."""
+        upload = make_upload(
+            {
+                "a.csv": make_csv_capture(3),
+                "b.csv": make_csv_capture(3, b"Model,Scope\n,\n"),
+            }
+        )
+        self.assertEqual(
+            spu.find_cached_first_empty_row_index(upload, ["a.csv", "b.csv"]),
+            {"first_empty_row_index": 0},
+        )
+
+    def test_map_upload_files_keeps_order_and_limit(self):
+        """Results keep the item order with a bounded number in flight."""
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def square(item):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            try:
+                return item * item
+            finally:
+                with lock:
+                    running -= 1
+
+        items = list(range(50))
+        self.assertEqual(
+            spu.map_upload_files(square, items, max_workers=3),
+            [item * item for item in items],
+        )
+        self.assertLessEqual(peak, 3)
+
+
+class ReadCsvWindowsTest(unittest.TestCase):
+    """Tests for streaming selected rows and columns of CSV captures."""
+
+    def read(self, contents, windows, columns=None, chunk_size=7):
+        """Read windows of a capture with a small chunk size."""
+        with mock.patch.object(spu, "CSV_CHUNK_SIZE", chunk_size):
+            return spu.read_csv_windows(
+                io.BytesIO(contents), 3, columns, windows
+            )
+
+    def test_windows_are_merged_and_indexed(self):
+        """Overlapping windows in any order give each row once."""
+        data_frame = self.read(
+            make_csv_capture(20), [(12, 15), (2, 4), (3, 6), (14, 16)]
+        )
+        self.assertEqual(list(data_frame.index), [2, 3, 4, 5, 12, 13, 14, 15])
+        self.assertEqual(list(data_frame["TIME"]), list(data_frame.index))
+        self.assertEqual(list(data_frame.columns), ["TIME", "CH1", "CH2"])
+
+    def test_selected_columns_and_chunk_sizes(self):
+        """Results do not depend on the chunk size."""
+        contents = make_csv_capture(50)
+        expected = self.read(contents, [(10, 40)], ["CH2"], 1 << 20)
+        for chunk_size in (1, 5, 64):
+            with self.subTest(chunk_size=chunk_size):
+                data_frame = self.read(
+                    contents, [(10, 40)], ["CH2"], chunk_size
+                )
+                self.assertTrue(data_frame.equals(expected))
+        self.assertEqual(
+            list(expected["CH2"]), [row * 100 for row in range(10, 40)]
+        )
+
+    def test_windows_past_the_end_and_missing_newline(self):
+        """Windows are clipped to the file, even without a final newline."""
+        contents = make_csv_capture(5).rstrip(b"\n")
+        data_frame = self.read(contents, [(3, 100)])
+        self.assertEqual(list(data_frame.index), [3, 4])
+        self.assertEqual(list(data_frame["CH1"]), [30, 40])
+
+    def test_empty_lines_after_metadata_are_skipped(self):
+        """Blank lines before the column header are ignored."""
+        contents = CAPTURE_HEADER + b"\n" + make_csv_capture(4, b"")
+        data_frame = spu.read_csv_windows(
+            io.BytesIO(contents), 3, None, [(0, 2)]
+        )
+        self.assertEqual(list(data_frame["TIME"]), [0, 1])
+
+
+class DecimationTest(unittest.TestCase):
+    """Tests for limiting explorer traces to a point budget."""
+
+    def setUp(self):
+        """Create a noisy signal with one narrow spike."""
+        random = np.random.default_rng(7)
+        self.x_values = np.arange(10_000, dtype=float)
+        self.y_values = np.sin(self.x_values / 500) + random.normal(
+            0, 0.01, len(self.x_values)
+        )
+        self.y_values[6_543] = 5.0
+
+    def test_lttb_keeps_ends_and_spike(self):
+        """LTTB keeps the end samples and a dominant spike."""
+        indices = spu.lttb_indices(self.x_values, self.y_values, 200)
+        self.assertEqual(len(indices), 200)
+        self.assertEqual((indices[0], indices[-1]), (0, 9_999))
+        self.assertTrue(np.all(np.diff(indices) > 0))
+        self.assertIn(6_543, indices)
+
+    def test_min_max_keeps_extremes_of_every_bucket(self):
+        """The envelope holds the global extremes within the budget."""
+        indices = spu.min_max_indices(self.y_values, 200)
+        self.assertLessEqual(len(indices), 200)
+        self.assertTrue(np.all(np.diff(indices) > 0))
+        self.assertIn(int(self.y_values.argmax()), indices)
+        self.assertIn(int(self.y_values.argmin()), indices)
+
+    def test_small_inputs_are_kept(self):
+        """Traces within the budget, or tiny budgets, are not decimated."""
+        for indices in (
+            spu.lttb_indices(self.x_values[:50], self.y_values[:50], 100),
+            spu.lttb_indices(self.x_values[:50], self.y_values[:50], 2),
+            spu.min_max_indices(self.y_values[:50], 50),
+        ):
+            self.assertEqual(list(indices), list(range(50)))
+
+    def test_downsample_trace_limits_to_visible_range(self):
+        """Only the visible range, plus one edge sample, is decimated."""
+        x_series = pd.Series(self.x_values)
+        y_series = pd.Series(self.y_values)
+
+        x_visible, y_visible = spu.downsample_trace(
+            x_series, y_series, x_range=[100.5, 150.5], max_points=100
+        )
+        self.assertEqual(list(x_visible), list(range(100, 152)))
+        self.assertTrue(y_visible.equals(y_series.iloc[100:152]))
+
+        for mode in spu.DECIMATION_MODES:
+            with self.subTest(mode=mode):
+                x_decimated, _ = spu.downsample_trace(
+                    x_series, y_series, mode, max_points=100
+                )
+                self.assertLessEqual(len(x_decimated), 100)
+                self.assertTrue(x_decimated.is_monotonic_increasing)
+
+    def test_point_budget_follows_the_graph_width(self):
+        """Traces get two points per pixel once the width is measured."""
+        self.assertEqual(spu.get_max_points(800), 1600)
+        self.assertEqual(spu.get_max_points(None), spu.MAX_POINTS_PER_TRACE)
+        self.assertEqual(spu.get_max_points(0), spu.MAX_POINTS_PER_TRACE)
+
+
+def make_npz_capture(data, columns=("TIME", "CH1", "CH2")):
+    """Return an NPZ capture of a float64 array."""
+    output = io.BytesIO()
+    spu.write_npz_capture(
+        output,
+        [["Model", "Scope"], ["Channels", "2"]],
+        list(columns),
+        len(data),
+        lambda npy_file: npy_file.write(data.astype("<f8").tobytes()),
+    )
+    return output.getvalue()
+
+
+class NpzCaptureTest(unittest.TestCase):
+    """Tests for loading NPZ captures from uploads."""
+
+    def setUp(self):
+        """Create the data of a small capture."""
+        self.data = np.arange(30, dtype=float).reshape(10, 3)
+
+    def test_stored_capture_is_a_view(self):
+        """An uncompressed capture is read without copying its data."""
+        upload = make_upload(
+            {"capture.npz": make_npz_capture(self.data)},
+            zipfile.ZIP_STORED,
+        )
+        capture = spu.load_npz_capture(upload, "capture.npz")
+
+        self.assertEqual(capture.memory, 0)
+        self.assertFalse(capture.data.flags.writeable)
+        self.assertTrue(
+            np.shares_memory(
+                capture.data, np.frombuffer(upload.contents, np.uint8)
+            )
+        )
+        np.testing.assert_array_equal(capture.data, self.data)
+        self.assertEqual(capture.columns, ["TIME", "CH1", "CH2"])
+        self.assertEqual(capture.header_rows[1], ["Channels", "2"])
+        self.assertIs(spu.load_npz_capture(upload, "capture.npz"), capture)
+
+    def test_compressed_capture_is_copied(self):
+        """A compressed capture is decompressed into memory."""
+        upload = make_upload({"capture.npz": make_npz_capture(self.data)})
+        capture = spu.load_npz_capture(upload, "capture.npz")
+
+        self.assertEqual(capture.memory, self.data.nbytes)
+        np.testing.assert_array_equal(capture.data, self.data)
+
+    def test_read_npz_windows(self):
+        """Windows and columns select the rows and values to copy."""
+        upload = make_upload(
+            {"capture.npz": make_npz_capture(self.data)},
+            zipfile.ZIP_STORED,
+        )
+        capture = spu.load_npz_capture(upload, "capture.npz")
+        data_frame = spu.read_npz_windows(
+            capture, ["CH2"], [(8, 20), (1, 3), (2, 4)]
+        )
+        self.assertEqual(list(data_frame.index), [1, 2, 3, 8, 9])
+        self.assertEqual(list(data_frame["CH2"]), [5, 8, 11, 26, 29])
+
+    def test_metadata_rows_set_the_skip_count(self):
+        """NPZ captures report the length of their metadata table."""
+        upload = make_upload(
+            {"capture.npz": make_npz_capture(self.data)},
+            zipfile.ZIP_STORED,
+        )
+        self.assertEqual(
+            spu.find_cached_first_empty_row_index(upload, ["capture.npz"]),
+            {"first_empty_row_index": 1},
+        )
+
+    def test_invalid_capture_raises(self):
+        """Archives without the capture arrays are rejected."""
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as npz_archive:
+            npz_archive.writestr("other.npy", b"")
+        upload = make_upload({"capture.npz": archive.getvalue()})
+        with self.assertRaises(ValueError):
+            spu.load_npz_capture(upload, "capture.npz")
+
+
+GENERATOR_PREFIX = "generator"
+
+
+def make_zip_download(file_format="csv", records=500):
+    """Return the parameters of a generated zip file."""
+    return spu.ZipDownload(
+        app_state={
+            f"{GENERATOR_PREFIX}_csv_files_button": "2",
+            f"{GENERATOR_PREFIX}_records_button": str(records),
+            f"{GENERATOR_PREFIX}_channels_button": "2",
+            f"{GENERATOR_PREFIX}_frames_button": "2",
+            f"{GENERATOR_PREFIX}_sample_interval_button": "0.001",
+        },
+        channel_data={
+            "channel_data": [{"name": "CH1", "unit": "V"}],
+            "columns": [{"name": ["Name"]}, {"name": ["Unit"]}],
+        },
+        base_filename="capture",
+        module_prefix=GENERATOR_PREFIX,
+        file_format=file_format,
+        zip_filename="captures.zip",
+    )
+
+
+def zip_file_arguments(download):
+    """Return the ``write_zip_file`` arguments of a download."""
+    return download[:5]
+
+
+class ZipStreamTest(unittest.TestCase):
+    """Tests for streaming and measuring generated zip files."""
+
+    def test_streamed_zip_file(self):
+        """The streamed chunks form a valid zip file of capture files."""
+        for file_format in spu.CAPTURE_FILE_FORMATS:
+            with self.subTest(file_format=file_format):
+                download = make_zip_download(file_format)
+                contents = b"".join(
+                    spu.iter_zip_file(*zip_file_arguments(download))
+                )
+                with zipfile.ZipFile(io.BytesIO(contents)) as zip_file:
+                    self.assertIsNone(zip_file.testzip())
+                    self.assertEqual(
+                        zip_file.namelist(),
+                        [
+                            f"capture_1.{file_format}",
+                            f"capture_2.{file_format}",
+                        ],
+                    )
+
+    def test_chunks_are_bounded(self):
+        """Chunks are no larger than the configured chunk size."""
+        chunk_size = 1 << 12
+        with mock.patch.object(spu, "CSV_CHUNK_SIZE", chunk_size):
+            chunks = list(
+                spu.iter_zip_file(
+                    *zip_file_arguments(make_zip_download(records=5000))
+                )
+            )
+        self.assertGreater(len(chunks), 2)
+        self.assertLessEqual(max(map(len, chunks)), chunk_size)
+
+    def test_measured_size_matches_stored_captures(self):
+        """Uncompressed NPZ captures have a reproducible size."""
+        download = make_zip_download("npz")
+        contents = b"".join(spu.iter_zip_file(*zip_file_arguments(download)))
+        self.assertEqual(
+            spu.measure_zip_file(*zip_file_arguments(download)),
+            len(contents),
+        )
+
+    def test_closing_the_stream_stops_the_writer(self):
+        """The background writer stops once the stream is closed."""
+        chunks = spu.iter_zip_file(
+            *zip_file_arguments(make_zip_download(records=100000))
+        )
+        next(chunks)
+        writer = next(
+            thread
+            for thread in threading.enumerate()
+            if thread.name == "zip_stream"
+        )
+        chunks.close()
+        writer.join(timeout=5)
+        self.assertFalse(writer.is_alive())
+
+    def test_writer_errors_are_raised(self):
+        """Errors of the writer are raised by the stream."""
+        download = make_zip_download()._replace(app_state={})
+        with self.assertRaises(KeyError):
+            b"".join(spu.iter_zip_file(*zip_file_arguments(download)))
+
+    def test_download_round_trip(self):
+        """Registered downloads are read back from the download store."""
+        download = make_zip_download()
+        with tempfile.TemporaryDirectory() as download_dir:
+            with mock.patch.object(
+                spu, "ZIP_DOWNLOAD_DIR", Path(download_dir)
+            ):
+                token = spu.register_zip_download(download)
+                self.assertEqual(spu.get_zip_download(token), download)
+                with self.assertRaises(ValueError):
+                    spu.get_zip_download("0" * 64)
+                with self.assertRaises(ValueError):
+                    spu.get_zip_download("../" + token)
+
+
+def make_sine_samples(frequency, records, sample_spacing, frames=1):
+    """Return frames of a sine wave with amplitude 3 and offset 0.5."""
+    time_points = np.arange(frames * records) * sample_spacing
+    values = 0.5 + 3 * np.sin(2 * np.pi * frequency * time_points)
+    return values.reshape(1, frames, records)
+
+
+def make_analysis_filtering(**changes):
+    """Return a selection of two files of two frames of ten records."""
+    filtering = {
+        "files_to_keep": [0, 1],
+        "frames_to_keep": [0, 1],
+        "x_axis_data": "TIME",
+        "y_axis_data": ["CH1"],
+        "records_slice": [0, 10],
+        "records_max": 10,
+    }
+    filtering.update(changes)
+    return filtering
+
+
+class SignalAnalysisTest(unittest.TestCase):
+    """Tests for the statistics and spectra of the selected frames."""
+
+    def setUp(self):
+        """Cache an upload of two captures under a token."""
+        header = b"Model,Scope\nChannels,2\n\n"
+        self.upload = make_upload(
+            {
+                "a.csv": make_csv_capture(20, header),
+                "b.csv": make_csv_capture(20, header),
+            }
+        )
+        self.token = "a" * 64
+        patch = mock.patch.object(
+            spu, "_upload_cache", OrderedDict({self.token: self.upload})
+        )
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def analyze(self, filtering):
+        """Analyze a selection of the cached upload."""
+        return spu.analyze_selected_zip_contents(
+            self.token, "captures.zip", filtering
+        )
+
+    def test_sine_wave_statistics(self):
+        """Statistics of whole periods of a sine wave match its shape."""
+        statistics = spu.compute_frame_statistics(
+            make_sine_samples(5, 1000, 1e-3)
+        )
+        self.assertAlmostEqual(statistics["Min"][0, 0], -2.5)
+        self.assertAlmostEqual(statistics["Max"][0, 0], 3.5)
+        self.assertAlmostEqual(statistics["Mean"][0, 0], 0.5)
+        self.assertAlmostEqual(
+            statistics["RMS"][0, 0], np.sqrt(0.5**2 + 3**2 / 2)
+        )
+        self.assertAlmostEqual(statistics["Peak-to-peak"][0, 0], 6)
+
+    def test_spectrum_peak_at_tone_frequency(self):
+        """The power spectral density peaks at the frequency of the tone."""
+        frequencies, density = spu.compute_power_spectral_density(
+            make_sine_samples(50, 1000, 1e-3, frames=3), 1e-3
+        )
+        self.assertEqual(density.shape, (1, len(frequencies)))
+        self.assertEqual(frequencies[np.argmax(density[0])], 50)
+
+    def test_statistics_of_the_selected_frames(self):
+        """Every selected file and frame gets a row of statistics."""
+        statistics = self.analyze(make_analysis_filtering()).statistics
+        self.assertEqual(
+            list(statistics["File"]), ["a.csv", "a.csv", "b.csv", "b.csv"]
+        )
+        self.assertEqual(list(statistics["Frame"]), [1, 2, 1, 2])
+        self.assertEqual(list(statistics["Min"]), [0, 100, 0, 100])
+        self.assertEqual(list(statistics["Max"]), [90, 190, 90, 190])
+
+    def test_repeated_selection_is_cached(self):
+        """The same selection of the same upload returns the cached result."""
+        analysis = self.analyze(make_analysis_filtering())
+        self.assertIs(self.analyze(make_analysis_filtering()), analysis)
+        self.assertEqual(len(self.upload.analyses), 1)
+
+    def test_other_selections_are_analyzed(self):
+        """Other frames or files give new results."""
+        analysis = self.analyze(make_analysis_filtering())
+
+        frame_analysis = self.analyze(
+            make_analysis_filtering(frames_to_keep=[1])
+        )
+        self.assertIsNot(frame_analysis, analysis)
+        self.assertEqual(list(frame_analysis.statistics["Frame"]), [2, 2])
+
+        file_analysis = self.analyze(
+            make_analysis_filtering(files_to_keep=[1])
+        )
+        self.assertIsNot(file_analysis, analysis)
+        self.assertEqual(list(file_analysis.statistics["File"]), ["b.csv"] * 2)
+        self.assertEqual(len(self.upload.analyses), 3)
+
+
+def make_archive(files=None):
+    """Return a zip archive holding the given members."""
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        for file_name, contents in (files or {"a.csv": b"TIME\n0\n"}).items():
+            zip_file.writestr(file_name, contents)
+    return archive.getvalue()
+
+
+class UploadCacheTest(unittest.TestCase):
+    """Tests for evicting least recently used uploads from the cache."""
+
+    def setUp(self):
+        """Start with an empty upload cache."""
+        patch = mock.patch.object(spu, "_upload_cache", OrderedDict())
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.contents = make_archive()
+
+    def set_budget(self, uploads):
+        """Set the cache budget to a number of archives."""
+        patch = mock.patch.object(
+            spu, "UPLOAD_CACHE_BUDGET", int(uploads * len(self.contents))
+        )
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_least_recently_used_upload_is_evicted(self):
+        """Uploads are evicted in the order they were cached."""
+        self.set_budget(2.5)
+        for token in ("a", "b", "c"):
+            spu._cache_upload(token, self.contents)
+        self.assertEqual(list(spu._upload_cache), ["b", "c"])
+
+    def test_most_recent_upload_is_kept_over_budget(self):
+        """An upload larger than the budget stays cached on its own."""
+        self.set_budget(0.5)
+        spu._cache_upload("a", self.contents)
+        upload = spu._cache_upload("b", self.contents)
+        self.assertEqual(list(spu._upload_cache), ["b"])
+        self.assertIs(spu._upload_cache["b"], upload)
+
+    def test_cache_hit_moves_upload_to_the_end(self):
+        """A cache hit makes the upload the most recently used one."""
+        self.set_budget(2.5)
+        upload = spu._cache_upload("a", self.contents)
+        spu._cache_upload("b", self.contents)
+
+        self.assertIs(spu.get_cached_upload("a"), upload)
+        self.assertEqual(list(spu._upload_cache), ["b", "a"])
+
+        spu._cache_upload("c", self.contents)
+        self.assertEqual(list(spu._upload_cache), ["a", "c"])
+
+
+class UploadStoreTest(unittest.TestCase):
+    """Tests for storing uploads on the server under their hash."""
+
+    def setUp(self):
+        """Point the upload store at an empty temporary directory."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.store_dir = Path(temp_dir.name)
+        for patch in (
+            mock.patch.object(spu, "UPLOAD_STORE_DIR", self.store_dir),
+            mock.patch.object(spu, "_upload_cache", OrderedDict()),
+        ):
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.contents = make_archive()
+
+    def store(self, contents):
+        """Store contents encoded like a ``dcc.Upload`` data URL."""
+        return spu.store_upload(
+            "data:application/zip;base64,"
+            + base64.b64encode(contents).decode()
+        )
+
+    def test_token_round_trip(self):
+        """The token is the archive hash and reads the archive back."""
+        token = self.store(self.contents)
+        self.assertEqual(token, hashlib.sha256(self.contents).hexdigest())
+
+        spu._upload_cache.clear()
+        upload = spu.get_cached_upload(token)
+        self.assertEqual(upload.contents, self.contents)
+        self.assertEqual(upload.csv_files, ["a.csv"])
+
+    def test_same_archive_is_stored_once(self):
+        """Storing an archive again reuses its file."""
+        self.assertEqual(self.store(self.contents), self.store(self.contents))
+        self.assertEqual(
+            [path.suffix for path in self.store_dir.iterdir()], [".zip"]
+        )
+
+    def test_malformed_token_raises(self):
+        """Tokens that are not a hash are rejected."""
+        with self.assertRaises(ValueError):
+            spu.get_cached_upload("../x")
+
+    def test_missing_upload_raises(self):
+        """An upload neither cached nor stored has to be uploaded again."""
+        token = self.store(self.contents)
+        spu._upload_cache.clear()
+        (self.store_dir / f"{token}.zip").unlink()
+        with self.assertRaisesRegex(ValueError, "upload it again"):
+            spu.get_cached_upload(token)
+
+    def test_non_zip_upload_raises(self):
+        """Contents that are not a zip archive are rejected."""
+        with self.assertRaises(zipfile.BadZipFile):
+            self.store(b"not a zip file")
+        self.assertEqual(list(self.store_dir.iterdir()), [])
+
+    def test_expired_uploads_are_removed(self):
+        """Uploads older than the maximum age are removed."""
+        expired_file = self.store_dir / f"{'0' * 64}.zip"
+        expired_file.write_bytes(self.contents)
+        expired_time = time.time() - spu.UPLOAD_STORE_MAX_AGE - 60
+        os.utime(expired_file, (expired_time, expired_time))
+
+        token = self.store(make_archive({"b.csv": b"TIME\n1\n"}))
+        self.assertFalse(expired_file.exists())
+        self.assertTrue((self.store_dir / f"{token}.zip").is_file())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,236 @@
+"""Tests for the traffic data service against a local HTTP server."""
+
+import io
+import logging
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(REPO_ROOT / "app"))
+
+import pages.utils.traffic_data_utils as tdu  # noqa: E402
+
+from tests.local_http_server import (  # noqa: E402
+    QuietHandler,
+    start_file_server,
+    start_patches,
+    stop_file_server,
+)
+
+REPO_NAME = "Sample_Repo"
+CLONES_FILE = "sample_repo_clones_history.csv"
+VISITORS_FILE = "sample_repo_visitors_history.csv"
+
+CLONES_TEXT = """clone_timestamp,total_clones,unique_clones
+"2025-03-01",5,2
+"2025-03-04",7,3
+"""
+VISITORS_TEXT = """visitor_timestamp,total_visitors,unique_visitors
+"2025-03-02",11,4
+"""
+
+
+class CountingHandler(QuietHandler):
+    """File handler that counts the requests it serves."""
+
+    requests_served = 0
+
+    def do_GET(self):  # noqa: N802
+        """Serve a file and count the request."""
+        type(self).requests_served += 1
+        super().do_GET()
+
+
+class TrafficDataServiceTest(unittest.TestCase):
+    """Tests for fetching, caching and falling back of traffic data."""
+
+    def setUp(self):
+        """Start a file server and point the service at it."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        temp_path = Path(self.temp_dir.name)
+        self.served_dir = temp_path / "served"
+        self.cache_dir = temp_path / "cache"
+        self.local_dir = temp_path / "local"
+        for directory in (self.served_dir, self.cache_dir, self.local_dir):
+            directory.mkdir()
+
+        CountingHandler.requests_served = 0
+        self.server = start_file_server(self.served_dir, CountingHandler)
+        self.server_url = f"http://127.0.0.1:{self.server.server_port}"
+
+        patches = [
+            mock.patch.object(tdu, "TRAFFIC_DATA_URL", self.server_url),
+            mock.patch.object(tdu, "TRAFFIC_CACHE_DIR", self.cache_dir),
+            mock.patch.object(tdu, "TRAFFIC_LOCAL_DIR", self.local_dir),
+            mock.patch.object(tdu, "TRAFFIC_FETCH_TIMEOUT", 5),
+            mock.patch.object(tdu, "_traffic_cache", {}),
+            mock.patch.object(tdu, "_pending_refreshes", {}),
+        ]
+        start_patches(self, patches)
+
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+
+    def tearDown(self):
+        """Stop the file server and remove the temporary directories."""
+        self.stop_server()
+        self.temp_dir.cleanup()
+
+    def stop_server(self):
+        """Shut the file server down, so downloads fail."""
+        if self.server is not None:
+            stop_file_server(self.server)
+            self.server = None
+
+    def serve(self, file_name, text):
+        """Publish a traffic CSV file on the file server."""
+        (self.served_dir / file_name).write_text(text, encoding="utf-8")
+
+    def wait_for_refreshes(self):
+        """Wait for the background refreshes started so far."""
+        for future in list(tdu._pending_refreshes.values()):
+            future.result(timeout=10)
+
+    def test_fresh_data_is_downloaded_once(self):
+        """The first request downloads, later ones are served from memory."""
+        self.serve(CLONES_FILE, CLONES_TEXT)
+        self.serve(VISITORS_FILE, VISITORS_TEXT)
+
+        traffic_data = tdu.get_traffic_data(REPO_NAME)
+        self.assertEqual(
+            list(traffic_data.clones["total_clones"]), [5, 0, 0, 7]
+        )
+        self.assertEqual(list(traffic_data.visitors["total_clones"]), [11])
+        self.assertEqual(CountingHandler.requests_served, 2)
+        self.assertTrue((self.cache_dir / CLONES_FILE).is_file())
+
+        self.assertIs(tdu.get_traffic_data(REPO_NAME), traffic_data)
+        self.assertEqual(CountingHandler.requests_served, 2)
+
+    def test_stale_data_is_served_while_refreshing(self):
+        """Data older than the time to live is replaced in the background."""
+        self.serve(CLONES_FILE, CLONES_TEXT)
+        self.serve(VISITORS_FILE, VISITORS_TEXT)
+        with mock.patch.object(tdu, "TRAFFIC_CACHE_TTL", 0):
+            first = tdu.get_traffic_data(REPO_NAME)
+            time.sleep(0.01)
+            self.serve(CLONES_FILE, CLONES_TEXT + '"2025-03-05",1,1\n')
+
+            self.assertIs(tdu.get_traffic_data(REPO_NAME), first)
+            self.wait_for_refreshes()
+
+        second = tdu.get_traffic_data(REPO_NAME)
+        self.assertIsNot(second, first)
+        self.assertEqual(len(second.clones), 5)
+
+    def test_server_down_keeps_previous_data(self):
+        """A failed refresh keeps the frames loaded before."""
+        self.serve(CLONES_FILE, CLONES_TEXT)
+        self.serve(VISITORS_FILE, VISITORS_TEXT)
+        first = tdu.get_traffic_data(REPO_NAME)
+
+        self.stop_server()
+        (self.cache_dir / CLONES_FILE).unlink()
+        (self.cache_dir / VISITORS_FILE).unlink()
+        tdu.refresh_traffic_data([REPO_NAME])[0].result(timeout=10)
+
+        second = tdu.get_traffic_data(REPO_NAME)
+        self.assertIsNot(second, first)
+        self.assertIs(second.clones, first.clones)
+        self.assertIs(second.visitors, first.visitors)
+
+    def test_server_down_falls_back_to_disk_copies(self):
+        """Without a server, cached and then bundled copies are used."""
+        self.stop_server()
+        (self.cache_dir / CLONES_FILE).write_text(CLONES_TEXT)
+        (self.local_dir / CLONES_FILE).write_text('clone_timestamp\n"x"\n')
+        (self.local_dir / VISITORS_FILE).write_text(VISITORS_TEXT)
+
+        traffic_data = tdu.get_traffic_data(REPO_NAME)
+        self.assertEqual(len(traffic_data.clones), 4)
+        self.assertEqual(len(traffic_data.visitors), 1)
+
+    def test_missing_file_gives_empty_frame(self):
+        """A file missing on the server and on disk loads as empty."""
+        self.serve(CLONES_FILE, CLONES_TEXT)
+
+        traffic_data = tdu.get_traffic_data(REPO_NAME)
+        self.assertEqual(len(traffic_data.clones), 4)
+        self.assertTrue(traffic_data.visitors.empty)
+        self.assertEqual(
+            traffic_data.visitor_periods,
+            {"week": (), "month": ()},
+        )
+
+    def test_failed_first_refresh_returns_empty_data(self):
+        """An error in the first refresh returns uncached empty data."""
+        with mock.patch.object(
+            tdu,
+            "_refresh_repo",
+            side_effect=RuntimeError("broken"),
+        ):
+            traffic_data = tdu.get_traffic_data(REPO_NAME)
+
+        self.assertTrue(traffic_data.clones.empty)
+        self.assertTrue(traffic_data.visitors.empty)
+        self.assertNotIn(REPO_NAME, tdu._traffic_cache)
+
+
+class TrafficPeriodTest(unittest.TestCase):
+    """Tests for splitting traffic frames into weeks and months."""
+
+    def setUp(self):
+        """Parse a frame spanning two months and three weeks."""
+        self.data_frame = tdu.parse_traffic_csv(
+            io.StringIO(
+                "clone_timestamp,total_clones,unique_clones\n"
+                '"2025-03-29",1,1\n'
+                '"2025-03-31",4,2\n'
+                '"2025-04-07",10,3\n'
+            )
+        )
+
+    def test_periods_hold_rows_and_totals(self):
+        """Every period holds its rows and the sums of its counts."""
+        periods = tdu.build_traffic_periods(self.data_frame)
+
+        weeks = periods["week"]
+        self.assertEqual([week.total for week in weeks], [10, 4, 1])
+        self.assertEqual([week.unique for week in weeks], [3, 2, 1])
+        self.assertEqual(len(weeks[1].data_frame), 7)
+        self.assertEqual(weeks[1].label, "Mar 31 - Apr 06, 2025")
+
+        months = periods["month"]
+        self.assertEqual(
+            [month.label for month in months],
+            [
+                "April 2025",
+                "March 2025",
+            ],
+        )
+        self.assertEqual([month.total for month in months], [10, 5])
+        self.assertEqual(
+            sum(len(month.data_frame) for month in months),
+            len(self.data_frame),
+        )
+
+    def test_period_offsets_are_clamped(self):
+        """Offsets outside the history select the nearest period."""
+        periods = tdu.build_traffic_periods(self.data_frame)
+        self.assertIs(
+            tdu.get_traffic_period(periods, "week", 9),
+            periods["week"][-1],
+        )
+        self.assertIs(
+            tdu.get_traffic_period(periods, "week", -1),
+            periods["week"][0],
+        )
+        self.assertIsNone(tdu.get_traffic_period(periods, "all", 0))
+
+
+if __name__ == "__main__":
+    unittest.main()